@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark the data serialization methods on large binary payloads
+
+Compares ``DillDataBase64`` (the default) with ``PickleDataRaw`` (pickle protocol
+5 with out-of-band buffers, for transports that carry bytes) on NumPy arrays of
+1 MB to 100 MB, reporting the serialize and deserialize times, and the
+serialized size relative to the array.  Without NumPy installed, a ``bytearray``
+stands in for the array (wrapped in a ``pickle.PickleBuffer`` for
+``PickleDataRaw``, as a NumPy array would provide one).
+
+    python benchmarks/bench_data_serializers.py --max-size 100M
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import pickle
+import time
+
+from globus_compute_sdk.serialize.concretes import DillDataBase64, PickleDataRaw
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SIZES = {"1M": 1_000_000, "10M": 10_000_000, "100M": 100_000_000}
+
+
+def make_payload(size: int, method_name: str):
+    if numpy is not None:
+        return numpy.random.default_rng(0).integers(0, 255, size, dtype=numpy.uint8)
+    data = bytearray(size)
+    return pickle.PickleBuffer(data) if method_name == "raw" else data
+
+
+def best_time(fn, arg, repeat: int) -> tuple[float, object]:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--max-size", default="100M", choices=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = list(SIZES.items())[: list(SIZES).index(args.max_size) + 1]
+    methods = {"base64": DillDataBase64(), "raw": PickleDataRaw()}
+
+    payload_kind = "NumPy uint8 arrays" if numpy is not None else "bytearrays"
+    print(f"{payload_kind} (best of {args.repeat})\n")
+    print(
+        f"{'size':>5} {'method':>7} {'serialize ms':>13} {'deserialize ms':>15}"
+        f" {'size ratio':>11}"
+    )
+    for label, size in sizes:
+        totals = {}
+        for name, method in methods.items():
+            payload = make_payload(size, name)
+            ser_s, serialized = best_time(method.serialize, payload, args.repeat)
+            de_s, _ = best_time(method.deserialize, serialized, args.repeat)
+            totals[name] = ser_s + de_s
+            print(
+                f"{label:>5} {name:>7} {ser_s * 1e3:13.1f} {de_s * 1e3:15.1f}"
+                f" {len(serialized) / size:11.3f}"
+            )
+        print(f"{'':>5} raw is {totals['base64'] / totals['raw']:.1f}x faster\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,427 @@
+#!/usr/bin/env python
+"""Benchmark the endpoint task pipeline end to end, on localhost
+
+Runs an ``EndpointInterchange`` and its ``HighThroughputExecutor`` (interchange,
+manager, and workers) as the endpoint does, but with RabbitMQ replaced by
+in-process stand-ins: tasks are put straight onto the pending task queue, and
+results are "published" by noting when they arrive.  For each workload (a
+no-op, a short sleep, and a large argument echoed back as the result), reports
+the throughput, the latency from queueing a task to publishing its result, and
+the CPU time and peak memory of each kind of endpoint process.
+
+Save the numbers as a JSON baseline, then compare a later run against it:
+
+    python benchmarks/bench_endpoint_pipeline.py --tasks 2000 --save before.json
+    python benchmarks/bench_endpoint_pipeline.py --tasks 2000 --compare before.json
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import typing as t
+import uuid
+from unittest import mock
+
+import psutil
+from globus_compute_common import messagepack
+from globus_compute_common.messagepack.message_types import Result, Task
+from globus_compute_endpoint.endpoint.interchange import EndpointInterchange
+from globus_compute_endpoint.endpoint.utils.config import Config
+from globus_compute_endpoint.executors import HighThroughputExecutor
+from globus_compute_sdk.serialize import ComputeSerializer
+from parsl.channels import LocalChannel
+from parsl.providers import LocalProvider
+
+_IX_PATH = "globus_compute_endpoint.endpoint.interchange"
+
+
+def noop():
+    return None
+
+
+def sleep(seconds):
+    import time
+
+    time.sleep(seconds)
+
+
+def echo(payload):
+    return payload
+
+
+class FakeResultPublisher:
+    """Stands in for the ``PipelinedResultQueuePublisher``; notes result arrival"""
+
+    def __init__(self, *args, **kwargs):
+        self.in_flight = 0
+        self.arrived: dict[str, float] = {}
+        self.errors = 0
+        self.expected = 0
+        self.all_arrived = threading.Event()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def expect(self, num_results: int):
+        with self._lock:
+            self.arrived.clear()
+            self.errors = 0
+            self.expected = num_results
+            self.all_arrived.clear()
+
+    def publish(self, message: bytes, task_id: str | None = None, timeout=None):
+        if not task_id:
+            return  # a status report
+        now = time.perf_counter()
+        result = messagepack.unpack(message)
+        with self._lock:
+            self.arrived[task_id] = now
+            if isinstance(result, Result) and result.error_details is not None:
+                self.errors += 1
+            if len(self.arrived) >= self.expected:
+                self.all_arrived.set()
+
+
+def endpoint_processes(workdir: str) -> list[tuple[str, psutil.Process]]:
+    """This process, and every process it started for the executor
+
+    Managers are launched detached (and so are not descendants of this
+    process); find them by their log directory, which is in ``workdir``.
+    """
+    me = psutil.Process()
+    found = [("endpoint", me)]
+    found.extend(("interchange", p) for p in me.children())
+    logdir_arg = f"--logdir={workdir}"
+    for proc in psutil.process_iter(["cmdline"]):
+        argv = proc.info["cmdline"] or []
+        is_manager = any(a.endswith("globus-compute-manager") for a in argv[:2])
+        if is_manager and any(a.startswith(logdir_arg) for a in argv):
+            found.append(("manager", proc))
+            try:
+                found.extend(("worker", p) for p in proc.children(recursive=True))
+            except psutil.Error:
+                pass
+    return found
+
+
+class ProcessSampler(threading.Thread):
+    """Samples CPU time and RSS of the endpoint's processes"""
+
+    def __init__(self, workdir: str, interval_s: float = 0.1):
+        super().__init__(daemon=True, name="Process Sampler")
+        self.workdir = workdir
+        self.interval_s = interval_s
+        self._done = threading.Event()
+        self._cpu_start: dict[int, float] = {}
+        self.cpu_s: dict[int, float] = {}
+        self.peak_rss: dict[int, int] = {}
+        self.roles: dict[int, str] = {}
+
+    def run(self):
+        while not self._done.wait(self.interval_s):
+            self.sample()
+
+    def stop(self) -> dict[str, dict[str, float]]:
+        self._done.set()
+        self.join()
+        self.sample()
+        by_role: dict[str, dict[str, float]] = {}
+        for pid, role in self.roles.items():
+            stats = by_role.setdefault(
+                role, {"count": 0, "cpu_s": 0.0, "peak_rss_mib": 0.0}
+            )
+            stats["count"] += 1
+            stats["cpu_s"] += self.cpu_s.get(pid, 0.0)
+            rss_mib = self.peak_rss.get(pid, 0) / 2**20
+            stats["peak_rss_mib"] = max(stats["peak_rss_mib"], rss_mib)
+        return by_role
+
+    def sample(self):
+        for role, proc in endpoint_processes(self.workdir):
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_times()
+                    rss = proc.memory_info().rss
+            except psutil.Error:
+                continue  # exited
+            cpu_s = cpu.user + cpu.system
+            start = self._cpu_start.setdefault(proc.pid, cpu_s)
+            self.roles[proc.pid] = role
+            self.cpu_s[proc.pid] = cpu_s - start
+            self.peak_rss[proc.pid] = max(self.peak_rss.get(proc.pid, 0), rss)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    if not values:
+        return float("nan")
+    k = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[k]
+
+
+class Pipeline:
+    def __init__(self, workdir: str, workers: int):
+        # The manager is launched by name; launch this environment's
+        bin_dir = os.path.dirname(sys.executable)
+        path = bin_dir + os.pathsep + os.environ.get("PATH", "")
+
+        self.serializer = ComputeSerializer()
+        self.publisher = FakeResultPublisher()
+        htex = HighThroughputExecutor(
+            provider=LocalProvider(
+                channel=LocalChannel(envs={"PATH": path}),
+                init_blocks=1,
+                min_blocks=1,
+                max_blocks=1,
+            ),
+            max_workers_per_node=workers,
+            heartbeat_period=2,
+            heartbeat_threshold=10,
+        )
+        config = Config(executors=[htex], heartbeat_period=2, idle_heartbeats_soft=0)
+        self.ei = EndpointInterchange(
+            config=config,
+            reg_info={"task_queue_info": {}, "result_queue_info": {}},
+            logdir=workdir,
+            endpoint_id=str(uuid.uuid4()),
+            endpoint_dir=workdir,
+        )
+        self._patches = [
+            mock.patch(f"{_IX_PATH}.TaskQueueSubscriber"),
+            mock.patch(
+                f"{_IX_PATH}.PipelinedResultQueuePublisher",
+                return_value=self.publisher,
+            ),
+        ]
+        self.workdir = workdir
+        self._main: threading.Thread | None = None
+
+    def __enter__(self):
+        for p in self._patches:
+            p.start()
+        self.ei.start_executor()
+        self._main = threading.Thread(
+            target=self.ei._start_threads_and_main, daemon=True, name="Main Loop"
+        )
+        self._main.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.ei.stop()
+        if self._main:
+            self._main.join(timeout=10)
+        procs = [p for role, p in endpoint_processes(self.workdir)[1:]]
+        self.ei.cleanup()
+        for p in self._patches:
+            p.stop()
+        for proc in procs:
+            try:
+                proc.terminate()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(procs, timeout=5)
+
+    def pack_task(self, fn: t.Callable, *args) -> tuple[str, bytes]:
+        task_id = str(uuid.uuid4())
+        buffer = self.serializer.pack_buffers(
+            [
+                self.serializer.serialize(fn),
+                self.serializer.serialize(args),
+                self.serializer.serialize({}),
+            ]
+        )
+        return task_id, messagepack.pack(Task(task_id=task_id, task_buffer=buffer))
+
+    def run(
+        self,
+        fn: t.Callable,
+        args: tuple,
+        num_tasks: int,
+        rate: float,
+        timeout_s: float,
+    ) -> dict[str, t.Any]:
+        tasks = [self.pack_task(fn, *args) for _ in range(num_tasks)]
+        self.publisher.expect(num_tasks)
+
+        sampler = ProcessSampler(self.workdir)
+        sampler.sample()  # CPU baseline before the first task
+        sampler.start()
+        queued: dict[str, float] = {}
+        start = time.perf_counter()
+        for i, (task_id, packed) in enumerate(tasks):
+            if rate:
+                delay = start + i / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            queued[task_id] = time.perf_counter()
+            self.ei.pending_task_queue.put(packed)
+
+        finished = self.publisher.all_arrived.wait(timeout_s)
+        elapsed = time.perf_counter() - start
+        processes = sampler.stop()
+
+        arrived = dict(self.publisher.arrived)
+        if not finished:
+            print(
+                f"  timed out; {len(arrived)} of {num_tasks} results arrived",
+                file=sys.stderr,
+            )
+        else:
+            elapsed = max(arrived.values()) - start
+        latencies_ms = [(arrived[tid] - queued[tid]) * 1e3 for tid in arrived]
+        return {
+            "tasks": num_tasks,
+            "completed": len(arrived),
+            "errors": self.publisher.errors,
+            "elapsed_s": elapsed,
+            "tasks_per_s": len(arrived) / elapsed if elapsed else 0.0,
+            "latency_ms": {
+                "p50": percentile(latencies_ms, 50),
+                "p99": percentile(latencies_ms, 99),
+                "max": max(latencies_ms, default=float("nan")),
+            },
+            "processes": processes,
+        }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(workloads: dict[str, dict[str, t.Any]]):
+    print(f"{'workload':>10} {'tasks/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, r in workloads.items():
+        lat = r["latency_ms"]
+        print(
+            f"{name:>10} {r['tasks_per_s']:9.0f} {lat['p50']:9.1f} {lat['p99']:9.1f}"
+            f" {r['errors']:7d}"
+        )
+    print(
+        f"\n{'workload':>10} {'process':>12} {'count':>6} {'cpu s':>8} {'rss MiB':>8}"
+    )
+    for name, r in workloads.items():
+        for role, p in sorted(r["processes"].items()):
+            print(
+                f"{name:>10} {role:>12} {p['count']:6d} {p['cpu_s']:8.2f}"
+                f" {p['peak_rss_mib']:8.1f}"
+            )
+
+
+def print_comparison(
+    baseline: dict[str, t.Any], workloads: dict[str, t.Any], args: dict[str, t.Any]
+):
+    meta = baseline.get("meta", {})
+    print(f"\nCompared to {meta.get('commit') or 'baseline'}:")
+    for arg in ("tasks", "workers", "rate", "sleep_ms", "payload_kib"):
+        before = meta.get("args", {}).get(arg)
+        if before != args[arg]:
+            print(f"  (note: baseline ran with {arg}={before}, not {args[arg]})")
+    if meta.get("cpus") != os.cpu_count():
+        print(f"  (note: baseline ran with {meta.get('cpus')} CPUs)")
+    print(f"{'workload':>10} {'metric':>9} {'before':>9} {'after':>9} {'change':>8}")
+    for name, r in workloads.items():
+        before = baseline.get("workloads", {}).get(name)
+        if not before:
+            continue
+        for metric, b, a in (
+            ("tasks/s", before["tasks_per_s"], r["tasks_per_s"]),
+            ("p50 ms", before["latency_ms"]["p50"], r["latency_ms"]["p50"]),
+            ("p99 ms", before["latency_ms"]["p99"], r["latency_ms"]["p99"]),
+        ):
+            change = f"{(a - b) / b * 100:+7.1f}%" if b else "     n/a"
+            print(f"{name:>10} {metric:>9} {b:9.1f} {a:9.1f} {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--rate", type=float, default=0, help="tasks/s to queue; 0 queues all at once"
+    )
+    parser.add_argument("--sleep-ms", type=float, default=10)
+    parser.add_argument("--payload-kib", type=int, default=256)
+    parser.add_argument(
+        "--workloads", default="noop,sleep,payload", help="comma-separated subset"
+    )
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument(
+        "--workdir", help="keep logs here (default: a temporary directory)"
+    )
+    parser.add_argument("--save", metavar="JSON", help="write the results here")
+    parser.add_argument("--compare", metavar="JSON", help="a previously saved run")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    workload_specs = {
+        "noop": (noop, ()),
+        "sleep": (sleep, (args.sleep_ms / 1e3,)),
+        "payload": (echo, (b"x" * (args.payload_kib * 1024),)),
+    }
+    selected = [w.strip() for w in args.workloads.split(",") if w.strip()]
+
+    print(
+        f"{args.tasks} tasks per workload; {args.workers} workers;"
+        f" {'all at once' if not args.rate else f'{args.rate:g} tasks/s'}\n"
+    )
+    workloads = {}
+    with contextlib.ExitStack() as stack:
+        workdir = args.workdir or stack.enter_context(tempfile.TemporaryDirectory())
+        pipeline = stack.enter_context(Pipeline(workdir, args.workers))
+        # Warm up: wait for the manager and workers, and prime the function caches
+        for name in selected:
+            fn, fn_args = workload_specs[name]
+            pipeline.run(fn, fn_args, args.workers * 2, 0, args.timeout)
+        for name in selected:
+            fn, fn_args = workload_specs[name]
+            workloads[name] = pipeline.run(
+                fn, fn_args, args.tasks, args.rate, args.timeout
+            )
+
+    print_results(workloads)
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(json.load(f), workloads, vars(args))
+
+    if args.save:
+        report = {
+            "meta": {
+                "commit": git_commit(),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "args": vars(args),
+            },
+            "workloads": workloads,
+        }
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
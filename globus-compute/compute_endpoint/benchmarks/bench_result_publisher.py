@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Benchmark result publishing throughput against a simulated broker round trip
+
+Compares publish-and-wait-for-confirm (the ``ResultQueuePublisher`` pattern,
+one message per round trip) with the ``PipelinedResultQueuePublisher``, which
+keeps up to ``--window`` messages unconfirmed.  The broker is a stand-in: a
+channel on pika's own ``IOLoop`` that confirms each published message after
+``--rtt-ms`` milliseconds, so the numbers isolate the cost of waiting on
+confirms rather than measure a real RabbitMQ deployment.
+
+    python benchmarks/bench_result_publisher.py --rtt-ms 2 --messages 2000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import pika.frame
+import pika.spec
+from globus_compute_endpoint.endpoint.rabbit_mq import PipelinedResultQueuePublisher
+from pika.adapters.select_connection import IOLoop
+
+
+class SimulatedChannel:
+    def __init__(self, connection: SimulatedConnection):
+        self.connection = connection
+        self._delivery_tag = 0
+        self._on_ack = None
+
+    def add_on_close_callback(self, _cb):
+        pass
+
+    def add_on_return_callback(self, _cb):
+        pass
+
+    def exchange_declare(self, callback, **_kw):
+        self.connection.ioloop.add_callback(lambda: callback(None))
+
+    def queue_declare(self, callback, **_kw):
+        self.connection.ioloop.add_callback(lambda: callback(None))
+
+    def confirm_delivery(self, ack_nack_callback, callback):
+        self._on_ack = ack_nack_callback
+        self.connection.ioloop.add_callback(lambda: callback(None))
+
+    def basic_publish(self, body, **_kw):
+        self._delivery_tag += 1
+        ack = pika.spec.Basic.Ack(delivery_tag=self._delivery_tag)
+        self.connection.ioloop.call_later(
+            self.connection.rtt_s, lambda: self._on_ack(pika.frame.Method(1, ack))
+        )
+
+
+class SimulatedConnection:
+    def __init__(self, rtt_s: float, on_open_callback, on_close_callback):
+        self.rtt_s = rtt_s
+        self.ioloop = IOLoop()
+        self.is_open = True
+        self._on_close = on_close_callback
+        self.ioloop.add_callback(lambda: on_open_callback(self))
+
+    def channel(self, on_open_callback):
+        self.ioloop.add_callback(lambda: on_open_callback(SimulatedChannel(self)))
+
+    def close(self):
+        self.is_open = False
+        self.ioloop.add_callback(lambda: self._on_close(self, Exception("closed")))
+
+
+class SimulatedPublisher(PipelinedResultQueuePublisher):
+    def __init__(self, rtt_s: float, **kwargs):
+        super().__init__(**kwargs)
+        self.rtt_s = rtt_s
+
+    def _connect(self):
+        return SimulatedConnection(
+            self.rtt_s, self._on_connection_open, self._on_connection_closed
+        )
+
+
+def run_synchronous(messages: list[bytes], rtt_s: float) -> float:
+    start = time.perf_counter()
+    for _message in messages:
+        time.sleep(rtt_s)  # basic_publish blocks until the broker confirms
+    return time.perf_counter() - start
+
+
+def run_pipelined(messages: list[bytes], rtt_s: float, window: int) -> float:
+    queue_info = {
+        "exchange": "results",
+        "queue": "results",
+        "queue_publish_kwargs": {"routing_key": "bench.results"},
+    }
+    store: dict[str, bytes] = {}
+    pub = SimulatedPublisher(
+        rtt_s, queue_info=queue_info, result_store=store, max_in_flight=window
+    )
+    pub.connect()
+    start = time.perf_counter()
+    for i, message in enumerate(messages):
+        pub.publish(message, task_id=str(i))
+    pub.flush()
+    elapsed = time.perf_counter() - start
+    pub.close()
+    assert pub.num_confirmed == len(messages) and not store
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--message-size", type=int, default=1024)
+    parser.add_argument("--window", type=int, nargs="+", default=[16, 64, 256])
+    args = parser.parse_args()
+
+    rtt_s = args.rtt_ms / 1e3
+    messages = [b"x" * args.message_size] * args.messages
+    sync_s = run_synchronous(messages, rtt_s)
+
+    print(f"{args.messages} messages, simulated round trip of {args.rtt_ms} ms\n")
+    print(f"{'mode':>15} {'msgs/s':>10} {'speedup':>8}")
+    print(f"{'synchronous':>15} {args.messages / sync_s:10.0f} {1:7.1f}x")
+    for window in args.window:
+        elapsed = run_pipelined(messages, rtt_s, window)
+        print(
+            f"{f'window {window}':>15} {args.messages / elapsed:10.0f}"
+            f" {sync_s / elapsed:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
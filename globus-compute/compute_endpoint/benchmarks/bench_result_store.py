@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""Benchmark the ResultStore through a simulated outage and recovery
+
+Stores N results (as during a broker outage), reopens the store (as on endpoint
+restart), then replays and removes every result (as on reconnect).  Compares
+the segment-log ``ResultStore`` with the one-file-per-result layout it
+replaced, which listed the directory to find stored results.
+
+    python benchmarks/bench_result_store.py --results 100000
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+from globus_compute_endpoint.endpoint.result_store import ResultStore
+
+
+class FilePerResultStore:
+    def __init__(self, endpoint_dir: pathlib.Path):
+        self.data_path = endpoint_dir / "unacked_results"
+        self.data_path.mkdir(exist_ok=True)
+
+    def __setitem__(self, key: str, payload: bytes):
+        (self.data_path / key).write_bytes(payload)
+
+    def __iter__(self):
+        for rp in self.data_path.glob("[!.]*"):
+            yield rp.name, rp.read_bytes()
+
+    def discard(self, key: str):
+        (self.data_path / key).unlink()
+
+    def close(self):
+        pass
+
+
+def run(store_cls, num_results: int, payload: bytes) -> dict[str, float]:
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        ep_dir = pathlib.Path(tmp)
+        store = store_cls(ep_dir)
+        start = time.perf_counter()
+        for i in range(num_results):
+            store[f"{i:032x}"] = payload
+        store.close()
+        timings["store"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = store_cls(ep_dir)
+        timings["reopen"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        replayed = 0
+        for key, _payload in store:
+            store.discard(key)
+            replayed += 1
+        store.close()
+        timings["replay"] = time.perf_counter() - start
+        assert replayed == num_results
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--results", type=int, default=100_000)
+    parser.add_argument("--payload-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    payload = b"x" * args.payload_size
+    print(f"{args.results} results of {args.payload_size} bytes; seconds\n")
+    print(f"{'store':>16} {'store':>8} {'reopen':>8} {'replay':>8} {'total':>8}")
+    for name, store_cls in (
+        ("file per result", FilePerResultStore),
+        ("segment log", ResultStore),
+    ):
+        t = run(store_cls, args.results, payload)
+        print(
+            f"{name:>16} {t['store']:8.2f} {t['reopen']:8.2f} {t['replay']:8.2f}"
+            f" {sum(t.values()):8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
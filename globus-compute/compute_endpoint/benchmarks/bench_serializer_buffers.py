@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""Benchmark ComputeSerializer's buffer packing and unpacking
+
+Compares the offset-based ``pack_buffers`` / ``unpack_buffers`` with the
+split-and-slice implementation they replaced, which copied the remainder of the
+packed string for every buffer unpacked, over packed task payloads (a function,
+args and kwargs buffer) from 1 KB to 100 MB:
+
+    python benchmarks/bench_serializer_buffers.py --buffers 3
+    python benchmarks/bench_serializer_buffers.py --buffers 64 --max-size 10M
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+
+from globus_compute_sdk.serialize import ComputeSerializer
+
+SIZES = {
+    "1K": 1_000,
+    "10K": 10_000,
+    "100K": 100_000,
+    "1M": 1_000_000,
+    "10M": 10_000_000,
+    "100M": 100_000_000,
+}
+
+
+def previous_pack_buffers(buffers):
+    packed = ""
+    for buf in buffers:
+        s_length = str(len(buf)) + "\n"
+        packed += s_length + buf
+    return packed
+
+
+def previous_unpack_buffers(packed_buffer):
+    unpacked = []
+    while packed_buffer:
+        s_length, buf = packed_buffer.split("\n", 1)
+        i_length = int(s_length)
+        current, packed_buffer = buf[:i_length], buf[i_length:]
+        unpacked.extend([current])
+    return unpacked
+
+
+def make_buffers(total_size: int, count: int) -> list[str]:
+    size = max(1, total_size // count)
+    return ["00\n" + "A" * (size - 3) for _ in range(count)]
+
+
+def best_time(fn, arg, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--buffers", type=int, default=3, help="Buffers per payload")
+    parser.add_argument("--max-size", default="100M", choices=SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = list(SIZES.items())
+    sizes = sizes[: list(SIZES).index(args.max_size) + 1]
+
+    print(f"{args.buffers} buffers per payload (best of {args.repeat}); ms per call\n")
+    print(
+        f"{'size':>6} {'pack old':>10} {'pack new':>10} {'unpack old':>11}"
+        f" {'unpack new':>11} {'unpack bytes':>13} {'speedup':>8}"
+    )
+    for label, size in sizes:
+        buffers = make_buffers(size, args.buffers)
+        packed = ComputeSerializer.pack_buffers(buffers)
+        assert packed == previous_pack_buffers(buffers)
+        assert ComputeSerializer.unpack_buffers(packed) == buffers
+
+        pack_old = best_time(previous_pack_buffers, buffers, args.repeat)
+        pack_new = best_time(ComputeSerializer.pack_buffers, buffers, args.repeat)
+        unpack_old = best_time(previous_unpack_buffers, packed, args.repeat)
+        unpack_new = best_time(ComputeSerializer.unpack_buffers, packed, args.repeat)
+        unpack_bytes = best_time(
+            ComputeSerializer.unpack_buffers, packed.encode(), args.repeat
+        )
+        print(
+            f"{label:>6} {pack_old * 1e3:10.3f} {pack_new * 1e3:10.3f}"
+            f" {unpack_old * 1e3:11.3f} {unpack_new * 1e3:11.3f}"
+            f" {unpack_bytes * 1e3:13.3f}"
+            f" {(pack_old + unpack_old) / (pack_new + unpack_new):7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
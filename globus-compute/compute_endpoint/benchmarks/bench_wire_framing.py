@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""Benchmark the interchange -> manager -> worker task wire
+
+Compares the binary framing (``executors.high_throughput.framing``) with the dill
+pickling it replaced, over the work the interchange and the manager do per task
+batch:
+
+  interchange   frame a batch of pending tasks for a manager
+  manager       unpack the batch, and frame each task for a worker
+
+Each path is measured in-process (encode/decode only) and over a pair of
+connected ZMQ sockets (including the send/receive copies), reporting the time
+per task, and the peak memory allocated per batch as a proxy for GC pressure.
+
+    python benchmarks/bench_wire_framing.py --tasks 20000 --batch 64 --size 4096
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import statistics
+import time
+import tracemalloc
+import uuid
+
+import dill
+import zmq
+from globus_compute_endpoint.executors.high_throughput import framing
+from globus_compute_endpoint.executors.high_throughput.messages import Message, Task
+
+
+def make_batches(num_tasks: int, batch_size: int, payload_size: int):
+    payload = "x" * payload_size
+    tasks = []
+    for _ in range(num_tasks):
+        task_id = str(uuid.uuid4())
+        tasks.append(
+            {
+                "task_id": task_id,
+                "container_id": "RAW",
+                "local_container": "RAW",
+                "raw_buffer": Task(task_id, "RAW", payload).pack(),
+            }
+        )
+    return [tasks[i : i + batch_size] for i in range(0, num_tasks, batch_size)]
+
+
+# The previous wire: a dill-pickled list of task dicts per batch; the manager
+# unpacks each task and re-packs it for the worker, with a dill-pickled task id
+# and container id
+def dill_interchange(batch):
+    return [dill.dumps(batch)]
+
+
+def dill_manager(frames):
+    to_workers = []
+    for rt in dill.loads(frames[0]):
+        task = Message.unpack(rt["raw_buffer"])
+        to_workers.append(
+            [dill.dumps(task.task_id), dill.dumps(task.container_id), task.pack()]
+        )
+    return to_workers
+
+
+def framed_interchange(batch):
+    return framing.pack_tasks(batch)
+
+
+def framed_manager(frames):
+    _, records, payloads = framing.unpack(frames)
+    return [
+        framing.pack_worker_task(wt.task_id, wt.container_id, wt.pack())
+        for wt in framing.unpack_tasks(records, payloads)
+    ]
+
+
+CODECS = {
+    "dill": (dill_interchange, dill_manager),
+    "framed": (framed_interchange, framed_manager),
+}
+
+
+def bench_codec(name, batches, repeat):
+    encode, decode = CODECS[name]
+    num_tasks = sum(len(b) for b in batches)
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for batch in batches:
+            decode(encode(batch))
+        timings.append((time.perf_counter() - start) / num_tasks)
+
+    tracemalloc.start()
+    peaks = []
+    for batch in batches:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        decode(encode(batch))
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return min(timings), statistics.mean(peaks)
+
+
+def bench_zmq(name, batches, repeat):
+    encode, decode = CODECS[name]
+    copy = name == "dill"
+    num_tasks = sum(len(b) for b in batches)
+    ctx = zmq.Context()
+    tx, rx = ctx.socket(zmq.PAIR), ctx.socket(zmq.PAIR)
+    tx.bind("inproc://bench")
+    rx.connect("inproc://bench")
+    sink = ctx.socket(zmq.PUSH)
+    sink.set_hwm(0)
+    sink.bind("inproc://sink")
+    drain = ctx.socket(zmq.PULL)
+    drain.connect("inproc://sink")
+
+    timings = []
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            for batch in batches:
+                tx.send_multipart(encode(batch), copy=copy)
+                for to_worker in decode(rx.recv_multipart(copy=copy)):
+                    sink.send_multipart(to_worker, copy=copy)
+                    drain.recv_multipart()
+            timings.append((time.perf_counter() - start) / num_tasks)
+    finally:
+        for sock in (tx, rx, sink, drain):
+            sock.close(linger=0)
+        ctx.term()
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=64, help="Tasks per batch")
+    parser.add_argument("--size", type=int, default=4096, help="Task payload bytes")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    batches = make_batches(args.tasks, args.batch, args.size)
+    print(
+        f"{args.tasks} tasks in batches of {args.batch}, {args.size} B payloads"
+        f" (best of {args.repeat})\n"
+    )
+    print(
+        f"{'codec':>8} {'codec us/task':>14} {'zmq us/task':>12} {'peak KiB/batch':>15}"
+    )
+    results = {}
+    for name in CODECS:
+        per_task, peak = bench_codec(name, batches, args.repeat)
+        zmq_per_task = bench_zmq(name, batches, args.repeat)
+        results[name] = per_task, zmq_per_task, peak
+        print(
+            f"{name:>8} {per_task * 1e6:14.2f} {zmq_per_task * 1e6:12.2f}"
+            f" {peak / 1024:15.1f}"
+        )
+
+    (d_codec, d_zmq, d_peak), (f_codec, f_zmq, f_peak) = results.values()
+    print(
+        f"\nframed vs dill: {d_codec / f_codec:.1f}x faster codec,"
+        f" {d_zmq / f_zmq:.1f}x faster over zmq,"
+        f" {d_peak / max(f_peak, 1):.1f}x less memory per batch"
+    )
+
+
+if __name__ == "__main__":
+    main()
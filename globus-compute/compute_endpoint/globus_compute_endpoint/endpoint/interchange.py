@@ -33,7 +33,7 @@ from globus_compute_endpoint.endpoint.messages_compat import (
     try_convert_to_messagepack,
 )
 from globus_compute_endpoint.endpoint.rabbit_mq import (
-    ResultQueuePublisher,
+    PipelinedResultQueuePublisher,
     TaskQueueSubscriber,
 )
 from globus_compute_endpoint.endpoint.result_store import ResultStore
@@ -47,6 +47,13 @@ if t.TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _queue_depth(q: queue.Queue | multiprocessing.Queue) -> int | str:
+    try:
+        return q.qsize()
+    except NotImplementedError:  # multiprocessing.Queue, on macOS
+        return "?"
+
+
 class EndpointInterchange:
     """Interchange is a task orchestrator for distributed systems.
 
@@ -69,6 +76,7 @@ class EndpointInterchange:
         result_store: ResultStore | None = None,
         reconnect_attempt_limit: int = 5,
         parent_pid: int = 0,
+        stored_results_replay_rate: float = 1000,
     ):
         """
         Parameters
@@ -90,6 +98,11 @@ class EndpointInterchange:
 
         endpoint_dir : pathlib.Path
              Endpoint directory path to store registration info in
+
+        stored_results_replay_rate : float
+             Maximum number of previously stored results to forward per second,
+             so that a large backlog (e.g., after an outage) does not flood the
+             result queue on reconnect.  Default: 1000
         """
         self.logdir = logdir
         log.info(
@@ -108,6 +121,7 @@ class EndpointInterchange:
         self.heartbeat_period = self.config.heartbeat_period
 
         self.pending_task_queue: multiprocessing.Queue = multiprocessing.Queue()
+        self._task_puller_procs: list[multiprocessing.Process] = []
 
         self._reconnect_fail_counter = 0
         self.reconnect_attempt_limit = max(1, reconnect_attempt_limit)
@@ -118,6 +132,7 @@ class EndpointInterchange:
         if result_store is None:
             result_store = ResultStore(endpoint_dir=endpoint_dir)
         self.result_store = result_store
+        self.stored_results_replay_rate = stored_results_replay_rate
 
         self.endpoint_id = endpoint_id
 
@@ -155,6 +170,8 @@ class EndpointInterchange:
         endpoint_uuid: str,
         pending_task_queue: multiprocessing.Queue,
         quiesce_event: EventType,
+        prefetch_count: int = 0,
+        exclusive: bool = True,
     ) -> multiprocessing.Process:
         """Pull tasks from the incoming tasks 0mq pipe onto the internal
         pending task queue
@@ -171,6 +188,12 @@ class EndpointInterchange:
 
         quiesce_event : EventType
               Event to let the thread know when it is time to die.
+
+        prefetch_count : int
+              Maximum number of unacknowledged tasks to receive; 0 for no limit
+
+        exclusive : bool
+              Whether to consume the task queue exclusively
         """
         try:
             log.info(f"Starting the TaskQueueSubscriber as {endpoint_uuid}")
@@ -179,6 +202,8 @@ class EndpointInterchange:
                 external_queue=pending_task_queue,
                 quiesce_event=quiesce_event,
                 endpoint_id=endpoint_uuid,
+                prefetch_count=prefetch_count,
+                exclusive=exclusive,
             )
             task_q_proc.start()
         except Exception:
@@ -195,7 +220,8 @@ class EndpointInterchange:
         self._quiesce_event.set()
 
         log.info("Waiting for quiesce complete")
-        self._task_puller_proc.join()
+        for task_puller_proc in self._task_puller_procs:
+            task_puller_proc.join()
 
         log.info("Quiesce done")
 
@@ -210,6 +236,7 @@ class EndpointInterchange:
 
     def cleanup(self):
         self.executor.shutdown()
+        self.result_store.close()
 
     def handle_sigterm(self, sig_num, curr_stack_frame):
         log.warning("Received SIGTERM, setting termination flag.")
@@ -302,12 +329,19 @@ class EndpointInterchange:
         log.info("EndpointInterchange shutdown complete.")
 
     def _start_threads_and_main(self):
-        self._task_puller_proc = self.migrate_tasks_to_internal(
-            self.task_q_info,
-            self.endpoint_id,
-            self.pending_task_queue,
-            self._quiesce_event,
-        )
+        # Only a lone consumer may be exclusive; RabbitMQ refuses any other
+        num_consumers = self.config.task_queue_consumers
+        self._task_puller_procs = [
+            self.migrate_tasks_to_internal(
+                self.task_q_info,
+                self.endpoint_id,
+                self.pending_task_queue,
+                self._quiesce_event,
+                prefetch_count=self.config.task_queue_prefetch,
+                exclusive=num_consumers == 1,
+            )
+            for _ in range(num_consumers)
+        ]
 
         self._main_loop()
 
@@ -319,7 +353,9 @@ class EndpointInterchange:
         (RMQ), and forward any previous results that may have failed to send previously
         (e.g., if a RMQ connection was dropped).
 
-        We accomplish this via three threads, one each for each task.
+        We accomplish this via three kinds of threads, one each for each task;
+        there may be several threads forwarding tasks (``Config.task_decoders``),
+        so that unpacking tasks keeps up with several task queue consumers.
 
         Of special note is that this kernel does not try very hard to handle the
         non-happy path.  If an error occurs that is too "unhappy" (e.g., communication
@@ -329,12 +365,18 @@ class EndpointInterchange:
         """
         log.debug("_main_loop begins")
 
-        results_publisher = ResultQueuePublisher(queue_info=self.result_q_info)
+        results_publisher = PipelinedResultQueuePublisher(
+            queue_info=self.result_q_info,
+            result_store=self.result_store,
+            thread_name="Result Publisher",
+        )
 
         with results_publisher:
             executor = self.executor
 
-            num_tasks_forwarded = 0
+            # one count per task decoder thread, so that each only increments
+            # its own
+            tasks_forwarded = [0] * self.config.task_decoders
             num_results_forwarded = 0
 
             def process_stored_results():
@@ -344,9 +386,12 @@ class EndpointInterchange:
                 # don't treat them any differently than "fresh" results: put the into
                 # the same multiprocessing queue as results incoming directly from
                 # the executors.  The normal processing by `process_pending_results()`
-                # will take over from there.
+                # will take over from there.  The store is replayed from its index
+                # (not the filesystem), at a bounded rate.
+                replay_rate = self.stored_results_replay_rate
                 while not self._quiesce_event.wait(timeout=1):
-                    for task_id, packed_result in self.result_store:
+                    stored = self.result_store.replay(max_per_second=replay_rate)
+                    for task_id, packed_result in stored:
                         if self._quiesce_event.is_set():
                             # important to check every iteration as well, so as not to
                             # potentially hang up the shutdown procedure
@@ -357,49 +402,75 @@ class EndpointInterchange:
                         self.results_passthrough.put(msg)
                 log.debug("Exit process-stored-results thread.")
 
-            def process_pending_tasks():
+            def fail_task(task_msg: Task, exc: Exception):
+                log.exception("Failed to process %s", task_msg.task_id)
+                code, msg = get_result_error_details()
+                failed_result = Result(
+                    task_id=task_msg.task_id,
+                    data=f"Failed to start task: {exc}",
+                    error_details=ResultErrorDetails(code=code, user_message=msg),
+                )
+                res = {
+                    "task_id": task_msg.task_id,
+                    "message": pack(failed_result),
+                }
+                self.results_passthrough.put(res)
+
+            def process_pending_tasks(decoder_id: int):
                 # Pull tasks from upstream (RMQ) and send them down the ZMQ pipe to the
                 # globus-compute-manager.  In terms of shutting down (or "rebooting")
                 # gracefully, iterate once a second whether or not a task has arrived.
-                nonlocal num_tasks_forwarded
+                # Tasks already waiting are taken along with the first, up to the
+                # batch size, and submitted to the executor together.
                 ctype = executor.container_type
+                batch_size = self.config.task_submit_batch_size
+                submit_batch = getattr(executor, "submit_batch", None)
                 while not self._quiesce_event.is_set():
                     if self.time_to_quit:
                         self.stop()
                         continue  # nominally == break; but let event do it
                     try:
-                        incoming_task = self.pending_task_queue.get(timeout=1)
-                        task_msg = unpack(incoming_task)
-                        if not isinstance(task_msg, Task):
-                            raise InvalidMessageError()
-
+                        incoming = [self.pending_task_queue.get(timeout=1)]
                     except queue.Empty:
                         continue
+                    try:
+                        while len(incoming) < batch_size:
+                            incoming.append(self.pending_task_queue.get_nowait())
+                    except queue.Empty:
+                        pass
+
+                    task_msgs: list[Task] = []
+                    tasks: list[bytes] = []
+                    for incoming_task in incoming:
+                        try:
+                            task_msg = unpack(incoming_task)
+                            if not isinstance(task_msg, Task):
+                                raise InvalidMessageError()
+                        except Exception:
+                            log.exception("Unhandled error processing incoming task")
+                            continue
 
-                    except Exception:
-                        log.exception("Unhandled error processing incoming task")
+                        try:
+                            tasks.append(convert_to_internaltask(task_msg, ctype))
+                            task_msgs.append(task_msg)
+                        except Exception as exc:
+                            fail_task(task_msg, exc)
+
+                    if submit_batch and len(tasks) > 1:
+                        try:
+                            submit_batch(tasks)
+                            tasks_forwarded[decoder_id] += len(tasks)
+                        except Exception as exc:
+                            for task_msg in task_msgs:
+                                fail_task(task_msg, exc)
                         continue
 
-                    try:
-                        task = convert_to_internaltask(task_msg, ctype)
-                        executor.submit_raw(task)
-                        num_tasks_forwarded += 1  # Safe given GIL
-
-                    except Exception as exc:
-                        log.exception(f"Failed to process {task_msg.task_id}")
-                        code, msg = get_result_error_details()
-                        failed_result = Result(
-                            task_id=task_msg.task_id,
-                            data=f"Failed to start task: {exc}",
-                            error_details=ResultErrorDetails(
-                                code=code, user_message=msg
-                            ),
-                        )
-                        res = {
-                            "task_id": task_msg.task_id,
-                            "message": pack(failed_result),
-                        }
-                        self.results_passthrough.put(res)
+                    for task_msg, task in zip(task_msgs, tasks):
+                        try:
+                            executor.submit_raw(task)
+                            tasks_forwarded[decoder_id] += 1
+                        except Exception as exc:
+                            fail_task(task_msg, exc)
 
                 log.debug("Exit process-pending-tasks thread.")
 
@@ -460,10 +531,26 @@ class EndpointInterchange:
                         message = pack(Result(**kwargs))
 
                     if task_id:
-                        log.debug(f"Forwarding result for task {task_id}")
+                        log.debug(
+                            "Forwarding result for task %s",
+                            task_id,
+                            extra={"task_id": task_id},
+                        )
 
                     try:
-                        results_publisher.publish(message)
+                        # Confirmed asynchronously; results the broker rejects, or
+                        # that are unconfirmed when the connection drops, are
+                        # stored by the publisher.  The wait here is only while the
+                        # window of unconfirmed results is full.
+                        while True:
+                            try:
+                                results_publisher.publish(
+                                    message, task_id=task_id, timeout=1
+                                )
+                                break
+                            except TimeoutError:
+                                if self._quiesce_event.is_set():
+                                    raise
                         if task_id:
                             num_results_forwarded += 1  # Safe given GIL
 
@@ -483,14 +570,20 @@ class EndpointInterchange:
             stored_processor_thread = threading.Thread(
                 target=process_stored_results, name="Stored Result Handler"
             )
-            task_processor_thread = threading.Thread(
-                target=process_pending_tasks, name="Pending Task Handler"
-            )
+            task_processor_threads = [
+                threading.Thread(
+                    target=process_pending_tasks,
+                    args=(decoder_id,),
+                    name=f"Pending Task Handler-{decoder_id}",
+                )
+                for decoder_id in range(len(tasks_forwarded))
+            ]
             result_processor_thread = threading.Thread(
                 target=process_pending_results, name="Pending Result Handler"
             )
             stored_processor_thread.start()
-            task_processor_thread.start()
+            for task_processor_thread in task_processor_threads:
+                task_processor_thread.start()
             result_processor_thread.start()
 
             last_t, last_r = 0, 0
@@ -505,13 +598,19 @@ class EndpointInterchange:
             while not self._quiesce_event.wait(self.heartbeat_period):
                 # Possibly TOCTOU here, but we don't need to be super precise.  The
                 # point here is to mention "still alive" and that we're still working
-                num_t, num_r = num_tasks_forwarded, num_results_forwarded
+                num_t, num_r = sum(tasks_forwarded), num_results_forwarded
                 diff_t, diff_r = num_t - last_t, num_r - last_r
                 log.debug(
                     "Heartbeat.  Approximate Tasks and Results forwarded since last "
-                    "heartbeat: %s (T), %s (R)",
+                    "heartbeat: %s (T), %s (R).  Queued: %s tasks to forward,"
+                    " %s results to publish, %s results awaiting confirmation,"
+                    " %s results stored",
                     diff_t,
                     diff_r,
+                    _queue_depth(self.pending_task_queue),
+                    _queue_depth(self.results_passthrough),
+                    results_publisher.in_flight,
+                    len(self.result_store),
                 )
                 last_t, last_r = num_t, num_r
 
@@ -582,7 +681,8 @@ class EndpointInterchange:
             # quit, then the _quiesce_event is set, and both threads check that event
             # every internal iteration.  But "for kicks."
             stored_processor_thread.join(timeout=5)
-            task_processor_thread.join(timeout=5)
+            for task_processor_thread in task_processor_threads:
+                task_processor_thread.join(timeout=5)
             result_processor_thread.join(timeout=5)
 
             # let higher-level error handling take over if the following excepts
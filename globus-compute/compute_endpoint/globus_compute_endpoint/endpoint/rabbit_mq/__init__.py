@@ -1,10 +1,16 @@
 from .base import RabbitPublisherStatus, SubscriberProcessStatus
+from .pipelined_result_queue_publisher import (
+    PipelinedResultQueuePublisher,
+    PublisherFailedError,
+)
 from .result_queue_publisher import ResultQueuePublisher
 from .task_queue_subscriber import TaskQueueSubscriber
 
 __all__ = (
     "TaskQueueSubscriber",
     "ResultQueuePublisher",
+    "PipelinedResultQueuePublisher",
+    "PublisherFailedError",
     "RabbitPublisherStatus",
     "SubscriberProcessStatus",
 )
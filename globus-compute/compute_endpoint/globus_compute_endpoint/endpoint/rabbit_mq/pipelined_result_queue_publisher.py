@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+import typing as t
+
+import pika
+import pika.exceptions
+import pika.spec
+
+from .base import RabbitPublisherStatus
+
+if t.TYPE_CHECKING:
+    from globus_compute_endpoint.endpoint.result_store import ResultStore
+    from pika.channel import Channel
+    from pika.frame import Method
+
+log = logging.getLogger(__name__)
+
+
+class PublisherFailedError(Exception):
+    """The publisher lost its connection, or could not connect"""
+
+
+class PipelinedResultQueuePublisher(threading.Thread):
+    """Publish results to RabbitMQ with pipelined publisher confirms
+
+    Where the ``ResultQueuePublisher`` waits for the broker to confirm each message
+    before returning from ``publish()`` (capping throughput at one message per
+    round trip), this publisher keeps a bounded window of unconfirmed messages in
+    flight, and settles them as the broker's confirms arrive, tracking them by
+    delivery tag.  ``publish()`` only blocks while the window is full.
+
+    Results the broker rejects (Basic.Nack), and all results still unconfirmed
+    when the connection is lost or closed, are spilled to the ``ResultStore``, to
+    be sent again later.  After a connection loss, ``publish()`` raises
+    ``PublisherFailedError``; as with the ``ResultQueuePublisher``, the caller is
+    expected to reconnect with a new publisher.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_info: dict,
+        result_store: ResultStore | None = None,
+        max_in_flight: int = 256,
+        connect_timeout_s: float = 30,
+        thread_name: str | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        :param queue_info: the AMQP connection credentials, as received from upstream
+        :param result_store: Where to spill results that could not be delivered;
+            if not set, such results are only logged
+        :param max_in_flight: Maximum number of unconfirmed messages; ``publish()``
+            blocks while this many messages await confirmation
+        :param connect_timeout_s: How long ``connect()`` waits for the channel to
+            be ready for publishing
+        :param thread_name: Name the backing thread; default: implementation
+            generated value.
+        """
+        super().__init__(daemon=True)
+        self.queue_info = queue_info
+        self.result_store = result_store
+        self.max_in_flight = max(1, max_in_flight)
+        self.connect_timeout_s = connect_timeout_s
+        if thread_name:
+            self.name = thread_name
+
+        publish_kw = dict(**self.queue_info["queue_publish_kwargs"])
+        if "properties" in publish_kw:
+            publish_kw["properties"] = pika.BasicProperties(**publish_kw["properties"])
+        self._publish_kwargs = publish_kw
+
+        # start closed ("connected" after connect)
+        self.status = RabbitPublisherStatus.closed
+
+        self._connection: pika.SelectConnection | None = None
+        self._channel: Channel | None = None
+        self._ready = threading.Event()
+        self._failure: Exception | None = None
+        self._closing = False
+
+        # (task_id, message) awaiting publication by the ioloop thread
+        self._outgoing: queue.SimpleQueue[
+            tuple[str | None, bytes]
+        ] = queue.SimpleQueue()
+        # delivery tag -> (task_id, message); only touched by the ioloop thread
+        self._unconfirmed: dict[int, tuple[str | None, bytes]] = {}
+        self._delivery_tag = 0
+
+        # count of messages published (via publish()) but not yet settled; guarded
+        # by the condition, which publish() and flush() wait on
+        self._in_flight = 0
+        self._settled = threading.Condition()
+
+        self.num_published = 0
+        self.num_confirmed = 0
+        self.num_nacked = 0
+        self.num_spilled = 0
+
+    def __repr__(self):
+        return "{}<{}; in flight: {}>".format(
+            self.__class__.__name__,
+            "✓" if self.status is RabbitPublisherStatus.connected else "✗",
+            self._in_flight,
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of published messages not yet confirmed (or spilled)"""
+        return self._in_flight
+
+    def __enter__(self):
+        if self.status != RabbitPublisherStatus.connected:
+            self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def connect(self):
+        """Start the ioloop thread, and wait until the channel accepts messages
+
+        Raises: PublisherFailedError if the channel is not ready in time
+        """
+        self.start()
+        with self._settled:
+            ready = self._settled.wait_for(
+                lambda: self._ready.is_set() or self._failure, self.connect_timeout_s
+            )
+        if not ready:
+            self._fail(
+                PublisherFailedError(
+                    f"Channel not ready after {self.connect_timeout_s}s"
+                )
+            )
+        if self._failure:
+            self.close(timeout=0)
+            raise self._failure
+        self.status = RabbitPublisherStatus.connected
+
+    def publish(
+        self, message: bytes, task_id: str | None = None, timeout: float | None = None
+    ) -> None:
+        """Queue message for publication, blocking while the window is full
+
+        The message is confirmed asynchronously; if the broker rejects it or the
+        connection is lost first, and it has a ``task_id``, it is spilled to the
+        result store.
+
+        Raises: PublisherFailedError if the publisher is not connected, or lost its
+            connection; TimeoutError if the window stayed full for ``timeout``
+            seconds
+        """
+        if not self._ready.is_set():
+            raise ValueError("cannot publish() without first calling connect()")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._settled:
+            while self._in_flight >= self.max_in_flight and not self._failure:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"{self.max_in_flight} messages awaiting confirmation"
+                    )
+                self._settled.wait(remaining)
+            if self._failure or self._closing:
+                raise PublisherFailedError("Publisher is not connected") from (
+                    self._failure
+                )
+            self._in_flight += 1
+
+        self._outgoing.put((task_id, message))
+        assert self._connection is not None
+        self._connection.ioloop.add_callback_threadsafe(self._publish_outgoing)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every published message is confirmed or spilled
+
+        Returns True if no messages remain in flight.
+        """
+        with self._settled:
+            self._settled.wait_for(lambda: not self._in_flight, timeout)
+            return not self._in_flight
+
+    def close(self, timeout: float | None = 10) -> None:
+        """Wait (up to ``timeout`` seconds) for outstanding confirms, then close
+
+        Messages still unconfirmed when the connection closes are spilled.
+        """
+        if self._ready.is_set() and not self._failure:
+            if not self.flush(timeout):
+                log.warning(
+                    "%s Closing with %s messages unconfirmed", self, self._in_flight
+                )
+        with self._settled:
+            self._closing = True
+
+        if self._connection and self.is_alive():
+            try:
+                self._connection.ioloop.add_callback_threadsafe(self._close_connection)
+            except Exception as e:
+                log.debug("%s Unable to schedule close: %s", self, e)
+            self.join(timeout=5)
+        self._spill_unconfirmed()
+        self.status = RabbitPublisherStatus.closed
+
+    def run(self):
+        log.debug("%s AMQP thread begins", self)
+        try:
+            self._connection = self._connect()
+            self._connection.ioloop.start()
+        except Exception as e:
+            log.exception("%s Unhandled exception: shutting down connection.", self)
+            self._fail(e)
+        log.debug("%s Shutdown complete", self)
+
+    def _connect(self) -> pika.SelectConnection:
+        pika_params = pika.URLParameters(self.queue_info["connection_url"])
+        return pika.SelectConnection(
+            pika_params,
+            on_open_callback=self._on_connection_open,
+            on_open_error_callback=self._on_open_failed,
+            on_close_callback=self._on_connection_closed,
+        )
+
+    def _on_open_failed(self, mq_conn: pika.BaseConnection, exc: str | Exception):
+        log.warning("%s Failed to open connection: %s", self, exc)
+        self._fail(PublisherFailedError(f"Failed to open connection: {exc}"))
+        mq_conn.ioloop.stop()
+
+    def _on_connection_open(self, mq_conn: pika.BaseConnection):
+        log.debug("%s Connection established; creating channel", self)
+        mq_conn.channel(on_open_callback=self._on_channel_open)
+
+    def _on_connection_closed(self, mq_conn: pika.BaseConnection, exc: Exception):
+        if self._closing:
+            log.debug("%s Connection closed: %s", self, exc)
+        else:
+            log.warning("%s Connection lost: %s", self, exc)
+            self._fail(PublisherFailedError(f"Connection lost: {exc}"))
+        self._channel = None
+        self._spill_unconfirmed()
+        mq_conn.ioloop.stop()
+
+    def _on_channel_open(self, mq_chan: Channel):
+        self._channel = mq_chan
+        mq_chan.add_on_close_callback(self._on_channel_closed)
+        mq_chan.add_on_return_callback(self._on_message_returned)
+        mq_chan.exchange_declare(
+            passive=True,  # *we* don't create the exchange
+            exchange=self.queue_info["exchange"],
+            callback=self._on_exchange_declareok,
+        )
+
+    def _on_exchange_declareok(self, _frame: Method):
+        assert self._channel is not None
+        self._channel.queue_declare(
+            passive=True,  # *we* don't create the queue
+            queue=self.queue_info["queue"],
+            callback=self._on_queue_declareok,
+        )
+
+    def _on_queue_declareok(self, _frame: Method):
+        assert self._channel is not None
+        self._channel.confirm_delivery(
+            ack_nack_callback=self._on_delivery_confirmation,
+            callback=self._on_confirm_selectok,
+        )
+
+    def _on_confirm_selectok(self, _frame: Method):
+        log.debug("%s Channel ready for publishing", self)
+        self._delivery_tag = 0
+        with self._settled:
+            self._ready.set()
+            self._settled.notify_all()
+        self._publish_outgoing()
+
+    def _on_channel_closed(self, mq_chan: Channel, exc: Exception):
+        self._channel = None
+        if not self._closing:
+            log.warning("%s Channel closed: %s", self, exc)
+            self._fail(PublisherFailedError(f"Channel closed: {exc}"))
+        self._spill_unconfirmed()
+        conn = mq_chan.connection
+        if conn.is_open:
+            conn.close()
+        elif not self._ready.is_set():
+            conn.ioloop.stop()
+
+    def _on_message_returned(self, _chan, method, _props, _body):
+        log.error(
+            "%s Message returned by broker as unroutable: (%s) %s",
+            self,
+            method.reply_code,
+            method.reply_text,
+        )
+
+    def _publish_outgoing(self):
+        """Publish queued messages; runs in the ioloop thread"""
+        if not self._channel or not self._ready.is_set():
+            return
+        while True:
+            try:
+                task_id, message = self._outgoing.get(block=False)
+            except queue.Empty:
+                break
+            try:
+                self._channel.basic_publish(body=message, **self._publish_kwargs)
+            except Exception as e:
+                log.error("%s Unable to publish message: %s", self, e)
+                self._spill(task_id, message)
+                self._settle(1)
+                continue
+            self._delivery_tag += 1
+            self._unconfirmed[self._delivery_tag] = (task_id, message)
+            self.num_published += 1
+
+    def _on_delivery_confirmation(self, frame: Method):
+        """Settle the confirmed (or rejected) messages; runs in the ioloop thread"""
+        method = frame.method
+        acked = isinstance(method, pika.spec.Basic.Ack)
+        if method.multiple:
+            tags = [tag for tag in self._unconfirmed if tag <= method.delivery_tag]
+        else:
+            tags = [method.delivery_tag]
+
+        settled = 0
+        for tag in tags:
+            entry = self._unconfirmed.pop(tag, None)
+            if entry is None:
+                continue
+            settled += 1
+            if acked:
+                self.num_confirmed += 1
+            else:
+                self.num_nacked += 1
+                task_id, message = entry
+                log.warning("%s Broker rejected message for task %s", self, task_id)
+                self._spill(task_id, message)
+        self._settle(settled)
+
+    def _settle(self, count: int):
+        if count:
+            with self._settled:
+                self._in_flight -= count
+                self._settled.notify_all()
+
+    def _spill(self, task_id: str | None, message: bytes):
+        if not task_id:
+            log.warning("%s Dropping undelivered message (no task id)", self)
+            return
+        if self.result_store is None:
+            log.error("%s Unable to deliver result for task %s", self, task_id)
+            return
+        log.info("%s Storing result for later: %s", self, task_id)
+        self.result_store[task_id] = message
+        self.num_spilled += 1
+
+    def _spill_unconfirmed(self):
+        """Spill all unsettled messages: those unconfirmed, and those not sent"""
+        pending = list(self._unconfirmed.values())
+        self._unconfirmed.clear()
+        while True:
+            try:
+                pending.append(self._outgoing.get(block=False))
+            except queue.Empty:
+                break
+        for task_id, message in pending:
+            self._spill(task_id, message)
+        self._settle(len(pending))
+
+    def _fail(self, exc: Exception):
+        with self._settled:
+            self._failure = self._failure or exc
+            self._settled.notify_all()
+        self.status = RabbitPublisherStatus.closed
+
+    def _close_connection(self):
+        if self._connection and self._connection.is_open:
+            self._connection.close()
+        elif self._connection:
+            self._connection.ioloop.stop()
@@ -36,6 +36,8 @@ class TaskQueueSubscriber(multiprocessing.Process):
         queue_info: dict,
         external_queue: multiprocessing.Queue,
         quiesce_event: EventType,
+        prefetch_count: int = 0,
+        exclusive: bool = True,
     ):
         """
 
@@ -54,6 +56,19 @@ class TaskQueueSubscriber(multiprocessing.Process):
              This event is used to communicate a failure on the subscriber
 
         endpoint_id: endpoint uuid string
+
+        prefetch_count: int
+             Maximum number of unacknowledged messages RabbitMQ will deliver to
+             this subscriber (``basic_qos``); 0 for no limit.  With more than
+             one subscriber on a queue, this is what balances messages between
+             them.
+             Default: 0
+
+        exclusive: bool
+             Consume the queue exclusively; RabbitMQ then refuses any other
+             consumer, such as another instance of the same endpoint.  Must be
+             False if more than one subscriber consumes the queue.
+             Default: True
         """
 
         super().__init__()
@@ -63,12 +78,15 @@ class TaskQueueSubscriber(multiprocessing.Process):
         self.queue_info = queue_info
         self.external_queue = external_queue
         self.quiesce_event = quiesce_event
+        self.prefetch_count = max(0, prefetch_count)
+        self.exclusive = exclusive
         self._channel_closed = multiprocessing.Event()
         self._cleanup_complete = multiprocessing.Event()
 
         self._connection: pika.SelectConnection | None = None
         self._channel: pika.channel.Channel | None = None
         self._consumer_tag: str | None = None
+        self._ack_through = 0  # latest delivery tag not yet acknowledged
 
         self._watcher_poll_period = 0.1  # seconds
         logger.debug("Init done")
@@ -179,6 +197,7 @@ class TaskQueueSubscriber(multiprocessing.Process):
             logger.debug("Detected channel closed by client")
         else:
             logger.exception("Channel closed by unhandled exception.")
+        self._ack_through = 0  # unacknowledged messages will be redelivered
         logger.debug("marking channel as closed")
         self._channel_closed.set()
 
@@ -198,7 +217,15 @@ class TaskQueueSubscriber(multiprocessing.Process):
         )
 
     def _on_queue_declareok(self, _frame: pika.frame.Method):
-        self.start_consuming()
+        if self.prefetch_count:
+            assert self._channel is not None
+            logger.info(f"Setting prefetch count: {self.prefetch_count}")
+            self._channel.basic_qos(
+                prefetch_count=self.prefetch_count,
+                callback=lambda _frame: self.start_consuming(),
+            )
+        else:
+            self.start_consuming()
 
     def start_consuming(self):
         """This method sets up the consumer by first calling
@@ -214,7 +241,7 @@ class TaskQueueSubscriber(multiprocessing.Process):
         self._consumer_tag = self._channel.basic_consume(
             queue=self.queue_info["queue"],
             on_message_callback=self.on_message,
-            exclusive=True,
+            exclusive=self.exclusive,
         )
 
     def on_consumer_cancelled(self, method_frame):
@@ -241,6 +268,10 @@ class TaskQueueSubscriber(multiprocessing.Process):
         a redelivered flag for the message. The properties passed in is an
         instance of BasicProperties with the message properties and the body
         is the message that was sent.
+
+        Messages are acknowledged in bulk: the first message to arrive schedules
+        an acknowledgement, sent once pika has dispatched the other messages it
+        read from the socket at the same time.
         """
         logger.debug(
             "Received message from %s: %s, %s",
@@ -259,8 +290,16 @@ class TaskQueueSubscriber(multiprocessing.Process):
             logger.exception("External queue put failed")
             channel.basic_nack(basic_deliver.delivery_tag, requeue=True)
         else:
-            channel.basic_ack(basic_deliver.delivery_tag)
-            logger.debug("Acknowledged message: %s", basic_deliver.delivery_tag)
+            if not self._ack_through:
+                channel.connection.ioloop.add_callback(self._ack_received)
+            self._ack_through = max(self._ack_through, basic_deliver.delivery_tag)
+
+    def _ack_received(self):
+        """Acknowledge every message put to the external queue so far"""
+        delivery_tag, self._ack_through = self._ack_through, 0
+        if delivery_tag and self._channel and self._channel.is_open:
+            self._channel.basic_ack(delivery_tag, multiple=True)
+            logger.debug("Acknowledged through message: %s", delivery_tag)
 
     def stop_consuming(self):
         """Tell RabbitMQ that you would like to stop consuming by sending the
@@ -1,9 +1,40 @@
 from __future__ import annotations
 
+import logging
 import os
 import pathlib
-import sys
+import re
+import struct
+import threading
+import time
 import typing as t
+import zlib
+
+log = logging.getLogger(__name__)
+
+# Record layout: crc32 (of everything after it), record type, key length, payload
+# length; then the key and the payload
+_HEADER = struct.Struct("!IBHI")
+_CRC = struct.Struct("!I")
+_RECORD_INFO = struct.Struct("!BHI")
+_PUT = 1
+_DELETE = 2
+
+_SEGMENT_RE = re.compile(r"^segment-(\d{8})\.log$")
+
+
+def _unlink(path: pathlib.Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class _IndexEntry(t.NamedTuple):
+    segment: int
+    offset: int  # of the payload, within the segment
+    length: int  # of the payload
+    record_size: int  # of the whole record (header, key, and payload)
 
 
 class ResultStore:
@@ -11,9 +42,18 @@ class ResultStore:
     Persists bytes to disk by key via a dict()-like API.
 
     The ResultStore is a generic byte-storage data structure that stores and
-    retrieves bytes to the filesystem.  Each payload is stored on the
-    filesystem as a single file, named by the associated key.  Payloads are
-    stored in a subdirectory of the init path, named "unacked_results".
+    retrieves bytes to the filesystem.  Payloads are appended to a log of
+    segment files (``segment-00000001.log``, ...) in a subdirectory of the init
+    path, named "unacked_results".  An in-memory index maps each key to the
+    location of its payload, so lookups and iteration never scan the directory;
+    the index is rebuilt by reading the segments when the store is opened.
+    Removing a key appends a tombstone record.  Segments that no longer hold any
+    live payloads are deleted, and once removed payloads take two thirds of the
+    log, the live payloads are rewritten to a fresh segment (compacted).
+
+    Writes are flushed to the operating system immediately, but only ``fsync``-ed
+    once every ``fsync_interval_s`` seconds (or via ``.sync()`` or ``.close()``), so
+    that a burst of stored results shares a single ``fsync``.
 
     A typical interaction might look like:
 
@@ -25,9 +65,11 @@ class ResultStore:
         >>> stored_bytes = rs["some_key_01"]  # raises if key does not exist
         >>> stored_bytes = rs.get("some_key_01")  # returns None if key doesn't exist
 
-    Iterate all currently stored items via iteration:
+    Iterate all currently stored items via iteration, or at a bounded rate via
+    ``.replay()``:
 
         >>> for key_str, stored_bytes in rs:
+        >>> for key_str, stored_bytes in rs.replay(max_per_second=1000):
 
     Discard stored items via `.pop()`, `.remove()`, or `.discard()`
 
@@ -35,16 +77,40 @@ class ResultStore:
         >>> rs.pop("some_key_01")  # will raise as key does not exist
         >>> rs.discard("some_key_02")  # will not raise if key does not exist
 
-    Completely empty the ResultStore with `.clear()`.  All non-hidden files
-    (those not beginning with a dot) in the unacked_results directory will be
-    removed from the filesystem.
+    Completely empty the ResultStore with `.clear()`, which removes the segment
+    files from the filesystem.
 
         >>> rs.clear()
+
+    Results stored by prior versions (one file per result, named by key) are
+    imported into the log when the store is opened, and their files removed.
+
+    No file is held open between calls, as the store may be created before the
+    endpoint daemonizes (which closes all open file descriptors).
     """
 
-    def __init__(self, endpoint_dir: str | pathlib.Path):
+    def __init__(
+        self,
+        endpoint_dir: str | pathlib.Path,
+        *,
+        segment_size: int = 64 * 1024 * 1024,
+        fsync_interval_s: float = 0.5,
+        compact_min_bytes: int = 1024 * 1024,
+    ):
+        """
+        :param endpoint_dir: The directory in which to create "unacked_results"
+        :param segment_size: Start a new segment once the current one reaches
+            this many bytes
+        :param fsync_interval_s: Minimum time between ``fsync`` calls; 0 to
+            ``fsync`` every write
+        :param compact_min_bytes: Do not compact while fewer than this many bytes
+            are taken by removed payloads
+        """
         self.data_path = pathlib.Path(endpoint_dir) / "unacked_results"
         self.data_path.mkdir(exist_ok=True)
+        self.segment_size = segment_size
+        self.fsync_interval_s = fsync_interval_s
+        self.compact_min_bytes = compact_min_bytes
 
         self.data_path.chmod(mode=0o0700)
         test_path = self.data_path / ".test-reading-and-writing.txt"
@@ -57,27 +123,62 @@ class ResultStore:
             raise PermissionError(msg)
         test_path.unlink()
 
+        self._lock = threading.RLock()
+        self._index: dict[str, _IndexEntry] = {}
+        self._segment_live: dict[int, int] = {}  # segment -> count of live payloads
+        self._live_bytes = 0
+        self._dead_bytes = 0
+        self._active_segment = 0
+        self._active_size = 0
+        self._unsynced = False
+        self._last_sync = 0.0
+
+        # opened lazily, in the process using the store
+        self._pid = 0
+        self._writer: t.BinaryIO | None = None
+        self._readers: dict[int, t.BinaryIO] = {}
+
+        self._load()
+
     def __contains__(self, key: str) -> bool:
-        normpath = os.path.normpath(key)
-        return (self.data_path / normpath).exists()
+        return key in self._index
+
+    def __iter__(self) -> t.Iterator[tuple[str, bytes]]:
+        return self.replay()
 
-    def __iter__(self) -> t.Iterable[tuple[str, bytes]]:
-        for rp in self._iter_result_paths():
-            yield rp.name, rp.read_bytes()
+    def __len__(self) -> int:
+        return len(self._index)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(data_dir: {self.data_path})"
 
-    def __getitem__(self, key):
-        rp = self.data_path / key
-        return rp.read_bytes()
+    def __getitem__(self, key: str) -> bytes:
+        """
+        Raises
+        ------
+        FileNotFoundError when there is no payload for key
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                raise FileNotFoundError(f"No stored result for key: {key}")
+            reader = self._reader(entry.segment)
+            reader.seek(entry.offset)
+            return reader.read(entry.length)
 
     def __setitem__(self, key: str, payload: bytes) -> None:
         """
-        Store bytes to disk by filename 'key'
+        Append payload for 'key' to the log
         """
-        result_path = self.data_path / os.path.normpath(key)
-        result_path.write_bytes(payload)
+        with self._lock:
+            segment, offset, record_size = self._append(_PUT, key, payload)
+            prior = self._index.get(key)
+            if prior is not None:
+                self._forget(prior)
+            self._index[key] = _IndexEntry(segment, offset, len(payload), record_size)
+            self._segment_live[segment] = self._segment_live.get(segment, 0) + 1
+            self._live_bytes += record_size
+            self._sync_if_due()
 
     def __delitem__(self, key: str) -> None:
         """
@@ -85,81 +186,330 @@ class ResultStore:
 
         If there is no payload for key, raise a FileNotFoundError.
         """
-        (self.data_path / key).unlink()
+        with self._lock:
+            entry = self._index.pop(key, None)
+            if entry is None:
+                raise FileNotFoundError(f"No stored result for key: {key}")
+            self._forget(entry)
+            if self._index:
+                _seg, _offset, record_size = self._append(_DELETE, key, b"")
+                self._dead_bytes += record_size
+                self._sync_if_due()
+            self._maybe_compact()
 
     def discard(self, key: str) -> None:
         """
-        Discard the requested task result.  Will not raise if backing file does
-        not exist.
+        Discard the requested task result.  Will not raise if there is no result
+        for key.
 
         Parameters
         ----------
         key - the key for the result
         """
-        if sys.version_info < (3, 8):
-            try:
-                (self.data_path / key).unlink()
-            except FileNotFoundError:
-                pass
-        else:
-            (self.data_path / key).unlink(missing_ok=True)
-
-    def _iter_result_paths(self) -> t.Iterable[pathlib.Path]:
-        yield from self.data_path.glob("[!.]*")
+        try:
+            del self[key]
+        except FileNotFoundError:
+            pass
 
     def get(self, key: str, default=None) -> bytes:
         """
-        Retrieve result from the data directory.
-
-        Raises
-        ------
-        FileNotFoundError when backing file does not exist
+        Retrieve result from the store.
 
         Returns
         -------
-        message
+        message, or default if there is no result for key
         """
         try:
-            rp = self.data_path / key
-            return rp.read_bytes()
+            return self[key]
         except FileNotFoundError:
             return default
 
     def pop(self, key: str, *args, **kwargs) -> bytes:
         """
-        Retrieve and remove a result from the data directory.
+        Retrieve and remove a result from the store.
 
         Raises
         ------
-        FileNotFoundError when backing file does not exist
+        FileNotFoundError when there is no result for key (and no default)
 
         Returns
         -------
         message
         """
-        try:
-            payload = self[key]
-            self.discard(key)
+        with self._lock:
+            try:
+                payload = self[key]
+            except FileNotFoundError:
+                if args:
+                    return args[0]
+                elif "default" in kwargs:
+                    return kwargs["default"]
+                raise
+            del self[key]
             return payload
-        except FileNotFoundError:
-            if args:
-                return args[0]
-            elif "default" in kwargs:
-                return kwargs["default"]
-            raise
+
+    def replay(
+        self, max_per_second: float | None = None
+    ) -> t.Iterator[tuple[str, bytes]]:
+        """
+        Iterate the stored items, from the in-memory index (no directory scan).
+
+        Keys are snapshotted when iteration begins; items removed since are
+        skipped, and items stored since are not included.
+
+        :param max_per_second: If set, yield at most this many items per second,
+            so that a large backlog (e.g., after reconnecting) is forwarded at a
+            bounded rate
+        """
+        with self._lock:
+            keys = list(self._index)
+        interval = 1 / max_per_second if max_per_second else 0.0
+        next_at = time.monotonic()
+        for key in keys:
+            try:
+                payload = self[key]
+            except FileNotFoundError:
+                continue  # removed since the snapshot
+            if interval:
+                now = time.monotonic()
+                if next_at > now:
+                    time.sleep(next_at - now)
+                next_at = max(next_at, now) + interval
+            yield key, payload
 
     def clear(self) -> None:
         """
-        Remove all stored items from the storage directory.  This iterates the
-        storage for all non-hidden files (those that don't begin with a dot)
-        and safely unlinks them.
-        """
-        if sys.version_info < (3, 8):
-            for result_path in self._iter_result_paths():
-                try:
-                    result_path.unlink()
-                except FileNotFoundError:
-                    pass
-        else:
-            for result_path in self._iter_result_paths():
-                result_path.unlink(missing_ok=True)
+        Remove all stored items, and the segment files from the storage directory.
+        """
+        with self._lock:
+            self._reset()
+
+    def sync(self) -> None:
+        """
+        ``fsync`` any writes not yet synced to disk
+        """
+        with self._lock:
+            if self._unsynced and self._writer is not None:
+                self._writer.flush()
+                os.fsync(self._writer.fileno())
+            self._unsynced = False
+            self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Sync outstanding writes, and close the open segment files.  The store
+        reopens them if used again.
+        """
+        with self._lock:
+            self.sync()
+            self._close_files()
+
+    def _segment_path(self, segment: int) -> pathlib.Path:
+        return self.data_path / f"segment-{segment:08d}.log"
+
+    def _segments(self) -> list[int]:
+        return sorted(self._segment_live)
+
+    def _check_pid(self):
+        # open files are not shared with a forked (or daemonized) process
+        if self._pid != os.getpid():
+            self._writer = None
+            self._readers = {}
+            self._pid = os.getpid()
+
+    def _reader(self, segment: int) -> t.BinaryIO:
+        self._check_pid()
+        reader = self._readers.get(segment)
+        if reader is None:
+            if segment == self._active_segment and self._writer is not None:
+                self._writer.flush()
+            reader = open(self._segment_path(segment), "rb")
+            self._readers[segment] = reader
+        return reader
+
+    def _append(self, rtype: int, key: str, payload: bytes) -> tuple[int, int, int]:
+        """Append a record to the active segment
+
+        Returns the segment, the offset of the payload within it, and the size of
+        the record
+        """
+        self._check_pid()
+        if self._writer is None or self._active_size >= self.segment_size:
+            self._roll()
+        assert self._writer is not None
+
+        key_b = key.encode()
+        body = _RECORD_INFO.pack(rtype, len(key_b), len(payload)) + key_b
+        crc = zlib.crc32(payload, zlib.crc32(body))
+        self._writer.write(_CRC.pack(crc) + body)
+        self._writer.write(payload)
+        self._writer.flush()
+
+        record_size = _HEADER.size + len(key_b) + len(payload)
+        offset = self._active_size + _HEADER.size + len(key_b)
+        self._active_size += record_size
+        self._unsynced = True
+        return self._active_segment, offset, record_size
+
+    def _roll(self):
+        """Open the active segment for appending; start a new one if it is full"""
+        if self._writer is not None:
+            self.sync()
+            self._writer.close()
+            self._writer = None
+        if not self._active_segment or self._active_size >= self.segment_size:
+            self._active_segment += 1
+            self._active_size = 0
+
+        self._segment_live.setdefault(self._active_segment, 0)
+        path = self._segment_path(self._active_segment)
+        self._writer = open(path, "ab")
+        os.chmod(path, 0o600)
+
+    def _sync_if_due(self):
+        if time.monotonic() - self._last_sync >= self.fsync_interval_s:
+            self.sync()
+
+    def _forget(self, entry: _IndexEntry):
+        self._segment_live[entry.segment] -= 1
+        self._live_bytes -= entry.record_size
+        self._dead_bytes += entry.record_size
+
+    def _maybe_compact(self):
+        if not self._index:
+            self._reset()
+            return
+
+        # Tombstones in a segment may refer to payloads in earlier segments, so
+        # only the oldest segments are safe to delete outright
+        for segment in self._segments():
+            if segment == self._active_segment or self._segment_live[segment]:
+                break
+            self._delete_segment(segment)
+
+        # Compact once removed payloads take two thirds of the log; a lower
+        # threshold rewrites much of a backlog that is about to drain anyway
+        if self._dead_bytes >= max(2 * self._live_bytes, self.compact_min_bytes):
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the live payloads into fresh segments, and delete the rest"""
+        old_segments = self._segments()
+        log.debug(
+            "Compacting %s segments (%s live bytes, %s dead bytes)",
+            len(old_segments),
+            self._live_bytes,
+            self._dead_bytes,
+        )
+        live = [(key, self[key]) for key in self._index]
+
+        self.sync()
+        self._close_files()
+        self._index.clear()
+        self._segment_live.clear()
+        self._live_bytes = self._dead_bytes = 0
+        self._active_segment = old_segments[-1] + 1 if old_segments else 1
+        self._active_size = 0
+
+        for key, payload in live:
+            self[key] = payload
+        self.sync()
+
+        for segment in old_segments:
+            _unlink(self._segment_path(segment))
+
+    def _delete_segment(self, segment: int):
+        reader = self._readers.pop(segment, None)
+        if reader is not None:
+            reader.close()
+        del self._segment_live[segment]
+        _unlink(self._segment_path(segment))
+
+    def _reset(self):
+        """Remove every segment; the next write starts a fresh log"""
+        self._close_files()
+        for segment in self._segments():
+            _unlink(self._segment_path(segment))
+        self._index.clear()
+        self._segment_live.clear()
+        self._live_bytes = self._dead_bytes = 0
+        self._active_segment = 0
+        self._active_size = 0
+        self._unsynced = False
+
+    def _close_files(self):
+        self._check_pid()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    def _load(self):
+        """Rebuild the index from the segments, and import legacy result files"""
+        legacy: list[pathlib.Path] = []
+        for path in self.data_path.iterdir():
+            m = _SEGMENT_RE.match(path.name)
+            if m:
+                self._segment_live[int(m.group(1))] = 0
+            elif not path.name.startswith(".") and path.is_file():
+                legacy.append(path)
+
+        for segment in self._segments():
+            self._load_segment(segment)
+        if self._segment_live:
+            self._active_segment = self._segments()[-1]
+            self._active_size = self._segment_path(self._active_segment).stat().st_size
+
+        if legacy:
+            log.info("Importing %s results stored by a prior version", len(legacy))
+            for path in legacy:
+                self[path.name] = path.read_bytes()
+            self.sync()
+            for path in legacy:
+                path.unlink()
+
+        self._maybe_compact()
+        self._close_files()
+
+    def _load_segment(self, segment: int):
+        path = self._segment_path(segment)
+        data = path.read_bytes()
+        pos = 0
+        while pos < len(data):
+            if pos + _HEADER.size > len(data):
+                break
+            crc, rtype, key_len, payload_len = _HEADER.unpack_from(data, pos)
+            end = pos + _HEADER.size + key_len + payload_len
+            if end > len(data) or crc != zlib.crc32(data[pos + 4 : end]):
+                break
+
+            key_start = pos + _HEADER.size
+            key = data[key_start : key_start + key_len].decode()
+            prior = self._index.pop(key, None)
+            if prior is not None:
+                self._forget(prior)
+            record_size = end - pos
+            if rtype == _PUT:
+                entry = _IndexEntry(
+                    segment, key_start + key_len, payload_len, end - pos
+                )
+                self._index[key] = entry
+                self._segment_live[segment] += 1
+                self._live_bytes += record_size
+            else:
+                self._dead_bytes += record_size
+            pos = end
+
+        if pos < len(data):
+            # a torn write (e.g., the endpoint was killed mid-append); records
+            # after it cannot be trusted, so drop them
+            log.warning(
+                "Truncating %s at byte %s of %s: incomplete or corrupt record",
+                path,
+                pos,
+                len(data),
+            )
+            with open(path, "r+b") as f:
+                f.truncate(pos)
@@ -71,6 +71,30 @@ class Config(RepresentationMixin):
         suggest 5760.
         Default: 5760
 
+    task_queue_consumers: int (count)
+        Number of processes consuming tasks from the Globus Compute service.  A
+        single consumer has exclusive use of the endpoint's task queue, so that a
+        second instance of the endpoint cannot also consume it; with more than
+        one consumer, that protection is not available.
+        Default: 1
+
+    task_queue_prefetch: int (count)
+        Maximum number of tasks the Globus Compute service sends each consumer
+        ahead of its acknowledgements.  With more than one consumer, this
+        balances tasks between them.  If 0, no limit.
+        Default: 1024
+
+    task_decoders: int (count)
+        Number of threads unpacking incoming tasks and handing them to the
+        executor.
+        Default: 2
+
+    task_submit_batch_size: int (count)
+        Maximum number of incoming tasks a decoder thread hands to the executor
+        at once.  Only the tasks already waiting are batched, so a task is never
+        held back to fill a batch.
+        Default: 256
+
     stdout : str
         Path where the endpoint's stdout should be written
         Default: ./interchange.stdout
@@ -110,6 +134,10 @@ class Config(RepresentationMixin):
         heartbeat_threshold=120,
         idle_heartbeats_soft=0,
         idle_heartbeats_hard=5760,  # Two days, divided by `heartbeat_period`
+        task_queue_consumers: int = 1,
+        task_queue_prefetch: int = 1024,
+        task_decoders: int = 2,
+        task_submit_batch_size: int = 256,
         detach_endpoint=True,
         # Misc info
         display_name: str | None = None,
@@ -154,6 +182,10 @@ class Config(RepresentationMixin):
         self.heartbeat_threshold = heartbeat_threshold
         self.idle_heartbeats_soft = int(max(0, idle_heartbeats_soft))
         self.idle_heartbeats_hard = int(max(0, idle_heartbeats_hard))
+        self.task_queue_consumers = int(max(1, task_queue_consumers))
+        self.task_queue_prefetch = int(max(0, task_queue_prefetch))
+        self.task_decoders = int(max(1, task_decoders))
+        self.task_submit_batch_size = int(max(1, task_submit_batch_size))
         self.detach_endpoint = detach_endpoint
 
         # Logging info
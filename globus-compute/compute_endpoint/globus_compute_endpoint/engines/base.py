@@ -14,7 +14,7 @@ from globus_compute_common.messagepack.message_types import (
     TaskTransition,
 )
 from globus_compute_common.tasks import ActorName, TaskState
-from globus_compute_endpoint.engines.helper import execute_task
+from globus_compute_endpoint.engines.helper import execute_task, execute_task_batch
 from globus_compute_endpoint.exception_handling import (
     get_error_string,
     get_result_error_details,
@@ -124,27 +124,57 @@ class GlobusComputeEngineBase(ABC):
         future: Future for which the callback is triggerd
         """
 
-        if future.exception():
-            code, user_message = get_result_error_details()
-            error_details = {"code": code, "user_message": user_message}
-            exec_end = TaskTransition(
-                timestamp=time.time_ns(),
-                state=TaskState.EXEC_END,
-                actor=ActorName.WORKER,
-            )
-            result_message = dict(
-                task_id=future.task_id,  # type: ignore
-                data=get_error_string(),
-                exception=get_error_string(),
-                error_details=error_details,
-                task_statuses=[exec_end],  # We don't have any more info transitions
-            )
-            packed_result = messagepack.pack(Result(**result_message))
+        exc = future.exception()
+        if exc:
+            task_id = future.task_id  # type: ignore
+            packed_result = self._pack_failed_result(task_id, exc)
         else:
             packed_result = future.result()
 
         self.results_passthrough.put(packed_result)
 
+    def _batch_done_callback(self, future: Future):
+        """Callback to post the results of a batch to the passthrough queue,
+        together, as a list
+        Parameters
+        ----------
+        future: Future of the batch, for which the callback is triggered
+        """
+        exc = future.exception()
+        if exc:
+            packed_results = [
+                self._pack_failed_result(task_id, exc)
+                for task_id in future.task_ids  # type: ignore
+            ]
+        else:
+            packed_results = future.result()
+
+        self.results_passthrough.put(packed_results)
+
+    @staticmethod
+    def _pack_failed_result(task_id: uuid.UUID, exc: BaseException) -> bytes:
+        # The error helpers read sys.exc_info(), which is only set while the
+        # exception is being handled; done-callbacks may run outside of that
+        try:
+            raise exc
+        except BaseException:
+            code, user_message = get_result_error_details()
+            error_string = get_error_string()
+        error_details = {"code": code, "user_message": user_message}
+        exec_end = TaskTransition(
+            timestamp=time.time_ns(),
+            state=TaskState.EXEC_END,
+            actor=ActorName.WORKER,
+        )
+        result_message = dict(
+            task_id=task_id,
+            data=error_string,
+            exception=error_string,
+            error_details=error_details,
+            task_statuses=[exec_end],  # We don't have any more info transitions
+        )
+        return messagepack.pack(Result(**result_message))
+
     @abstractmethod
     def _submit(
         self,
@@ -174,3 +204,23 @@ class GlobusComputeEngineBase(ABC):
         future.task_id = task_id  # type: ignore
         future.add_done_callback(self._future_done_callback)
         return future
+
+    def submit_batch(self, tasks: t.Sequence[t.Tuple[uuid.UUID, bytes]]) -> Future:
+        """Submit several tasks with one dispatch to the execution backend, to
+        keep the per-task overhead small at high task rates.  The tasks run one
+        after another, in a single worker, so batch only short tasks.
+        Parameters
+        ----------
+        tasks: (task_id, packed_task) pairs, as given to ``submit``
+        Returns
+        -------
+        future of the list of packed results.  The results are put on the
+        passthrough queue together, as one list, when the last task completes.
+        """
+        task_ids = [task_id for task_id, _ in tasks]
+        future: Future = self._submit(
+            execute_task_batch, [packed_task for _, packed_task in tasks]
+        )
+        future.task_ids = task_ids  # type: ignore
+        future.add_done_callback(self._batch_done_callback)
+        return future
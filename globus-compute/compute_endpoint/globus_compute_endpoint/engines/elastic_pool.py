@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import collections
+import itertools
+import logging
+import threading
+import time
+import typing as t
+from concurrent.futures import BrokenExecutor, CancelledError, Executor, Future
+
+from globus_compute_endpoint.logging_config import ComputeLogger
+
+logger: ComputeLogger = logging.getLogger(__name__)  # type: ignore
+
+
+def _noop() -> None:
+    pass
+
+
+class _Worker:
+    __slots__ = ("worker_id", "executor", "busy", "idle_since")
+
+    def __init__(self, worker_id: str, executor: Executor):
+        self.worker_id = worker_id
+        self.executor = executor
+        self.busy = False
+        self.idle_since = time.monotonic()
+
+
+class ElasticPool(Executor):
+    """A pool of workers that grows while tasks are queued and shrinks when idle
+
+    Each worker is a single-worker native executor (e.g., a
+    ``ProcessPoolExecutor(max_workers=1)``) that runs one task at a time, so the
+    same pool serves both processes and threads.  A dispatcher thread hands the
+    queued tasks to idle workers, starting new workers (up to ``max_workers``)
+    while tasks are waiting, and stops the workers that have been idle for
+    ``max_idletime`` seconds (down to ``min_workers``).
+    """
+
+    def __init__(
+        self,
+        executor_factory: t.Callable[..., Executor],
+        max_workers: int,
+        *,
+        min_workers: int = 0,
+        max_idletime: float = 60.0,
+        **executor_kwargs: t.Any,
+    ):
+        """
+        Parameters
+        ----------
+        executor_factory: Callable[..., Executor]
+            Creates a worker, as ``executor_factory(max_workers=1, **executor_kwargs)``
+
+        max_workers: int
+            Maximum number of workers to run at once
+
+        min_workers: int
+            Number of workers to keep, even when idle.
+            Default: 0
+
+        max_idletime: float
+            Seconds after which an idle worker (beyond ``min_workers``) is stopped.
+            Default: 60
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive (got {max_workers})")
+        if not 0 <= min_workers <= max_workers:
+            raise ValueError(
+                f"min_workers must be between 0 and max_workers (got {min_workers})"
+            )
+        self.max_workers = max_workers
+        self.min_workers = min_workers
+        self.max_idletime = max_idletime
+        self._executor_factory = executor_factory
+        self._executor_kwargs = executor_kwargs
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending: t.Deque[
+            tuple[Future, t.Callable, tuple, dict]
+        ] = collections.deque()
+        self._workers: dict[str, _Worker] = {}
+        self._worker_ids = itertools.count()
+        self._shutdown = False
+        self._dispatcher: threading.Thread | None = None
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(workers={len(self._workers)},"
+            f" min_workers={self.min_workers}, max_workers={self.max_workers})"
+        )
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    @property
+    def num_idle_workers(self) -> int:
+        return sum(1 for w in list(self._workers.values()) if not w.busy)
+
+    @property
+    def num_pending_tasks(self) -> int:
+        """Tasks waiting for a worker"""
+        return len(self._pending)
+
+    @property
+    def num_outstanding_tasks(self) -> int:
+        """Tasks waiting for a worker or running"""
+        busy = sum(1 for w in list(self._workers.values()) if w.busy)
+        return len(self._pending) + busy
+
+    def submit(self, fn, *args, **kwargs) -> Future:  # type: ignore[override]
+        fut: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._pending.append((fut, fn, args, kwargs))
+            self._start_dispatcher()
+        self._wakeup.set()
+        return fut
+
+    def scale_out(self, workers: int = 1) -> list[str]:
+        """Start up to ``workers`` more workers; returns the ids of those started"""
+        with self._lock:
+            if self._shutdown:
+                return []
+            count = min(workers, self.max_workers - len(self._workers))
+            started = [self._add_worker() for _ in range(count)]
+            self._start_dispatcher()
+        for worker in started:
+            worker.executor.submit(_noop)  # start the native worker now
+        return [w.worker_id for w in started]
+
+    def scale_in(self, workers: int = 1) -> list[str]:
+        """Stop up to ``workers`` idle workers, keeping at least ``min_workers``"""
+        with self._lock:
+            count = min(workers, len(self._workers) - self.min_workers)
+            idle = sorted(
+                (w for w in self._workers.values() if not w.busy),
+                key=lambda w: w.idle_since,
+            )
+            stopped = idle[: max(0, count)]
+            for worker in stopped:
+                del self._workers[worker.worker_id]
+        for worker in stopped:
+            worker.executor.shutdown(wait=False)
+        return [w.worker_id for w in stopped]
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while self._pending:
+                    self._pending.popleft()[0].cancel()
+            dispatcher = self._dispatcher
+        self._wakeup.set()
+        if dispatcher is not None and wait:
+            dispatcher.join()
+        if dispatcher is None or wait:
+            self._stop_workers(wait)
+
+    def _start_dispatcher(self):
+        # Caller holds the lock
+        if self._dispatcher is None:
+            for _ in range(self.min_workers - len(self._workers)):
+                self._add_worker()
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, name="ElasticPool-Dispatcher", daemon=True
+            )
+            self._dispatcher.start()
+
+    def _add_worker(self) -> _Worker:
+        # Caller holds the lock
+        worker_id = str(next(self._worker_ids))
+        executor = self._executor_factory(max_workers=1, **self._executor_kwargs)
+        worker = _Worker(worker_id, executor)
+        self._workers[worker_id] = worker
+        logger.debug("Started worker %s (%s workers)", worker_id, len(self._workers))
+        return worker
+
+    def _dispatch(self):
+        reap_interval = max(0.01, min(1.0, self.max_idletime / 2))
+        while True:
+            self._wakeup.wait(timeout=reap_interval)
+            self._wakeup.clear()
+
+            reaped: list[_Worker] = []
+            with self._lock:
+                if self._shutdown and not self._pending:
+                    break
+                assigned = self._assign()
+                if not self._shutdown:
+                    reaped = self._reap(time.monotonic())
+
+            for worker in reaped:
+                logger.debug("Stopping idle worker %s", worker.worker_id)
+                worker.executor.shutdown(wait=False)
+            for worker, (fut, fn, args, kwargs) in assigned:
+                self._run(worker, fut, fn, args, kwargs)
+
+        self._stop_workers(wait=True)
+
+    def _assign(self) -> list[tuple[_Worker, tuple]]:
+        # Caller holds the lock.  Most recently idle workers are used first, so
+        # that the surplus ages out
+        idle = sorted(
+            (w for w in self._workers.values() if not w.busy),
+            key=lambda w: w.idle_since,
+        )
+        assigned = []
+        while self._pending:
+            if idle:
+                worker = idle.pop()
+            elif len(self._workers) < self.max_workers:
+                worker = self._add_worker()
+            else:
+                break
+            item = self._pending.popleft()
+            if not item[0].set_running_or_notify_cancel():
+                idle.append(worker)
+                continue
+            worker.busy = True
+            assigned.append((worker, item))
+        return assigned
+
+    def _reap(self, now: float) -> list[_Worker]:
+        # Caller holds the lock
+        surplus = len(self._workers) - self.min_workers
+        reaped: list[_Worker] = []
+        if surplus <= 0:
+            return reaped
+        for worker in sorted(self._workers.values(), key=lambda w: w.idle_since):
+            if len(reaped) >= surplus:
+                break
+            if not worker.busy and now - worker.idle_since >= self.max_idletime:
+                del self._workers[worker.worker_id]
+                reaped.append(worker)
+        return reaped
+
+    def _run(self, worker: _Worker, fut: Future, fn, args, kwargs):
+        try:
+            inner = worker.executor.submit(fn, *args, **kwargs)
+        except Exception as e:
+            fut.set_exception(e)
+            self._worker_done(worker, retire=True)
+            return
+
+        def _on_done(inner: Future):
+            # Free the worker before resolving the task, so that a caller
+            # waiting on the task sees the worker as idle
+            exc = CancelledError() if inner.cancelled() else inner.exception()
+            self._worker_done(worker, retire=isinstance(exc, BrokenExecutor))
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(inner.result())
+
+        inner.add_done_callback(_on_done)
+
+    def _worker_done(self, worker: _Worker, retire: bool = False):
+        # Only bookkeeping here, as this may run in the native executor's own
+        # thread; the dispatcher submits the next task
+        with self._lock:
+            worker.busy = False
+            worker.idle_since = time.monotonic()
+            if retire:
+                self._workers.pop(worker.worker_id, None)
+        if retire:
+            logger.warning("Worker %s is broken; replacing it", worker.worker_id)
+            worker.executor.shutdown(wait=False)
+        self._wakeup.set()
+
+    def _stop_workers(self, wait: bool):
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.executor.shutdown(wait=wait)
@@ -13,7 +13,9 @@ from globus_compute_endpoint.engines.base import (
     GlobusComputeEngineBase,
     ReportingThread,
 )
+from globus_compute_endpoint.strategies import BaseStrategy, SimpleStrategy
 from parsl.executors.high_throughput.executor import HighThroughputExecutor
+from parsl.providers.base import JobStatus
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +27,32 @@ class GlobusComputeEngine(GlobusComputeEngineBase):
         label: str = "GlobusComputeEngine",
         address: t.Optional[str] = None,
         heartbeat_period_s: float = 30.0,
+        strategy: t.Optional[BaseStrategy] = None,
+        scaling_enabled: bool = True,
         **kwargs,
     ):
+        """
+        Parameters
+        ----------
+        strategy: BaseStrategy
+            The scaling strategy to run against the HTEX's blocks, as with the
+            HighThroughputExecutor's ``strategy``.
+            Default: SimpleStrategy()
+
+        scaling_enabled: bool
+            Run the scaling strategy; if False, the HTEX keeps the blocks it
+            starts with (``init_blocks``).
+            Default: True
+
+        All other arguments are passed to parsl's HighThroughputExecutor.
+        """
         self.address = address
         self.run_dir = os.getcwd()
         self.label = label
+        self.strategy: t.Optional[BaseStrategy] = None
+        if scaling_enabled:
+            self.strategy = strategy if strategy is not None else SimpleStrategy()
+        self._strategy_started = False
         self._status_report_thread = ReportingThread(
             target=self.report_status, args=[], reporting_period=heartbeat_period_s
         )
@@ -58,6 +81,14 @@ class GlobusComputeEngine(GlobusComputeEngineBase):
             self.results_passthrough = results_passthrough
         self.executor.start()
         self._status_report_thread.start()
+        if self.strategy is not None:
+            try:
+                logger.info("Starting strategy.")
+                self.strategy.start(self)
+                self._strategy_started = True
+            except RuntimeError:
+                # This is raised when the strategy was already started elsewhere
+                logger.exception("Failed to start strategy.")
 
     def _submit(
         self,
@@ -67,6 +98,74 @@ class GlobusComputeEngine(GlobusComputeEngineBase):
     ) -> Future:
         return self.executor.submit(func, {}, *args, **kwargs)
 
+    @property
+    def provider(self):
+        return self.executor.provider
+
+    @property
+    def max_workers_per_node(self) -> t.Union[int, float]:
+        return self.executor.workers_per_node
+
+    def _get_managers(self) -> t.List[t.Dict[str, t.Any]]:
+        """Live state of the managers connected to the HTEX interchange
+
+        Asked of the interchange over its command channel; an empty list if
+        the interchange cannot be reached (e.g., it is not started yet).
+        """
+        try:
+            return self.executor.connected_managers
+        except Exception as e:
+            logger.warning(f"Unable to query managers from interchange: {e}")
+            return []
+
+    def get_outstanding_breakdown(
+        self, managers: t.Optional[t.List[t.Dict[str, t.Any]]] = None
+    ) -> t.List[t.Tuple[str, int, bool]]:
+        """Get outstanding breakdown per manager and in the interchange queues
+
+        Returns
+        -------
+        List of status for online elements
+        [ (element, tasks_pending, status) ... ]
+        """
+        if managers is None:
+            managers = self._get_managers()
+        on_managers = sum(m["tasks"] for m in managers)
+        pending = max(0, len(self.executor.tasks) - on_managers)
+        reply = [("interchange", pending, True)]
+        reply.extend((m["manager"], m["tasks"], m["active"]) for m in managers)
+        return reply
+
+    def get_total_tasks_outstanding(self) -> t.Dict[str, int]:
+        """Get the outstanding tasks in total, per container type
+
+        The HTEX does not route tasks by container, so all tasks are "RAW".
+        """
+        outstanding = len(self.executor.tasks)
+        return {"RAW": outstanding} if outstanding else {}
+
+    def get_total_live_workers(
+        self, managers: t.Optional[t.List[t.Dict[str, t.Any]]] = None
+    ) -> int:
+        """Get the total active workers"""
+        if managers is None:
+            managers = self._get_managers()
+        return sum(m["worker_count"] for m in managers if m["active"])
+
+    def provider_status(self) -> t.List[JobStatus]:
+        """Get status of all blocks from the provider"""
+        return list(self.executor.status().values())
+
+    def scale_out(self, blocks: int = 1) -> t.List[str]:
+        """Scale out by ``blocks`` blocks; returns the new block ids"""
+        logger.info(f"Scaling out by {blocks} more blocks")
+        return self.executor.scale_out(blocks)
+
+    def scale_in(self, blocks: int = 1) -> t.List[str]:
+        """Scale in by up to ``blocks`` idle blocks; returns the block ids removed"""
+        logger.info(f"Scaling in by up to {blocks} idle blocks")
+        return self.executor.scale_in(blocks, force=False)
+
     def get_status_report(self) -> EPStatusReport:
         """
         endpoint_id: uuid.UUID
@@ -75,6 +174,18 @@ class GlobusComputeEngine(GlobusComputeEngineBase):
         Returns
         -------
         """
+        managers = self._get_managers()
+        active_managers = [m for m in managers if m["active"]]
+        ((_, pending_tasks, _), *_) = self.get_outstanding_breakdown(managers)
+        block_states: t.Dict[str, int] = {}
+        try:
+            for job_status in self.provider_status():
+                state = job_status.state.name
+                block_states[state] = block_states.get(state, 0) + 1
+        except Exception as e:
+            logger.warning(f"Unable to query block states from provider: {e}")
+
+        provider = self.executor.provider
         executor_status: t.Dict[str, t.Any] = {
             "task_id": -2,
             "info": {
@@ -82,22 +193,25 @@ class GlobusComputeEngine(GlobusComputeEngineBase):
                 "total_mem": 0,
                 "new_core_hrs": 0,
                 "total_core_hrs": 0,
-                "managers": 0,
-                "active_managers": 0,
-                "total_workers": 0,
-                "idle_workers": 0,
-                "pending_tasks": 0,
-                "outstanding_tasks": 0,
+                "managers": len(managers),
+                "active_managers": len(active_managers),
+                "total_workers": sum(m["worker_count"] for m in managers),
+                "idle_workers": sum(
+                    max(0, m["worker_count"] - m["tasks"]) for m in active_managers
+                ),
+                "pending_tasks": pending_tasks,
+                "outstanding_tasks": self.get_total_tasks_outstanding(),
                 "worker_mode": 0,
                 "scheduler_mode": 0,
-                "scaling_enabled": False,
-                "mem_per_worker": 0,
-                "cores_per_worker": 0,
-                "prefetch_capacity": 0,
-                "max_blocks": 1,
-                "min_blocks": 1,
-                "max_workers_per_node": 0,
-                "nodes_per_block": 1,
+                "scaling_enabled": self.strategy is not None,
+                "mem_per_worker": self.executor.mem_per_worker,
+                "cores_per_worker": self.executor.cores_per_worker,
+                "prefetch_capacity": self.executor.prefetch_capacity,
+                "max_blocks": provider.max_blocks,
+                "min_blocks": provider.min_blocks,
+                "max_workers_per_node": self.max_workers_per_node,
+                "nodes_per_block": provider.nodes_per_block,
+                "block_states": block_states,
                 "heartbeat_period": self._heartbeat_period_s,
             },
         }
@@ -110,4 +224,6 @@ class GlobusComputeEngine(GlobusComputeEngineBase):
 
     def shutdown(self):
         self._status_report_thread.stop()
+        if self.strategy is not None and self._strategy_started:
+            self.strategy.close()
         return self.executor.shutdown()
@@ -11,6 +11,9 @@ from globus_compute_endpoint.exception_handling import (
     get_result_error_details,
 )
 from globus_compute_endpoint.exceptions import CouldNotExecuteUserTaskError
+from globus_compute_endpoint.executors.high_throughput.function_cache import (
+    FunctionCache,
+)
 from globus_compute_endpoint.executors.high_throughput.messages import Message
 from globus_compute_sdk.errors import MaxResultSizeExceeded
 from globus_compute_sdk.serialize import ComputeSerializer
@@ -18,6 +21,7 @@ from globus_compute_sdk.serialize import ComputeSerializer
 log = logging.getLogger(__name__)
 
 serializer = ComputeSerializer()
+function_cache = FunctionCache(serializer)
 
 
 def execute_task(task_body: bytes, result_size_limit: int = 10 * 1024 * 1024) -> bytes:
@@ -77,6 +81,21 @@ def execute_task(task_body: bytes, result_size_limit: int = 10 * 1024 * 1024) ->
     return messagepack.pack(Result(**result_message))
 
 
+def execute_task_batch(
+    task_bodies: t.List[bytes], result_size_limit: int = 10 * 1024 * 1024
+) -> t.List[bytes]:
+    """Execute several tasks, one after another, with ``execute_task``
+    Parameters
+    ----------
+    task_bodies: packed messages as bytes
+    result_size_limit: result size in bytes, per task
+    Returns
+    -------
+    messagepack packed Results, in the order of the tasks
+    """
+    return [execute_task(body, result_size_limit) for body in task_bodies]
+
+
 def _unpack_messagebody(message: bytes) -> t.Tuple[Task, str]:
     """Unpack messagebody as a messagepack message with
     some legacy handling
@@ -106,19 +125,23 @@ def _unpack_messagebody(message: bytes) -> t.Tuple[Task, str]:
 
 
 def _call_user_function(
-    task_buffer: str, result_size_limit: int, serializer=serializer
+    task_buffer: str,
+    result_size_limit: int,
+    serializer=serializer,
+    function_cache: FunctionCache = function_cache,
 ) -> str:
     """Deserialize the buffer and execute the task.
     Parameters
     ----------
     task_buffer: serialized buffer of (fn, args, kwargs)
     result_size_limit: size limit in bytes for results
-    serializer: serializer for the buffers
+    serializer: serializer for the result
+    function_cache: cache of deserialized functions
     Returns
     -------
     Returns serialized result or throws exception.
     """
-    f, args, kwargs = serializer.unpack_and_deserialize(task_buffer)
+    f, args, kwargs, _ = function_cache.deserialize_task(task_buffer)
     result_data = f(*args, **kwargs)
     serialized_data = serializer.serialize(result_data)
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import multiprocessing
+import os
 import typing as t
 import uuid
 from concurrent.futures import Future
@@ -17,8 +18,10 @@ from globus_compute_endpoint.engines.base import (
     GlobusComputeEngineBase,
     ReportingThread,
 )
+from globus_compute_endpoint.engines.elastic_pool import ElasticPool
+from globus_compute_endpoint.logging_config import ComputeLogger
 
-logger = logging.getLogger(__name__)
+logger: ComputeLogger = logging.getLogger(__name__)  # type: ignore
 
 
 class ProcessPoolEngine(GlobusComputeEngineBase):
@@ -27,10 +30,39 @@ class ProcessPoolEngine(GlobusComputeEngineBase):
         *args,
         label: str = "ProcessPoolEngine",
         heartbeat_period_s: float = 30.0,
+        max_workers: t.Optional[int] = None,
+        min_workers: int = 0,
+        max_idletime: float = 60.0,
         **kwargs,
     ):
+        """
+        Parameters
+        ----------
+        max_workers: int
+            Maximum number of worker processes; more are started (up to this
+            many) while tasks are waiting for a worker.
+            Default: the number of CPUs
+
+        min_workers: int
+            Number of worker processes to keep, even when idle.
+            Default: 0
+
+        max_idletime: float
+            Seconds after which an idle worker (beyond ``min_workers``) is stopped.
+            Default: 60
+
+        All other arguments are passed to each worker's ProcessPoolExecutor.
+        """
         self.label = label
-        self.executor = NativeExecutor(*args, **kwargs)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.executor = ElasticPool(
+            NativeExecutor,
+            max_workers,
+            min_workers=min_workers,
+            max_idletime=max_idletime,
+            **kwargs,
+        )
         self._status_report_thread = ReportingThread(
             target=self.report_status, args=[], reporting_period=heartbeat_period_s
         )
@@ -75,13 +107,16 @@ class ProcessPoolEngine(GlobusComputeEngineBase):
                 "total_cores": multiprocessing.cpu_count(),
                 "total_mem": round(psutil.virtual_memory().available / (2**30), 1),
                 "total_core_hrs": 0,
-                "total_workers": self.executor._max_workers,  # type: ignore
-                "pending_tasks": 0,
-                "outstanding_tasks": 0,
-                "scaling_enabled": False,
+                "total_workers": self.executor.num_workers,
+                "idle_workers": self.executor.num_idle_workers,
+                "pending_tasks": self.executor.num_pending_tasks,
+                "outstanding_tasks": self.executor.num_outstanding_tasks,
+                "scaling_enabled": self.executor.min_workers
+                < self.executor.max_workers,
                 "max_blocks": 1,
                 "min_blocks": 1,
-                "max_workers_per_node": self.executor._max_workers,  # type: ignore
+                "min_workers": self.executor.min_workers,
+                "max_workers_per_node": self.executor.max_workers,
                 "nodes_per_block": 1,
                 "heartbeat_period": self._heartbeat_period_s,
             },
@@ -103,17 +138,19 @@ class ProcessPoolEngine(GlobusComputeEngineBase):
         """We basically pass all params except the resource_specification
         over to executor.submit
         """
-        logger.warning("Got task")
+        logger.trace("Got task")
         return self.executor.submit(func, *args, **kwargs)
 
     def status_polling_interval(self) -> int:
         return 30
 
     def scale_out(self, blocks: int) -> list[str]:
-        return []
+        """Start up to ``blocks`` more worker processes"""
+        return self.executor.scale_out(blocks)
 
     def scale_in(self, blocks: int) -> list[str]:
-        return []
+        """Stop up to ``blocks`` idle worker processes"""
+        return self.executor.scale_in(blocks)
 
     def status(self) -> dict:
         return {}
@@ -26,6 +26,11 @@ from globus_compute_endpoint.executors.high_throughput.messages import (
     HeartbeatReq,
     Task,
     TaskCancel,
+    TaskCancelBulk,
+)
+from globus_compute_endpoint.executors.high_throughput.scheduling_policies import (
+    SchedulingPolicy,
+    get_scheduling_policy,
 )
 from globus_compute_endpoint.logging_config import setup_logging
 from globus_compute_endpoint.strategies.simple import SimpleStrategy
@@ -179,15 +184,26 @@ class HighThroughputExecutor(RepresentationMixin):
 
     poll_period : int
         Timeout period to be used by the executor components in milliseconds.
-        Increasing poll_periods trades performance for cpu efficiency. Default: 10ms
+        Increasing poll_periods trades performance for cpu efficiency.  (The
+        interchange is event driven and does not poll.) Default: 10ms
 
     container_image : str
         Path or identfier to the container image to be used by the workers
 
     scheduler_mode: str
-        Scheduling mode to be used by the node manager. Options: 'hard', 'soft'
+        Scheduling mode to be used by the node manager. Options: 'hard', 'soft',
+        'indexed'
         'hard' -> managers cannot replace worker's container types
         'soft' -> managers can replace unused worker's containers based on demand
+        'indexed' -> as 'hard', but the interchange dispatches through a capacity
+                     index; recommended for endpoints with many managers
+
+    scheduling_policy: SchedulingPolicy or str
+        The interchange's task scheduling policy, or the name of one of the
+        built-in policies: 'random', 'least-loaded', 'round-robin',
+        'container-affinity', or 'fair-share'.  See
+        ``globus_compute_endpoint.executors.high_throughput.scheduling_policies``.
+        Default: None ('random')
 
     worker_mode : str
         Select the mode of operation from no_container, singularity_reuse,
@@ -233,6 +249,7 @@ class HighThroughputExecutor(RepresentationMixin):
         # Container specific
         worker_mode="no_container",
         scheduler_mode="hard",
+        scheduling_policy: SchedulingPolicy | str | None = None,
         container_type=None,
         container_cmd_options="",
         cold_routing_interval=10.0,
@@ -271,6 +288,7 @@ class HighThroughputExecutor(RepresentationMixin):
 
         # Container specific
         self.scheduler_mode = scheduler_mode
+        self.scheduling_policy = get_scheduling_policy(scheduling_policy)
         self.container_type = container_type
         self.container_cmd_options = container_cmd_options
         self.cold_routing_interval = cold_routing_interval
@@ -440,6 +458,7 @@ class HighThroughputExecutor(RepresentationMixin):
                 "available_accelerators": self.available_accelerators,
                 "prefetch_capacity": self.prefetch_capacity,
                 "scheduler_mode": self.scheduler_mode,
+                "scheduling_policy": self.scheduling_policy,
                 "worker_mode": self.worker_mode,
                 "container_type": self.container_type,
                 "container_cmd_options": self.container_cmd_options,
@@ -534,7 +553,7 @@ class HighThroughputExecutor(RepresentationMixin):
                     return
 
                 elif isinstance(msgs, EPStatusReport):
-                    log.debug(f"Received EPStatusReport {msgs}")
+                    log.debug("Received EPStatusReport %s", msgs)
                     if self.passthrough:
                         self.results_passthrough.put(
                             {"task_id": None, "message": dill.dumps(msgs)}
@@ -585,18 +604,23 @@ class HighThroughputExecutor(RepresentationMixin):
                             break
 
                         if self.passthrough is True:
-                            log.debug(f"Pushing results for task:{tid}")
+                            log.debug(
+                                "Pushing results for task:%s",
+                                tid,
+                                extra={"task_id": tid},
+                            )
                             # we are only interested in actual task ids here, not
                             # identifiers for other message types
                             sent_task_id = tid if isinstance(tid, str) else None
                             x = self.results_passthrough.put(
                                 {"task_id": sent_task_id, "message": serialized_msg}
                             )
-                            log.debug(f"task:{tid} ret value: {x}")
+                            log.debug("task:%s ret value: %s", tid, x)
                             log.debug(
                                 "task:%s items in queue: %s",
                                 tid,
                                 self.results_passthrough.qsize(),
+                                extra={"task_id": tid},
                             )
                             continue
 
@@ -737,13 +761,34 @@ class HighThroughputExecutor(RepresentationMixin):
         Returns:
               Submit status
         """
-        log.debug(f"Submitting raw task : {packed_task}")
+        log.debug("Submitting raw task (%s bytes)", len(packed_task))
         if self._executor_bad_state.is_set():
             raise self._executor_exception
 
         # Submit task to queue
         return self.outgoing_q.put(packed_task)
 
+    def submit_batch(self, packed_tasks):
+        """Submits several packed tasks to the outgoing_q with one send
+
+        Equivalent to calling ``submit_raw`` for each task, in order, but the
+        tasks travel to the interchange as a single (multipart) message.
+
+        Parameters
+        ----------
+        packed_tasks: list of packed Tasks (messages.Task)
+
+        Returns:
+              Submit status
+        """
+        log.debug("Submitting batch of %s raw tasks", len(packed_tasks))
+        if self._executor_bad_state.is_set():
+            raise self._executor_exception
+        if not packed_tasks:
+            return None
+
+        return self.outgoing_q.put_multipart(packed_tasks)
+
     def _get_block_and_job_ids(self):
         # Not using self.blocks.keys() and self.blocks.values() simultaneously
         # The dictionary may be changed during invoking this function
@@ -869,12 +914,33 @@ class HighThroughputExecutor(RepresentationMixin):
         """
 
         ret_value = future._cancel()
-        log.debug("Sending cancel of task_id:{future.task_id} to interchange")
+        log.debug("Sending cancel of task_id:%s to interchange", future.task_id)
         if ret_value is True:
             self.command_client.run(TaskCancel(future.task_id))
             log.debug("Sent TaskCancel to interchange")
         return ret_value
 
+    def _cancel_many(self, futures):
+        """As ``_cancel()``, for each of ``futures``, but with a single request
+        to the interchange for all of the cancellable tasks
+
+        Parameters
+        ----------
+        futures
+            HTEXFutures of this executor
+
+        Returns
+        -------
+        List[Bool], the ``_cancel()`` return value for each future
+        """
+        cancelled = [fut._cancel() for fut in futures]
+        task_ids = [fut.task_id for fut, ok in zip(futures, cancelled) if ok]
+        if task_ids:
+            log.debug("Sending cancel of %s tasks to interchange", len(task_ids))
+            self.command_client.run(TaskCancelBulk(task_ids))
+            log.debug("Sent TaskCancelBulk to interchange")
+        return cancelled
+
 
 CANCELLED = "CANCELLED"
 CANCELLED_AND_NOTIFIED = "CANCELLED_AND_NOTIFIED"
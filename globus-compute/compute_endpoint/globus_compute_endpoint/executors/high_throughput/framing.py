@@ -0,0 +1,241 @@
+"""Binary framing for the interchange <-> manager <-> worker wire
+
+Every message is a ZMQ multipart message whose first frame is a small header:
+
+    magic (4 bytes) | version (1) | kind (1) | record count (4) | records ...
+
+Each record is a fixed (per kind) number of length-prefixed UTF-8 fields, such
+as a task's id and container id.  Task and result payloads are already opaque
+bytes, so they are never re-encoded: they follow the header as one frame per
+record, and are sent (and forwarded by the manager) without copying.
+"""
+from __future__ import annotations
+
+import enum
+import json
+import typing as t
+from struct import Struct
+
+MAGIC = b"GCWF"
+WIRE_VERSION = 1
+
+_PREAMBLE = Struct("!4sBBI")  # magic, version, kind, record count
+_FIELD_LEN = Struct("!I")
+
+
+class FrameKind(enum.IntEnum):
+    TASKS = 1  # interchange -> manager
+    TASK_CANCEL = 2  # interchange -> manager
+    HEARTBEAT = 3  # interchange -> manager
+    STOP = 4  # interchange -> manager
+    ADVERTISEMENT = 5  # manager -> interchange
+    RESULTS = 6  # manager -> interchange
+    WORKER_REGISTRATION = 7  # worker -> manager
+    WORKER_TASK = 8  # manager -> worker
+    WORKER_RESULT = 9  # worker -> manager
+
+
+# Number of fields in each record of a header
+_FIELD_COUNT = {
+    FrameKind.TASKS: 3,  # task_id, container_id, local_container
+    FrameKind.TASK_CANCEL: 1,  # task_id
+    FrameKind.HEARTBEAT: 0,
+    FrameKind.STOP: 0,
+    FrameKind.ADVERTISEMENT: 0,
+    FrameKind.RESULTS: 2,  # task_id, container_id
+    FrameKind.WORKER_REGISTRATION: 2,  # worker_id, worker_type
+    FrameKind.WORKER_TASK: 2,  # task_id, container_id
+    FrameKind.WORKER_RESULT: 3,  # task_id, container_id, function cache hit
+}
+
+# Kinds whose header is followed by one payload frame per record
+_PAYLOAD_KINDS = {
+    FrameKind.TASKS,
+    FrameKind.ADVERTISEMENT,
+    FrameKind.RESULTS,
+    FrameKind.WORKER_TASK,
+    FrameKind.WORKER_RESULT,
+}
+
+Frames = t.List[t.Any]  # bytes, or zmq.Frame when received with copy=False
+
+
+class WireFormatError(ValueError):
+    """A multipart message does not follow the framing"""
+
+
+class WireTask(t.NamedTuple):
+    """A task as received by the manager
+
+    ``raw_buffer`` is the packed task message, exactly as the interchange received
+    it; the manager forwards it to a worker untouched.
+    """
+
+    task_id: str
+    container_id: str
+    local_container: str
+    raw_buffer: t.Any
+
+    def pack(self):
+        return self.raw_buffer
+
+
+def pack_header(kind: FrameKind, records: t.Sequence[t.Sequence[str]] = ()) -> bytes:
+    nfields = _FIELD_COUNT[kind]
+    parts = [_PREAMBLE.pack(MAGIC, WIRE_VERSION, kind, len(records))]
+    for record in records:
+        if len(record) != nfields:
+            raise WireFormatError(
+                f"{kind.name} records have {nfields} fields; got {len(record)}"
+            )
+        for field in record:
+            b_field = str(field).encode("utf-8")
+            parts.append(_FIELD_LEN.pack(len(b_field)))
+            parts.append(b_field)
+    return b"".join(parts)
+
+
+def _buffer(frame) -> memoryview:
+    return memoryview(getattr(frame, "buffer", frame))
+
+
+def unpack_header(frame) -> tuple[FrameKind, list[tuple[str, ...]]]:
+    buf = _buffer(frame)
+    try:
+        magic, version, kind, count = _PREAMBLE.unpack_from(buf)
+    except Exception as e:
+        raise WireFormatError(f"Truncated header ({len(buf)} bytes)") from e
+    if magic != MAGIC:
+        raise WireFormatError(f"Not a framed message (magic: {bytes(magic)!r})")
+    if version != WIRE_VERSION:
+        raise WireFormatError(
+            f"Unsupported wire version: {version} (expected {WIRE_VERSION})"
+        )
+    try:
+        kind = FrameKind(kind)
+    except ValueError:
+        raise WireFormatError(f"Unknown frame kind: {kind}") from None
+
+    nfields = _FIELD_COUNT[kind]
+    offset = _PREAMBLE.size
+    records = []
+    try:
+        for _ in range(count):
+            record = []
+            for _ in range(nfields):
+                (flen,) = _FIELD_LEN.unpack_from(buf, offset)
+                offset += _FIELD_LEN.size
+                if offset + flen > len(buf):
+                    raise WireFormatError("Truncated header field")
+                record.append(str(buf[offset : offset + flen], "utf-8"))
+                offset += flen
+            records.append(tuple(record))
+    except WireFormatError:
+        raise
+    except Exception as e:
+        raise WireFormatError("Malformed header records") from e
+    if offset != len(buf):
+        raise WireFormatError(f"{len(buf) - offset} trailing bytes in header")
+    return kind, records
+
+
+def unpack(frames: Frames) -> tuple[FrameKind, list[tuple[str, ...]], Frames]:
+    """Split a framed multipart message into its kind, records and payloads"""
+    if not frames:
+        raise WireFormatError("Empty message")
+    kind, records = unpack_header(frames[0])
+    payloads = frames[1:]
+    if kind in _PAYLOAD_KINDS:
+        if len(payloads) < len(records):
+            raise WireFormatError(
+                f"{kind.name}: {len(records)} records but {len(payloads)} payloads"
+            )
+    return kind, records, payloads
+
+
+def pack_tasks(tasks: t.Iterable[dict]) -> Frames:
+    """Frame a batch of the interchange's pending task records for a manager"""
+    tasks = list(tasks)
+    header = pack_header(
+        FrameKind.TASKS,
+        [(tk["task_id"], tk["container_id"], tk["local_container"]) for tk in tasks],
+    )
+    return [header, *(tk["raw_buffer"] for tk in tasks)]
+
+
+def unpack_tasks(records: list[tuple[str, ...]], payloads: Frames) -> list[WireTask]:
+    return [
+        WireTask(task_id, container_id, local_container, raw)
+        for (task_id, container_id, local_container), raw in zip(records, payloads)
+    ]
+
+
+def pack_task_cancel(task_id: str) -> Frames:
+    return [pack_header(FrameKind.TASK_CANCEL, [(task_id,)])]
+
+
+HEARTBEAT_FRAMES: Frames = [pack_header(FrameKind.HEARTBEAT)]
+STOP_FRAMES: Frames = [pack_header(FrameKind.STOP)]
+
+
+def pack_advertisement(ads: dict) -> Frames:
+    return [pack_header(FrameKind.ADVERTISEMENT, [()]), json.dumps(ads).encode()]
+
+
+def unpack_advertisement(payloads: Frames) -> dict:
+    return json.loads(bytes(_buffer(payloads[0])))
+
+
+def pack_results(
+    results: t.Sequence[tuple[str, str, t.Any]], status_report: bytes | None = None
+) -> Frames:
+    """Frame a manager's batch of (task_id, container_id, result) for the interchange
+
+    The (optional) status report, if any, follows the results.
+    """
+    header = pack_header(FrameKind.RESULTS, [(tid, cid) for tid, cid, _ in results])
+    frames = [header, *(r for _, _, r in results)]
+    if status_report is not None:
+        frames.append(status_report)
+    return frames
+
+
+def unpack_results(
+    records: list[tuple[str, ...]], payloads: Frames
+) -> tuple[list[tuple[str, str, t.Any]], t.Any]:
+    results = [(tid, cid, r) for (tid, cid), r in zip(records, payloads)]
+    status_report = payloads[len(records)] if len(payloads) > len(records) else None
+    return results, status_report
+
+
+def pack_worker_registration(worker_id: str, worker_type: str) -> Frames:
+    return [pack_header(FrameKind.WORKER_REGISTRATION, [(worker_id, worker_type)])]
+
+
+def pack_worker_task(task_id: str, container_id: str, task_buffer) -> Frames:
+    return [pack_header(FrameKind.WORKER_TASK, [(task_id, container_id)]), task_buffer]
+
+
+_CACHE_HIT_FIELD = {True: "hit", False: "miss", None: ""}
+
+
+def pack_worker_result(
+    task_id: str,
+    container_id: str,
+    result: bytes,
+    function_cache_hit: bool | None = None,
+) -> Frames:
+    """Frame a worker's result for the manager
+
+    ``function_cache_hit`` records whether the task's function came from the
+    worker's cache of deserialized functions (None: the function was not looked up)
+    """
+    cache_field = _CACHE_HIT_FIELD[function_cache_hit]
+    header = pack_header(
+        FrameKind.WORKER_RESULT, [(task_id, container_id, cache_field)]
+    )
+    return [header, result]
+
+
+def unpack_function_cache_hit(field: str) -> bool | None:
+    return {"hit": True, "miss": False}.get(field)
@@ -0,0 +1,139 @@
+"""Cache of deserialized functions, for workers
+
+A worker typically runs the same few functions over and over, but every task
+carries its function serialized alongside its arguments.  Rather than
+deserializing the function (running dill, or ``exec``-ing its source) for every
+task, the ``FunctionCache`` keeps the most recently used callables, keyed by a
+digest of the function's serialized buffer; only the arguments are deserialized
+per task.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import typing as t
+from collections import OrderedDict
+
+from globus_compute_endpoint.logging_config import ComputeLogger
+from globus_compute_sdk.serialize import ComputeSerializer
+
+log: ComputeLogger = logging.getLogger(__name__)  # type: ignore
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class DeserializedTask(t.NamedTuple):
+    fn: t.Callable
+    args: t.Any
+    kwargs: t.Any
+    cache_hit: bool
+
+
+def _digest(fn_buffer: str) -> bytes:
+    return hashlib.blake2b(fn_buffer.encode(), digest_size=16).digest()
+
+
+class FunctionCache:
+    """An LRU cache of deserialized functions
+
+    Parameters
+    ----------
+    serializer: ComputeSerializer
+        Serializer for the task buffers
+
+    max_entries: int
+        Maximum number of cached functions.  0 disables the cache.  Default: the
+        ``GC_FUNCTION_CACHE_ENTRIES`` environment variable if set, else 128
+
+    max_bytes: int
+        Maximum total size of the serialized buffers of the cached functions.
+        Default: 64 MiB
+    """
+
+    def __init__(
+        self,
+        serializer: ComputeSerializer,
+        max_entries: int | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        if max_entries is None:
+            max_entries = int(
+                os.environ.get("GC_FUNCTION_CACHE_ENTRIES", DEFAULT_MAX_ENTRIES)
+            )
+        self.serializer = serializer
+        self.max_entries = max(0, max_entries)
+        self.max_bytes = max_bytes
+
+        # digest -> (function, size of its serialized buffer)
+        self._entries: OrderedDict[bytes, tuple[t.Callable, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, fn_buffer: str) -> tuple[t.Callable, bool]:
+        """Return the function serialized in ``fn_buffer``, and whether it was cached"""
+        size = len(fn_buffer)
+        if not self.max_entries or size > self.max_bytes:
+            with self._lock:
+                self.misses += 1
+            return self.serializer.deserialize(fn_buffer), False
+
+        key = _digest(fn_buffer)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], True
+            self.misses += 1
+
+        # Deserialize outside the lock; if two threads race on the same function,
+        # the second to finish simply replaces the first's entry
+        fn = self.serializer.deserialize(fn_buffer)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.cached_bytes -= previous[1]
+            self._entries[key] = (fn, size)
+            self.cached_bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self.cached_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.cached_bytes -= evicted_size
+                self.evictions += 1
+        return fn, False
+
+    def deserialize_task(self, packed_buffer: str) -> DeserializedTask:
+        """Unpack a task buffer of (function, args, kwargs)
+
+        The function comes from the cache if possible; the arguments are always
+        deserialized.
+        """
+        buffers = self.serializer.unpack_buffers(packed_buffer)
+        if len(buffers) != 3:
+            raise ValueError(f"Unpack expects 3 buffers, got {len(buffers)}")
+        fn_buffer, args_buffer, kwargs_buffer = buffers
+        fn, cache_hit = self.get(fn_buffer)
+        args = self.serializer.deserialize(args_buffer)
+        kwargs = self.serializer.deserialize(kwargs_buffer)
+        return DeserializedTask(fn, args, kwargs, cache_hit)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.cached_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import argparse
 import collections
-import copy
 import json
 import logging
+import math
 import os
 import platform
 import queue
@@ -13,29 +13,41 @@ import sys
 import threading
 import time
 import typing as t
-from collections import defaultdict
 
 import daemon
 import dill
 import zmq
-from globus_compute_common.messagepack.message_types import TaskTransition
 from globus_compute_common.tasks import ActorName, TaskState
 from globus_compute_endpoint.exception_handling import (
     get_error_string,
     get_result_error_details,
 )
+from globus_compute_endpoint.executors.high_throughput import framing
 from globus_compute_endpoint.executors.high_throughput.interchange_task_dispatch import (  # noqa: E501
+    ManagerCapacityIndex,
+    indexed_interchange_task_dispatch,
     naive_interchange_task_dispatch,
 )
+from globus_compute_endpoint.executors.high_throughput.interchange_events import (
+    TimerWheel,
+    Waker,
+)
 from globus_compute_endpoint.executors.high_throughput.messages import (
     BadCommand,
     EPStatusReport,
     Heartbeat,
     Message,
     MessageType,
+    TaskCancelBulk,
+)
+from globus_compute_endpoint.executors.high_throughput.scheduling_policies import (
+    SchedulingPolicy,
+    get_scheduling_policy,
+)
+from globus_compute_endpoint.executors.high_throughput.task_status_deltas import (
+    TaskStatusDeltas,
 )
 from globus_compute_endpoint.logging_config import ComputeLogger
-from globus_compute_sdk.sdk.utils import chunk_by
 from globus_compute_sdk.serialize import ComputeSerializer
 from parsl.version import VERSION as PARSL_VERSION
 
@@ -44,8 +56,8 @@ if t.TYPE_CHECKING:
 
 log: ComputeLogger = logging.getLogger(__name__)  # type: ignore
 
-HEARTBEAT_CODE = (2**32) - 1
-PKL_HEARTBEAT_CODE = dill.dumps(HEARTBEAT_CODE)
+# Key of the soft-mode cold routing timer; managers' timers are keyed by manager id
+_COLD_ROUTING_TIMER = "cold_routing"
 
 
 class ManagerLost(Exception):
@@ -108,6 +120,7 @@ class Interchange:
         available_accelerators: t.Sequence[str] = (),
         prefetch_capacity=None,
         scheduler_mode=None,
+        scheduling_policy: SchedulingPolicy | str | None = None,
         container_type=None,
         container_cmd_options="",
         worker_mode=None,
@@ -167,6 +180,21 @@ class Interchange:
             Container command strings to be added to associated container command.
             For example, singularity exec {container_cmd_options}
 
+        scheduler_mode: str
+            Task scheduling mode; one of 'hard', 'soft', or 'indexed'.  'indexed'
+            has the same semantics as 'hard' (managers run a fixed worker type), but
+            dispatches through a capacity index, so the cost of a dispatch pass
+            scales with the number of tasks placed rather than the number of
+            managers.
+
+        scheduling_policy: SchedulingPolicy, str, or None
+            The policy (or name of the policy) that orders managers and pending
+            tasks for dispatch; one of 'random', 'least-loaded', 'round-robin',
+            'container-affinity', or 'fair-share'.  The manager ordering does not
+            apply to the 'indexed' scheduler_mode, which always prefers the manager
+            with the most free capacity.
+            Default: None ('random')
+
         cold_routing_interval: float
             The time interval between warm and cold function routing in SOFT
             scheduler_mode.
@@ -202,6 +230,9 @@ class Interchange:
         self.prefetch_capacity = prefetch_capacity
 
         self.scheduler_mode = scheduler_mode
+        self._capacity_index = ManagerCapacityIndex()
+        self.scheduling_policy = get_scheduling_policy(scheduling_policy)
+        log.info(f"Scheduling policy: {self.scheduling_policy}")
         self.container_type = container_type
         self.container_cmd_options = container_cmd_options
         self.worker_mode = worker_mode
@@ -232,7 +263,7 @@ class Interchange:
         self.context = zmq.Context()
         self.task_incoming = self.context.socket(zmq.DEALER)
         self.task_incoming.set_hwm(0)
-        self.task_incoming.RCVTIMEO = 10  # in milliseconds
+        self.task_incoming.RCVTIMEO = 1000  # in milliseconds
         log.info(f"Task incoming on tcp://{client_address}:{client_ports[0]}")
         self.task_incoming.connect(f"tcp://{client_address}:{client_ports[0]}")
 
@@ -337,9 +368,15 @@ class Interchange:
             log.exception("Caught exception")
             raise
 
+        # Wakes the main loop for work queued by the other interchange threads
+        self._waker = Waker()
+        self._task_arrivals = 0
+
         self.task_cancel_running_queue: queue.Queue = queue.Queue()
         self.task_cancel_pending_trap: dict[str, str] = {}
-        self.task_status_deltas: dict[str, list[TaskTransition]] = defaultdict(list)
+        # Where each dispatched task is: task_id -> (manager, task type)
+        self._task_locations: dict[str, tuple[bytes, str]] = {}
+        self.task_status_deltas = TaskStatusDeltas()
         self._task_status_delta_lock = threading.Lock()
         self.container_switch_count: dict[bytes, int] = {}
 
@@ -388,7 +425,7 @@ class Interchange:
             poll_period=self.poll_period,
             worker_mode=self.worker_mode,
             container_cmd_options=self.container_cmd_options,
-            scheduler_mode=self.scheduler_mode,
+            scheduler_mode=self.manager_scheduler_mode,
             logdir=working_dir,
         )
 
@@ -399,6 +436,14 @@ class Interchange:
             log.info("Scaling ...")
             self.scale_out(self.provider.init_blocks)
 
+    @property
+    def manager_scheduler_mode(self) -> str | None:
+        """The scheduler mode as understood by the managers; the indexed dispatcher
+        is an interchange-only detail of the hard mode"""
+        if self.scheduler_mode == "indexed":
+            return "hard"
+        return self.scheduler_mode
+
     def migrate_tasks_to_internal(self, kill_event):
         """Pull tasks from the incoming tasks 0mq pipe onto the internal
         pending task queue
@@ -416,7 +461,9 @@ class Interchange:
         while not kill_event.is_set():
             # We are no longer doing heartbeats on the task side.
             try:
-                raw_msg = self.task_incoming.recv()
+                # A batch of tasks (HighThroughputExecutor.submit_batch) arrives
+                # as one multipart message, a task per frame
+                raw_msgs = self.task_incoming.recv_multipart()
                 self.last_heartbeat = time.time()
             except zmq.Again:
                 log.trace(
@@ -425,28 +472,33 @@ class Interchange:
                 )
                 continue
 
-            try:
-                msg = Message.unpack(raw_msg)
-            except Exception:
-                log.exception(f"Failed to unpack message, RAW:{raw_msg}")
-                continue
-
-            if msg == "STOP":
-                # TODO: Yadu. This should be replaced by a proper MessageType
-                log.debug("Received STOP message.")
-                kill_event.set()
-                break
-            elif isinstance(msg, Heartbeat):
-                log.debug("Got heartbeat")
-            else:
-                log.info(f"Received task: {msg.task_id}")
+            received = []
+            for raw_msg in raw_msgs:
+                try:
+                    msg = Message.unpack(raw_msg)
+                except Exception:
+                    log.exception(f"Failed to unpack message, RAW:{raw_msg}")
+                    continue
+
+                if msg == "STOP":
+                    # TODO: Yadu. This should be replaced by a proper MessageType
+                    log.debug("Received STOP message.")
+                    kill_event.set()
+                    break
+                elif isinstance(msg, Heartbeat):
+                    log.debug("Got heartbeat")
+                    continue
+
+                log.info(
+                    "Received task: %s", msg.task_id, extra={"task_id": msg.task_id}
+                )
                 local_container = msg.container_id
                 self.containers[local_container] = local_container
                 msg.set_local_container(local_container)
                 if local_container not in self.pending_task_queue:
-                    self.pending_task_queue[local_container] = queue.Queue(
-                        maxsize=10**6
-                    )
+                    self.pending_task_queue[
+                        local_container
+                    ] = self.scheduling_policy.new_task_queue(maxsize=10**6)
 
                 # We pass the raw message along
                 self.pending_task_queue[local_container].put(
@@ -458,25 +510,35 @@ class Interchange:
                     }
                 )
                 self.total_pending_task_count += 1
-                tt = TaskTransition(
-                    timestamp=time.time_ns(),
-                    state=TaskState.WAITING_FOR_NODES,
-                    actor=ActorName.INTERCHANGE,
+                self._task_arrivals += 1
+                received.append(msg.task_id)
+
+                log.debug(
+                    "[TASK_PULL_THREAD] task %s is now WAITING_FOR_NODES",
+                    msg.task_id,
+                    extra={"task_id": msg.task_id},
                 )
 
+            if received:
+                now_ns = time.time_ns()
                 with self._task_status_delta_lock:
-                    self.task_status_deltas[msg.task_id].append(tt)
+                    for task_id in received:
+                        self.task_status_deltas.append(
+                            task_id,
+                            TaskState.WAITING_FOR_NODES,
+                            ActorName.INTERCHANGE,
+                            now_ns,
+                        )
+                self._waker.wake()
 
+                task_counter += len(received)
                 log.debug(
-                    f"[TASK_PULL_THREAD] task {msg.task_id} is now WAITING_FOR_NODES"
-                )
-                log.debug(
-                    "[TASK_PULL_THREAD] pending task count: {}".format(
-                        self.total_pending_task_count
-                    )
+                    "[TASK_PULL_THREAD] Fetched %s tasks (%s in total); pending"
+                    " task count: %s",
+                    len(received),
+                    task_counter,
+                    self.total_pending_task_count,
                 )
-                task_counter += 1
-                log.debug(f"[TASK_PULL_THREAD] Fetched task:{task_counter}")
 
     def get_total_tasks_outstanding(self):
         """Get the outstanding tasks in total"""
@@ -555,32 +617,40 @@ class Interchange:
     def _status_report_loop(self, kill_event, status_report_queue: queue.Queue):
         log.info(f"Endpoint id: {self.endpoint_id}")
 
+        # Double-buffered: under the lock, only swap in the (empty) spare buffer;
+        # the full one is serialized and cleared outside of it, to become the
+        # next spare
+        spare_deltas = TaskStatusDeltas()
         while True:
             with self._task_status_delta_lock:
-                task_status_deltas = copy.deepcopy(self.task_status_deltas)
-                self.task_status_deltas.clear()
+                task_status_deltas = self.task_status_deltas
+                self.task_status_deltas = spare_deltas
 
             log.debug(
-                "Cleared task deltas (%s); sending status report to executor.",
+                "Swapped out task deltas (%s); sending status report to executor.",
                 len(task_status_deltas),
             )
 
             # The result processor will gracefully handle any size message, but
             # courtesy says to chunk work; 4,096 is empirically chosen to be plenty
             # "bulk enough," but not rude.
-            for tsd_chunk in chunk_by(task_status_deltas.items(), 4_096):
+            for tsd_chunk in task_status_deltas.to_dicts(4_096):
                 try:
                     msg = EPStatusReport(
                         self.endpoint_id,
                         self.get_global_state_for_status_report(),
-                        dict(tsd_chunk),
+                        tsd_chunk,
                     )
                     status_report_queue.put(msg.pack())
+                    self._waker.wake()
                 except Exception:
                     log.exception("Unable to create or send EP status report.")
                     log.debug("Attempted to send chunk: %s", tsd_chunk)
                     # ignoring so that the thread continues; "it's just a status"
 
+            task_status_deltas.clear()
+            spare_deltas = task_status_deltas
+
             if kill_event.wait(self.heartbeat_period):
                 break
 
@@ -599,14 +669,20 @@ class Interchange:
         while not kill_event.is_set():
             try:
                 buffer = self.command_channel.recv()
-                log.debug(f"Received command request {buffer}")
+                log.debug("Received command request %r", buffer)
                 command = Message.unpack(buffer)
 
                 if command.type is MessageType.TASK_CANCEL:
-                    log.info(f"Received TASK_CANCEL for Task:{command.task_id}")
+                    log.info("Received TASK_CANCEL for Task:%s", command.task_id)
                     self.enqueue_task_cancel(command.task_id)
                     reply = command
 
+                elif command.type is MessageType.TASK_CANCEL_BULK:
+                    log.info(
+                        "Received TASK_CANCEL_BULK for %s tasks", len(command.task_ids)
+                    )
+                    reply = TaskCancelBulk(self.enqueue_task_cancels(command.task_ids))
+
                 elif command.type is MessageType.HEARTBEAT_REQ:
                     log.info("Received synchonous HEARTBEAT_REQ from hub")
                     log.info(f"Replying with Heartbeat({self.endpoint_id})")
@@ -619,14 +695,14 @@ class Interchange:
                     )
                     reply = BadCommand(f"Unknown command type: {command.type}")
 
-                log.debug(f"Reply: {reply}")
+                log.debug("Reply: %s", reply)
                 self.command_channel.send(reply.pack())
 
             except zmq.Again:
                 log.trace("Command server is alive")
                 continue
 
-    def enqueue_task_cancel(self, task_id):
+    def enqueue_task_cancel(self, task_id) -> bool:
         """Cancel a task on the interchange
         Here are the task states and responses we issue here
         1. Task is pending in queues -> we add task to a trap to capture while in
@@ -636,26 +712,41 @@ class Interchange:
         3. Task is pending on a manager -> we delegate cancellation to manager
         4. Task is already complete -> we leave in trap, since we can't know
 
-        We place the task in the trap so that even if the search misses, the task
-        will be caught from getting dispatched even if the search fails due to a
-        race-condition. Since the task can't be dispatched before scheduling is
-        complete, either must work.
+        We place the task in the trap so that even if the lookup misses, the task
+        will be caught from getting dispatched even if the lookup fails due to a
+        race-condition.  The main loop records a task's location before it checks
+        the trap, so either must work.
+
+        Returns True if the task was dispatched to a manager.
+        """
+        if self._cancel_task(task_id):
+            self._waker.wake()
+            return True
+        return False
+
+    def enqueue_task_cancels(self, task_ids: t.Iterable[str]) -> list[str]:
+        """Cancel many tasks on the interchange, in one pass
+
+        As ``enqueue_task_cancel()``, for each of ``task_ids``.  Returns the ids
+        of those tasks that were dispatched to a manager.
         """
-        log.debug(f"Received task_cancel request for Task:{task_id}")
+        dispatched = [tid for tid in task_ids if self._cancel_task(tid)]
+        if dispatched:
+            self._waker.wake()
+        return dispatched
+
+    def _cancel_task(self, task_id: str) -> bool:
+        log.debug("Received task_cancel request for Task:%s", task_id)
 
         self.task_cancel_pending_trap[task_id] = task_id
-        for manager in self._ready_manager_queue:
-            for task_type in self._ready_manager_queue[manager]["tasks"]:
-                for tid in self._ready_manager_queue[manager]["tasks"][task_type]:
-                    if tid == task_id:
-                        log.debug(
-                            f"Task:{task_id} is running, "
-                            "moving task_cancel message onto queue"
-                        )
-                        self.task_cancel_running_queue.put((manager, task_id))
-                        self.task_cancel_pending_trap.pop(task_id, None)
-                        break
-        return
+        location = self._task_locations.get(task_id)
+        if location is None:
+            return False
+
+        log.debug("Task:%s is running, moving task_cancel message onto queue", task_id)
+        self.task_cancel_running_queue.put((location[0], task_id))
+        self.task_cancel_pending_trap.pop(task_id, None)
+        return True
 
     def handle_sigterm(self, sig_num, curr_stack_frame):
         log.warning("Received SIGTERM, stopping")
@@ -664,26 +755,25 @@ class Interchange:
     def stop(self):
         """Prepare the interchange for shutdown"""
         self._kill_event.set()
+        self._waker.wake()
 
         self._task_puller_thread.join()
         self._command_thread.join()
         self._status_report_thread.join()
         log.info("HighThroughput Interchange stopped")
 
-    def start(self, poll_period: int | None = None) -> None:
+    def start(self) -> None:
         """Start the Interchange
 
-        Parameters:
-        ----------
-        poll_period : int
-           poll_period in milliseconds
+        The main loop is event driven: it sleeps until a manager message arrives,
+        another interchange thread queues work (new tasks, task cancellations,
+        status reports), or a timer (missed manager heartbeats, soft-mode cold
+        routing) is due.  Dispatch only runs when pending tasks or manager
+        capacity have changed since the previous dispatch.
         """
         signal.signal(signal.SIGTERM, self.handle_sigterm)
         log.info("Incoming ports bound")
 
-        if poll_period is None:
-            poll_period = self.poll_period
-
         start = time.time()
         count = 0
 
@@ -719,6 +809,7 @@ class Interchange:
         # poller.register(self.task_incoming, zmq.POLLIN)
         poller.register(self.task_outgoing, zmq.POLLIN)
         poller.register(self.results_incoming, zmq.POLLIN)
+        poller.register(self._waker.fd, zmq.POLLIN)
 
         # These are managers which we should examine in an iteration
         # for scheduling a job (or maybe any other attention?).
@@ -726,19 +817,39 @@ class Interchange:
         # onto this list.
         interesting_managers: set[bytes] = set()
 
-        # This value records when the last cold routing in soft mode happens
+        # Heartbeat expiry of each manager, and the soft-mode cold routing interval
+        timers = TimerWheel()
+
         # When the cold routing in soft mode happens, it may cause worker containers to
         # switch
         # Cold routing is to reduce the number idle workers of specific task types on
         # the managers when there are not enough tasks of those types in the task queues
         # on interchange
-        last_cold_routing_time = time.time()
+        if self.scheduler_mode == "soft":
+            timers.schedule(
+                _COLD_ROUTING_TIMER, time.time() + self.cold_routing_interval
+            )
+        cold_routing = False
         prev_manager_stat = None
 
-        task_deltas_to_merge: dict[str, list[TaskTransition]] = defaultdict(list)
+        # Dispatch is only worthwhile if tasks have arrived or manager capacity has
+        # changed since the last dispatch
+        dispatch_needed = True
+        task_arrivals_seen = 0
+
+        task_deltas_to_merge = TaskStatusDeltas()
 
         while not self._kill_event.is_set():
-            self.socks = dict(poller.poll(timeout=poll_period))
+            timeout = timers.timeout()
+            timeout_ms = None if timeout is None else math.ceil(timeout * 1000)
+            self.socks = dict(poller.poll(timeout=timeout_ms))
+
+            if self._waker.fd in self.socks:
+                self._waker.drain()
+
+            if self._task_arrivals != task_arrivals_seen:
+                task_arrivals_seen = self._task_arrivals
+                dispatch_needed = True
 
             # Listen for requests for work
             if (
@@ -773,6 +884,7 @@ class Interchange:
                         "active": True,
                         "tasks": collections.defaultdict(set),
                         "total_tasks": 0,
+                        "worker_stats": {},
                     }
                     if reg_flag is True:
                         interesting_managers.add(manager)
@@ -782,6 +894,7 @@ class Interchange:
                         )
                         mdata.update(msg)
                         self._ready_manager_queue[manager] = mdata
+                        timers.schedule(manager, now + self.heartbeat_threshold)
 
                         if (
                             msg["python_v"].rsplit(".", 1)[0]
@@ -815,15 +928,25 @@ class Interchange:
                     if message[1] == b"HEARTBEAT":
                         log.debug("Manager %s sends heartbeat", manager)
                         self.task_outgoing.send_multipart(
-                            [manager, b"", PKL_HEARTBEAT_CODE]
+                            [manager, b"", *framing.HEARTBEAT_FRAMES]
                         )
                     else:
-                        manager_adv = dill.loads(message[1])
-                        log.debug("Manager %s requested %s", manager, manager_adv)
-                        manager_adv["total_workers"] = sum(manager_adv["free"].values())
-                        mdata["free_capacity"].update(manager_adv)
-                        interesting_managers.add(manager)
-                        del manager_adv
+                        try:
+                            kind, _, payloads = framing.unpack(message[1:])
+                            if kind is not framing.FrameKind.ADVERTISEMENT:
+                                raise framing.WireFormatError(f"Unexpected {kind}")
+                            manager_adv = framing.unpack_advertisement(payloads)
+                        except Exception:
+                            log.exception("Bad message from manager %s", manager)
+                        else:
+                            log.debug("Manager %s requested %s", manager, manager_adv)
+                            manager_adv["total_workers"] = sum(
+                                manager_adv["free"].values()
+                            )
+                            mdata["free_capacity"].update(manager_adv)
+                            interesting_managers.add(manager)
+                            dispatch_needed = True
+                            del manager_adv
 
             # If we had received any requests, check if there are tasks that could be
             # passed
@@ -831,26 +954,46 @@ class Interchange:
             cur_manager_stat = len(self._ready_manager_queue), len(interesting_managers)
             if cur_manager_stat != prev_manager_stat:
                 prev_manager_stat = cur_manager_stat
-                _msg = "[MAIN] New managers count (total/interesting): {}/{}"
-                log.debug(_msg.format(*cur_manager_stat))
+                _msg = "[MAIN] New managers count (total/interesting): %s/%s"
+                log.debug(_msg, *cur_manager_stat)
 
-            if time.time() - last_cold_routing_time > self.cold_routing_interval:
-                task_dispatch, dispatched_task = naive_interchange_task_dispatch(
-                    interesting_managers,
-                    self.pending_task_queue,
-                    self._ready_manager_queue,
-                    scheduler_mode=self.scheduler_mode,
-                    cold_routing=True,
-                )
-                last_cold_routing_time = time.time()
-            else:
+            now = time.time()
+            bad_managers: list[bytes] = []
+            for key in timers.expire(now):
+                if key == _COLD_ROUTING_TIMER:
+                    cold_routing = True
+                    timers.schedule(key, now + self.cold_routing_interval)
+                    continue
+                manager = t.cast(bytes, key)
+                mdata = self._ready_manager_queue.get(manager)
+                if not mdata:
+                    continue
+                if now - self.heartbeat_threshold > mdata["last"]:
+                    bad_managers.append(manager)
+                else:
+                    timers.schedule(manager, mdata["last"] + self.heartbeat_threshold)
+
+            task_dispatch: dict[bytes, list] = {}
+            dispatched_task = 0
+            if self.scheduler_mode == "indexed":
+                if dispatch_needed:
+                    task_dispatch, dispatched_task = indexed_interchange_task_dispatch(
+                        interesting_managers,
+                        self.pending_task_queue,
+                        self._ready_manager_queue,
+                        self._capacity_index,
+                    )
+            elif dispatch_needed or cold_routing:
                 task_dispatch, dispatched_task = naive_interchange_task_dispatch(
                     interesting_managers,
                     self.pending_task_queue,
                     self._ready_manager_queue,
                     scheduler_mode=self.scheduler_mode,
-                    cold_routing=False,
+                    cold_routing=cold_routing,
+                    manager_order=self.scheduling_policy.order_managers,
                 )
+                cold_routing = False
+            dispatch_needed = False
 
             self.total_pending_task_count -= dispatched_task
 
@@ -862,50 +1005,60 @@ class Interchange:
                     log.debug(
                         "CANCELLED running task (id: %s, manager: %s)", task_id, manager
                     )
-                    cancel_message = dill.dumps(("TASK_CANCEL", task_id))
-                    self.task_outgoing.send_multipart([manager, b"", cancel_message])
+                    self.task_outgoing.send_multipart(
+                        [manager, b"", *framing.pack_task_cancel(task_id)]
+                    )
             except queue.Empty:
                 pass
 
             for manager in task_dispatch:
                 tasks = task_dispatch[manager]
                 if tasks:
-                    log.info(
-                        'Sending task message "{}..." to manager {!r}'.format(
-                            str(tasks)[:50], manager
-                        )
-                    )
-                    serializd_raw_tasks_buffer = dill.dumps(tasks)
+                    log.info("Sending %s tasks to manager %r", len(tasks), manager)
+                    # Task buffers are sent as-is, without copying
                     self.task_outgoing.send_multipart(
-                        [manager, b"", serializd_raw_tasks_buffer]
+                        [manager, b"", *framing.pack_tasks(tasks)], copy=False
                     )
 
                     for task in tasks:
                         task_id = task["task_id"]
-                        log.info(f"Sent task {task_id} to manager {manager!r}")
+                        log.info(
+                            "Sent task %s to manager %r",
+                            task_id,
+                            manager,
+                            extra={"task_id": task_id},
+                        )
+                        # Record the location before checking the trap; see
+                        # enqueue_task_cancel()
+                        self._task_locations[task_id] = (
+                            manager,
+                            task["local_container"],
+                        )
                         if (
                             self.task_cancel_pending_trap
                             and task_id in self.task_cancel_pending_trap
                         ):
-                            log.info(f"Task:{task_id} CANCELLED before launch")
-                            cancel_message = dill.dumps(("TASK_CANCEL", task_id))
+                            log.info("Task:%s CANCELLED before launch", task_id)
                             self.task_outgoing.send_multipart(
-                                [manager, b"", cancel_message]
+                                [manager, b"", *framing.pack_task_cancel(task_id)]
                             )
-                            self.task_cancel_pending_trap.pop(task_id)
+                            self.task_cancel_pending_trap.pop(task_id, None)
                         else:
-                            log.debug("Task:%s is now WAITING_FOR_LAUNCH", task_id)
-                            tt = TaskTransition(
-                                timestamp=time.time_ns(),
-                                state=TaskState.WAITING_FOR_LAUNCH,
-                                actor=ActorName.INTERCHANGE,
+                            log.debug(
+                                "Task:%s is now WAITING_FOR_LAUNCH",
+                                task_id,
+                                extra={"task_id": task_id},
+                            )
+                            task_deltas_to_merge.append(
+                                task_id,
+                                TaskState.WAITING_FOR_LAUNCH,
+                                ActorName.INTERCHANGE,
+                                time.time_ns(),
                             )
-                            task_deltas_to_merge[task_id].append(tt)
 
             if task_deltas_to_merge:
                 with self._task_status_delta_lock:
-                    for task_id, deltas in task_deltas_to_merge.items():
-                        self.task_status_deltas[task_id].extend(deltas)
+                    self.task_status_deltas.merge(task_deltas_to_merge)
                 task_deltas_to_merge.clear()
 
             # Receive any results and forward to client
@@ -914,7 +1067,7 @@ class Interchange:
                 and self.socks[self.results_incoming] == zmq.POLLIN
             ):
                 log.debug("entering results_incoming section")
-                manager, *b_messages = self.results_incoming.recv_multipart()
+                manager, *frames = self.results_incoming.recv_multipart()
                 mdata = self._ready_manager_queue.get(manager)
                 if not mdata:
                     log.warning(
@@ -922,64 +1075,81 @@ class Interchange:
                         manager,
                     )
                 else:
-                    # We expect the batch of messages to be (optionally) a task status
-                    # update message followed by 0 or more task results
+                    # We expect the batch to be 0 or more task results, followed
+                    # (optionally) by a task status update message
                     try:
-                        log.debug("Trying to unpack")
-                        manager_report = Message.unpack(b_messages[0])
-                        if manager_report.task_statuses:
+                        _, records, payloads = framing.unpack(frames)
+                        results, b_report = framing.unpack_results(records, payloads)
+                    except framing.WireFormatError:
+                        log.exception("Bad result batch from manager %s", manager)
+                        results, b_report = [], None
+
+                    if b_report is not None:
+                        try:
+                            log.debug("Trying to unpack")
+                            manager_report = Message.unpack(b_report)
+                            if manager_report.task_statuses:
+                                log.info(
+                                    "Got manager status report: %s",
+                                    manager_report.task_statuses,
+                                )
+
+                                for tid, sts in manager_report.task_statuses.items():
+                                    task_deltas_to_merge.extend(tid, sts)
+
+                            self.task_outgoing.send_multipart(
+                                [manager, b"", *framing.HEARTBEAT_FRAMES]
+                            )
+                            mdata["last"] = time.time()
+                            self.container_switch_count[
+                                manager
+                            ] = manager_report.container_switch_count
+                            self.scheduling_policy.record_container_switches(
+                                manager, manager_report.container_switch_count
+                            )
                             log.info(
-                                "Got manager status report: %s",
-                                manager_report.task_statuses,
+                                "Got container switch count: %s",
+                                self.container_switch_count,
                             )
+                            mdata["worker_stats"] = manager_report.worker_stats
+                            log.debug(
+                                "Manager %s worker stats: %s",
+                                manager,
+                                manager_report.worker_stats,
+                            )
+                        except Exception:
+                            pass
 
-                            for tid, statuses in manager_report.task_statuses.items():
-                                task_deltas_to_merge[tid].extend(statuses)
-
-                        self.task_outgoing.send_multipart(
-                            [manager, b"", PKL_HEARTBEAT_CODE]
-                        )
-                        b_messages = b_messages[1:]
-                        mdata["last"] = time.time()
-                        self.container_switch_count[
-                            manager
-                        ] = manager_report.container_switch_count
-                        log.info(
-                            "Got container switch count: %s",
-                            self.container_switch_count,
-                        )
-                    except Exception:
-                        pass
-                    if len(b_messages):
-                        log.info(f"Got {len(b_messages)} result items in batch")
+                    b_messages = []
+                    if results:
+                        log.info("Got %s result items in batch", len(results))
                         with self._task_status_delta_lock:
-                            for idx, b_message in enumerate(b_messages):
-                                r = dill.loads(b_message)
-                                tid = r["task_id"]
-
-                                log.debug(
-                                    "Received task result %s (from %s)", tid, manager
-                                )
-                                task_container = self.containers[r["container_id"]]
+                            for tid, container_id, b_message in results:
                                 log.debug(
-                                    "Removing for manager: %s from %s",
+                                    "Received task result %s (from %s)",
+                                    tid,
                                     manager,
-                                    self._ready_manager_queue,
+                                    extra={"task_id": tid},
                                 )
+                                task_container = self.containers[container_id]
 
                                 mdata["tasks"][task_container].remove(tid)
+                                self._task_locations.pop(tid, None)
 
                                 # Transfer any outstanding task statuses to the
-                                # result message
+                                # result message; only then is the result unpacked
                                 if tid in self.task_status_deltas:
-                                    r["task_statuses"] += self.task_status_deltas[tid]
-                                    del self.task_status_deltas[tid]
-                                    b_messages[idx] = dill.dumps(r)
+                                    r = dill.loads(b_message)
+                                    r["task_statuses"] += self.task_status_deltas.pop(
+                                        tid
+                                    )
+                                    b_message = dill.dumps(r)
                                     log.debug(
                                         "Transferring statuses for %s: %s",
                                         tid,
                                         r["task_statuses"],
                                     )
+                                b_messages.append(b_message)
 
                         mdata["total_tasks"] -= len(b_messages)
 
@@ -988,26 +1158,21 @@ class Interchange:
                     # self.results_outgoing.send_multipart(b_messages)
                     self.results_outgoing.send(dill.dumps(b_messages))
                     interesting_managers.add(manager)
+                    dispatch_needed = True
 
-                    log.debug(f"Current tasks: {mdata['tasks']}")
+                    log.debug("Outstanding tasks: %s", mdata["total_tasks"])
                 log.debug("leaving results_incoming section")
 
             # Send status reports from this main thread to avoid thread-safety on zmq
             # sockets
             try:
-                packed_status_report = status_report_queue.get(block=False)
-                log.trace("forwarding status report: %s", packed_status_report)
-                self.results_outgoing.send(packed_status_report)
+                while True:
+                    packed_status_report = status_report_queue.get(block=False)
+                    log.trace("forwarding status report: %s", packed_status_report)
+                    self.results_outgoing.send(packed_status_report)
             except queue.Empty:
                 pass
 
-            now = time.time()
-            hbt_window_start = now - self.heartbeat_threshold
-            bad_managers = [
-                manager
-                for manager, mdata in self._ready_manager_queue.items()
-                if hbt_window_start > mdata["last"]
-            ]
             bad_manager_msgs = []
             for manager in bad_managers:
                 log.debug(
@@ -1015,9 +1180,10 @@ class Interchange:
                     self._ready_manager_queue[manager]["last"],
                     now,
                 )
-                log.warning(f"Too many heartbeats missed for manager {manager!r}")
+                log.warning("Too many heartbeats missed for manager %r", manager)
                 for tasks in self._ready_manager_queue[manager]["tasks"].values():
                     for tid in tasks:
+                        self._task_locations.pop(tid, None)
                         try:
                             raise ManagerLost(manager)
                         except Exception:
@@ -1028,14 +1194,17 @@ class Interchange:
                             }
                             pkl_package = dill.dumps(result_package)
                             bad_manager_msgs.append(pkl_package)
-                log.warning(f"Unregistering manager {manager!r}")
+                log.warning("Unregistering manager %r", manager)
                 self._ready_manager_queue.pop(manager, None)
+                self._capacity_index.discard(manager)
+                self.scheduling_policy.forget_manager(manager)
                 if manager in interesting_managers:
                     interesting_managers.remove(manager)
             if bad_manager_msgs:
-                log.warning(f"Sending task failure reports of manager {manager!r}")
+                log.warning("Sending task failure reports of manager %r", manager)
                 self.results_outgoing.send(dill.dumps(bad_manager_msgs))
 
+        self._waker.close()
         delta = time.time() - start
         log.info(f"Processed {count} tasks in {delta} seconds")
         log.warning("Exiting")
@@ -1071,7 +1240,7 @@ class Interchange:
             if self.provider:
                 self._block_counter += 1
                 external_block_id = str(self._block_counter)
-                if not task_type and self.scheduler_mode == "hard":
+                if not task_type and self.manager_scheduler_mode == "hard":
                     launch_cmd = self.launch_cmd.format(
                         block_id=external_block_id, worker_type="RAW"
                     )
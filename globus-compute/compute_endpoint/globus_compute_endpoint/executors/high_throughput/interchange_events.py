@@ -0,0 +1,145 @@
+"""Event sources for the interchange main loop
+
+The interchange main loop sleeps in ``zmq.Poller.poll()`` until there is something
+to do.  Besides the manager sockets, it must wake for work handed to it by the
+other interchange threads (``Waker``), and for deadlines such as missed manager
+heartbeats and cold-routing passes (``TimerWheel``).
+"""
+from __future__ import annotations
+
+import math
+import os
+import time
+import typing as t
+
+
+class Waker:
+    """Wake a thread blocked in ``zmq.Poller.poll()`` from other threads
+
+    A self-pipe: register ``fd`` with the poller for ``zmq.POLLIN``, call
+    ``wake()`` from any thread, and ``drain()`` from the polling thread once it has
+    woken.  Consecutive wakes between drains are coalesced into a single write.
+    """
+
+    def __init__(self):
+        self._r, self._w = os.pipe()
+        os.set_blocking(self._r, False)
+        os.set_blocking(self._w, False)
+        self._pending = False
+
+    @property
+    def fd(self) -> int:
+        return self._r
+
+    def wake(self) -> None:
+        if self._pending:
+            return
+        self._pending = True
+        try:
+            os.write(self._w, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # pipe full (so a wake is already pending) or closed
+
+    def drain(self) -> None:
+        # Clear the flag before draining, so a wake() racing with the drain leaves
+        # either its byte in the pipe or its work visible to the caller
+        self._pending = False
+        try:
+            while os.read(self._r, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self) -> None:
+        for fd in (self._r, self._w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class TimerWheel:
+    """A hashed timing wheel of keyed, one-shot timers
+
+    Deadlines are bucketed into ``num_slots`` slots of ``tick`` seconds each;
+    deadlines more than one rotation away simply wait in their slot until a later
+    rotation.  Each key has at most one pending timer: scheduling an existing key
+    replaces its timer.  Scheduling and cancelling are O(1); ``expire()`` visits
+    only the slots for the ticks that have elapsed since the previous call.
+
+    Timers fire with a resolution of ``tick``: never early, and at most one tick
+    late.
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.1,
+        num_slots: int = 512,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        if tick <= 0 or num_slots < 1:
+            raise ValueError("tick and num_slots must be positive")
+        self.tick = tick
+        self.num_slots = num_slots
+        self._clock = clock
+        self._slots: list[dict[t.Hashable, float]] = [{} for _ in range(num_slots)]
+        self._timers: dict[t.Hashable, int] = {}  # key -> slot index
+        self._current_tick = self._tick_of(clock())
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: t.Hashable) -> bool:
+        return key in self._timers
+
+    def _tick_of(self, when: float) -> int:
+        return math.floor(when / self.tick)
+
+    def schedule(self, key: t.Hashable, deadline: float) -> None:
+        """Fire ``key`` at ``deadline`` (a time as returned by the clock)"""
+        self.cancel(key)
+        slot = max(self._tick_of(deadline), self._current_tick) % self.num_slots
+        self._slots[slot][key] = deadline
+        self._timers[key] = slot
+
+    def cancel(self, key: t.Hashable) -> None:
+        slot = self._timers.pop(key, None)
+        if slot is not None:
+            del self._slots[slot][key]
+
+    def expire(self, now: float | None = None) -> list[t.Hashable]:
+        """Remove and return the keys of all timers due at or before ``now``"""
+        if now is None:
+            now = self._clock()
+        now_tick = self._tick_of(now)
+        last_tick = min(now_tick, self._current_tick + self.num_slots - 1)
+
+        fired = []
+        if self._timers:
+            for tick in range(self._current_tick, last_tick + 1):
+                slot = self._slots[tick % self.num_slots]
+                if not slot:
+                    continue
+                due = [key for key, deadline in slot.items() if deadline <= now]
+                for key in due:
+                    del slot[key]
+                    del self._timers[key]
+                fired.extend(due)
+        self._current_tick = max(self._current_tick, now_tick)
+        return fired
+
+    def timeout(self, now: float | None = None) -> float | None:
+        """Seconds until the next tick with a pending timer; None if there are none
+
+        The result is suitable as a poll timeout: the returned time is at the end
+        of the tick, after every deadline in that tick.
+        """
+        if not self._timers:
+            return None
+        if now is None:
+            now = self._clock()
+        for offset in range(self.num_slots):
+            tick = self._current_tick + offset
+            if self._slots[tick % self.num_slots]:
+                return max(0.0, (tick + 1) * self.tick - now)
+        return None  # unreachable while timers are pending
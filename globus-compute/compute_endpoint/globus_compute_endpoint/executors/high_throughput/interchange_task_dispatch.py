@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import collections
+import heapq
+import itertools
 import logging
 import queue
 import random
+import typing as t
 
 from globus_compute_endpoint.logging_config import ComputeLogger
 
 log: ComputeLogger = logging.getLogger(__name__)  # type: ignore
 log.info("Interchange task dispatch started")
 
+ManagerOrder = t.Callable[
+    [t.Iterable[bytes], t.Dict[bytes, dict], t.Dict[str, queue.Queue]],
+    t.List[bytes],
+]
+
 
 def naive_interchange_task_dispatch(
     interesting_managers: set[bytes],
@@ -17,11 +25,15 @@ def naive_interchange_task_dispatch(
     ready_manager_queue: dict[bytes, dict],
     scheduler_mode: str = "hard",
     cold_routing: bool = False,
+    manager_order: ManagerOrder | None = None,
 ) -> tuple[dict[bytes, list], int]:
     """
     This is an initial task dispatching algorithm for interchange.
     It returns a dictionary, whose key is manager, and the value is the list of tasks
     to be sent to manager, and the total number of dispatched tasks.
+
+    ``manager_order`` (typically a scheduling policy's ``order_managers``) decides
+    the order in which managers are offered tasks; by default, a random order.
     """
     task_dispatch: dict[bytes, list] = {}
     dispatched_tasks = 0
@@ -32,6 +44,7 @@ def naive_interchange_task_dispatch(
             pending_task_queue,
             ready_manager_queue,
             scheduler_mode="hard",
+            manager_order=manager_order,
         )
 
     elif scheduler_mode == "soft":
@@ -44,10 +57,159 @@ def naive_interchange_task_dispatch(
                 ready_manager_queue,
                 scheduler_mode="soft",
                 loop=loop,
+                manager_order=manager_order,
             )
     return task_dispatch, dispatched_tasks
 
 
+def indexed_interchange_task_dispatch(
+    interesting_managers: set[bytes],
+    pending_task_queue: dict[str, queue.Queue[dict]],
+    ready_manager_queue: dict[bytes, dict],
+    capacity_index: ManagerCapacityIndex,
+) -> tuple[dict[bytes, list], int]:
+    """
+    Hard-mode task dispatch backed by a capacity index.
+
+    Rather than shuffling and rescanning every interesting manager on every pass,
+    ``interesting_managers`` is treated as the set of managers whose state changed
+    since the last pass; only those are (re)indexed, after which each task type with
+    pending tasks pulls managers from the index in order of free capacity.  The cost
+    of a pass is thereby proportional to the number of changed managers and tasks
+    placed, rather than to the total number of connected managers.
+
+    Returns the same shape as ``naive_interchange_task_dispatch``: a dictionary of
+    manager to the list of tasks to send to it, and the total number of dispatched
+    tasks.
+    """
+    for dirty in interesting_managers:
+        capacity_index.update(dirty, ready_manager_queue.get(dirty))
+    interesting_managers.clear()
+
+    task_dispatch: dict[bytes, list] = {}
+    dispatched_tasks = 0
+    for task_type, task_q in pending_task_queue.items():
+        while not task_q.empty():
+            manager = capacity_index.pop(task_type)
+            if manager is None:
+                log.trace("No managers with free capacity for type %s", task_type)
+                break
+
+            mdata = ready_manager_queue.get(manager)
+            if not (mdata and mdata["active"]):
+                # lost or held since it was last indexed; pop() already dropped it
+                continue
+
+            real_capacity = _real_capacity(mdata)
+            tasks, tids = get_tasks_hard(pending_task_queue, mdata, real_capacity)
+            if tasks:
+                for tids_type in tids:
+                    # This line is a set update, not dict update
+                    mdata["tasks"][tids_type].update(tids[tids_type])
+                mdata["total_tasks"] += len(tasks)
+                task_dispatch.setdefault(manager, []).extend(tasks)
+                dispatched_tasks += len(tasks)
+                log.debug("Assigned %s tasks to manager %s", len(tasks), manager)
+            capacity_index.update(manager, mdata)
+            if not tasks:
+                # Capacity advertised, but nothing taken (e.g., a race with another
+                # consumer of the queue); leave this type for the next pass
+                break
+
+    log.trace(
+        "The indexed task dispatch is %s, in total %s tasks",
+        task_dispatch,
+        dispatched_tasks,
+    )
+    return task_dispatch, dispatched_tasks
+
+
+def _real_capacity(mdata: dict) -> int:
+    return min(
+        mdata["free_capacity"]["total_workers"],
+        mdata["max_worker_count"] - mdata["total_tasks"],
+    )
+
+
+class ManagerCapacityIndex:
+    """Index of managers by worker type and free capacity
+
+    Each worker type has a max-heap of ``(capacity, manager)`` entries.  Updates push
+    a new entry and record the manager's current capacity; entries that no longer
+    match the recorded capacity are stale and are discarded lazily when popped.  The
+    heaps are compacted whenever stale entries outnumber the live ones, so memory
+    stays proportional to the number of managers.
+
+    Capacity is computed with hard scheduler semantics: a manager of worker type
+    ``T`` can accept tasks of type ``T`` into its free ``T`` workers and into its
+    unused worker slots, bounded by the manager's total free capacity.
+    """
+
+    def __init__(self):
+        self._heaps: dict[str, list[tuple[int, int, bytes]]] = {}
+        self._entries: dict[bytes, tuple[str, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, manager: bytes) -> bool:
+        return manager in self._entries
+
+    @staticmethod
+    def capacity_of(mdata: dict | None) -> tuple[str | None, int]:
+        """Return the (worker type, dispatchable capacity) of a manager"""
+        if not mdata or not mdata.get("active"):
+            return None, 0
+        task_type = mdata.get("worker_type")
+        if not task_type:
+            return None, 0
+        free = mdata["free_capacity"].get("free", {})
+        type_capacity = free.get(task_type, 0) + free.get("unused", 0)
+        return task_type, max(0, min(_real_capacity(mdata), type_capacity))
+
+    def update(self, manager: bytes, mdata: dict | None):
+        """(Re)index a manager; managers without capacity are removed"""
+        task_type, capacity = self.capacity_of(mdata)
+        if task_type is None or capacity < 1:
+            self.discard(manager)
+            return
+
+        if self._entries.get(manager) == (task_type, capacity):
+            return
+        self._entries[manager] = (task_type, capacity)
+        heap = self._heaps.setdefault(task_type, [])
+        heapq.heappush(heap, (-capacity, next(self._counter), manager))
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def discard(self, manager: bytes):
+        """Remove a manager from the index; stale heap entries are dropped lazily"""
+        self._entries.pop(manager, None)
+
+    def pop(self, task_type: str) -> bytes | None:
+        """Remove and return the manager with the most free capacity for task_type
+
+        Returns None if no manager of that type has free capacity.  The caller is
+        expected to ``update()`` the manager after assigning tasks to it.
+        """
+        heap = self._heaps.get(task_type)
+        while heap:
+            neg_capacity, _, manager = heapq.heappop(heap)
+            if self._entries.get(manager) == (task_type, -neg_capacity):
+                del self._entries[manager]
+                return manager
+        return None
+
+    def _compact(self):
+        heaps: dict[str, list[tuple[int, int, bytes]]] = collections.defaultdict(list)
+        for manager, (task_type, capacity) in self._entries.items():
+            heaps[task_type].append((-capacity, next(self._counter), manager))
+        for heap in heaps.values():
+            heapq.heapify(heap)
+        self._heaps = dict(heaps)
+
+
 def dispatch(
     task_dispatch: dict[bytes, list],
     interesting_managers: set[bytes],
@@ -55,6 +217,7 @@ def dispatch(
     ready_manager_queue: dict[bytes, dict],
     scheduler_mode: str = "hard",
     loop: str = "warm",
+    manager_order: ManagerOrder | None = None,
 ) -> int:
     """
     This is the core task dispatching algorithm for interchange.
@@ -62,9 +225,14 @@ def dispatch(
     """
     dispatched_tasks = 0
     if interesting_managers:
-        shuffled_managers = list(interesting_managers)
-        random.shuffle(shuffled_managers)
-        for manager in shuffled_managers:
+        if manager_order is None:
+            ordered_managers = list(interesting_managers)
+            random.shuffle(ordered_managers)
+        else:
+            ordered_managers = manager_order(
+                interesting_managers, ready_manager_queue, pending_task_queue
+            )
+        for manager in ordered_managers:
             mdata = ready_manager_queue[manager]
             tasks_inflight = mdata["total_tasks"]
             real_capacity: int = min(
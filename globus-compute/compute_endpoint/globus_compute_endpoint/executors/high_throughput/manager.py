@@ -26,22 +26,24 @@ from globus_compute_endpoint.exception_handling import (
     get_error_string,
     get_result_error_details,
 )
+from globus_compute_endpoint.executors.high_throughput import framing
 from globus_compute_endpoint.executors.high_throughput.container_sched import (
     naive_scheduler,
 )
-from globus_compute_endpoint.executors.high_throughput.mac_safe_queue import mpQueue
 from globus_compute_endpoint.executors.high_throughput.messages import (
     ManagerStatusReport,
-    Message,
     Task,
 )
+from globus_compute_endpoint.executors.high_throughput.worker_forkserver import (
+    ForkedWorker,
+    WorkerForkServer,
+)
 from globus_compute_endpoint.executors.high_throughput.worker_map import WorkerMap
 from globus_compute_endpoint.logging_config import ComputeLogger, setup_logging
 from parsl.version import VERSION as PARSL_VERSION
 
 RESULT_TAG = 10
 TASK_REQUEST_TAG = 11
-HEARTBEAT_CODE = (2**32) - 1
 
 log: ComputeLogger = logging.getLogger(__name__)  # type: ignore
 
@@ -98,6 +100,7 @@ class Manager:
         scheduler_mode="hard",
         worker_type=None,
         worker_max_idletime=60,
+        worker_launch_method="forkserver",
         # TODO : This should be 10ms
         poll_period=100,
     ):
@@ -160,6 +163,14 @@ class Manager:
         worker_type : str
              If set, the worker type for this manager is fixed. Default: None
 
+        worker_launch_method : str
+             How to start workers:
+              1. forkserver : fork workers from a warm, already-imported template
+                              process; containerized workers are still started
+                              with Popen
+              2. popen : start each worker as a new globus-compute-worker process
+             Default: forkserver (popen where forkserver is unavailable)
+
         poll_period : int
              Timeout period used by the manager in milliseconds. Default: 10ms
         """
@@ -207,7 +218,18 @@ class Manager:
                 self.max_worker_count, len(self.available_accelerators)
             )
 
-        self.worker_map = WorkerMap(self.max_worker_count, self.available_accelerators)
+        if worker_launch_method not in ("forkserver", "popen"):
+            raise ValueError(f"Unknown worker launch method: {worker_launch_method}")
+        forkserver = None
+        if worker_launch_method == "forkserver":
+            if WorkerForkServer.is_available():
+                forkserver = WorkerForkServer()
+            else:
+                log.warning("forkserver unavailable on this platform; using popen")
+
+        self.worker_map = WorkerMap(
+            self.max_worker_count, self.available_accelerators, forkserver=forkserver
+        )
 
         self.internal_worker_port_range = internal_worker_port_range
 
@@ -232,7 +254,9 @@ class Manager:
         self.outstanding_task_count: dict[str, int] = {}
         self.task_type_mapping: dict[str, str] = {}
 
-        self.pending_result_queue = mpQueue()
+        # Only shared between this process' threads: a plain Queue spares pickling
+        # every result on its way to the result pusher
+        self.pending_result_queue: queue.Queue = queue.Queue()
 
         self.max_queue_size = max_queue_size + self.max_worker_count
         self.tasks_per_round = 1
@@ -241,7 +265,7 @@ class Manager:
         self.heartbeat_threshold = heartbeat_threshold
         self.poll_period = poll_period
         self.next_worker_q: list[str] = []  # FIFO queue for spinning up workers.
-        self.worker_procs: dict[str, subprocess.Popen] = {}
+        self.worker_procs: dict[str, subprocess.Popen | ForkedWorker] = {}
 
         self.task_status_deltas: dict[str, list[TaskTransition]] = defaultdict(list)
 
@@ -255,6 +279,8 @@ class Manager:
             name="Status-Report",
         )
         self.container_switch_count = 0
+        # Hits and misses of the workers' deserialized-function caches
+        self.function_cache_counts = {"hits": 0, "misses": 0}
 
         self.poller = zmq.Poller()
         self.poller.register(self.task_incoming, zmq.POLLIN)
@@ -335,8 +361,7 @@ class Manager:
             if pending_task_count < self.max_queue_size and ready_worker_count > 0:
                 ads = self.worker_map.advertisement()
                 log.trace("Requesting tasks: %s", ads)
-                msg = dill.dumps(ads)
-                self.task_incoming.send(msg)
+                self.task_incoming.send_multipart(framing.pack_advertisement(ads))
 
             # Receive results from the workers, if any
             socks = dict(self.poller.poll(timeout=poll_timer))
@@ -358,18 +383,24 @@ class Manager:
                 #       task_revc_counter
                 #   )
                 poll_timer = 0
-                _, pkl_msg = self.task_incoming.recv_multipart()
-                message = dill.loads(pkl_msg)
+                # Received without copying; task buffers are forwarded to the workers
+                # as-is
+                _, *frames = self.task_incoming.recv_multipart(copy=False)
                 last_interchange_contact = time.time()
+                try:
+                    kind, records, payloads = framing.unpack(frames)
+                except framing.WireFormatError:
+                    log.exception("Ignoring malformed message from interchange")
+                    continue
 
-                if message == "STOP":
+                if kind is framing.FrameKind.STOP:
                     log.critical("Received stop request")
                     kill_event.set()
                     break
 
-                elif type(message) == tuple and message[0] == "TASK_CANCEL":
+                elif kind is framing.FrameKind.TASK_CANCEL:
                     with self.task_finalization_lock:
-                        task_id = message[1]
+                        task_id = records[0][0]
                         log.info(f"Received TASK_CANCEL request for task: {task_id}")
                         if task_id not in self.task_worker_map:
                             log.warning(f"Task:{task_id} is not in task_worker_map.")
@@ -417,7 +448,9 @@ class Manager:
                                 "error_details": get_result_error_details(e),
                                 "exception": get_error_string(tb_levels=0),
                             }
-                            self.pending_result_queue.put(dill.dumps(result_package))
+                            self.pending_result_queue.put(
+                                (task_id, worker_type, dill.dumps(result_package))
+                            )
 
                         worker_proc = self.worker_map.add_worker(
                             worker_id=str(self.worker_map.worker_id_counter),
@@ -433,25 +466,21 @@ class Manager:
                         self.task_worker_map.pop(task_id)
                         self.remove_task(task_id)
 
-                elif message == HEARTBEAT_CODE:
+                elif kind is framing.FrameKind.HEARTBEAT:
                     log.debug("Got heartbeat from interchange")
 
-                else:
+                elif kind is framing.FrameKind.TASKS:
                     tasks = [
-                        (rt["local_container"], Message.unpack(rt["raw_buffer"]))
-                        for rt in message
+                        (wt.local_container, wt)
+                        for wt in framing.unpack_tasks(records, payloads)
                     ]
 
                     task_recv_counter += len(tasks)
                     log.debug(
-                        "Got tasks: {} of {}".format(
-                            [t[1].task_id for t in tasks], task_recv_counter
-                        )
+                        "Got %s tasks (%s in total)", len(tasks), task_recv_counter
                     )
 
                     for task_type, task in tasks:
-                        log.debug(f"Task is of type: {task_type}")
-
                         if task_type not in self.task_queues:
                             self.task_queues[task_type] = queue.Queue()
                         if task_type not in self.outstanding_task_count:
@@ -460,13 +489,10 @@ class Manager:
                         self.outstanding_task_count[task_type] += 1
                         self.task_type_mapping[task.task_id] = task_type
                         log.debug(
-                            "Got task: Outstanding task counts: {}".format(
-                                self.outstanding_task_count
-                            )
-                        )
-                        log.debug(
-                            f"Task {task.task_id} pushed to task queue "
-                            f"for type: {task_type}"
+                            "Task %s pushed to task queue for type: %s",
+                            task.task_id,
+                            task_type,
+                            extra={"task_id": task.task_id},
                         )
 
             else:
@@ -563,37 +589,43 @@ class Manager:
                             == 0
                         ):
                             log.debug(
-                                "Task type {} has task queue size {}".format(
-                                    task_type, self.task_queues[task_type].qsize()
-                                )
-                            )
-                            log.debug(
-                                "... and available workers: {}".format(
-                                    self.worker_map.worker_queues[task_type].qsize()
-                                )
+                                "Task type %s has task queue size %s"
+                                " and available workers: %s",
+                                task_type,
+                                self.task_queues[task_type].qsize(),
+                                self.worker_map.worker_queues[task_type].qsize(),
                             )
 
                             self.send_task_to_worker(task_type)
 
     def poll_funcx_task_socket(self, test=False):
         try:
-            w_id, m_type, message = self.funcx_task_socket.recv_multipart()
+            w_id, m_type, *frames = self.funcx_task_socket.recv_multipart()
             if m_type == b"REGISTER":
-                reg_info = dill.loads(message)
-                log.debug(f"Registration received from worker:{w_id} {reg_info}")
-                self.worker_map.register_worker(w_id, reg_info["worker_type"])
+                _, records, _ = framing.unpack(frames)
+                (_, worker_type), *_ = records
+                log.debug(f"Registration received from worker:{w_id} {worker_type}")
+                self.worker_map.register_worker(w_id, worker_type)
 
             elif m_type == b"TASK_RET":
                 # the following steps are also shared by task_cancel
                 with self.task_finalization_lock:
-                    log.debug(f"Result received from worker: {w_id}")
-                    task_id = dill.loads(message)["task_id"]
+                    log.debug("Result received from worker: %s", w_id)
+                    _, records, payloads = framing.unpack(frames)
+                    (task_id, container_id, cache_field), *_ = records
+                    cache_hit = framing.unpack_function_cache_hit(cache_field)
+                    if cache_hit is not None:
+                        self.function_cache_counts[
+                            "hits" if cache_hit else "misses"
+                        ] += 1
                     try:
                         self.remove_task(task_id)
                     except KeyError:
                         log.exception(f"Task:{task_id} missing in task structure")
                     else:
-                        self.pending_result_queue.put(message)
+                        self.pending_result_queue.put(
+                            (task_id, container_id, payloads[0])
+                        )
                         self.worker_map.put_worker(w_id)
 
             elif m_type == b"WRKR_DIE":
@@ -623,7 +655,7 @@ class Manager:
                 log.debug(f"[WORKER_REMOVE] Worker processes: {self.worker_procs}")
 
             if test:
-                return dill.loads(message)
+                return frames
 
         except Exception:
             log.exception("Unhandled exception while processing worker messages")
@@ -638,18 +670,22 @@ class Manager:
         task = self.task_queues[task_type].get()
         worker_id = self.worker_map.get_worker(task_type)
 
-        log.debug(f"Sending task {task.task_id} to {worker_id}")
-        # TODO: Some duplication of work could be avoided here
+        log.debug(
+            "Sending task %s to %s",
+            task.task_id,
+            worker_id,
+            extra={"task_id": task.task_id},
+        )
         to_send = [
             worker_id,
-            dill.dumps(task.task_id),
-            dill.dumps(task.container_id),
-            task.pack(),
+            *framing.pack_worker_task(task.task_id, task.container_id, task.pack()),
         ]
-        self.funcx_task_socket.send_multipart(to_send)
+        self.funcx_task_socket.send_multipart(to_send, copy=False)
         self.worker_map.update_worker_idle(task_type)
         if task.task_id != "KILL":
-            log.debug(f"Set task {task.task_id} to RUNNING")
+            log.debug(
+                "Set task %s to RUNNING", task.task_id, extra={"task_id": task.task_id}
+            )
             tt = TaskTransition(
                 timestamp=time.time_ns(),
                 state=TaskState.RUNNING,
@@ -669,8 +705,15 @@ class Manager:
             msg = ManagerStatusReport(
                 self.task_status_deltas,
                 self.container_switch_count,
+                worker_stats={
+                    "spinup": self.worker_map.spinup_report(),
+                    "function_cache": dict(self.function_cache_counts),
+                },
+            )
+            log.info(
+                "Sending status report to interchange (%s tasks)",
+                len(msg.task_statuses),
             )
-            log.info(f"Sending status report to interchange: {msg.task_statuses}")
             self.pending_result_queue.put(msg)
             if self.task_status_deltas:
                 log.info("Clearing task deltas")
@@ -694,17 +737,21 @@ class Manager:
 
         last_beat = time.time()
         items = []
+        status_report = None
 
         while not kill_event.is_set():
             try:
                 r = self.pending_result_queue.get(block=True, timeout=push_poll_period)
-                # This avoids the interchange searching and attempting to unpack every
-                # message in case it's a status report.
-                # (It would be better to use Task Messages eventually to make this more
-                #  uniform)
-                # TODO: use task messages, and don't have to prepend
+                # The status report travels in the same batch as the results, so the
+                # interchange does not have to search for it
                 if isinstance(r, ManagerStatusReport):
-                    items.insert(0, r.pack())
+                    if status_report is not None:
+                        # One report per batch: send the one already waiting first
+                        self.result_outgoing.send_multipart(
+                            framing.pack_results(items, status_report), copy=False
+                        )
+                        items = []
+                    status_report = r.pack()
                 else:
                     items.append(r)
             except queue.Empty:
@@ -719,9 +766,12 @@ class Manager:
                 or time.time() > last_beat + push_poll_period
             ):
                 last_beat = time.time()
-                if items:
-                    self.result_outgoing.send_multipart(items)
+                if items or status_report is not None:
+                    self.result_outgoing.send_multipart(
+                        framing.pack_results(items, status_report), copy=False
+                    )
                     items = []
+                    status_report = None
 
         log.critical("Exiting")
 
@@ -751,6 +801,9 @@ class Manager:
             Push tasks to available workers
             Forward results
         """
+        if self.worker_map.forkserver:
+            # Pay the template process' imports now, rather than at the first launch
+            self.worker_map.forkserver.start()
 
         if self.worker_type and self.scheduler_mode == "hard":
             log.debug(
@@ -851,6 +904,12 @@ def cli_run():
         default="soft",
         help=("Choose the mode of scheduler (hard, soft"),
     )
+    parser.add_argument(
+        "--worker_launch_method",
+        default="forkserver",
+        choices=("forkserver", "popen"),
+        help="How to start workers (forkserver, popen)",
+    )
     parser.add_argument(
         "-r",
         "--result_url",
@@ -884,6 +943,7 @@ def cli_run():
             f"\n  container_cmd_options: {args.container_cmd_options}"
             f"\n  scheduler_mode: {args.scheduler_mode}"
             f"\n  worker_type: {args.worker_type}"
+            f"\n  worker_launch_method: {args.worker_launch_method}"
         )
 
         manager = Manager(
@@ -904,6 +964,7 @@ def cli_run():
             container_cmd_options=args.container_cmd_options,
             scheduler_mode=args.scheduler_mode,
             worker_type=args.worker_type,
+            worker_launch_method=args.worker_launch_method,
             poll_period=int(args.poll),
         )
         manager.start()
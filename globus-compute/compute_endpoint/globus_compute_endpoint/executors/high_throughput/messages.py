@@ -21,6 +21,7 @@ class MessageType(Enum):
     RESULTS_ACK = auto()
     TASK_CANCEL = auto()
     BAD_COMMAND = auto()
+    TASK_CANCEL_BULK = auto()
 
     def pack(self):
         return MESSAGE_TYPE_FORMATTER.pack(self.value)
@@ -31,7 +32,11 @@ class MessageType(Enum):
         return MessageType(mtype), buffer[MESSAGE_TYPE_FORMATTER.size :]
 
 
-COMMAND_TYPES = {MessageType.HEARTBEAT_REQ, MessageType.TASK_CANCEL}
+COMMAND_TYPES = {
+    MessageType.HEARTBEAT_REQ,
+    MessageType.TASK_CANCEL,
+    MessageType.TASK_CANCEL_BULK,
+}
 
 
 class Message(ABC):
@@ -68,6 +73,8 @@ class Message(ABC):
             return ResultsAck.unpack(remaining)
         elif message_type is MessageType.TASK_CANCEL:
             return TaskCancel.unpack(remaining)
+        elif message_type is MessageType.TASK_CANCEL_BULK:
+            return TaskCancelBulk.unpack(remaining)
         elif message_type is MessageType.BAD_COMMAND:
             return BadCommand.unpack(remaining)
 
@@ -203,11 +210,14 @@ class EPStatusReport(Message):
         return cls(endpoint_id, global_state, task_statuses)
 
     def pack(self):
+        # Transitions may already be in their dict form (see TaskStatusDeltas)
         statuses = {}
         for tid, tt in self.task_statuses.items():
             for status in tt:
                 statuses[tid] = statuses.get(tid, [])
-                statuses[tid].append(status.to_dict())
+                if not isinstance(status, dict):
+                    status = status.to_dict()
+                statuses[tid].append(status)
         jsonified = json.dumps([self.global_state, statuses])
         return self.type.pack() + self._header + jsonified.encode("ascii")
 
@@ -215,22 +225,28 @@ class EPStatusReport(Message):
 class ManagerStatusReport(Message):
     """
     Status report sent from the Manager to the Interchange, which mostly just amounts
-    to saying which tasks are now RUNNING.
+    to saying which tasks are now RUNNING, along with manager-level statistics (e.g.,
+    worker spin-up latency).
     """
 
     type = MessageType.MANAGER_STATUS_REPORT
 
-    def __init__(self, task_statuses, container_switch_count):
+    def __init__(self, task_statuses, container_switch_count, worker_stats=None):
         super().__init__()
         self.task_statuses = task_statuses
         self.container_switch_count = container_switch_count
+        self.worker_stats = worker_stats or {}
 
     @classmethod
     def unpack(cls, msg):
         container_switch_count = int.from_bytes(msg[:10], "little")
         msg = msg[10:]
         jsonified = msg.decode("ascii")
-        statuses = json.loads(jsonified)
+        unpacked = json.loads(jsonified)
+        if isinstance(unpacked, list):
+            statuses, worker_stats = unpacked
+        else:
+            statuses, worker_stats = unpacked, {}  # reports predating worker_stats
         task_statuses = defaultdict(list)
         for tid, tt in statuses.items():
             for trans in tt:
@@ -241,7 +257,7 @@ class ManagerStatusReport(Message):
                         state=trans["state"],
                     )
                 )
-        return cls(task_statuses, container_switch_count)
+        return cls(task_statuses, container_switch_count, worker_stats)
 
     def pack(self):
         # TODO: do better than JSON?
@@ -251,7 +267,7 @@ class ManagerStatusReport(Message):
                 statuses[tid] = statuses.get(tid, [])
                 statuses[tid].append(status.to_dict())
 
-        jsonified = json.dumps(statuses)
+        jsonified = json.dumps([statuses, self.worker_stats])
         return (
             self.type.pack()
             + self.container_switch_count.to_bytes(10, "little")
@@ -300,6 +316,29 @@ class TaskCancel(Message):
         return self.type.pack() + json.dumps(self.task_id).encode("ascii")
 
 
+class TaskCancelBulk(Message):
+    """
+    Synchronous request to cancel many Tasks at once.
+
+    This is sent from the Executor to the Interchange.  The Interchange replies
+    with a TaskCancelBulk of those tasks that were already dispatched to a manager
+    (and so were cancelled there); the others are cancelled before dispatch.
+    """
+
+    type = MessageType.TASK_CANCEL_BULK
+
+    def __init__(self, task_ids: list[str]):
+        super().__init__()
+        self.task_ids = task_ids
+
+    @classmethod
+    def unpack(cls, msg):
+        return cls(json.loads(msg.decode("ascii")))
+
+    def pack(self):
+        return self.type.pack() + json.dumps(self.task_ids).encode("ascii")
+
+
 class BadCommand(Message):
     """
     Error message send to indicate that a command is either
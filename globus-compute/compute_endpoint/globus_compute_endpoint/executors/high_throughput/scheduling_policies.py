@@ -0,0 +1,343 @@
+"""Scheduling policies for the HTEX interchange
+
+A scheduling policy decides two things for the interchange's task dispatcher:
+
+- the order in which managers are offered pending tasks on each dispatch pass
+  (``order_managers``), and
+- how tasks are ordered within each per-container pending task queue
+  (``new_task_queue``).
+
+The container-level semantics (which worker types a manager may run, and when a
+warm container may be replaced) remain governed by the ``scheduler_mode``; the
+policy only chooses among the placements that mode allows.
+"""
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import queue
+import random
+import typing as t
+
+from globus_compute_endpoint.logging_config import ComputeLogger
+
+log: ComputeLogger = logging.getLogger(__name__)  # type: ignore
+
+ShareKey = t.Callable[[dict], t.Hashable]
+
+
+class SchedulingPolicy:
+    """Base scheduling policy: offer managers in random order, and dispatch the
+    pending tasks of each container type in FIFO order.
+
+    This is the interchange's historical behavior.
+    """
+
+    name = "random"
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def new_task_queue(self, maxsize: int = 0) -> queue.Queue:
+        """Create the pending task queue for a new container type"""
+        return queue.Queue(maxsize=maxsize)
+
+    def order_managers(
+        self,
+        managers: t.Iterable[bytes],
+        ready_manager_queue: dict[bytes, dict],
+        pending_task_queue: dict[str, queue.Queue],
+    ) -> list[bytes]:
+        """Return the managers in the order they should be offered tasks"""
+        ordered = list(managers)
+        random.shuffle(ordered)
+        return ordered
+
+    def record_container_switches(self, manager: bytes, switch_count: int) -> None:
+        """Called with each manager's reported (cumulative) container switch count"""
+
+    def forget_manager(self, manager: bytes) -> None:
+        """Called when a manager is unregistered"""
+
+
+class LeastLoadedPolicy(SchedulingPolicy):
+    """Offer tasks to the least-loaded managers first
+
+    Load is the fraction of a manager's workers that have tasks in flight; ties are
+    broken in favor of the manager with the most free capacity.
+    """
+
+    name = "least-loaded"
+
+    def order_managers(self, managers, ready_manager_queue, pending_task_queue):
+        def load(manager: bytes) -> tuple[float, int]:
+            mdata = ready_manager_queue[manager]
+            max_workers = mdata["max_worker_count"] or 1
+            free = mdata["free_capacity"]["total_workers"]
+            return mdata["total_tasks"] / max_workers, -free
+
+        return sorted(managers, key=load)
+
+
+class RoundRobinPolicy(SchedulingPolicy):
+    """Offer tasks to managers in turn, in registration order
+
+    Each dispatch pass starts with the manager after the one that was first offered
+    tasks in the previous pass, so no manager is persistently favored.
+    """
+
+    name = "round-robin"
+
+    def __init__(self):
+        self._last: tuple[float, bytes] | None = None
+
+    def order_managers(self, managers, ready_manager_queue, pending_task_queue):
+        ordered = sorted(
+            managers, key=lambda m: (ready_manager_queue[m].get("reg_time", 0), m)
+        )
+        if not ordered:
+            return ordered
+
+        if self._last is not None:
+            for i, m in enumerate(ordered):
+                if (ready_manager_queue[m].get("reg_time", 0), m) > self._last:
+                    ordered = ordered[i:] + ordered[:i]
+                    break
+        first = ordered[0]
+        self._last = (ready_manager_queue[first].get("reg_time", 0), first)
+        return ordered
+
+
+class ContainerAffinityPolicy(SchedulingPolicy):
+    """Offer tasks to managers with warm containers first
+
+    Each manager is scored by the cheapest placement it offers for the container
+    types currently pending at the interchange:
+
+    - a free worker already running the container ("warm") costs nothing,
+    - an unused worker slot costs ``cold_start_cost``, and
+    - anything else would require switching a warm container, costing
+      ``switch_cost``, inflated by the manager's recent container-switch rate (as
+      reported by the managers) so that thrashing managers are offered cold work
+      last.
+
+    Costs are relative; only their ratios matter.
+
+    Parameters
+    ----------
+    cold_start_cost: float
+        Relative cost of starting a container in an unused worker slot
+        Default: 1.0
+
+    switch_cost: float
+        Relative cost of replacing a warm container with another
+        Default: 4.0
+
+    switch_decay: float
+        Weight of history in the exponentially-weighted switch rate; between 0
+        (only the latest report matters) and 1 (never forget)
+        Default: 0.8
+    """
+
+    name = "container-affinity"
+
+    def __init__(
+        self,
+        cold_start_cost: float = 1.0,
+        switch_cost: float = 4.0,
+        switch_decay: float = 0.8,
+    ):
+        if not 0 <= switch_decay <= 1:
+            raise ValueError("switch_decay must be between 0 and 1")
+        self.cold_start_cost = cold_start_cost
+        self.switch_cost = switch_cost
+        self.switch_decay = switch_decay
+        self._switch_totals: dict[bytes, int] = {}
+        self._switch_rates: dict[bytes, float] = {}
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(cold_start_cost={self.cold_start_cost}, "
+            f"switch_cost={self.switch_cost}, switch_decay={self.switch_decay})"
+        )
+
+    def record_container_switches(self, manager, switch_count):
+        prev_total = self._switch_totals.get(manager, switch_count)
+        new_switches = max(0, switch_count - prev_total)
+        rate = self._switch_rates.get(manager, 0.0)
+        self._switch_totals[manager] = switch_count
+        self._switch_rates[manager] = (
+            self.switch_decay * rate + (1 - self.switch_decay) * new_switches
+        )
+
+    def forget_manager(self, manager):
+        self._switch_totals.pop(manager, None)
+        self._switch_rates.pop(manager, None)
+
+    def placement_cost(
+        self, manager: bytes, mdata: dict, pending_types: t.Iterable[str]
+    ) -> float:
+        """The cost of the cheapest placement ``manager`` offers for pending work"""
+        free = mdata["free_capacity"].get("free", {})
+        cost = None
+        for task_type in pending_types:
+            if free.get(task_type, 0) > 0:
+                return 0.0
+            cost = self.cold_start_cost if free.get("unused", 0) > 0 else cost
+        if cost is not None:
+            return cost
+        return self.switch_cost * (1 + self._switch_rates.get(manager, 0.0))
+
+    def order_managers(self, managers, ready_manager_queue, pending_task_queue):
+        pending_types = [
+            task_type
+            for task_type, task_q in pending_task_queue.items()
+            if task_type != "unused" and not task_q.empty()
+        ]
+        return sorted(
+            managers,
+            key=lambda m: self.placement_cost(m, ready_manager_queue[m], pending_types),
+        )
+
+
+def function_share_key(task: dict) -> t.Hashable:
+    """Share key identifying a pending task by the function it invokes
+
+    Task group identifiers are not forwarded to the endpoint, so by default tasks
+    are shared by function: a large sweep of one function does not hold back the
+    tasks of other functions queued behind it.  The key is a digest of the
+    function buffer, the first of the packed buffers in the task payload; tasks
+    whose payload cannot be parsed share a single key.
+    """
+    try:
+        raw = task["raw_buffer"]
+        payload_start = raw.index(b";", raw.index(b";") + 1) + 1
+        header_end = raw.index(b"\n", payload_start)
+        fn_len = int(raw[payload_start:header_end])
+        fn_buf = raw[header_end + 1 : header_end + 1 + fn_len]
+    except (KeyError, ValueError, TypeError, AttributeError):
+        return None
+    return hashlib.blake2b(fn_buf, digest_size=16).digest()
+
+
+class FairShareQueue(queue.Queue):
+    """A Queue that round-robins between share keys
+
+    Items are grouped by ``key(item)``; ``get()`` serves the groups in turn,
+    taking up to ``weights.get(key, 1)`` items from a group before moving on, and
+    within a group items remain FIFO.  All operations are O(1).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        key: ShareKey = function_share_key,
+        weights: dict[t.Hashable, int] | None = None,
+    ):
+        self._key = key
+        self._weights = weights or {}
+        super().__init__(maxsize=maxsize)
+
+    def _init(self, maxsize):
+        self._groups: dict[t.Hashable, collections.deque] = {}
+        self._turns: collections.deque = collections.deque()
+        self._served = 0
+        self._size = 0
+
+    def _qsize(self):
+        return self._size
+
+    def _put(self, item):
+        share_key = self._key(item)
+        group = self._groups.get(share_key)
+        if group is None:
+            group = self._groups[share_key] = collections.deque()
+            self._turns.append(share_key)
+        group.append(item)
+        self._size += 1
+
+    def _get(self):
+        share_key = self._turns[0]
+        group = self._groups[share_key]
+        item = group.popleft()
+        self._size -= 1
+        self._served += 1
+        if not group:
+            del self._groups[share_key]
+            self._turns.popleft()
+            self._served = 0
+        elif self._served >= max(1, self._weights.get(share_key, 1)):
+            self._turns.rotate(-1)
+            self._served = 0
+        return item
+
+    def share_sizes(self) -> dict[t.Hashable, int]:
+        """Number of queued items per share key"""
+        with self.mutex:
+            return {k: len(g) for k, g in self._groups.items()}
+
+
+class FairSharePolicy(SchedulingPolicy):
+    """Share dispatch between task groups, rather than first-come-first-served
+
+    Pending tasks of each container type are dispatched round-robin between share
+    groups (by default, the invoked function; see ``function_share_key``), so that
+    small, interactive workloads are not starved behind large ones.  Managers are
+    offered tasks in random order.
+
+    Parameters
+    ----------
+    key: callable
+        Maps a pending task record to its share group
+        Default: function_share_key
+
+    weights: dict
+        Number of tasks to dispatch from a share group per turn (default: 1 for all
+        groups)
+    """
+
+    name = "fair-share"
+
+    def __init__(
+        self,
+        key: ShareKey = function_share_key,
+        weights: dict[t.Hashable, int] | None = None,
+    ):
+        self.key = key
+        self.weights = weights
+
+    def __repr__(self):
+        return f"{type(self).__name__}(key={self.key!r}, weights={self.weights!r})"
+
+    def new_task_queue(self, maxsize=0):
+        return FairShareQueue(maxsize=maxsize, key=self.key, weights=self.weights)
+
+
+SCHEDULING_POLICIES: dict[str, type[SchedulingPolicy]] = {
+    p.name: p
+    for p in (
+        SchedulingPolicy,
+        LeastLoadedPolicy,
+        RoundRobinPolicy,
+        ContainerAffinityPolicy,
+        FairSharePolicy,
+    )
+}
+
+
+def get_scheduling_policy(
+    policy: SchedulingPolicy | str | None,
+) -> SchedulingPolicy:
+    """Resolve a scheduling policy instance from an instance, a name, or None"""
+    if policy is None:
+        return SchedulingPolicy()
+    if isinstance(policy, SchedulingPolicy):
+        return policy
+    try:
+        return SCHEDULING_POLICIES[policy]()
+    except KeyError:
+        known = ", ".join(sorted(SCHEDULING_POLICIES))
+        raise ValueError(
+            f"Unknown scheduling policy: {policy!r} (known policies: {known})"
+        ) from None
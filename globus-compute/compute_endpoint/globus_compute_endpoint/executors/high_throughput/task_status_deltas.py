@@ -0,0 +1,162 @@
+"""Columnar storage for the task status transitions the interchange reports
+
+The interchange records a transition for every task as it moves through
+WAITING_FOR_NODES, WAITING_FOR_LAUNCH, and RUNNING, and reports the accumulated
+transitions every heartbeat.  With many tasks in flight, a dict of lists of
+``TaskTransition`` models is both large and slow to copy, so transitions are
+kept instead as four parallel columns (task id, state, actor, timestamp) that
+are appended to, merged, and read in bulk.
+"""
+from __future__ import annotations
+
+import typing as t
+from array import array
+
+from globus_compute_common.messagepack.message_types import TaskTransition
+from globus_compute_common.tasks import ActorName, TaskState
+
+_STATES: list[TaskState] = list(TaskState)
+_ACTORS: list[ActorName] = list(ActorName)
+_STATE_CODE = {state: code for code, state in enumerate(_STATES)}
+_ACTOR_CODE = {actor: code for code, actor in enumerate(_ACTORS)}
+
+
+class TaskStatusDeltas:
+    """Task status transitions, in arrival order, stored column-wise
+
+    Behaves as a read-only mapping of task id to that task's transitions, as
+    ``TaskTransition`` objects; those objects are created only when a task's
+    transitions are read.  Not thread-safe: the interchange guards the shared
+    instance with its delta lock, and to report swaps it for an empty instance
+    rather than copying it, so that the report is built outside the lock.
+    """
+
+    __slots__ = ("_task_ids", "_states", "_actors", "_timestamps", "_rows", "_dead")
+
+    def __init__(self):
+        self._task_ids: list[str | None] = []
+        self._states = array("B")
+        self._actors = array("B")
+        self._timestamps = array("q")
+        self._rows: dict[str, list[int]] = {}  # task id -> its row numbers
+        self._dead = 0  # rows of popped tasks, skipped when read
+
+    def __repr__(self):
+        return f"{type(self).__name__}(tasks={len(self)}, rows={self.num_rows})"
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __bool__(self) -> bool:
+        return bool(self._rows)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._rows)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._rows
+
+    def __getitem__(self, task_id: str) -> list[TaskTransition]:
+        return [self._transition(row) for row in self._rows[task_id]]
+
+    @property
+    def num_rows(self) -> int:
+        """Number of live transitions held, across all tasks"""
+        return len(self._task_ids) - self._dead
+
+    def append(
+        self,
+        task_id: str,
+        state: TaskState,
+        actor: ActorName,
+        timestamp: int,
+    ) -> None:
+        """Record one transition of ``task_id``"""
+        self._rows.setdefault(task_id, []).append(len(self._task_ids))
+        self._task_ids.append(task_id)
+        self._states.append(_STATE_CODE[state])
+        self._actors.append(_ACTOR_CODE[actor])
+        self._timestamps.append(timestamp)
+
+    def extend(self, task_id: str, transitions: t.Iterable[TaskTransition]) -> None:
+        """Record ``transitions`` (such as from a manager report) of ``task_id``"""
+        for tt in transitions:
+            self.append(task_id, tt.state, tt.actor, tt.timestamp)
+
+    def merge(self, other: TaskStatusDeltas) -> None:
+        """Append every transition held by ``other``, in its order"""
+        if not other._dead:
+            offset = len(self._task_ids)
+            for task_id, rows in other._rows.items():
+                self._rows.setdefault(task_id, []).extend(r + offset for r in rows)
+            self._task_ids.extend(other._task_ids)
+            self._states.extend(other._states)
+            self._actors.extend(other._actors)
+            self._timestamps.extend(other._timestamps)
+            return
+
+        for row, row_task_id in enumerate(other._task_ids):
+            if row_task_id is not None:
+                self.append(
+                    row_task_id,
+                    _STATES[other._states[row]],
+                    _ACTORS[other._actors[row]],
+                    other._timestamps[row],
+                )
+
+    def pop(self, task_id: str) -> list[TaskTransition]:
+        """Remove and return the transitions of ``task_id`` (none if unknown)
+
+        The rows are only marked as removed; they are reclaimed by ``clear``.
+        """
+        rows = self._rows.pop(task_id, None)
+        if not rows:
+            return []
+        transitions = [self._transition(row) for row in rows]
+        for row in rows:
+            self._task_ids[row] = None
+        self._dead += len(rows)
+        return transitions
+
+    def clear(self) -> None:
+        del self._task_ids[:]
+        del self._states[:]
+        del self._actors[:]
+        del self._timestamps[:]
+        self._rows.clear()
+        self._dead = 0
+
+    def to_dicts(
+        self, chunk_size: int | None = None
+    ) -> t.Iterator[dict[str, list[dict[str, t.Any]]]]:
+        """Yield the transitions, grouped by task, in their serialized form
+
+        Each yielded mapping holds the transitions of at most ``chunk_size``
+        tasks (all of them, if ``chunk_size`` is not given); each transition is
+        the ``TaskTransition.to_dict()`` form, without creating the object.
+        """
+        limit = chunk_size or len(self._rows) or 1
+        chunk: dict[str, list[dict[str, t.Any]]] = {}
+        states = [s.value for s in _STATES]
+        actors = [a.value for a in _ACTORS]
+        for task_id, rows in self._rows.items():
+            chunk[task_id] = [
+                {
+                    "timestamp": self._timestamps[row],
+                    "state": states[self._states[row]],
+                    "actor": actors[self._actors[row]],
+                }
+                for row in rows
+            ]
+            if len(chunk) >= limit:
+                yield chunk
+                chunk = {}
+        if chunk:
+            yield chunk
+
+    def _transition(self, row: int) -> TaskTransition:
+        return TaskTransition(
+            timestamp=self._timestamps[row],
+            state=_STATES[self._states[row]],
+            actor=_ACTORS[self._actors[row]],
+        )
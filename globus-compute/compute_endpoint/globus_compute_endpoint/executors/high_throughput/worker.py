@@ -17,6 +17,10 @@ from globus_compute_endpoint.exception_handling import (
     get_result_error_details,
 )
 from globus_compute_endpoint.exceptions import CouldNotExecuteUserTaskError
+from globus_compute_endpoint.executors.high_throughput import framing
+from globus_compute_endpoint.executors.high_throughput.function_cache import (
+    FunctionCache,
+)
 from globus_compute_endpoint.executors.high_throughput.messages import Message
 from globus_compute_endpoint.logging_config import setup_logging
 from globus_compute_sdk.errors import MaxResultSizeExceeded
@@ -47,6 +51,9 @@ class Worker:
      Maximum result size allowed in Bytes
      Default = 10 MB
 
+    function_cache : FunctionCache
+     Cache of deserialized functions.  Default: a new cache
+
     Globus Compute worker will use the REP sockets to:
          task = recv ()
          result = execute(task)
@@ -60,6 +67,7 @@ class Worker:
         port,
         worker_type="RAW",
         result_size_limit=DEFAULT_RESULT_SIZE_LIMIT_B,
+        function_cache: FunctionCache | None = None,
     ):
         self.worker_id = worker_id
         self.address = address
@@ -69,6 +77,10 @@ class Worker:
         self.serialize = self.serializer.serialize
         self.deserialize = self.serializer.deserialize
         self.result_size_limit = result_size_limit
+        self.function_cache = function_cache or FunctionCache(self.serializer)
+        # Whether the current task's function came from the cache (None if the
+        # task failed before the function was looked up)
+        self.function_cache_hit: bool | None = None
 
         log.info(f"Initializing worker {worker_id}")
         log.info(f"Worker is of type: {worker_type}")
@@ -91,8 +103,12 @@ class Worker:
 
     def _send_registration_message(self):
         log.debug("Sending registration")
-        payload = {"worker_id": self.worker_id, "worker_type": self.worker_type}
-        self.task_socket.send_multipart([b"REGISTER", dill.dumps(payload)])
+        self.task_socket.send_multipart(
+            [
+                b"REGISTER",
+                *framing.pack_worker_registration(self.worker_id, self.worker_type),
+            ]
+        )
 
     def start(self):
         log.info("Starting worker")
@@ -100,10 +116,15 @@ class Worker:
 
         while True:
             log.debug("Waiting for task")
-            p_task_id, p_container_id, msg = self.task_socket.recv_multipart()
-            task_id: str = dill.loads(p_task_id)
-            container_id: str = dill.loads(p_container_id)
-            log.debug(f"Received task with task_id='{task_id}' and msg='{msg}'")
+            _, records, payloads = framing.unpack(self.task_socket.recv_multipart())
+            (task_id, container_id), *_ = records
+            msg = payloads[0]
+            log.debug(
+                "Received task with task_id='%s' (%s bytes)",
+                task_id,
+                len(msg),
+                extra={"task_id": task_id},
+            )
 
             if task_id == "KILL":
                 log.info("[KILL] -- Worker KILL message received! ")
@@ -117,12 +138,23 @@ class Worker:
                 result["container_id"] = container_id
                 log.debug("Sending result")
                 # send bytes over the socket back to the manager
-                self.task_socket.send_multipart([b"TASK_RET", dill.dumps(result)])
+                self.task_socket.send_multipart(
+                    [
+                        b"TASK_RET",
+                        *framing.pack_worker_result(
+                            task_id,
+                            container_id,
+                            dill.dumps(result),
+                            function_cache_hit=self.function_cache_hit,
+                        ),
+                    ]
+                )
 
         log.warning("Broke out of the loop... dying")
 
     def execute_task(self, task_id: str, task_body: bytes) -> dict:
-        log.debug("executing task task_id='%s'", task_id)
+        log.debug("executing task task_id='%s'", task_id, extra={"task_id": task_id})
+        self.function_cache_hit = None
         exec_start = TaskTransition(
             timestamp=time.time_ns(), state=TaskState.EXEC_START, actor=ActorName.WORKER
         )
@@ -130,7 +162,10 @@ class Worker:
         try:
             result = self.call_user_function(task_body)
         except Exception:
-            log.exception("Caught an exception while executing user function")
+            log.exception(
+                "Caught an exception while executing user function",
+                extra={"task_id": task_id},
+            )
             result_message: dict[
                 str, str | tuple[str, str] | list[TaskTransition]
             ] = dict(
@@ -155,6 +190,7 @@ class Worker:
             "task %s completed in %d ns",
             task_id,
             (exec_end.timestamp - exec_start.timestamp),
+            extra={"task_id": task_id},
         )
         return result_message
 
@@ -179,7 +215,9 @@ class Worker:
             task = Message.unpack(message)
             task_data = task.task_buffer.decode("utf-8")  # type: ignore[attr-defined]
 
-        f, args, kwargs = self.serializer.unpack_and_deserialize(task_data)
+        deserialized = self.function_cache.deserialize_task(task_data)
+        self.function_cache_hit = deserialized.cache_hit
+        f, args, kwargs = deserialized.fn, deserialized.args, deserialized.kwargs
         GC_TASK_TIMEOUT = max(0.0, float(os.environ.get("GC_TASK_TIMEOUT", 0.0)))
         if GC_TASK_TIMEOUT > 0.0:
             log.debug(f"Setting task timeout to GC_TASK_TIMEOUT={GC_TASK_TIMEOUT}s")
@@ -221,14 +259,42 @@ def cli_run():
     )
     args = parser.parse_args()
 
-    setup_logging(
-        logfile=os.path.join(args.logdir, f"funcx_worker_{args.worker_id}.log"),
+    run_worker(
+        args.worker_id,
+        args.address,
+        int(args.port),
+        worker_type=args.type,
+        logdir=args.logdir,
         debug=args.debug,
     )
 
+
+def run_worker(
+    worker_id: str,
+    address: str,
+    port: int,
+    worker_type: str = "RAW",
+    logdir: str = ".",
+    debug: bool = False,
+    environment: dict[str, str] | None = None,
+):
+    """Set up logging and output redirection, and run a worker until it is killed
+
+    This is the entry point of both ``globus-compute-worker`` and of workers forked
+    by the manager's forkserver (in which case ``environment`` carries the
+    worker-specific environment variables, such as accelerator pinning).
+    """
+    if environment:
+        os.environ.update(environment)
+
+    setup_logging(
+        logfile=os.path.join(logdir, f"funcx_worker_{worker_id}.log"),
+        debug=debug,
+    )
+
     # Redirect the stdout and stderr
-    stdout_path = os.path.join(args.logdir, f"funcx_worker_{args.worker_id}.stdout")
-    stderr_path = os.path.join(args.logdir, f"funcx_worker_{args.worker_id}.stderr")
+    stdout_path = os.path.join(logdir, f"funcx_worker_{worker_id}.stdout")
+    stderr_path = os.path.join(logdir, f"funcx_worker_{worker_id}.stderr")
     with open(stdout_path, "w") as fo, open(stderr_path, "w") as fe:
         # Redirect the stdout
         old_stdout, old_stderr = sys.stdout, sys.stderr
@@ -236,12 +302,7 @@ def cli_run():
         sys.stderr = fe
 
         try:
-            worker = Worker(
-                args.worker_id,
-                args.address,
-                int(args.port),
-                worker_type=args.type,
-            )
+            worker = Worker(worker_id, address, port, worker_type=worker_type)
             worker.start()
         finally:
             # Switch them back
@@ -0,0 +1,115 @@
+"""Fast worker launches for the manager
+
+Starting a worker with ``globus-compute-worker`` costs a fresh interpreter, plus
+importing dill, zmq, the SDK, and parsl -- and the manager pays that again for
+every worker replaced after a task cancellation or a container switch.  Instead,
+the ``WorkerForkServer`` keeps a warm template process (a ``multiprocessing``
+forkserver) that has already imported the worker module, and forks workers from
+it.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import subprocess
+import typing as t
+from multiprocessing import forkserver
+
+from globus_compute_endpoint.executors.high_throughput.worker import run_worker
+from globus_compute_endpoint.logging_config import ComputeLogger
+
+log: ComputeLogger = logging.getLogger(__name__)  # type: ignore
+
+WORKER_MODULE = "globus_compute_endpoint.executors.high_throughput.worker"
+
+
+class ForkedWorker:
+    """A ``subprocess.Popen``-like handle on a worker forked by the forkserver
+
+    The manager treats its worker processes as ``Popen`` objects; this provides the
+    subset of that interface the manager uses.
+    """
+
+    def __init__(self, process: multiprocessing.process.BaseProcess):
+        self._process = process
+
+    def __repr__(self):
+        return f"<{type(self).__name__} pid={self.pid} returncode={self.returncode}>"
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid
+
+    @property
+    def returncode(self) -> int | None:
+        return self._process.exitcode
+
+    def poll(self) -> int | None:
+        return self._process.exitcode
+
+    def wait(self, timeout: float | None = None) -> int:
+        self._process.join(timeout)
+        if self._process.exitcode is None:
+            raise subprocess.TimeoutExpired(f"worker (pid {self.pid})", timeout or 0)
+        return self._process.exitcode
+
+    def terminate(self) -> None:
+        self._process.terminate()
+
+    def kill(self) -> None:
+        self._process.kill()
+
+
+class WorkerForkServer:
+    """Fork workers from a warm template process
+
+    Parameters
+    ----------
+    preload: list of str
+        Modules imported by the template process, and so already imported in
+        every worker.  Default: the worker module (and thereby its dependencies)
+    """
+
+    def __init__(self, preload: t.Sequence[str] = (WORKER_MODULE,)):
+        self._ctx = multiprocessing.get_context("forkserver")
+        self._preload = list(preload)
+        self._started = False
+
+    @staticmethod
+    def is_available() -> bool:
+        return "forkserver" in multiprocessing.get_all_start_methods()
+
+    def start(self) -> None:
+        """Start (and warm up) the template process, if not already running"""
+        if self._started:
+            return
+        self._ctx.set_forkserver_preload(self._preload)
+        forkserver.ensure_running()
+        self._started = True
+        log.info("Worker forkserver running; preloaded: %s", self._preload)
+
+    def launch(
+        self,
+        worker_id: str,
+        address: str,
+        port: int,
+        worker_type: str,
+        logdir: str,
+        debug: bool = False,
+        environment: dict[str, str] | None = None,
+    ) -> ForkedWorker:
+        """Fork a worker; the arguments are those of ``globus-compute-worker``"""
+        self.start()
+        process = self._ctx.Process(
+            target=run_worker,
+            args=(worker_id, address, port),
+            kwargs={
+                "worker_type": worker_type,
+                "logdir": logdir,
+                "debug": debug,
+                "environment": environment,
+            },
+            name=f"globus-compute-worker-{worker_id}",
+        )
+        process.start()
+        return ForkedWorker(process)
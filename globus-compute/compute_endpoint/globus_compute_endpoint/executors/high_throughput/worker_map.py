@@ -9,6 +9,9 @@ from collections import defaultdict
 from queue import Empty, Queue
 from typing import Any
 
+from globus_compute_endpoint.executors.high_throughput.worker_forkserver import (
+    WorkerForkServer,
+)
 from globus_compute_endpoint.logging_config import ComputeLogger
 
 log: ComputeLogger = logging.getLogger(__name__)  # type: ignore
@@ -21,6 +24,7 @@ class WorkerMap:
         self,
         max_worker_count: int,
         available_accelerators: list[str],
+        forkserver: WorkerForkServer | None = None,
     ):
         """
 
@@ -30,7 +34,11 @@ class WorkerMap:
             Maximum number of workers allowed
         available_accelerators:
             List of accelerator devices workers can be pinned to
+        forkserver:
+            If set, workers that do not run in a container are forked from this
+            forkserver, rather than started as new processes
         """
+        self.forkserver = forkserver
         self.max_worker_count = max_worker_count
         self.total_worker_type_counts: dict[str, int] = {
             "unused": self.max_worker_count
@@ -65,11 +73,28 @@ class WorkerMap:
 
         self._noisy_log: dict[str, Any] = defaultdict(dict)
 
+        # Worker spin-up latency: from launch to registration with the manager
+        self._launch_times: dict[str, float] = {}
+        self.spinup_count = 0
+        self.spinup_total_s = 0.0
+        self.spinup_max_s = 0.0
+        self.spinup_last_s: float | None = None
+
     def register_worker(self, worker_id, worker_type):
         """Add a new worker"""
         log.debug(f"In register worker worker_id: {worker_id} type:{worker_type}")
         self.worker_types[worker_id] = worker_type
 
+        launch_key = worker_id.decode() if isinstance(worker_id, bytes) else worker_id
+        launched_at = self._launch_times.pop(launch_key, None)
+        if launched_at is not None:
+            spinup_s = time.monotonic() - launched_at
+            self.spinup_count += 1
+            self.spinup_total_s += spinup_s
+            self.spinup_max_s = max(self.spinup_max_s, spinup_s)
+            self.spinup_last_s = spinup_s
+            log.debug("Worker %s spun up in %.3fs", launch_key, spinup_s)
+
         if worker_type not in self.worker_queues:
             self.worker_queues[worker_type] = Queue()
 
@@ -289,6 +314,20 @@ class WorkerMap:
                 container_switch_count += num_remove
         return spin_downs, container_switch_count
 
+    def spinup_report(self) -> dict[str, Any]:
+        """Worker spin-up latency statistics, for the manager's status report"""
+        mean_s = max_s = None
+        if self.spinup_count:
+            mean_s = self.spinup_total_s / self.spinup_count
+            max_s = self.spinup_max_s
+        return {
+            "launch_method": "forkserver" if self.forkserver else "popen",
+            "count": self.spinup_count,
+            "mean_s": mean_s,
+            "max_s": max_s,
+            "last_s": self.spinup_last_s,
+        }
+
     def add_worker(
         self,
         worker_id=None,
@@ -317,6 +356,8 @@ class WorkerMap:
         if worker_id is None:
             str(random.random())
 
+        raw_worker_id = str(worker_id)
+        debug_enabled = bool(debug)
         debug = " --debug" if debug else ""
 
         worker_id = f" --worker_id {worker_id}"
@@ -337,7 +378,7 @@ class WorkerMap:
 
         # If accelerator list is provided, get the next one off the queue
         #   and mark it as assigned
-        environment_variables = os.environ.copy()
+        worker_environment: dict[str, str] = {}
         if self.available_accelerators is not None:
             try:
                 device = self.available_accelerators.get_nowait()
@@ -352,9 +393,9 @@ class WorkerMap:
 
             # Create the
             #  TODO (wardlt): This code has only been tested for CUDA
-            environment_variables["CUDA_VISIBLE_DEVICES"] = device
-            environment_variables["ROCR_VISIBLE_DEVICES"] = device
-            environment_variables["SYCL_DEVICE_FILTER"] = f"*:*:{device}"
+            worker_environment["CUDA_VISIBLE_DEVICES"] = device
+            worker_environment["ROCR_VISIBLE_DEVICES"] = device
+            worker_environment["SYCL_DEVICE_FILTER"] = f"*:*:{device}"
 
         log.info(f"Command string :\n {cmd}")
         log.info(f"Mode: {mode}")
@@ -385,18 +426,37 @@ class WorkerMap:
         else:
             raise NameError("Invalid container launch mode.")
 
-        try:
-            proc = subprocess.Popen(
-                modded_cmd.split(),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=False,
-                env=environment_variables,
-            )
+        self._launch_times[raw_worker_id] = time.monotonic()
+        proc = None
+        if self.forkserver and modded_cmd is cmd:
+            # Not containerized, so the worker may be forked from the warm template
+            try:
+                proc = self.forkserver.launch(
+                    raw_worker_id,
+                    address,
+                    int(worker_port),
+                    worker_type=worker_type,
+                    logdir=os.path.join(logdir, uid),
+                    debug=debug_enabled,
+                    environment=worker_environment,
+                )
+            except Exception:
+                log.exception("Unable to fork worker; starting a new process instead")
+
+        if proc is None:
+            try:
+                proc = subprocess.Popen(
+                    modded_cmd.split(),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    shell=False,
+                    env={**os.environ, **worker_environment},
+                )
 
-        except Exception:
-            log.exception("Got an error in worker launch")
-            raise
+            except Exception:
+                self._launch_times.pop(raw_worker_id, None)
+                log.exception("Got an error in worker launch")
+                raise
 
         self.total_worker_type_counts["unused"] -= 1
         self.ready_worker_type_counts["unused"] -= 1
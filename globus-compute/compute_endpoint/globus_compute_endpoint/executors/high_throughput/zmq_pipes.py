@@ -100,13 +100,38 @@ class TasksOutgoing:
         zmq.EAGAIN if the send failed.
 
         """
+        self._send(self.zmq_socket.send, message, max_timeout)
+
+    def put_multipart(self, messages, max_timeout=1000):
+        """Send several messages at once, as the frames of one multipart message
+
+        The receiver handles each frame as if it had been sent with ``put``.
+
+        Parameters
+        ----------
+
+        messages : list of bytes
+             Messages to send
+        max_timeout : int
+             Max timeout in milliseconds that we will wait for before raising an
+             exception
+
+        Raises
+        ------
+
+        zmq.EAGAIN if the send failed.
+
+        """
+        self._send(self.zmq_socket.send_multipart, messages, max_timeout)
+
+    def _send(self, send, message, max_timeout):
         timeout_ms = 0
         current_wait = 0
         while current_wait < max_timeout:
             socks = dict(self.poller.poll(timeout=timeout_ms))
             if self.zmq_socket in socks and socks[self.zmq_socket] == zmq.POLLOUT:
                 # The copy option adds latency but reduces the risk of ZMQ overflow
-                self.zmq_socket.send(message, copy=True)
+                send(message, copy=True)
                 return
             else:
                 timeout_ms += 1
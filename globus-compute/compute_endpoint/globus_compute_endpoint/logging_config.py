@@ -3,15 +3,19 @@ This module contains logging configuration for the globus-compute-endpoint appli
 """
 from __future__ import annotations
 
+import atexit
 import copy
 import logging
 import logging.config
 import logging.handlers
 import os
 import pathlib
+import queue
 import re
 import sys
+import typing as t
 import uuid
+import zlib
 
 log = logging.getLogger(__name__)
 
@@ -231,23 +235,148 @@ class ComputeLogger(logging.Logger):
     TRACE = logging.DEBUG - 5
 
     def trace(self, msg, *args, **kwargs):
-        self.log(ComputeLogger.TRACE, msg, args, **kwargs)
+        self.log(ComputeLogger.TRACE, msg, *args, **kwargs)
 
 
 logging.setLoggerClass(ComputeLogger)
 logger = logging.getLogger(__name__)
 
 
+class TaskLogSampler(logging.Filter):
+    """
+    Pass only a sample of the per-task records below WARNING.
+
+    A record is per-task if it has a ``task_id`` attribute (i.e., it was logged
+    with ``extra={"task_id": task_id}``).  Whether a task is in the sample depends
+    only on its id, so all of a sampled task's records are kept, in every process.
+    Records of WARNING and above, and records not about a task, always pass.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = min(1.0, max(0.0, rate))
+        self._threshold = int(self.rate * 2**32)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        task_id = getattr(record, "task_id", None)
+        if task_id is None:
+            return True
+        return zlib.crc32(str(task_id).encode()) < self._threshold
+
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now, as the caller may change them before the
+        # listener gets to the record; the (costlier) formatting and output are
+        # left to the listener
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Block, rather than drop the record, if the listener lags behind
+        t.cast(queue.Queue, self.queue).put(record)
+
+
+# The listener of the queue-based logging mode, and its handlers
+_log_queue_listener: logging.handlers.QueueListener | None = None
+_log_queue_handler: _LogQueueHandler | None = None
+_LOG_QUEUE_SIZE = 65536
+
+
+def _start_log_queue(handlers: t.Sequence[logging.Handler]) -> _LogQueueHandler:
+    global _log_queue_listener, _log_queue_handler
+
+    log_q: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+    _log_queue_handler = _LogQueueHandler(log_q)
+    _log_queue_listener = logging.handlers.QueueListener(
+        log_q, *handlers, respect_handler_level=True
+    )
+    _log_queue_listener.start()
+    return _log_queue_handler
+
+
+def _stop_log_queue() -> None:
+    global _log_queue_listener, _log_queue_handler
+
+    if _log_queue_listener is not None:
+        _log_queue_listener.stop()  # writes out any records still queued
+    _log_queue_listener = None
+    _log_queue_handler = None
+
+
+def _restart_log_queue_in_child() -> None:
+    # A forked child inherits the queue but not the listener thread; give it its
+    # own (the parent writes out the records that were queued at the fork)
+    global _log_queue_listener
+
+    if _log_queue_listener is None or _log_queue_handler is None:
+        return
+    log_q: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+    _log_queue_handler.queue = log_q
+    _log_queue_listener = logging.handlers.QueueListener(
+        log_q, *_log_queue_listener.handlers, respect_handler_level=True
+    )
+    _log_queue_listener.start()
+
+
+atexit.register(_stop_log_queue)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_log_queue_in_child)
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
 def setup_logging(
     *,
     logfile: pathlib.Path | str | None = None,
     console_enabled: bool = True,
     debug: bool = False,
     no_color: bool = False,
+    log_queue: bool | None = None,
+    task_sample_rate: float | None = None,
 ) -> None:
+    """
+    Configure logging for the endpoint and SDK loggers.
+
+    :param logfile: write to this (rotated) file; if not given, log to stderr
+    :param console_enabled: with a logfile, also log to stderr
+    :param debug: log at DEBUG (rather than INFO) level, in the full format
+    :param no_color: do not colorize console output
+    :param log_queue: hand records to a background thread to format and write,
+        so that logging does not block the caller.  Default: set from the
+        ``GC_LOG_QUEUE`` environment variable (e.g., ``GC_LOG_QUEUE=1``)
+    :param task_sample_rate: keep the per-task records (see ``TaskLogSampler``)
+        of only this fraction of tasks.  Default: set from the
+        ``GC_LOG_TASK_SAMPLE_RATE`` environment variable, else 1.0
+    """
+    if log_queue is None:
+        log_queue = _env_flag("GC_LOG_QUEUE")
+    if task_sample_rate is None:
+        task_sample_rate = float(os.environ.get("GC_LOG_TASK_SAMPLE_RATE", 1.0))
+
     if logfile is not None:
         config = _get_file_dict_config(str(logfile), console_enabled, debug, no_color)
     else:
         config = _get_stream_dict_config(debug, no_color)
 
+    _stop_log_queue()  # before dictConfig() closes the handlers it writes to
     logging.config.dictConfig(config)
+
+    loggers = [logging.getLogger(name) for name in config["loggers"]]
+    handlers = list(dict.fromkeys(h for lg in loggers for h in lg.handlers))
+    sampler = TaskLogSampler(task_sample_rate) if task_sample_rate < 1.0 else None
+
+    if log_queue:
+        queue_handler = _start_log_queue(handlers)
+        if sampler:
+            queue_handler.addFilter(sampler)  # so dropped records are not queued
+        for lg in loggers:
+            lg.handlers = [queue_handler]
+    elif sampler:
+        for handler in handlers:
+            handler.addFilter(sampler)
@@ -291,7 +291,7 @@ class KubernetesProvider(ExecutionProvider, RepresentationMixin):
 
         # Create the enviornment variables and command to initiate IPP
         env = []
-        for var_name in ("GC_TASK_TIMEOUT",):
+        for var_name in ("GC_TASK_TIMEOUT", "GC_LOG_QUEUE", "GC_LOG_TASK_SAMPLE_RATE"):
             if var_name in os.environ:
                 env.append(client.V1EnvVar(name=var_name, value=os.getenv(var_name)))
 
@@ -13,6 +13,7 @@ from globus_compute_endpoint.endpoint.interchange import EndpointInterchange, lo
 from globus_compute_endpoint.endpoint.utils.config import Config
 from globus_compute_endpoint.executors.high_throughput.messages import (
     EPStatusReport as HTEPStatusReport,
+    Message as HTMessage,
 )
 from tests.utils import try_for_timeout
 
@@ -72,7 +73,9 @@ def test_invalid_task_received(mocker, endpoint_uuid):
     )
 
     mock_results = mocker.MagicMock()
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher", return_value=mock_results)
+    mocker.patch(
+        f"{_MOCK_BASE}PipelinedResultQueuePublisher", return_value=mock_results
+    )
     mocker.patch(f"{_MOCK_BASE}convert_to_internaltask", side_effect=Exception("BLAR"))
     task = Task(task_id=uuid.uuid4(), task_buffer="")
     ei.pending_task_queue.put(pack(task))
@@ -90,9 +93,76 @@ def test_invalid_task_received(mocker, endpoint_uuid):
     assert "Failed to start task" in result.data
 
 
+@pytest.mark.parametrize("batch_size", (1, 3, 256))
+def test_pending_tasks_submitted_in_batches(mocker, endpoint_uuid, batch_size):
+    executor = mocker.Mock(endpoint_id=endpoint_uuid)
+    ei = EndpointInterchange(
+        endpoint_id=endpoint_uuid,
+        config=Config(
+            executors=[executor], task_decoders=1, task_submit_batch_size=batch_size
+        ),
+        reg_info={"task_queue_info": {}, "result_queue_info": {}},
+    )
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher")
+    tasks = [Task(task_id=uuid.uuid4(), task_buffer="") for _ in range(5)]
+    for task in tasks:
+        ei.pending_task_queue.put(pack(task))
+    try_for_timeout(lambda: ei.pending_task_queue.qsize() == 5, timeout_ms=1000)
+
+    def submitted():
+        return sum(len(a[0]) for a, _ in executor.submit_batch.call_args_list) + (
+            executor.submit_raw.call_count
+        )
+
+    t = threading.Thread(target=ei._main_loop, daemon=True)
+    t.start()
+    try_for_timeout(lambda: submitted() == 5, timeout_ms=2000)
+    ei.time_to_quit = True
+    t.join()
+
+    batches = [a[0] for a, _ in executor.submit_batch.call_args_list]
+    expected_sizes = {1: [], 3: [3, 2], 256: [5]}[batch_size]
+    assert [len(b) for b in batches] == expected_sizes, "Lone tasks go one by one"
+    assert executor.submit_raw.call_count == 5 - sum(expected_sizes)
+
+    sent = [b for batch in batches for b in batch]
+    sent.extend(a[0] for a, _ in executor.submit_raw.call_args_list)
+    sent_ids = [HTMessage.unpack(b).task_id for b in sent]
+    assert sent_ids == [str(tk.task_id) for tk in tasks], "Order is kept"
+
+
+def test_failed_batch_submit_fails_each_task(mocker, endpoint_uuid):
+    executor = mocker.Mock(endpoint_id=endpoint_uuid)
+    executor.submit_batch.side_effect = Exception("BLAR")
+    ei = EndpointInterchange(
+        endpoint_id=endpoint_uuid,
+        config=Config(executors=[executor], task_decoders=1),
+        reg_info={"task_queue_info": {}, "result_queue_info": {}},
+    )
+    mock_results = mocker.MagicMock()
+    mocker.patch(
+        f"{_MOCK_BASE}PipelinedResultQueuePublisher", return_value=mock_results
+    )
+    tasks = [Task(task_id=uuid.uuid4(), task_buffer="") for _ in range(3)]
+    for task in tasks:
+        ei.pending_task_queue.put(pack(task))
+    try_for_timeout(lambda: ei.pending_task_queue.qsize() == 3, timeout_ms=1000)
+
+    t = threading.Thread(target=ei._main_loop, daemon=True)
+    t.start()
+    try_for_timeout(lambda: mock_results.publish.call_count >= 3, timeout_ms=2000)
+    ei.time_to_quit = True
+    t.join()
+
+    results = [unpack(a[0]) for a, _ in mock_results.publish.call_args_list]
+    failed = [r for r in results if isinstance(r, Result)]
+    assert [r.task_id for r in failed] == [tk.task_id for tk in tasks]
+    assert all("Failed to start task: BLAR" in r.data for r in failed)
+
+
 def test_invalid_result_received(mocker, endpoint_uuid):
     mock_rqp = mocker.MagicMock()
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher", return_value=mock_rqp)
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher", return_value=mock_rqp)
 
     conf = Config(
         executors=[mocker.Mock(endpoint_id=endpoint_uuid)],
@@ -141,7 +211,7 @@ def test_die_with_parent_refuses_to_start_if_not_parent(mocker):
 def test_die_with_parent_goes_away_if_parent_dies(mocker):
     ppid = os.getppid()
 
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher")
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher")
     mocker.patch(f"{_MOCK_BASE}convert_to_internaltask")
     mocker.patch(f"{_MOCK_BASE}time.sleep")
     mock_ppid = mocker.patch(f"{_MOCK_BASE}os.getppid")
@@ -164,7 +234,7 @@ def test_die_with_parent_goes_away_if_parent_dies(mocker):
 
 def test_no_idle_if_not_configured(mocker, endpoint_uuid, mock_spt):
     mock_log = mocker.patch(f"{_MOCK_BASE}log")
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher")
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher")
 
     conf = Config(
         executors=[mocker.Mock(endpoint_id=endpoint_uuid)],
@@ -187,7 +257,7 @@ def test_no_idle_if_not_configured(mocker, endpoint_uuid, mock_spt):
 
 def test_soft_idle_honored(mocker, endpoint_uuid, mock_spt):
     mock_log = mocker.patch(f"{_MOCK_BASE}log")
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher")
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher")
 
     conf = Config(
         executors=[mocker.Mock(endpoint_id=endpoint_uuid)],
@@ -223,7 +293,7 @@ def test_soft_idle_honored(mocker, endpoint_uuid, mock_spt):
 
 def test_hard_idle_honored(mocker, endpoint_uuid, mock_spt):
     mock_log = mocker.patch(f"{_MOCK_BASE}log")
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher")
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher")
 
     conf = Config(
         executors=[mocker.Mock(endpoint_id=endpoint_uuid)],
@@ -259,7 +329,7 @@ def test_hard_idle_honored(mocker, endpoint_uuid, mock_spt):
 
 def test_unidle_updates_proc_title(mocker, endpoint_uuid, mock_spt):
     mock_log = mocker.patch(f"{_MOCK_BASE}log")
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher")
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher")
 
     conf = Config(
         executors=[mocker.Mock(endpoint_id=endpoint_uuid)],
@@ -294,7 +364,7 @@ def test_unidle_updates_proc_title(mocker, endpoint_uuid, mock_spt):
 
 def test_sends_final_status_message_on_shutdown(mocker, endpoint_uuid):
     mock_rqp = mocker.MagicMock()
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher", return_value=mock_rqp)
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher", return_value=mock_rqp)
 
     conf = Config(
         executors=[mocker.Mock(endpoint_id=endpoint_uuid)],
@@ -319,7 +389,7 @@ def test_sends_final_status_message_on_shutdown(mocker, endpoint_uuid):
 
 def test_faithfully_handles_status_report_messages(mocker, endpoint_uuid, randomstring):
     mock_rqp = mocker.MagicMock()
-    mocker.patch(f"{_MOCK_BASE}ResultQueuePublisher", return_value=mock_rqp)
+    mocker.patch(f"{_MOCK_BASE}PipelinedResultQueuePublisher", return_value=mock_rqp)
 
     conf = Config(
         executors=[mocker.Mock(endpoint_id=endpoint_uuid)],
@@ -11,17 +11,27 @@ import pytest
 from globus_compute_common.messagepack import pack
 from globus_compute_common.messagepack.message_types import Result, Task
 from globus_compute_endpoint.endpoint.interchange import EndpointInterchange
+from globus_compute_endpoint.endpoint.result_store import ResultStore
 from globus_compute_endpoint.endpoint.utils.config import Config
 from tests.integration.endpoint.executors.mock_executors import MockExecutor
 from tests.utils import try_for_timeout
 
 
+@pytest.fixture
+def stored_results() -> dict[str, bytes]:
+    return {}
+
+
 @pytest.fixture
 def run_interchange_process(
-    get_standard_compute_client, setup_register_endpoint_response, tmp_path
+    get_standard_compute_client,
+    setup_register_endpoint_response,
+    tmp_path,
+    stored_results,
 ):
     """
     Start and stop a subprocess that executes the EndpointInterchange class.
+    Results in ``stored_results`` are put in the ResultStore before it starts.
 
     Yields a tuple of the interchange subprocess, (temporary) working directory,
     a random endpoint id, and the mocked registration info.
@@ -52,6 +62,12 @@ def run_interchange_process(
     assert "task_queue_info" in reg_info
     assert "result_queue_info" in reg_info
 
+    if stored_results:
+        result_store = ResultStore(tmp_path)
+        for task_id, packed_result in stored_results.items():
+            result_store[task_id] = packed_result
+        result_store.close()
+
     ix_proc = multiprocessing.Process(
         target=run_it, args=(reg_info, endpoint_uuid), kwargs={"endpoint_dir": tmp_path}
     )
@@ -79,19 +95,17 @@ def test_epi_graceful_shutdown(run_interchange_process):
     assert try_for_timeout(lambda: ix_proc.exitcode is not None), "Failed to shutdown"
 
 
+@pytest.mark.parametrize("stored_results", [{str(uuid.uuid4()): b"GIBBERISH"}])
 def test_epi_stored_results_processed(run_interchange_process):
     ix_proc, tmp_path, endpoint_uuid, _reg_info = run_interchange_process
 
     unacked_results_dir = tmp_path / "unacked_results"
-    unacked_results_dir.mkdir(exist_ok=True)
-    stored_task_name = str(uuid.uuid4())
-    stored_task_path = unacked_results_dir / stored_task_name
-    stored_task_path.write_bytes(b"GIBBERISH")
 
-    def file_is_gone():
-        return not stored_task_path.exists()
+    def log_is_gone():
+        # the segment log is removed once the store is empty
+        return not any(unacked_results_dir.glob("segment-*"))
 
-    assert try_for_timeout(file_is_gone), "Expected stored task to be handled"
+    assert try_for_timeout(log_is_gone), "Expected stored task to be handled"
 
 
 def test_epi_forwards_tasks_and_results(
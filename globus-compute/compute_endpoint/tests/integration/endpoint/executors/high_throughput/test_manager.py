@@ -1,9 +1,9 @@
 import os
-import pickle
 import queue
 import shutil
 
 import pytest
+from globus_compute_endpoint.executors.high_throughput import framing
 from globus_compute_endpoint.executors.high_throughput.manager import Manager
 from globus_compute_endpoint.executors.high_throughput.messages import Task
 
@@ -50,7 +50,7 @@ class TestManager:
         manager.funcx_task_socket.recv_multipart.return_value = (
             b"0",
             b"REGISTER",
-            pickle.dumps({"worker_type": "RAW"}),
+            *framing.pack_worker_registration("0", "RAW"),
         )
         manager.poll_funcx_task_socket(test=True)
         mock_worker_map.return_value.register_worker.assert_called_with(b"0", "RAW")
@@ -58,7 +58,7 @@ class TestManager:
         manager.funcx_task_socket.recv_multipart.return_value = (
             b"0",
             b"WRKR_DIE",
-            pickle.dumps(None),
+            b"",
         )
         manager.poll_funcx_task_socket(test=True)
         mock_worker_map.return_value.remove_worker.assert_called_with(b"0")
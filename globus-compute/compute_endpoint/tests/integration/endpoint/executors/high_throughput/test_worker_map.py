@@ -40,3 +40,75 @@ class TestWorkerMap:
 
         last_call = mock_popen.mock_calls[-1]
         assert last_call[-1]["env"]["CUDA_VISIBLE_DEVICES"] == "0"
+
+    def test_add_worker_forkserver(self, mocker):
+        mock_popen = mocker.patch(
+            "globus_compute_endpoint.executors.high_throughput.worker_map.subprocess.Popen"  # noqa: E501
+        )
+        forkserver = mocker.Mock()
+        forkserver.launch.return_value = "forked"
+
+        worker_map = WorkerMap(1, ["0"], forkserver=forkserver)
+        worker = worker_map.add_worker(
+            worker_id="0",
+            address="127.0.0.1",
+            uid="test1",
+            logdir=os.getcwd(),
+            worker_port=50001,
+        )
+
+        assert worker["0"] == "forked"
+        assert not mock_popen.called
+        _a, kwargs = forkserver.launch.call_args
+        assert kwargs["environment"]["CUDA_VISIBLE_DEVICES"] == "0"
+        assert kwargs["logdir"] == os.path.join(os.getcwd(), "test1")
+
+    def test_add_worker_forkserver_falls_back_for_containers(self, mocker, tmp_path):
+        mock_popen = mocker.patch(
+            "globus_compute_endpoint.executors.high_throughput.worker_map.subprocess.Popen"  # noqa: E501
+        )
+        mock_popen.return_value = "proc"
+        forkserver = mocker.Mock()
+        container = tmp_path / "container.sif"
+        container.touch()
+
+        worker_map = WorkerMap(1, [], forkserver=forkserver)
+        worker = worker_map.add_worker(
+            worker_id="0",
+            mode="singularity_reuse",
+            worker_type=str(container),
+            address="127.0.0.1",
+            uid="test1",
+            logdir=os.getcwd(),
+            worker_port=50001,
+        )
+
+        assert worker["0"] == "proc"
+        assert not forkserver.launch.called
+        assert mock_popen.call_args[0][0][:2] == ["singularity", "exec"]
+
+    def test_spinup_latency(self, mocker):
+        mocker.patch(
+            "globus_compute_endpoint.executors.high_throughput.worker_map.subprocess.Popen"  # noqa: E501
+        )
+        worker_map = WorkerMap(2, [])
+        assert worker_map.spinup_report()["count"] == 0
+        assert worker_map.spinup_report()["mean_s"] is None
+
+        for w_id in ("0", "1"):
+            worker_map.add_worker(
+                worker_id=w_id,
+                address="127.0.0.1",
+                uid="test1",
+                logdir=os.getcwd(),
+                worker_port=50001,
+            )
+        worker_map.register_worker(b"0", "RAW")
+        worker_map.register_worker(b"1", "RAW")
+        worker_map.register_worker(b"2", "RAW")  # never launched; not measured
+
+        report = worker_map.spinup_report()
+        assert report["launch_method"] == "popen"
+        assert report["count"] == 2
+        assert 0 <= report["mean_s"] <= report["max_s"]
+        assert report["last_s"] is not None
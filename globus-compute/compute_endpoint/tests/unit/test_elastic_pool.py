@@ -0,0 +1,114 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from globus_compute_endpoint.engines.elastic_pool import ElasticPool
+from tests.utils import double
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def pool():
+    p = ElasticPool(ThreadPoolExecutor, 4, max_idletime=0.1)
+    yield p
+    p.shutdown(cancel_futures=True)
+
+
+@pytest.mark.parametrize("kwargs", ({"max_workers": 0}, {"min_workers": 5}))
+def test_invalid_bounds(kwargs):
+    kwargs = {"max_workers": 4, **kwargs}
+    with pytest.raises(ValueError):
+        ElasticPool(ThreadPoolExecutor, **kwargs)
+
+
+def test_starts_no_workers_until_needed(pool):
+    assert pool.num_workers == 0
+    assert pool.submit(double, 3).result(timeout=5) == 6
+    assert pool.num_workers == 1
+
+
+def test_grows_with_queue_depth_up_to_max(pool):
+    release = threading.Event()
+    futs = [pool.submit(release.wait) for _ in range(6)]
+
+    _wait_for(lambda: pool.num_workers == 4)
+    assert pool.num_pending_tasks == 2
+    assert pool.num_outstanding_tasks == 6
+    assert pool.num_idle_workers == 0
+
+    release.set()
+    assert all(f.result(timeout=5) for f in futs)
+
+
+def test_reaps_idle_workers_down_to_min():
+    pool = ElasticPool(ThreadPoolExecutor, 4, min_workers=1, max_idletime=0.05)
+    try:
+        release = threading.Event()
+        futs = [pool.submit(release.wait) for _ in range(4)]
+        _wait_for(lambda: pool.num_workers == 4)
+
+        release.set()
+        [f.result(timeout=5) for f in futs]
+        _wait_for(lambda: pool.num_workers == 1)
+        assert pool.num_idle_workers == 1
+    finally:
+        pool.shutdown()
+
+
+def test_exceptions_propagate(pool):
+    with pytest.raises(ZeroDivisionError):
+        pool.submit(lambda: 1 / 0).result(timeout=5)
+    assert pool.submit(double, 2).result(timeout=5) == 4
+
+
+def test_cancelled_tasks_are_skipped():
+    pool = ElasticPool(ThreadPoolExecutor, 1)
+    try:
+        release = threading.Event()
+        running = pool.submit(release.wait)
+        cancelled = pool.submit(double, 1)
+        assert cancelled.cancel()
+        release.set()
+
+        assert running.result(timeout=5)
+        assert pool.submit(double, 2).result(timeout=5) == 4
+        assert cancelled.cancelled()
+    finally:
+        pool.shutdown()
+
+
+def test_scale_out_and_in(pool):
+    assert pool.scale_out(2) == ["0", "1"]
+    assert pool.num_workers == 2
+    assert len(pool.scale_out(5)) == 2, "Bounded by max_workers"
+    _wait_for(lambda: pool.num_idle_workers == 4)
+
+    assert len(pool.scale_in(3)) == 3
+    assert pool.num_workers == 1
+
+
+def test_shutdown_runs_queued_tasks():
+    pool = ElasticPool(ThreadPoolExecutor, 1)
+    futs = [pool.submit(double, i) for i in range(5)]
+    pool.shutdown(wait=True)
+
+    assert [f.result(timeout=0) for f in futs] == [0, 2, 4, 6, 8]
+    assert pool.num_workers == 0
+    with pytest.raises(RuntimeError):
+        pool.submit(double, 1)
+
+
+def test_process_workers():
+    pool = ElasticPool(ProcessPoolExecutor, 2, max_idletime=0.1)
+    try:
+        futs = [pool.submit(double, i) for i in range(4)]
+        assert [f.result(timeout=30) for f in futs] == [0, 2, 4, 6]
+    finally:
+        pool.shutdown()
@@ -24,7 +24,7 @@ def test_main_exception_always_quiesces(mocker, fs, reset_signals):
         reg_info={"task_queue_info": {}, "result_queue_info": {}},
         reconnect_attempt_limit=num_iterations + 10,
     )
-    ei._task_puller_proc = mocker.MagicMock()
+    ei._task_puller_procs = [mocker.MagicMock()]
     ei._start_threads_and_main = mocker.MagicMock()
     ei._start_threads_and_main.side_effect = Exception("Woot")
     ei._kill_event.is_set = false_true
@@ -54,7 +54,7 @@ def test_reconnect_attempt_limit(mocker, fs, reconnect_attempt_limit, reset_sign
         reg_info={"task_queue_info": {}, "result_queue_info": {}},
         reconnect_attempt_limit=reconnect_attempt_limit,
     )
-    ei._task_puller_proc = mocker.MagicMock()
+    ei._task_puller_procs = [mocker.MagicMock()]
     ei._start_threads_and_main = mocker.MagicMock()
     ei._start_threads_and_main.side_effect = Exception("Woot")
     ei._kill_event.is_set = false_true
@@ -66,3 +66,28 @@ def test_reconnect_attempt_limit(mocker, fs, reconnect_attempt_limit, reset_sign
     expected_msg = f"Failed {reconnect_attempt_limit} consecutive"
     assert mock_log.critical.called
     assert expected_msg in mock_log.critical.call_args[0][0]
+
+
+@pytest.mark.parametrize("num_consumers", [1, 3])
+def test_starts_task_queue_consumers(mocker, fs, num_consumers):
+    mock_tqs = mocker.patch(f"{_mock_base}TaskQueueSubscriber")
+    ei = EndpointInterchange(
+        config=Config(
+            executors=[mocker.Mock()],
+            task_queue_consumers=num_consumers,
+            task_queue_prefetch=17,
+        ),
+        reg_info={"task_queue_info": {}, "result_queue_info": {}},
+    )
+    ei._main_loop = mocker.Mock()
+
+    ei._start_threads_and_main()
+
+    assert mock_tqs.call_count == num_consumers
+    assert len(ei._task_puller_procs) == num_consumers
+    for _a, kwargs in mock_tqs.call_args_list:
+        assert kwargs["prefetch_count"] == 17
+        assert kwargs["exclusive"] is (num_consumers == 1), "Only a lone consumer"
+
+    ei.quiesce()
+    assert mock_tqs.return_value.join.call_count == num_consumers
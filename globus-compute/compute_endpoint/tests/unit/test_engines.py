@@ -7,6 +7,7 @@ import shutil
 import time
 import uuid
 from queue import Queue
+from unittest import mock
 
 import pytest
 from globus_compute_common import messagepack
@@ -17,8 +18,10 @@ from globus_compute_endpoint.engines import (
     ProcessPoolEngine,
     ThreadPoolEngine,
 )
+from globus_compute_endpoint.strategies import SimpleStrategy
 from globus_compute_sdk.serialize import ComputeSerializer
 from parsl.executors.high_throughput.interchange import ManagerLost
+from parsl.providers.base import JobState, JobStatus
 from tests.utils import double, ez_pack_function, slow_double
 
 logger = logging.getLogger(__name__)
@@ -205,3 +208,179 @@ def test_gc_engine_system_failure(gc_engine):
             assert result.error_details
             assert "ManagerLost" in result.data
             break
+
+
+def _mock_htex(managers=(), num_tasks=0, block_states=()):
+    htex = mock.Mock()
+    htex.connected_managers = list(managers)
+    htex.tasks = {str(i): None for i in range(num_tasks)}
+    htex.status.return_value = {
+        str(i): JobStatus(state) for i, state in enumerate(block_states)
+    }
+    htex.provider.min_blocks = 0
+    htex.provider.max_blocks = 4
+    htex.provider.nodes_per_block = 1
+    htex.provider.parallelism = 1
+    htex.workers_per_node = 2
+    return htex
+
+
+def _manager(name, tasks, worker_count=2, active=True):
+    return {
+        "manager": name,
+        "block_id": "0",
+        "worker_count": worker_count,
+        "tasks": tasks,
+        "idle_duration": 0.0,
+        "active": active,
+    }
+
+
+@pytest.fixture
+def htex_engine():
+    engine = GlobusComputeEngine(address="127.0.0.1", heartbeat_period_s=1)
+    engine.endpoint_id = uuid.uuid4()
+    yield engine
+
+
+def test_globus_compute_engine_status_report(htex_engine):
+    managers = [_manager("a", 2), _manager("b", 1), _manager("c", 0, active=False)]
+    htex_engine.executor = _mock_htex(
+        managers, num_tasks=5, block_states=(JobState.RUNNING, JobState.PENDING)
+    )
+
+    info = htex_engine.get_status_report().global_state["info"]
+
+    assert info["managers"] == 3
+    assert info["active_managers"] == 2
+    assert info["total_workers"] == 6
+    assert info["idle_workers"] == 1
+    assert info["pending_tasks"] == 2
+    assert info["outstanding_tasks"] == {"RAW": 5}
+    assert info["block_states"] == {"RUNNING": 1, "PENDING": 1}
+    assert info["max_blocks"] == 4
+    assert info["scaling_enabled"] is True
+    assert htex_engine.get_total_live_workers() == 4
+    assert htex_engine.get_outstanding_breakdown() == [
+        ("interchange", 2, True),
+        ("a", 2, True),
+        ("b", 1, True),
+        ("c", 0, False),
+    ]
+
+
+def test_globus_compute_engine_status_report_without_interchange(htex_engine):
+    htex_engine.executor = _mock_htex()
+    type(htex_engine.executor).connected_managers = mock.PropertyMock(
+        side_effect=RuntimeError("no interchange")
+    )
+    htex_engine.executor.status.side_effect = RuntimeError("no provider")
+
+    info = htex_engine.get_status_report().global_state["info"]
+    assert info["managers"] == 0
+    assert info["outstanding_tasks"] == {}
+    assert info["block_states"] == {}
+
+
+def test_globus_compute_engine_strategy_scales_out(htex_engine):
+    htex_engine.executor = _mock_htex(num_tasks=10)
+    strategy = SimpleStrategy()
+    strategy.interchange = htex_engine
+
+    strategy._strategize()
+    htex_engine.executor.scale_out.assert_called_once_with(4)
+
+
+def test_globus_compute_engine_strategy_scales_in_idle(htex_engine):
+    htex_engine.executor = _mock_htex(
+        [_manager("a", 0)], block_states=(JobState.RUNNING,)
+    )
+    strategy = SimpleStrategy(max_idletime=0)
+    strategy.interchange = htex_engine
+
+    strategy._strategize()
+    htex_engine.executor.scale_in.assert_called_once_with(1, force=False)
+
+
+@pytest.mark.parametrize("scaling_enabled", (True, False))
+def test_globus_compute_engine_runs_strategy(tmp_path, scaling_enabled):
+    strategy = mock.Mock(spec=SimpleStrategy)
+    engine = GlobusComputeEngine(
+        address="127.0.0.1", strategy=strategy, scaling_enabled=scaling_enabled
+    )
+    engine.executor = _mock_htex()
+    engine._status_report_thread = mock.Mock()
+
+    engine.start(endpoint_id=uuid.uuid4(), run_dir=str(tmp_path))
+    engine.shutdown()
+
+    assert strategy.start.called is scaling_enabled
+    assert strategy.close.called is scaling_enabled
+    if scaling_enabled:
+        strategy.start.assert_called_once_with(engine)
+
+
+def test_thread_pool_engine_scales_with_work(thread_pool_engine):
+    info = thread_pool_engine.get_status_report().global_state["info"]
+    assert info["total_workers"] == 0
+    assert info["scaling_enabled"] is True
+
+    assert thread_pool_engine.scale_out(1) == ["0"]
+    future = thread_pool_engine._submit(slow_double, 2, 0.2)
+    future2 = thread_pool_engine._submit(slow_double, 3, 0.2)
+    time.sleep(0.05)
+    info = thread_pool_engine.get_status_report().global_state["info"]
+    assert info["total_workers"] == 2
+    assert info["outstanding_tasks"] == 2
+    assert (future.result(), future2.result()) == (4, 6)
+
+    assert len(thread_pool_engine.scale_in(2)) == 2
+
+
+def _get_result_list(q):
+    for _i in range(3):
+        item = q.get(timeout=1)
+        # Skip any EPStatusReport that popped in ahead of the results
+        if isinstance(item, list):
+            return item
+    raise AssertionError("Expected a list of results from the passthrough_q")
+
+
+@pytest.mark.parametrize("x", ["proc_pool_engine", "thread_pool_engine"])
+def test_engine_submit_batch(x, proc_pool_engine, thread_pool_engine):
+    engine = proc_pool_engine if x == "proc_pool_engine" else thread_pool_engine
+    serializer = ComputeSerializer()
+    tasks = []
+    for i in range(3):
+        task_id = uuid.uuid1()
+        task_body = ez_pack_function(serializer, double, (i,), {})
+        task_message = messagepack.pack(
+            messagepack.message_types.Task(
+                task_id=task_id, container_id=uuid.uuid1(), task_buffer=task_body
+            )
+        )
+        tasks.append((task_id, task_message))
+
+    future = engine.submit_batch(tasks)
+    packed_results = future.result(timeout=30)
+
+    results = [messagepack.unpack(r) for r in packed_results]
+    assert [r.task_id for r in results] == [task_id for task_id, _ in tasks]
+    assert [serializer.deserialize(r.data) for r in results] == [0, 2, 4]
+    assert _get_result_list(engine.results_passthrough) == packed_results
+
+
+def test_engine_submit_batch_failure_fails_each_task(thread_pool_engine):
+    task_ids = [uuid.uuid1(), uuid.uuid1()]
+    failed: concurrent.futures.Future = concurrent.futures.Future()
+    failed.set_exception(RuntimeError("executor lost"))
+    with mock.patch.object(thread_pool_engine, "_submit", return_value=failed):
+        thread_pool_engine.submit_batch([(tid, b"") for tid in task_ids])
+
+    results = [
+        messagepack.unpack(r)
+        for r in _get_result_list(thread_pool_engine.results_passthrough)
+    ]
+    assert [r.task_id for r in results] == task_ids
+    assert all("executor lost" in r.data for r in results)
+    assert all(r.error_details.code for r in results)
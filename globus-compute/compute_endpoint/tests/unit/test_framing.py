@@ -0,0 +1,144 @@
+import json
+import uuid
+
+import pytest
+from globus_compute_endpoint.executors.high_throughput import framing
+from globus_compute_endpoint.executors.high_throughput.messages import (
+    ManagerStatusReport,
+    Message,
+    Task,
+)
+
+
+def _pending(container_id="RAW"):
+    task_id = str(uuid.uuid4())
+    return {
+        "task_id": task_id,
+        "container_id": container_id,
+        "local_container": container_id,
+        "raw_buffer": Task(task_id, container_id, "some buffer").pack(),
+    }
+
+
+def test_task_batch_roundtrip():
+    tasks = [_pending(), _pending("ctr-ñ")]
+    frames = framing.pack_tasks(tasks)
+    assert len(frames) == 1 + len(tasks), "Expect header and one frame per task"
+    assert frames[1] is tasks[0]["raw_buffer"], "Task buffers must not be copied"
+
+    kind, records, payloads = framing.unpack(frames)
+    assert kind is framing.FrameKind.TASKS
+    wire_tasks = framing.unpack_tasks(records, payloads)
+    for pending, wt in zip(tasks, wire_tasks):
+        assert wt.task_id == pending["task_id"]
+        assert wt.container_id == pending["container_id"]
+        assert wt.local_container == pending["local_container"]
+        assert wt.pack() is pending["raw_buffer"]
+        assert Message.unpack(wt.pack()).task_id == pending["task_id"]
+
+
+def test_empty_task_batch():
+    kind, records, payloads = framing.unpack(framing.pack_tasks([]))
+    assert kind is framing.FrameKind.TASKS
+    assert records == [] and payloads == []
+
+
+@pytest.mark.parametrize(
+    "frames, kind",
+    (
+        (framing.HEARTBEAT_FRAMES, framing.FrameKind.HEARTBEAT),
+        (framing.STOP_FRAMES, framing.FrameKind.STOP),
+    ),
+)
+def test_control_frames(frames, kind):
+    assert framing.unpack(frames)[0] is kind
+
+
+def test_task_cancel_roundtrip():
+    task_id = str(uuid.uuid4())
+    kind, records, _ = framing.unpack(framing.pack_task_cancel(task_id))
+    assert kind is framing.FrameKind.TASK_CANCEL
+    assert records == [(task_id,)]
+
+
+def test_advertisement_roundtrip():
+    ads = {"total": {"RAW": 4}, "free": {"RAW": 2, "unused": 1}}
+    kind, _, payloads = framing.unpack(framing.pack_advertisement(ads))
+    assert kind is framing.FrameKind.ADVERTISEMENT
+    assert framing.unpack_advertisement(payloads) == ads
+
+
+@pytest.mark.parametrize("with_report", (True, False))
+def test_results_roundtrip(with_report):
+    results = [("tid-1", "RAW", b"result 1"), ("tid-2", "ctr", b"result 2")]
+    report = ManagerStatusReport({}, 3).pack() if with_report else None
+
+    _, records, payloads = framing.unpack(framing.pack_results(results, report))
+    got_results, got_report = framing.unpack_results(records, payloads)
+    assert got_results == results
+    assert got_report == report
+    if with_report:
+        assert Message.unpack(got_report).container_switch_count == 3
+
+
+def test_report_only_results():
+    report = ManagerStatusReport({}, 0).pack()
+    _, records, payloads = framing.unpack(framing.pack_results([], report))
+    assert framing.unpack_results(records, payloads) == ([], report)
+
+
+def test_worker_frames():
+    kind, records, _ = framing.unpack(framing.pack_worker_registration("3", "RAW"))
+    assert kind is framing.FrameKind.WORKER_REGISTRATION
+    assert records == [("3", "RAW")]
+
+    kind, records, payloads = framing.unpack(
+        framing.pack_worker_task("tid", "RAW", b"body")
+    )
+    assert kind is framing.FrameKind.WORKER_TASK
+    assert records == [("tid", "RAW")]
+    assert payloads == [b"body"]
+
+    kind, records, payloads = framing.unpack(
+        framing.pack_worker_result("tid", "RAW", b"result")
+    )
+    assert kind is framing.FrameKind.WORKER_RESULT
+    assert records == [("tid", "RAW", "")]
+    assert payloads == [b"result"]
+
+
+@pytest.mark.parametrize("cache_hit", (True, False, None))
+def test_worker_result_function_cache_hit(cache_hit):
+    frames = framing.pack_worker_result("tid", "RAW", b"", function_cache_hit=cache_hit)
+    (_, _, cache_field), *_ = framing.unpack(frames)[1]
+    assert framing.unpack_function_cache_hit(cache_field) is cache_hit
+
+
+def test_unpack_accepts_buffers():
+    header, *payloads = framing.pack_worker_task("tid", "RAW", b"body")
+    _, records, _ = framing.unpack([memoryview(header), *payloads])
+    assert records == [("tid", "RAW")]
+
+
+@pytest.mark.parametrize(
+    "frames",
+    (
+        [],
+        [b""],
+        [b"GCW"],
+        [json.dumps({"not": "framed"}).encode()],
+        [framing.HEARTBEAT_FRAMES[0][:4] + b"\xff" + framing.HEARTBEAT_FRAMES[0][5:]],
+        [framing.HEARTBEAT_FRAMES[0][:5] + b"\xff" + framing.HEARTBEAT_FRAMES[0][6:]],
+        [framing.HEARTBEAT_FRAMES[0] + b"trailing"],
+        [framing.pack_task_cancel("tid")[0][:-1]],
+        framing.pack_worker_task("tid", "RAW", b"body")[:1],
+    ),
+)
+def test_unpack_rejects_malformed(frames):
+    with pytest.raises(framing.WireFormatError):
+        framing.unpack(frames)
+
+
+def test_pack_header_validates_record_shape():
+    with pytest.raises(framing.WireFormatError):
+        framing.pack_header(framing.FrameKind.TASK_CANCEL, [("tid", "extra")])
@@ -0,0 +1,104 @@
+from unittest import mock
+
+import pytest
+from globus_compute_endpoint.executors.high_throughput.function_cache import (
+    FunctionCache,
+)
+from globus_compute_sdk.serialize import ComputeSerializer
+from tests.utils import ez_pack_function
+
+
+def add(x, y=0):
+    return x + y
+
+
+def sub(x, y=0):
+    return x - y
+
+
+def mul(x, y=1):
+    return x * y
+
+
+@pytest.fixture
+def serializer():
+    return ComputeSerializer()
+
+
+def test_function_deserialized_once(serializer):
+    cache = FunctionCache(serializer)
+    buffers = [ez_pack_function(serializer, add, (i,), {"y": 1}) for i in range(5)]
+
+    with mock.patch.object(
+        serializer, "deserialize", wraps=serializer.deserialize
+    ) as mock_deserialize:
+        tasks = [cache.deserialize_task(b) for b in buffers]
+
+    # once for the function, plus args and kwargs for each task
+    assert mock_deserialize.call_count == 1 + 2 * len(buffers)
+    assert [tk.fn(*tk.args, **tk.kwargs) for tk in tasks] == [1, 2, 3, 4, 5]
+    assert [tk.cache_hit for tk in tasks] == [False, True, True, True, True]
+    assert cache.stats() == {
+        "entries": 1,
+        "bytes": len(serializer.serialize(add)),
+        "hits": 4,
+        "misses": 1,
+        "evictions": 0,
+    }
+
+
+def test_lru_eviction_by_entries(serializer):
+    cache = FunctionCache(serializer, max_entries=2)
+    fn_add, fn_sub, fn_mul = (serializer.serialize(f) for f in (add, sub, mul))
+
+    cache.get(fn_add)
+    cache.get(fn_sub)
+    assert cache.get(fn_add)[1], "add is cached, and now most recently used"
+    cache.get(fn_mul)  # evicts sub
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(fn_add)[1]
+    assert not cache.get(fn_sub)[1]
+
+
+def test_eviction_by_bytes(serializer):
+    fn_add, fn_sub = serializer.serialize(add), serializer.serialize(sub)
+    cache = FunctionCache(serializer, max_bytes=max(len(fn_add), len(fn_sub)))
+
+    cache.get(fn_add)
+    cache.get(fn_sub)
+    assert len(cache) == 1
+    assert cache.cached_bytes == len(fn_sub)
+    assert not cache.get(fn_add)[1]
+
+
+def test_oversized_function_not_cached(serializer):
+    fn_add = serializer.serialize(add)
+    cache = FunctionCache(serializer, max_bytes=len(fn_add) - 1)
+
+    fn, hit = cache.get(fn_add)
+    assert fn(1, 2) == 3
+    assert not hit
+    assert len(cache) == 0
+    assert not cache.get(fn_add)[1]
+
+
+@pytest.mark.parametrize("env, max_entries", (("0", None), (None, 0)))
+def test_disabled(serializer, monkeypatch, env, max_entries):
+    if env is not None:
+        monkeypatch.setenv("GC_FUNCTION_CACHE_ENTRIES", env)
+    cache = FunctionCache(serializer, max_entries=max_entries)
+    fn_add = serializer.serialize(add)
+
+    assert not cache.get(fn_add)[1]
+    assert not cache.get(fn_add)[1]
+    assert len(cache) == 0
+    assert cache.misses == 2
+
+
+def test_deserialize_task_validates_buffer_count(serializer):
+    cache = FunctionCache(serializer)
+    packed = serializer.pack_buffers([serializer.serialize(add)])
+    with pytest.raises(ValueError):
+        cache.deserialize_task(packed)
@@ -3,12 +3,17 @@ import uuid
 from unittest import mock
 
 import pytest
-from globus_compute_common.tasks import TaskState
+from globus_compute_common.tasks import ActorName, TaskState
 from globus_compute_endpoint.executors.high_throughput.interchange import (
     Interchange,
     starter,
 )
-from globus_compute_endpoint.executors.high_throughput.messages import Task
+from globus_compute_endpoint.executors.high_throughput.messages import (
+    EPStatusReport,
+    Message,
+    Task,
+    TaskCancelBulk,
+)
 
 # Work with linter's 88 char limit, and be uniform in this file how we do it
 mod_dot_path = "globus_compute_endpoint.executors.high_throughput.interchange"
@@ -24,7 +29,7 @@ class TestHighThroughputInterchange:
         packed_task = Task(task_id, "RAW", b"").pack()
 
         ix = Interchange(logdir=tmp_path, worker_ports=(1, 1))
-        ix.task_incoming.recv.return_value = packed_task
+        ix.task_incoming.recv_multipart.return_value = [packed_task]
         ix.migrate_tasks_to_internal(mock_evt)
 
         assert task_id in ix.task_status_deltas
@@ -33,6 +38,24 @@ class TestHighThroughputInterchange:
         assert 0 <= time.time_ns() - tt.timestamp < 2000000000, "Expecting a timestamp"
         assert tt.state == TaskState.WAITING_FOR_NODES
 
+    def test_migrate_task_batch(self, _mzmq, _mfn_conf, tmp_path):
+        mock_evt = mock.Mock()
+        mock_evt.is_set.side_effect = [False, True]  # run once, please
+        task_ids = [str(uuid.uuid4()) for _ in range(5)]
+        frames = [Task(tid, "RAW", b"").pack() for tid in task_ids]
+        frames.insert(2, b"not a message")
+
+        ix = Interchange(logdir=tmp_path, worker_ports=(1, 1))
+        ix._waker = mock.Mock()
+        ix.task_incoming.recv_multipart.return_value = frames
+        ix.migrate_tasks_to_internal(mock_evt)
+
+        assert list(ix.task_status_deltas) == task_ids, "Bad frame skipped"
+        assert ix.total_pending_task_count == 5
+        assert ix._waker.wake.call_count == 1, "One wake for the whole batch"
+        queued = ix.pending_task_queue["RAW"]
+        assert [queued.get()["task_id"] for _ in task_ids] == task_ids
+
     def test_start_task_status(self, _mzmq, _mfn_conf, tmp_path, mocker, reset_signals):
         mock_evt = mock.Mock()
         mock_evt.is_set.side_effect = [False, False, True]  # run once, please
@@ -43,7 +66,13 @@ class TestHighThroughputInterchange:
         mock_thread.Event.return_value = mock_evt
 
         mock_dispatch = mocker.patch(f"{mod_dot_path}.naive_interchange_task_dispatch")
-        mock_dispatch.return_value = ({"mgr": [{"task_id": task_id}]}, 0)
+        task = {
+            "task_id": task_id,
+            "container_id": "RAW",
+            "local_container": "RAW",
+            "raw_buffer": Task(task_id, "RAW", b"").pack(),
+        }
+        mock_dispatch.return_value = ({"mgr": [task]}, 0)
 
         ix = Interchange(logdir=tmp_path, worker_ports=(1, 1))
         ix.strategy = mock.Mock()
@@ -54,6 +83,62 @@ class TestHighThroughputInterchange:
         tt = ix.task_status_deltas[task_id][0]
         assert 0 <= time.time_ns() - tt.timestamp < 2000000000, "Expecting a timestamp"
         assert tt.state == TaskState.WAITING_FOR_LAUNCH
+        assert ix._task_locations[task_id] == ("mgr", "RAW")
+
+    def test_cancel_uses_task_locations(self, _mzmq, _mfn_conf, tmp_path):
+        ix = Interchange(logdir=tmp_path, worker_ports=(1, 1))
+        ix._waker = mock.Mock()
+        ix._task_locations["dispatched"] = (b"mgr", "RAW")
+
+        assert ix.enqueue_task_cancel("dispatched") is True
+        assert ix.task_cancel_running_queue.get_nowait() == (b"mgr", "dispatched")
+        assert "dispatched" not in ix.task_cancel_pending_trap
+        assert ix._waker.wake.call_count == 1
+
+        assert ix.enqueue_task_cancel("pending") is False
+        assert ix.task_cancel_running_queue.empty()
+        assert "pending" in ix.task_cancel_pending_trap, "Caught at dispatch"
+        assert ix._waker.wake.call_count == 1, "Nothing to wake for"
+
+    def test_cancel_bulk(self, _mzmq, _mfn_conf, tmp_path):
+        ix = Interchange(logdir=tmp_path, worker_ports=(1, 1))
+        ix._waker = mock.Mock()
+        task_ids = [str(i) for i in range(10)]
+        for tid in task_ids[::2]:
+            ix._task_locations[tid] = (b"mgr" + tid.encode(), "RAW")
+
+        dispatched = ix.enqueue_task_cancels(task_ids)
+
+        assert dispatched == task_ids[::2]
+        assert ix._waker.wake.call_count == 1, "One wake for the whole batch"
+        running = []
+        while not ix.task_cancel_running_queue.empty():
+            running.append(ix.task_cancel_running_queue.get_nowait())
+        assert running == [(b"mgr" + tid.encode(), tid) for tid in task_ids[::2]]
+        assert set(ix.task_cancel_pending_trap) == set(task_ids[1::2])
+
+    def test_command_server_bulk_cancel(self, _mzmq, _mfn_conf, tmp_path):
+        ix = Interchange(logdir=tmp_path, worker_ports=(1, 1))
+        ix._waker = mock.Mock()
+        ix._task_locations["a"] = (b"mgr", "RAW")
+        ix.command_channel.recv.return_value = TaskCancelBulk(["a", "b"]).pack()
+        kill_evt = mock.Mock()
+        kill_evt.is_set.side_effect = [False, True]
+
+        ix._command_server(kill_evt)
+
+        (reply,), _ = ix.command_channel.send.call_args
+        reply = Message.unpack(reply)
+        assert isinstance(reply, TaskCancelBulk)
+        assert reply.task_ids == ["a"], "Reply lists the tasks sent to managers"
+        assert "b" in ix.task_cancel_pending_trap
+
+    @pytest.mark.parametrize(
+        "mode, mgr_mode", (("hard", "hard"), ("soft", "soft"), ("indexed", "hard"))
+    )
+    def test_manager_scheduler_mode(self, _mzmq, _mfn_conf, tmp_path, mode, mgr_mode):
+        ix = Interchange(logdir=tmp_path, worker_ports=(1, 1), scheduler_mode=mode)
+        assert ix.manager_scheduler_mode == mgr_mode
 
 
 def test_starter_sends_sentinel_upon_error(mocker):
@@ -65,3 +150,32 @@ def test_starter_sends_sentinel_upon_error(mocker):
     q.put.assert_called()
     q.close.assert_called()
     q.join_thread.assert_called()
+
+
+@mock.patch(f"{mod_dot_path}.zmq")
+@mock.patch(f"{mod_dot_path}.Interchange.load_config")
+def test_status_report_swaps_deltas_without_copy(_mzmq, _mfn_conf, tmp_path):
+    ix = Interchange(logdir=tmp_path, worker_ports=(1, 1))
+    ix.endpoint_id = str(uuid.uuid4())
+    ix.get_global_state_for_status_report = mock.Mock(return_value={})
+    for i in range(5):
+        ix.task_status_deltas.append(
+            str(i), TaskState.WAITING_FOR_NODES, ActorName.INTERCHANGE, i
+        )
+    reported = ix.task_status_deltas
+
+    sent = []
+
+    def _put(packed):
+        assert not ix._task_status_delta_lock.locked(), "Serialize outside lock"
+        sent.append(EPStatusReport.unpack(packed[1:]))
+
+    report_q, kill_evt = mock.Mock(), mock.Mock()
+    report_q.put.side_effect = _put
+    kill_evt.wait.side_effect = [False, True]
+    ix._status_report_loop(kill_evt, report_q)
+
+    assert len(sent) == 1, "Nothing to report on the second heartbeat"
+    assert sorted(sent[0].task_statuses) == [str(i) for i in range(5)]
+    assert ix.task_status_deltas is reported, "Buffers are reused"
+    assert not ix.task_status_deltas
@@ -0,0 +1,129 @@
+import select
+import threading
+
+import pytest
+from globus_compute_endpoint.executors.high_throughput.interchange_events import (
+    TimerWheel,
+    Waker,
+)
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _readable(fd, timeout=0.0):
+    return bool(select.select([fd], [], [], timeout)[0])
+
+
+def test_waker_wakes_and_drains():
+    w = Waker()
+    try:
+        assert not _readable(w.fd)
+        w.wake()
+        w.wake()
+        assert _readable(w.fd)
+        w.drain()
+        assert not _readable(w.fd)
+        w.wake()
+        assert _readable(w.fd), "Expect wake after drain to be delivered"
+    finally:
+        w.close()
+
+
+def test_waker_wakes_blocked_thread():
+    w = Waker()
+    woke = threading.Event()
+
+    def _wait():
+        if _readable(w.fd, timeout=5):
+            woke.set()
+
+    th = threading.Thread(target=_wait)
+    th.start()
+    w.wake()
+    th.join(timeout=5)
+    w.close()
+    assert woke.is_set()
+
+
+def test_waker_wake_after_close_is_harmless():
+    w = Waker()
+    w.close()
+    w.wake()
+    w.drain()
+
+
+@pytest.mark.parametrize("tick, num_slots", ((0, 8), (-1, 8), (0.1, 0)))
+def test_timer_wheel_validates(tick, num_slots):
+    with pytest.raises(ValueError):
+        TimerWheel(tick=tick, num_slots=num_slots)
+
+
+def test_timer_wheel_fires_when_due():
+    clock = _Clock()
+    tw = TimerWheel(tick=1, num_slots=8, clock=clock)
+    tw.schedule("a", clock.now + 2.5)
+    tw.schedule("b", clock.now + 5)
+    assert len(tw) == 2
+    assert "a" in tw
+
+    assert tw.expire(clock.now + 2) == []
+    assert tw.expire(clock.now + 2.5) == ["a"]
+    assert "a" not in tw
+    assert tw.expire(clock.now + 10) == ["b"]
+    assert len(tw) == 0
+
+
+def test_timer_wheel_reschedule_replaces():
+    clock = _Clock()
+    tw = TimerWheel(tick=1, num_slots=8, clock=clock)
+    tw.schedule("a", clock.now + 1)
+    tw.schedule("a", clock.now + 3)
+    assert len(tw) == 1
+    assert tw.expire(clock.now + 2) == []
+    assert tw.expire(clock.now + 3) == ["a"]
+
+
+def test_timer_wheel_cancel():
+    clock = _Clock()
+    tw = TimerWheel(tick=1, num_slots=8, clock=clock)
+    tw.schedule("a", clock.now + 1)
+    tw.cancel("a")
+    tw.cancel("not scheduled")
+    assert tw.expire(clock.now + 5) == []
+
+
+def test_timer_wheel_past_deadline_fires_next_expire():
+    clock = _Clock()
+    tw = TimerWheel(tick=1, num_slots=8, clock=clock)
+    tw.expire(clock.now + 3)
+    tw.schedule("late", clock.now)
+    assert tw.expire(clock.now + 3) == ["late"]
+
+
+def test_timer_wheel_beyond_one_rotation():
+    clock = _Clock()
+    tw = TimerWheel(tick=1, num_slots=4, clock=clock)
+    tw.schedule("far", clock.now + 10)
+    for step in range(1, 10):
+        assert tw.expire(clock.now + step) == [], step
+    assert tw.expire(clock.now + 10) == ["far"]
+
+
+def test_timer_wheel_timeout():
+    clock = _Clock(1000.0)
+    tw = TimerWheel(tick=1, num_slots=8, clock=clock)
+    assert tw.timeout() is None
+
+    tw.schedule("a", clock.now + 2.5)
+    # End of the tick holding the deadline: never early
+    assert tw.timeout() == pytest.approx(3.0)
+    clock.now += 3
+    assert tw.timeout() == 0.0
+    assert tw.expire() == ["a"]
+    assert tw.timeout() is None
@@ -0,0 +1,148 @@
+import collections
+import queue
+
+import pytest
+from globus_compute_endpoint.executors.high_throughput.interchange_task_dispatch import (  # noqa: E501
+    ManagerCapacityIndex,
+    indexed_interchange_task_dispatch,
+)
+
+
+def _mdata(free: int, worker_type="RAW", unused=0, max_workers=None, active=True):
+    max_workers = free + unused if max_workers is None else max_workers
+    return {
+        "active": active,
+        "worker_type": worker_type,
+        "max_worker_count": max_workers,
+        "total_tasks": 0,
+        "tasks": collections.defaultdict(set),
+        "free_capacity": {
+            "total_workers": free + unused,
+            "free": {worker_type: free, "unused": unused},
+            "total": {worker_type: free, "unused": unused},
+        },
+    }
+
+
+def _pending(num_tasks: int, task_type="RAW"):
+    q = queue.Queue()
+    for i in range(num_tasks):
+        q.put({"task_id": f"{task_type}-{i}", "container_id": task_type})
+    return {task_type: q}
+
+
+def test_capacity_index_pops_most_free_first():
+    idx = ManagerCapacityIndex()
+    idx.update(b"small", _mdata(1))
+    idx.update(b"large", _mdata(5))
+    idx.update(b"medium", _mdata(2, unused=1))
+
+    assert len(idx) == 3
+    assert [idx.pop("RAW") for _ in range(3)] == [b"large", b"medium", b"small"]
+    assert idx.pop("RAW") is None
+    assert len(idx) == 0
+
+
+def test_capacity_index_ignores_stale_entries():
+    idx = ManagerCapacityIndex()
+    idx.update(b"m1", _mdata(5))
+    idx.update(b"m2", _mdata(3))
+    idx.update(b"m1", _mdata(1))  # m1 capacity shrinks; heap holds a stale 5
+
+    assert idx.pop("RAW") == b"m2"
+    assert idx.pop("RAW") == b"m1"
+    assert idx.pop("RAW") is None
+
+
+@pytest.mark.parametrize(
+    "mdata",
+    (
+        None,
+        _mdata(0),
+        _mdata(3, active=False),
+        _mdata(3, worker_type=None),
+        _mdata(3, max_workers=0),
+    ),
+)
+def test_capacity_index_drops_managers_without_capacity(mdata):
+    idx = ManagerCapacityIndex()
+    idx.update(b"m", _mdata(3))
+    idx.update(b"m", mdata)
+
+    assert b"m" not in idx
+    assert idx.pop("RAW") is None
+
+
+def test_capacity_index_by_worker_type():
+    idx = ManagerCapacityIndex()
+    idx.update(b"raw", _mdata(2))
+    idx.update(b"ctr", _mdata(2, worker_type="some_container"))
+
+    assert idx.pop("some_container") == b"ctr"
+    assert idx.pop("some_container") is None
+    assert idx.pop("RAW") == b"raw"
+
+
+def test_capacity_index_compacts():
+    idx = ManagerCapacityIndex()
+    for cap in range(1, 500):
+        idx.update(b"m", _mdata(cap))
+
+    assert len(idx._heaps["RAW"]) < 100
+    assert idx.pop("RAW") == b"m"
+
+
+def test_indexed_dispatch_places_tasks():
+    ready = {b"m1": _mdata(2), b"m2": _mdata(3, unused=1)}
+    pending = _pending(5)
+    interesting = set(ready)
+    idx = ManagerCapacityIndex()
+
+    task_dispatch, count = indexed_interchange_task_dispatch(
+        interesting, pending, ready, idx
+    )
+
+    assert count == 5
+    assert not interesting, "Expect dirty managers consumed into the index"
+    assert len(task_dispatch[b"m2"]) == 4, "Expect largest capacity filled first"
+    assert len(task_dispatch[b"m1"]) == 1
+    assert pending["RAW"].empty()
+    assert ready[b"m2"]["total_tasks"] == 4
+    assert ready[b"m2"]["free_capacity"]["total_workers"] == 0
+    assert ready[b"m2"]["tasks"]["RAW"] == {f"RAW-{i}" for i in range(4)}
+
+    assert b"m2" not in idx, "Saturated manager should leave the index"
+    assert b"m1" in idx, "Manager with remaining capacity should remain"
+
+
+def test_indexed_dispatch_only_reindexes_dirty_managers():
+    ready = {b"m1": _mdata(2)}
+    idx = ManagerCapacityIndex()
+    indexed_interchange_task_dispatch({b"m1"}, _pending(0), ready, idx)
+
+    # no longer "interesting," and no pending work: nothing to do
+    task_dispatch, count = indexed_interchange_task_dispatch(
+        set(), _pending(0), ready, idx
+    )
+    assert (task_dispatch, count) == ({}, 0)
+
+    task_dispatch, count = indexed_interchange_task_dispatch(
+        set(), _pending(3), ready, idx
+    )
+    assert count == 2
+    assert len(task_dispatch[b"m1"]) == 2
+
+
+def test_indexed_dispatch_skips_lost_and_held_managers():
+    ready = {b"lost": _mdata(5), b"held": _mdata(5), b"ok": _mdata(1)}
+    idx = ManagerCapacityIndex()
+    indexed_interchange_task_dispatch(set(ready), _pending(0), ready, idx)
+
+    del ready[b"lost"]
+    ready[b"held"]["active"] = False
+    pending = _pending(3)
+    task_dispatch, count = indexed_interchange_task_dispatch(set(), pending, ready, idx)
+
+    assert count == 1
+    assert list(task_dispatch) == [b"ok"]
+    assert pending["RAW"].qsize() == 2
@@ -0,0 +1,112 @@
+import logging
+import uuid
+
+import pytest
+from globus_compute_endpoint import logging_config
+from globus_compute_endpoint.logging_config import TaskLogSampler, setup_logging
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging():
+    loggers = [logging.getLogger()] + [
+        lg
+        for lg in logging.root.manager.loggerDict.values()
+        if isinstance(lg, logging.Logger)
+    ]
+    saved = [
+        (lg, lg.handlers[:], lg.level, lg.propagate, lg.disabled) for lg in loggers
+    ]
+    yield
+    logging_config._stop_log_queue()
+    for lg, handlers, level, propagate, disabled in saved:
+        for h in lg.handlers:
+            if h not in handlers:
+                h.close()
+        lg.handlers = handlers
+        lg.level, lg.propagate, lg.disabled = level, propagate, disabled
+
+
+def _record(task_id=None, level=logging.DEBUG):
+    rec = logging.LogRecord("x", level, __file__, 1, "msg %s", ("arg",), None)
+    if task_id is not None:
+        rec.task_id = task_id
+    return rec
+
+
+def test_sampler_is_deterministic_per_task():
+    sampler = TaskLogSampler(0.5)
+    task_ids = [str(uuid.uuid4()) for _ in range(200)]
+    first = [sampler.filter(_record(tid)) for tid in task_ids]
+    assert first == [TaskLogSampler(0.5).filter(_record(tid)) for tid in task_ids]
+    assert 50 < sum(first) < 150, "Expect roughly half the tasks sampled"
+
+
+@pytest.mark.parametrize("rate, expected", ((0.0, False), (1.0, True)))
+def test_sampler_bounds(rate, expected):
+    sampler = TaskLogSampler(rate)
+    assert all(
+        sampler.filter(_record(str(uuid.uuid4()))) is expected for _ in range(50)
+    )
+
+
+def test_sampler_passes_warnings_and_untasked_records():
+    sampler = TaskLogSampler(0.0)
+    assert sampler.filter(_record())
+    assert sampler.filter(_record("some task", level=logging.WARNING))
+    assert not sampler.filter(_record("some task", level=logging.INFO))
+
+
+def test_queue_mode_writes_after_stop(tmp_path):
+    logfile = tmp_path / "ep.log"
+    setup_logging(logfile=logfile, console_enabled=False, log_queue=True)
+
+    lg = logging.getLogger("globus_compute_endpoint.test")
+    handlers = logging.getLogger("globus_compute_endpoint").handlers
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    args = ["before"]
+    lg.info("queued %s", args)
+    args[0] = "after"  # arguments are merged when the record is queued
+    logging_config._stop_log_queue()
+
+    assert "queued ['before']" in logfile.read_text()
+
+
+def test_queue_mode_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("GC_LOG_QUEUE", "1")
+    setup_logging(logfile=tmp_path / "ep.log", console_enabled=False)
+    assert logging_config._log_queue_listener is not None
+
+    monkeypatch.setenv("GC_LOG_QUEUE", "0")
+    setup_logging(logfile=tmp_path / "ep.log", console_enabled=False)
+    assert logging_config._log_queue_listener is None
+
+
+@pytest.mark.parametrize("log_queue", (True, False))
+def test_task_sample_rate_filters_task_records(tmp_path, log_queue):
+    logfile = tmp_path / "ep.log"
+    setup_logging(
+        logfile=logfile,
+        console_enabled=False,
+        debug=True,
+        log_queue=log_queue,
+        task_sample_rate=0.0,
+    )
+
+    lg = logging.getLogger("globus_compute_endpoint.test")
+    lg.debug("per-task line", extra={"task_id": "some task"})
+    lg.debug("general line")
+    logging_config._stop_log_queue()
+
+    content = logfile.read_text()
+    assert "per-task line" not in content
+    assert "general line" in content
+
+
+def test_trace_passes_arguments(caplog):
+    lg = logging.getLogger("globus_compute_endpoint.test")
+    with caplog.at_level(logging_config.ComputeLogger.TRACE, lg.name):
+        lg.trace("traced %s and %s", "one", "two")
+
+    assert "traced one and two" in caplog.text
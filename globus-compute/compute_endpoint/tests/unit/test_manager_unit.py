@@ -2,9 +2,15 @@ import time
 import uuid
 from unittest import mock
 
+import pytest
 from globus_compute_common.tasks import TaskState
+from globus_compute_endpoint.executors.high_throughput import framing
 from globus_compute_endpoint.executors.high_throughput.manager import Manager
-from globus_compute_endpoint.executors.high_throughput.messages import Task
+from globus_compute_endpoint.executors.high_throughput.messages import (
+    ManagerStatusReport,
+    Message,
+    Task,
+)
 
 
 @mock.patch("globus_compute_endpoint.executors.high_throughput.manager.zmq")
@@ -25,3 +31,44 @@ class TestManager:
         tt = mgr.task_status_deltas[task_id][0]
         assert time.time_ns() - tt.timestamp < 2000000000, "Expecting a timestamp"
         assert tt.state == TaskState.RUNNING
+
+    def test_forkserver_launch_method(self, _mock_zmq):
+        mgr = Manager(uid="some_uid")
+        assert mgr.worker_map.forkserver is not None
+
+        mgr = Manager(uid="some_uid", worker_launch_method="popen")
+        assert mgr.worker_map.forkserver is None
+
+    def test_unknown_launch_method(self, _mock_zmq):
+        with pytest.raises(ValueError):
+            Manager(uid="some_uid", worker_launch_method="spawn")
+
+    def test_status_report_includes_spinup(self, _mock_zmq):
+        mgr = Manager(uid="some_uid", worker_launch_method="popen")
+        kill_event = mock.Mock()
+        kill_event.wait.side_effect = (False, True)
+        mgr._status_report_loop(kill_event)
+
+        report = mgr.pending_result_queue.get_nowait()
+        assert isinstance(report, ManagerStatusReport)
+        spinup = report.worker_stats["spinup"]
+        assert spinup["launch_method"] == "popen"
+        assert spinup["count"] == 0
+
+        unpacked = Message.unpack(report.pack())
+        assert unpacked.worker_stats == report.worker_stats
+
+    def test_worker_result_counts_function_cache(self, _mock_zmq):
+        mgr = Manager(uid="some_uid", worker_launch_method="popen")
+        mgr.worker_map = mock.Mock()
+        mgr.remove_task = mock.Mock()
+        sock = mgr.funcx_task_socket
+        for hit in (False, True, True, None):
+            frames = framing.pack_worker_result(
+                "tid", "RAW", b"result", function_cache_hit=hit
+            )
+            sock.recv_multipart.return_value = [b"0", b"TASK_RET", *frames]
+            mgr.poll_funcx_task_socket()
+
+        assert mgr.function_cache_counts == {"hits": 2, "misses": 1}
+        assert mgr.pending_result_queue.qsize() == 4
@@ -0,0 +1,155 @@
+from unittest import mock
+
+import pika.frame
+import pika.spec
+import pytest
+from globus_compute_endpoint.endpoint.rabbit_mq import (
+    PipelinedResultQueuePublisher,
+    PublisherFailedError,
+    RabbitPublisherStatus,
+)
+
+
+def _ack(tag, multiple=False):
+    return pika.frame.Method(
+        1, pika.spec.Basic.Ack(delivery_tag=tag, multiple=multiple)
+    )
+
+
+def _nack(tag, multiple=False):
+    return pika.frame.Method(
+        1, pika.spec.Basic.Nack(delivery_tag=tag, multiple=multiple)
+    )
+
+
+@pytest.fixture
+def result_store():
+    return {}
+
+
+@pytest.fixture
+def publisher(randomstring, result_store):
+    queue_info = {
+        "connection_url": "amqp://localhost",
+        "exchange": randomstring(),
+        "queue": randomstring(),
+        "queue_publish_kwargs": {"routing_key": randomstring()},
+    }
+    pub = PipelinedResultQueuePublisher(
+        queue_info=queue_info, result_store=result_store, max_in_flight=3
+    )
+    # Run the "ioloop" callbacks inline, as if the channel were open
+    pub._connection = mock.Mock()
+    pub._connection.ioloop.add_callback_threadsafe.side_effect = lambda cb: cb()
+    pub._channel = mock.Mock()
+    pub._on_confirm_selectok(None)
+    yield pub
+
+
+def _published_bodies(pub):
+    return [kw["body"] for _a, kw in pub._channel.basic_publish.call_args_list]
+
+
+def test_publish_requires_connect(randomstring):
+    pub = PipelinedResultQueuePublisher(
+        queue_info={"queue_publish_kwargs": {randomstring(): randomstring()}}
+    )
+    with pytest.raises(ValueError):
+        pub.publish(b"some message")
+
+
+def test_publish_does_not_wait_for_confirm(publisher):
+    publisher.publish(b"m1", task_id="t1")
+    publisher.publish(b"m2", task_id="t2")
+
+    assert _published_bodies(publisher) == [b"m1", b"m2"]
+    _a, kwargs = publisher._channel.basic_publish.call_args
+    assert (
+        kwargs["routing_key"]
+        == publisher.queue_info["queue_publish_kwargs"]["routing_key"]
+    )
+    assert list(publisher._unconfirmed) == [1, 2], "Tracked by delivery tag"
+    assert not publisher.flush(timeout=0)
+
+
+def test_window_bounds_unconfirmed(publisher):
+    for i in range(publisher.max_in_flight):
+        publisher.publish(b"m%d" % i, task_id=f"t{i}")
+
+    with pytest.raises(TimeoutError):
+        publisher.publish(b"one too many", task_id="tx", timeout=0.01)
+
+    publisher._on_delivery_confirmation(_ack(2, multiple=True))
+    assert list(publisher._unconfirmed) == [3]
+    publisher.publish(b"fits now", task_id="ty", timeout=0.01)
+
+    publisher._on_delivery_confirmation(_ack(4, multiple=True))
+    assert publisher.flush(timeout=0)
+    assert publisher.num_confirmed == 4
+
+
+def test_nack_spills_only_rejected(publisher, result_store):
+    for i in range(3):
+        publisher.publish(b"m%d" % i, task_id=f"t{i}")
+
+    publisher._on_delivery_confirmation(_ack(1))
+    publisher._on_delivery_confirmation(_nack(2))
+    assert result_store == {"t1": b"m1"}
+
+    publisher._on_delivery_confirmation(_ack(3))
+    assert publisher.flush(timeout=0)
+    assert (publisher.num_confirmed, publisher.num_nacked) == (2, 1)
+
+
+def test_nack_multiple(publisher, result_store):
+    publisher.publish(b"status report")  # no task id; nothing to store
+    publisher.publish(b"m1", task_id="t1")
+    publisher.publish(b"m2", task_id="t2")
+
+    publisher._on_delivery_confirmation(_nack(2, multiple=True))
+    assert result_store == {"t1": b"m1"}
+    assert list(publisher._unconfirmed) == [3]
+
+
+def test_disconnect_spills_unconfirmed(publisher, result_store):
+    publisher.publish(b"m1", task_id="t1")
+    publisher.publish(b"m2", task_id="t2")
+    publisher._on_delivery_confirmation(_ack(1))
+
+    publisher._on_connection_closed(publisher._connection, Exception("gone"))
+
+    assert result_store == {"t2": b"m2"}, "Only the unconfirmed result is spilled"
+    assert publisher.flush(timeout=0)
+    assert publisher.status is RabbitPublisherStatus.closed
+    with pytest.raises(PublisherFailedError):
+        publisher.publish(b"m3", task_id="t3")
+
+
+def test_disconnect_spills_unsent(publisher, result_store):
+    # channel not yet ready: messages wait in the outgoing queue
+    publisher._channel = None
+    publisher.publish(b"m1", task_id="t1")
+    assert not publisher._unconfirmed
+
+    publisher._on_connection_closed(publisher._connection, Exception("gone"))
+    assert result_store == {"t1": b"m1"}
+    assert publisher.flush(timeout=0)
+
+
+def test_publish_error_spills(publisher, result_store):
+    publisher._channel.basic_publish.side_effect = Exception("channel is closed")
+    publisher.publish(b"m1", task_id="t1")
+    assert result_store == {"t1": b"m1"}
+    assert publisher.flush(timeout=0)
+
+
+def test_connect_failure_raises(publisher):
+    pub = PipelinedResultQueuePublisher(queue_info=publisher.queue_info)
+    mock_conn = mock.Mock()
+    mock_conn.ioloop.start.side_effect = lambda: pub._on_open_failed(
+        mock_conn, "refused"
+    )
+    with mock.patch.object(pub, "_connect", return_value=mock_conn):
+        with pytest.raises(PublisherFailedError):
+            pub.connect()
+    assert pub.status is RabbitPublisherStatus.closed
@@ -1,4 +1,6 @@
+import pathlib
 import random
+from unittest import mock
 
 import pytest
 from globus_compute_endpoint.endpoint.result_store import ResultStore
@@ -113,3 +115,143 @@ def test_store_repr(store):
     assert repr(store).startswith(store.__class__.__name__)
     assert "data_dir: " in repr(store)
     assert str(store.data_path) in repr(store)
+
+
+def _segment_names(store):
+    return sorted(p.name for p in store.data_path.iterdir())
+
+
+def test_store_persists_across_reopen(store, randomstring):
+    expected = {f"key_{num}": randomstring().encode() for num in range(10)}
+    for k, v in expected.items():
+        store[k] = v
+    store.discard("key_3")
+    store["key_4"] = b"overwritten"
+    expected.pop("key_3")
+    expected["key_4"] = b"overwritten"
+    store.close()
+
+    reopened = ResultStore(store.data_path.parent)
+    assert len(reopened) == len(expected)
+    assert dict(reopened) == expected
+
+
+def test_store_is_a_log_not_a_file_per_result(store, randomstring):
+    for num in range(50):
+        store[f"key_{num}"] = randomstring().encode()
+    assert _segment_names(store) == ["segment-00000001.log"]
+
+
+def test_store_iteration_does_not_scan_directory(store, randomstring):
+    store["key"] = randomstring().encode()
+    with mock.patch.object(pathlib.Path, "iterdir") as mock_iterdir:
+        with mock.patch.object(pathlib.Path, "glob") as mock_glob:
+            assert [k for k, _ in store] == ["key"]
+    assert not mock_iterdir.called
+    assert not mock_glob.called
+
+
+def test_store_rolls_and_drops_dead_segments(fs, randomstring):
+    fs.create_dir("ep_dir")
+    store = ResultStore("ep_dir", segment_size=100, compact_min_bytes=2**30)
+    for num in range(6):
+        store[f"key_{num}"] = b"x" * 100  # fills a segment
+    assert len(_segment_names(store)) == 6
+
+    store.discard("key_1")  # tombstone starts segment 7
+    assert "segment-00000002.log" in _segment_names(store), "Only oldest removed"
+    store.discard("key_0")
+    assert "segment-00000001.log" not in _segment_names(store)
+    assert "segment-00000002.log" not in _segment_names(store)
+
+    store.close()
+    assert sorted(k for k, _ in ResultStore("ep_dir")) == [
+        f"key_{num}" for num in range(2, 6)
+    ]
+
+
+def test_store_compacts_when_mostly_removed(fs):
+    fs.create_dir("ep_dir")
+    store = ResultStore("ep_dir", compact_min_bytes=0)
+    for num in range(10):
+        store[f"key_{num}"] = b"x" * 100
+    for num in range(8):
+        store.discard(f"key_{num}")
+
+    assert len(_segment_names(store)) == 1
+    seg_path = store.data_path / _segment_names(store)[0]
+    assert seg_path.name != "segment-00000001.log", "Expected rewritten segment"
+    assert seg_path.stat().st_size < 1000, "Expect removed payloads dropped"
+    assert {k for k, _ in store} == {"key_8", "key_9"}
+
+
+def test_store_empty_removes_segments(store, randomstring):
+    store["key"] = randomstring().encode()
+    store.pop("key")
+    assert not _segment_names(store)
+
+
+def test_store_truncates_torn_write(store, randomstring):
+    store["key_1"] = b"payload 1"
+    store["key_2"] = b"payload 2"
+    store.close()
+    seg_path = store.data_path / "segment-00000001.log"
+    data = seg_path.read_bytes()
+    seg_path.write_bytes(data[:-3])  # as if killed mid-write
+
+    reopened = ResultStore(store.data_path.parent)
+    assert dict(reopened) == {"key_1": b"payload 1"}
+    reopened["key_3"] = b"payload 3"
+    reopened.close()
+    assert dict(ResultStore(store.data_path.parent)) == {
+        "key_1": b"payload 1",
+        "key_3": b"payload 3",
+    }
+
+
+def test_store_imports_legacy_result_files(fs, randomstring):
+    fs.create_dir("ep_dir/unacked_results")
+    legacy = {randomstring(): randomstring().encode() for _ in range(3)}
+    for k, v in legacy.items():
+        fs.create_file(f"ep_dir/unacked_results/{k}", contents=v)
+
+    store = ResultStore("ep_dir")
+    assert dict(store) == legacy
+    assert _segment_names(store) == ["segment-00000001.log"]
+
+
+def test_store_fsync_batched(fs):
+    fs.create_dir("ep_dir")
+    store = ResultStore("ep_dir", fsync_interval_s=60)
+    with mock.patch(f"{ResultStore.__module__}.os.fsync") as mock_fsync:
+        for num in range(20):
+            store[f"key_{num}"] = b"some payload"
+        assert mock_fsync.call_count <= 1
+        store.sync()
+        assert mock_fsync.call_count <= 2
+
+
+def test_store_replay_is_rate_limited(store, randomstring):
+    for num in range(5):
+        store[f"key_{num}"] = randomstring().encode()
+
+    clock = [0.0]
+
+    def sleep(s):
+        clock[0] += s
+
+    with mock.patch(f"{ResultStore.__module__}.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = sleep
+        replayed = [k for k, _ in store.replay(max_per_second=10)]
+    assert len(replayed) == 5
+    assert clock[0] == pytest.approx(0.4), "5 items at 10/s: 4 intervals"
+
+
+def test_store_replay_skips_removed(store):
+    store["key_1"] = b"1"
+    store["key_2"] = b"2"
+    replay = store.replay()
+    assert next(replay) == ("key_1", b"1")
+    store.discard("key_2")
+    assert list(replay) == []
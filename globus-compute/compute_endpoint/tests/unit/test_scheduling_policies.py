@@ -0,0 +1,185 @@
+import collections
+import queue
+
+import pytest
+from globus_compute_endpoint.executors.high_throughput.interchange_task_dispatch import (  # noqa: E501
+    naive_interchange_task_dispatch,
+)
+from globus_compute_endpoint.executors.high_throughput.messages import Task
+from globus_compute_endpoint.executors.high_throughput.scheduling_policies import (
+    ContainerAffinityPolicy,
+    FairSharePolicy,
+    FairShareQueue,
+    LeastLoadedPolicy,
+    RoundRobinPolicy,
+    SchedulingPolicy,
+    function_share_key,
+    get_scheduling_policy,
+)
+from globus_compute_sdk.serialize import ComputeSerializer
+
+
+def _mdata(free: dict, total_tasks=0, max_workers=4, reg_time=0.0):
+    return {
+        "active": True,
+        "reg_time": reg_time,
+        "max_worker_count": max_workers,
+        "total_tasks": total_tasks,
+        "tasks": collections.defaultdict(set),
+        "free_capacity": {"total_workers": sum(free.values()), "free": dict(free)},
+    }
+
+
+@pytest.mark.parametrize(
+    "name, cls",
+    (
+        (None, SchedulingPolicy),
+        ("random", SchedulingPolicy),
+        ("least-loaded", LeastLoadedPolicy),
+        ("round-robin", RoundRobinPolicy),
+        ("container-affinity", ContainerAffinityPolicy),
+        ("fair-share", FairSharePolicy),
+    ),
+)
+def test_get_scheduling_policy(name, cls):
+    assert type(get_scheduling_policy(name)) is cls
+
+
+def test_get_scheduling_policy_passes_instances():
+    policy = LeastLoadedPolicy()
+    assert get_scheduling_policy(policy) is policy
+
+
+def test_get_scheduling_policy_unknown():
+    with pytest.raises(ValueError) as pyt_e:
+        get_scheduling_policy("fastest")
+    assert "fastest" in str(pyt_e.value)
+    assert "least-loaded" in str(pyt_e.value), "Expect helpful list of options"
+
+
+def test_least_loaded_order():
+    ready = {
+        b"busy": _mdata({"unused": 1}, total_tasks=3),
+        b"idle": _mdata({"unused": 4}),
+        b"half": _mdata({"unused": 2}, total_tasks=2),
+    }
+    order = LeastLoadedPolicy().order_managers(ready, ready, {})
+    assert order == [b"idle", b"half", b"busy"]
+
+
+def test_round_robin_rotates():
+    managers = (b"a", b"b", b"c")
+    ready = {m: _mdata({"unused": 1}, reg_time=i) for i, m in enumerate(managers)}
+    policy = RoundRobinPolicy()
+    firsts = [policy.order_managers(ready, ready, {})[0] for _ in range(4)]
+    assert firsts == [b"a", b"b", b"c", b"a"]
+
+
+def test_round_robin_survives_manager_loss():
+    ready = {m: _mdata({"unused": 1}, reg_time=i) for i, m in enumerate((b"a", b"b"))}
+    policy = RoundRobinPolicy()
+    assert policy.order_managers(ready, ready, {}) == [b"a", b"b"]
+    del ready[b"a"]
+    assert policy.order_managers(ready, ready, {}) == [b"b"]
+
+
+def test_container_affinity_warm_first():
+    pending = {"ctr_a": queue.Queue(), "ctr_b": queue.Queue()}
+    pending["ctr_a"].put({"task_id": "1"})
+    ready = {
+        b"switch": _mdata({"ctr_b": 2}),
+        b"warm": _mdata({"ctr_a": 1}),
+        b"unused": _mdata({"unused": 2}),
+    }
+    order = ContainerAffinityPolicy().order_managers(ready, ready, pending)
+    assert order == [b"warm", b"unused", b"switch"]
+
+
+def test_container_affinity_penalizes_thrashing_managers():
+    policy = ContainerAffinityPolicy(switch_decay=0.5)
+    ready = {b"thrash": _mdata({"ctr_b": 1}), b"calm": _mdata({"ctr_b": 1})}
+    pending = {"ctr_a": queue.Queue()}
+    pending["ctr_a"].put({"task_id": "1"})
+
+    for count in (0, 5, 10):
+        policy.record_container_switches(b"thrash", count)
+        policy.record_container_switches(b"calm", 0)
+
+    assert policy.order_managers(ready, ready, pending) == [b"calm", b"thrash"]
+    thrash_cost = policy.placement_cost(b"thrash", ready[b"thrash"], ["ctr_a"])
+    assert thrash_cost > policy.switch_cost
+
+    policy.forget_manager(b"thrash")
+    thrash_cost = policy.placement_cost(b"thrash", ready[b"thrash"], ["ctr_a"])
+    assert thrash_cost == policy.switch_cost
+
+
+@pytest.mark.parametrize("decay", (-0.1, 1.1))
+def test_container_affinity_validates_decay(decay):
+    with pytest.raises(ValueError):
+        ContainerAffinityPolicy(switch_decay=decay)
+
+
+def test_fair_share_queue_round_robins():
+    q = FairShareQueue(key=lambda item: item[0])
+    for item in ["a1", "a2", "a3", "a4", "b1", "c1", "b2"]:
+        q.put(item)
+
+    assert q.qsize() == 7
+    assert q.share_sizes() == {"a": 4, "b": 2, "c": 1}
+    got = [q.get(block=False) for _ in range(7)]
+    assert got == ["a1", "b1", "c1", "a2", "b2", "a3", "a4"]
+    assert q.empty()
+    with pytest.raises(queue.Empty):
+        q.get(block=False)
+
+
+def test_fair_share_queue_weights():
+    q = FairShareQueue(key=lambda item: item[0], weights={"a": 2})
+    for item in ["a1", "a2", "a3", "b1", "b2"]:
+        q.put(item)
+
+    got = [q.get(block=False) for _ in range(5)]
+    assert got == ["a1", "a2", "b1", "a3", "b2"]
+
+
+def _fn_a():
+    return 1
+
+
+def _fn_b():
+    return 2
+
+
+def test_function_share_key():
+    s = ComputeSerializer()
+    fn_a, fn_b = s.serialize(_fn_a), s.serialize(_fn_b)
+    args = s.serialize(())
+    kwargs = s.serialize({})
+
+    def _task(fn, task_id):
+        buf = s.pack_buffers([fn, args, kwargs])
+        return {"raw_buffer": Task(task_id, "RAW", buf).pack()}
+
+    assert function_share_key(_task(fn_a, "1")) == function_share_key(_task(fn_a, "2"))
+    assert function_share_key(_task(fn_a, "1")) != function_share_key(_task(fn_b, "1"))
+    assert function_share_key({"raw_buffer": b"garbage"}) is None
+    assert function_share_key({}) is None
+
+
+def test_naive_dispatch_uses_manager_order():
+    pending = {"RAW": queue.Queue()}
+    pending["RAW"].put({"task_id": "1"})
+    ready = {
+        m: {**_mdata({"RAW": 1, "unused": 0}), "worker_type": "RAW"}
+        for m in (b"a", b"b", b"c")
+    }
+
+    def order(managers, *_args):
+        return sorted(managers, reverse=True)
+
+    task_dispatch, count = naive_interchange_task_dispatch(
+        set(ready), pending, ready, manager_order=order
+    )
+    assert count == 1
+    assert list(task_dispatch) == [b"c"]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from globus_compute_endpoint.endpoint.rabbit_mq import TaskQueueSubscriber
+from pika.spec import Basic, BasicProperties
+
+
+@pytest.fixture
+def tqs(randomstring):
+    q_info = {"queue": randomstring(), "exchange": randomstring()}
+    sub = TaskQueueSubscriber(
+        queue_info=q_info,
+        external_queue=mock.Mock(),
+        quiesce_event=mock.Mock(),
+        endpoint_id=randomstring(),
+    )
+    sub._channel = mock.MagicMock()
+    yield sub
+
+
+def _deliver(sub: TaskQueueSubscriber, tag: int, body: bytes = b"some task"):
+    sub.on_message(
+        sub._channel, Basic.Deliver(delivery_tag=tag), BasicProperties(), body
+    )
+
+
+def test_acks_in_bulk(tqs):
+    for tag in range(1, 6):
+        _deliver(tqs, tag, b"task %d" % tag)
+
+    put_bodies = [a[0] for a, _k in tqs.external_queue.put.call_args_list]
+    assert put_bodies == [b"task %d" % tag for tag in range(1, 6)]
+    assert not tqs._channel.basic_ack.called, "Acknowledged after the burst"
+    add_callback = tqs._channel.connection.ioloop.add_callback
+    assert add_callback.call_count == 1
+
+    ack_received = add_callback.call_args[0][0]
+    ack_received()
+    tqs._channel.basic_ack.assert_called_once_with(5, multiple=True)
+
+    _deliver(tqs, 6)
+    assert add_callback.call_count == 2, "Next message schedules the next ack"
+
+
+def test_nacks_if_put_fails(tqs):
+    tqs.external_queue.put.side_effect = ValueError("Queue is closed")
+    _deliver(tqs, 1)
+
+    tqs._channel.basic_nack.assert_called_once_with(1, requeue=True)
+    assert not tqs._channel.connection.ioloop.add_callback.called
+
+
+def test_channel_close_forgets_unacked(tqs):
+    _deliver(tqs, 1)
+    tqs._on_channel_closed(tqs._channel, Exception("some reason"))
+
+    tqs._channel.connection.ioloop.add_callback.call_args[0][0]()
+    assert not tqs._channel.basic_ack.called, "Stale tag not acked"
+
+
+@pytest.mark.parametrize("prefetch_count", [0, 64])
+@pytest.mark.parametrize("exclusive", [True, False])
+def test_prefetch_and_exclusive(tqs, prefetch_count, exclusive):
+    tqs.prefetch_count = prefetch_count
+    tqs.exclusive = exclusive
+
+    tqs._on_queue_declareok(mock.Mock())
+
+    if prefetch_count:
+        _a, kwargs = tqs._channel.basic_qos.call_args
+        assert kwargs["prefetch_count"] == prefetch_count
+        assert not tqs._channel.basic_consume.called, "Consume once qos is set"
+        kwargs["callback"](mock.Mock())
+    else:
+        assert not tqs._channel.basic_qos.called
+
+    _a, kwargs = tqs._channel.basic_consume.call_args
+    assert kwargs["exclusive"] is exclusive
+    assert kwargs["queue"] == tqs.queue_info["queue"]
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from globus_compute_common.messagepack.message_types import TaskTransition
+from globus_compute_common.tasks import ActorName, TaskState
+from globus_compute_endpoint.executors.high_throughput.messages import EPStatusReport
+from globus_compute_endpoint.executors.high_throughput.task_status_deltas import (
+    TaskStatusDeltas,
+)
+
+_EP_ID = "00000000-0000-0000-0000-000000000000"
+
+
+@pytest.fixture
+def deltas():
+    tsd = TaskStatusDeltas()
+    tsd.append("a", TaskState.WAITING_FOR_NODES, ActorName.INTERCHANGE, 1)
+    tsd.append("b", TaskState.WAITING_FOR_NODES, ActorName.INTERCHANGE, 2)
+    tsd.append("a", TaskState.WAITING_FOR_LAUNCH, ActorName.INTERCHANGE, 3)
+    yield tsd
+
+
+def test_mapping_of_transitions(deltas):
+    assert len(deltas) == 2
+    assert deltas.num_rows == 3
+    assert list(deltas) == ["a", "b"]
+    assert "a" in deltas and "c" not in deltas
+
+    assert deltas["a"] == [
+        TaskTransition(
+            timestamp=1,
+            state=TaskState.WAITING_FOR_NODES,
+            actor=ActorName.INTERCHANGE,
+        ),
+        TaskTransition(
+            timestamp=3,
+            state=TaskState.WAITING_FOR_LAUNCH,
+            actor=ActorName.INTERCHANGE,
+        ),
+    ]
+
+
+def test_extend_from_manager_report(deltas):
+    tt = TaskTransition(timestamp=4, state=TaskState.RUNNING, actor=ActorName.MANAGER)
+    deltas.extend("b", [tt])
+    assert deltas["b"][-1] == tt
+
+
+def test_pop(deltas):
+    popped = deltas.pop("a")
+    assert [tt.timestamp for tt in popped] == [1, 3]
+    assert "a" not in deltas
+    assert deltas.num_rows == 1
+    assert deltas.pop("a") == [], "Unknown task has no transitions"
+    assert list(deltas.to_dicts()) == [
+        {"b": [{"timestamp": 2, "state": "waiting-for-nodes", "actor": "interchange"}]}
+    ]
+
+
+@pytest.mark.parametrize("pop_from_other", (False, True))
+def test_merge_preserves_order(deltas, pop_from_other):
+    other = TaskStatusDeltas()
+    other.append("c", TaskState.WAITING_FOR_NODES, ActorName.INTERCHANGE, 4)
+    other.append("a", TaskState.RUNNING, ActorName.MANAGER, 5)
+    if pop_from_other:
+        other.append("d", TaskState.RUNNING, ActorName.MANAGER, 6)
+        other.pop("d")
+
+    deltas.merge(other)
+
+    assert list(deltas) == ["a", "b", "c"]
+    assert [tt.timestamp for tt in deltas["a"]] == [1, 3, 5]
+    assert deltas["c"][0].state == TaskState.WAITING_FOR_NODES
+    assert deltas.num_rows == 5
+
+
+def test_clear_is_reusable(deltas):
+    deltas.pop("b")
+    deltas.clear()
+    assert not deltas
+    assert deltas.num_rows == 0
+
+    deltas.append("z", TaskState.RUNNING, ActorName.MANAGER, 7)
+    assert [tt.timestamp for tt in deltas["z"]] == [7]
+
+
+@pytest.mark.parametrize("chunk_size", (None, 1, 2, 5))
+def test_to_dicts_chunks_by_task(chunk_size):
+    tsd = TaskStatusDeltas()
+    for i in range(5):
+        tsd.append(str(i), TaskState.WAITING_FOR_NODES, ActorName.INTERCHANGE, i)
+        tsd.append(str(i), TaskState.WAITING_FOR_LAUNCH, ActorName.INTERCHANGE, i)
+
+    chunks = list(tsd.to_dicts(chunk_size))
+
+    assert all(len(c) <= (chunk_size or 5) for c in chunks)
+    merged = {tid: tts for c in chunks for tid, tts in c.items()}
+    assert merged == {
+        tid: [tt.to_dict() for tt in tts] for tid, tts in ((k, tsd[k]) for k in tsd)
+    }
+
+
+def test_to_dicts_empty():
+    assert list(TaskStatusDeltas().to_dicts(4_096)) == []
+
+
+def test_ep_status_report_packs_dict_form(deltas):
+    (chunk,) = deltas.to_dicts()
+    from_dicts = EPStatusReport(_EP_ID, {}, chunk).pack()
+    from_objects = EPStatusReport(_EP_ID, {}, {k: deltas[k] for k in deltas}).pack()
+    assert from_dicts == from_objects
+
+    _, statuses = json.loads(from_dicts[17:].decode())
+    assert statuses["a"][1]["state"] == "waiting-for-launch"
+
+    unpacked = EPStatusReport.unpack(from_dicts[1:])
+    assert unpacked.task_statuses["a"] == deltas["a"]
@@ -1,10 +1,10 @@
 import os
-import pickle
 import uuid
 from unittest import mock
 
 import pytest
 from globus_compute_common import messagepack
+from globus_compute_endpoint.executors.high_throughput import framing
 from globus_compute_endpoint.executors.high_throughput.messages import Task
 from globus_compute_endpoint.executors.high_throughput.worker import Worker
 from parsl.app.errors import AppTimeout
@@ -47,10 +47,8 @@ def test_worker():
 def test_register_and_kill(test_worker):
     # send a kill message on the mock socket
     task = Task(task_id="KILL", container_id="RAW", task_buffer="KILL")
-    test_worker.task_socket.recv_multipart.return_value = (
-        pickle.dumps("KILL"),
-        pickle.dumps("abc"),
-        task.pack(),
+    test_worker.task_socket.recv_multipart.return_value = framing.pack_worker_task(
+        "KILL", "abc", task.pack()
     )
 
     # calling worker.start begins a while loop, where first a REGISTER
@@ -170,3 +168,26 @@ def test_app_timeout(test_worker):
     with mock.patch.dict(os.environ, {"GC_TASK_TIMEOUT": "0.1"}):
         with pytest.raises(AppTimeout):
             test_worker.call_user_function(task_message)
+
+
+def double(x):
+    return x * 2
+
+
+def test_execute_caches_function(test_worker):
+    results = []
+    for arg in (1, 2):
+        task_id = uuid.uuid1()
+        task_body = ez_pack_function(test_worker.serializer, double, (arg,), {})
+        task_message = messagepack.pack(
+            messagepack.message_types.Task(
+                task_id=task_id, container_id=uuid.uuid1(), task_buffer=task_body
+            )
+        )
+        result = test_worker.execute_task(str(task_id), task_message)
+        results.append(
+            (test_worker.deserialize(result["data"]), test_worker.function_cache_hit)
+        )
+
+    assert results == [(2, False), (4, True)]
+    assert test_worker.function_cache.stats()["hits"] == 1
@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+from globus_compute_endpoint.executors.high_throughput import worker_forkserver
+from globus_compute_endpoint.executors.high_throughput.worker_forkserver import (
+    ForkedWorker,
+    WorkerForkServer,
+)
+
+_MOD = "globus_compute_endpoint.executors.high_throughput.worker_forkserver"
+
+pytestmark = pytest.mark.skipif(
+    not WorkerForkServer.is_available(), reason="forkserver is not available"
+)
+
+
+def _exit_with(code):
+    sys.exit(code)
+
+
+def _block():
+    import time
+
+    time.sleep(60)
+
+
+@pytest.fixture
+def fork_ctx():
+    # Plain forks keep the tests quick; the worker handle is indifferent to how the
+    # process was started
+    import multiprocessing
+
+    return multiprocessing.get_context("fork")
+
+
+def test_forked_worker_reports_exit(fork_ctx):
+    proc = fork_ctx.Process(target=_exit_with, args=(3,))
+    proc.start()
+    worker = ForkedWorker(proc)
+
+    assert worker.pid == proc.pid
+    assert worker.wait(timeout=10) == 3
+    assert worker.poll() == 3
+    assert worker.returncode == 3
+
+
+def test_forked_worker_wait_timeout_and_terminate(fork_ctx):
+    proc = fork_ctx.Process(target=_block)
+    proc.start()
+    worker = ForkedWorker(proc)
+
+    assert worker.poll() is None
+    with pytest.raises(subprocess.TimeoutExpired):
+        worker.wait(timeout=0.01)
+
+    worker.terminate()
+    assert worker.wait(timeout=10) == -15
+
+
+def test_launch_forks_run_worker():
+    fs = WorkerForkServer()
+    with mock.patch.object(fs, "_ctx") as mock_ctx:
+        worker = fs.launch(
+            "7", "127.0.0.1", 50001, "RAW", "/some/dir", environment={"A": "1"}
+        )
+
+    assert isinstance(worker, ForkedWorker)
+    mock_ctx.set_forkserver_preload.assert_called_once_with(
+        [worker_forkserver.WORKER_MODULE]
+    )
+    _a, kwargs = mock_ctx.Process.call_args
+    assert kwargs["target"] is worker_forkserver.run_worker
+    assert kwargs["args"] == ("7", "127.0.0.1", 50001)
+    assert kwargs["kwargs"]["environment"] == {"A": "1"}
+    assert kwargs["kwargs"]["logdir"] == "/some/dir"
+    mock_ctx.Process.return_value.start.assert_called_once()
+
+
+def test_start_is_idempotent():
+    fs = WorkerForkServer(preload=[])
+    with mock.patch(f"{_MOD}.forkserver") as mock_fs:
+        fs.start()
+        fs.start()
+    mock_fs.ensure_running.assert_called_once()
+
+
+def test_run_worker_applies_environment(tmp_path):
+    from globus_compute_endpoint.executors.high_throughput import worker
+
+    env_key = "GC_TEST_FORKED_WORKER_ENV"
+    with mock.patch.object(worker, "Worker") as mock_worker, mock.patch.object(
+        worker, "setup_logging"
+    ), mock.patch.dict(os.environ):
+        worker.run_worker(
+            "0", "127.0.0.1", 50001, logdir=str(tmp_path), environment={env_key: "0"}
+        )
+        assert os.environ[env_key] == "0"
+
+    mock_worker.assert_called_once_with("0", "127.0.0.1", 50001, worker_type="RAW")
+    mock_worker.return_value.start.assert_called_once()
+    assert (tmp_path / "funcx_worker_0.stdout").exists()
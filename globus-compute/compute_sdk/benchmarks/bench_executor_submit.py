@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""Benchmark Executor task submission throughput against a local fake web service
+
+The fake service answers ``POST /submit`` after ``--latency-ms`` milliseconds
+(standing in for the network and service time), so the numbers show how much
+of that wait the Executor's pipelined submission hides as the number of
+in-flight batches grows from 1 (the previous, one-request-at-a-time behavior)
+to 8.  Results are not streamed back; only submission is measured.
+
+    python benchmarks/bench_executor_submit.py --tasks 20000 --latency-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import http.server
+import json
+import threading
+import time
+import uuid
+from unittest import mock
+
+from globus_compute_sdk import Executor
+from globus_compute_sdk.sdk.batch import Batch
+from globus_compute_sdk.sdk.web_client import WebClient
+from globus_sdk.authorizers import NullAuthorizer
+
+
+def make_fake_service(latency_s: float) -> http.server.ThreadingHTTPServer:
+    class FakeComputeService(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(latency_s)
+            results = [
+                {"task_uuid": str(uuid.uuid4()), "http_status_code": 200}
+                for _ in body["tasks"]
+            ]
+            data = json.dumps({"results": results}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FakeComputeService)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class BenchClient:
+    """Just enough of the Client for the Executor to submit tasks"""
+
+    def __init__(self, web_client: WebClient):
+        self.web_client = web_client
+        self.session_task_group_id = str(uuid.uuid4())
+
+    def create_batch(self, task_group_id=None, create_websocket_queue=False):
+        return Batch(task_group_id, create_websocket_queue)
+
+    def batch_run(self, batch: Batch) -> list[str]:
+        r = self.web_client.submit(batch.prepare())
+        return [result["task_uuid"] for result in r["results"]]
+
+
+def noop(x):
+    return x
+
+
+def run(client: BenchClient, tasks: int, batch_size: int, inflight: int) -> float:
+    gce = Executor(
+        endpoint_id=str(uuid.uuid4()),
+        funcx_client=client,
+        batch_size=batch_size,
+        max_inflight_batches=inflight,
+    )
+    gce.register_function(noop, function_id=str(uuid.uuid4()))
+    start = time.perf_counter()
+    futs = [gce.submit(noop, i) for i in range(tasks)]
+    gce.shutdown(wait=True)  # returns once every batch is submitted
+    elapsed = time.perf_counter() - start
+    assert all(f.task_id for f in futs)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    server = make_fake_service(args.latency_ms / 1e3)
+    web_client = WebClient(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        authorizer=NullAuthorizer(),
+    )
+    client = BenchClient(web_client)
+
+    print(
+        f"{args.tasks} tasks in batches of {args.batch_size};"
+        f" {args.latency_ms} ms service latency\n"
+    )
+    print(f"{'in flight':>10} {'tasks/s':>10} {'speedup':>8}")
+    baseline = None
+    # the result watcher is not under test
+    with mock.patch("globus_compute_sdk.sdk.executor._ResultWatcher"):
+        for inflight in (1, 2, 4, 8):
+            elapsed = run(client, args.tasks, args.batch_size, inflight)
+            baseline = baseline or elapsed
+            print(
+                f"{inflight:>10} {args.tasks / elapsed:10.0f}"
+                f" {baseline / elapsed:7.1f}x"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""Benchmark Executor result consumption against a local AMQP stand-in
+
+The stand-in broker is a channel on pika's own ``IOLoop`` that delivers result
+messages while fewer than the prefetch count are unacknowledged, and learns of
+acknowledgements ``--rtt-ms`` / 2 milliseconds after they are sent.  So the
+numbers show how the acknowledgement cadence bounds throughput, rather than
+measure a real RabbitMQ deployment.  "poll" acknowledges only every
+``poll_period_s`` (the previous behavior); the others acknowledge every N
+results or every 50 ms, whichever comes first.
+
+    python benchmarks/bench_result_watcher.py --results 50000 --prefetch 2048
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import time
+import uuid
+from types import SimpleNamespace
+
+import pika.spec
+from globus_compute_common import messagepack
+from globus_compute_common.messagepack.message_types import Result
+from globus_compute_sdk.sdk.asynchronous.compute_future import ComputeFuture
+from globus_compute_sdk.sdk.executor import _ResultWatcher
+from globus_compute_sdk.serialize import ComputeSerializer
+from pika.adapters.select_connection import IOLoop
+
+
+class SimulatedChannel:
+    def __init__(self, connection: SimulatedConnection, messages: list[bytes]):
+        self.connection = connection
+        self.channel_number = 1
+        self.is_open, self.is_closed = True, False
+        self._messages = collections.deque(messages)
+        self._prefetch = 0
+        self._delivered = 0
+        self._acked = 0
+        self._on_message = None
+
+    def add_on_close_callback(self, _cb):
+        pass
+
+    def add_on_cancel_callback(self, _cb):
+        pass
+
+    def basic_qos(self, prefetch_count=0):
+        self._prefetch = prefetch_count
+
+    def basic_consume(self, queue, on_message_callback):
+        self._on_message = on_message_callback
+        self.connection.ioloop.add_callback(self._deliver)
+        return "consumer-tag"
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        def _on_ack():
+            self._acked = max(self._acked, delivery_tag)
+            self._deliver()
+
+        self.connection.ioloop.call_later(self.connection.rtt_s / 2, _on_ack)
+
+    def _deliver(self):
+        while self._messages and not (
+            self._prefetch and self._delivered - self._acked >= self._prefetch
+        ):
+            self._delivered += 1
+            deliver = pika.spec.Basic.Deliver(delivery_tag=self._delivered)
+            props = pika.spec.BasicProperties()
+            self._on_message(self, deliver, props, self._messages.popleft())
+
+    def close(self):
+        self.is_open, self.is_closed = False, True
+
+
+class SimulatedConnection:
+    def __init__(self, rtt_s: float, messages: list[bytes], on_open_callback):
+        self.rtt_s = rtt_s
+        self.messages = messages
+        self.ioloop = IOLoop()
+        self.is_open, self.is_closed = True, False
+        self.params = "simulated"
+        self.ioloop.add_callback(lambda: on_open_callback(self))
+
+    def channel(self, on_open_callback):
+        chan = SimulatedChannel(self, self.messages)
+        self.ioloop.add_callback(lambda: on_open_callback(chan))
+
+    def close(self):
+        self.is_open, self.is_closed = False, True
+
+
+class SimulatedResultWatcher(_ResultWatcher):
+    def __init__(self, rtt_s: float, messages: list[bytes], **kwargs):
+        executor = SimpleNamespace(
+            funcx_client=SimpleNamespace(fx_serializer=ComputeSerializer()),
+            task_group_id="bench",
+        )
+        super().__init__(executor, **kwargs)
+        self.rtt_s = rtt_s
+        self.messages = messages
+
+    def _connect(self):
+        return SimulatedConnection(self.rtt_s, self.messages, self._on_connection_open)
+
+
+def run(
+    num_results: int,
+    rtt_s: float,
+    prefetch: int,
+    ack_batch_size: int,
+    ack_interval_s: float,
+) -> float:
+    serialized = ComputeSerializer().serialize("some result")
+    futures = [ComputeFuture(str(uuid.uuid4())) for _ in range(num_results)]
+    messages = [
+        messagepack.pack(Result(task_id=f.task_id, data=serialized)) for f in futures
+    ]
+    watcher = SimulatedResultWatcher(
+        rtt_s, messages, prefetch_count=prefetch, ack_interval_s=ack_interval_s
+    )
+    watcher.ack_batch_size = ack_batch_size  # allow "never", for the baseline
+    watcher.watch_for_task_results(futures)
+
+    start = time.perf_counter()
+    watcher.start()
+    for f in futures:
+        f.result()
+    elapsed = time.perf_counter() - start
+    watcher.shutdown()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--results", type=int, default=50_000)
+    parser.add_argument("--prefetch", type=int, default=2048)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    rtt_s = args.rtt_ms / 1e3
+    print(
+        f"{args.results} results; prefetch {args.prefetch};"
+        f" simulated round trip of {args.rtt_ms} ms\n"
+    )
+    print(f"{'acks':>12} {'results/s':>10} {'speedup':>8}")
+    modes = [("poll", 2**31, 0.5)]
+    modes.extend((f"every {n}", n, 0.05) for n in (1024, 256, 32))
+    baseline = None
+    for name, ack_batch_size, ack_interval_s in modes:
+        elapsed = run(
+            args.results, rtt_s, args.prefetch, ack_batch_size, ack_interval_s
+        )
+        baseline = baseline or elapsed
+        print(f"{name:>12} {args.results / elapsed:10.0f} {baseline / elapsed:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import threading
 import typing as t
 from concurrent.futures import Future
 
@@ -17,3 +18,41 @@ class ComputeFuture(Future):
     def __init__(self, task_id: t.Optional[str] = None):
         super().__init__()
         self.task_id = task_id
+        self._serialized: t.Optional[t.Tuple[t.Any, t.Callable]] = None
+        self._serialized_lock = threading.Lock()
+
+    def set_serialized_result(
+        self, serialized: t.Any, deserialize: t.Callable[[t.Any], t.Any]
+    ) -> None:
+        """
+        Complete the future with a result that is not yet deserialized.
+
+        The future is done immediately, but ``deserialize(serialized)`` is only
+        called on the first call to ``.result()`` or ``.exception()``; if it
+        raises, that exception becomes the future's exception.
+        """
+        self._serialized = (serialized, deserialize)
+        self.set_result(None)
+
+    def _deserialize_result(self) -> None:
+        # Hold the lock throughout, so concurrent callers wait for the one
+        # deserialization rather than observe the placeholder result
+        with self._serialized_lock:
+            if self._serialized is None:
+                return
+            serialized, deserialize = self._serialized
+            try:
+                self._result = deserialize(serialized)
+            except Exception as exc:
+                self._exception = exc
+            self._serialized = None
+
+    def result(self, timeout=None):
+        super().exception(timeout)  # wait; raises if cancelled or timed out
+        self._deserialize_result()
+        return super().result(timeout)
+
+    def exception(self, timeout=None):
+        super().exception(timeout)
+        self._deserialize_result()
+        return super().exception(timeout)
@@ -27,7 +27,7 @@ class Batch:
         endpoint_id: str,
         args: tuple[t.Any, ...] | None = None,
         kwargs: dict[str, t.Any] | None = None,
-    ) -> None:
+    ) -> int:
         """Add a function invocation to a batch submission
 
         Parameters
@@ -43,7 +43,7 @@ class Batch:
 
         Returns
         -------
-        None
+        The size of the serialized arguments (characters), int
         """
         if args is None:
             args = ()
@@ -54,6 +54,7 @@ class Batch:
         payload = self.fx_serializer.pack_buffers([ser_args, ser_kwargs])
 
         self.tasks.append((function_id, endpoint_id, payload))
+        return len(payload)
 
     def prepare(self) -> dict[str, str | list[tuple[str, str, str]]]:
         """Prepare the payloads to be post to web service in a batch
@@ -9,7 +9,6 @@ import uuid
 import warnings
 
 from globus_compute_sdk.errors import (
-    SerializationError,
     TaskExecutionFailed,
     TaskPending,
 )
@@ -26,6 +25,7 @@ from globus_compute_sdk.version import __version__, compare_versions
 
 from .batch import Batch
 from .login_manager import LoginManager, LoginManagerProtocol, requires_login
+from .task_status_cache import TaskStatusCache
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +63,9 @@ class Client:
         fx_authorizer: t.Any = None,
         *,
         login_manager: LoginManagerProtocol | None = None,
+        task_cache_max_entries: int = 65536,
+        task_cache_max_bytes: int = 256 * 2**20,
+        task_cache_ttl_s: float | None = None,
         **kwargs,
     ):
         """
@@ -121,6 +124,22 @@ class Client:
             session or to reestablish Executor futures.
             Default: None (will be auto generated)
 
+        task_cache_max_entries: int
+            Maximum number of task statuses remembered by ``get_task``,
+            ``get_result``, and ``get_batch_result``; the least recently used
+            are forgotten (and fetched again if requested).
+            Default: 65536
+
+        task_cache_max_bytes: int
+            Maximum estimated memory, in bytes, of remembered task statuses.
+            Results are measured by their serialized size; large results are
+            kept serialized and deserialized when requested.
+            Default: 256 MiB
+
+        task_cache_ttl_s: float | None
+            Forget task statuses this many seconds after they were fetched.
+            Default: None (remember until evicted)
+
         Keyword arguments are the same as for BaseClient.
 
         """
@@ -128,7 +147,6 @@ class Client:
         if funcx_service_address is None:
             funcx_service_address = get_web_service_url(environment)
 
-        self._task_status_table: t.Dict[str, t.Dict] = {}
         self.funcx_home = os.path.expanduser(funcx_home)
         self.session_task_group_id = (
             task_group_id and str(task_group_id) or str(uuid.uuid4())
@@ -163,6 +181,12 @@ class Client:
             base_url=funcx_service_address
         )
         self.fx_serializer = ComputeSerializer()
+        self._task_status_table = TaskStatusCache(
+            max_entries=task_cache_max_entries,
+            max_bytes=task_cache_max_bytes,
+            ttl_s=task_cache_ttl_s,
+            deserialize=self.fx_serializer.deserialize,
+        )
 
         self.funcx_service_address = funcx_service_address
 
@@ -214,6 +238,15 @@ class Client:
                 endpoint_version, min_ep_version, package_name="globus-compute-endpoint"
             )
 
+    @property
+    def task_cache_stats(self) -> t.Dict[str, t.Any]:
+        """Size and hit-rate counters of the remembered task statuses
+
+        Useful for choosing ``task_cache_max_entries`` and ``task_cache_max_bytes``
+        for long-lived clients that poll many tasks.
+        """
+        return self._task_status_table.stats
+
     def logout(self):
         """Remove credentials from your local system"""
         self.login_manager.logout()
@@ -245,12 +278,9 @@ class Client:
                 raise ValueError("non-pending result is missing result data")
             completion_t = r_dict["completion_t"]
             if "result" in r_dict:
-                try:
-                    r_obj = self.fx_serializer.deserialize(r_dict["result"])
-                except Exception:
-                    raise SerializationError("Result Object Deserialization")
-                else:
-                    status.update({"result": r_obj, "completion_t": completion_t})
+                return self._task_status_table.set_result(
+                    task_id, r_dict["result"], completion_t, r_status
+                )
             elif "exception" in r_dict:
                 raise TaskExecutionFailed(r_dict["exception"], completion_t)
             else:
@@ -316,11 +346,15 @@ class Client:
             task_id_list, list
         ), "get_batch_result expects a list of task ids"
 
-        pending_task_ids = [
-            task_id
-            for task_id in task_id_list
-            if self._task_status_table.get(task_id, {}).get("pending", True) is True
-        ]
+        # Hold on to the known statuses: fetching the pending ones may evict them
+        known = {}
+        pending_task_ids = []
+        for task_id in task_id_list:
+            task = self._task_status_table.get(task_id, {})
+            if task.get("pending", True) is True:
+                pending_task_ids.append(task_id)
+            else:
+                known[task_id] = task
 
         results = {}
 
@@ -343,7 +377,7 @@ class Client:
                         "Failure while unpacking results fom get_batch_result"
                     )
             else:
-                results[task_id] = self._task_status_table[task_id]
+                results[task_id] = known[task_id]
 
         return results
 
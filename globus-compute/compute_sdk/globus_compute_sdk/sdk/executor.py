@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import collections
 import concurrent.futures
+import itertools
 import logging
 import os
 import queue
@@ -20,11 +22,13 @@ else:
         pass
 
 
+import globus_sdk
 import pika
 from globus_compute_common import messagepack
 from globus_compute_common.messagepack.message_types import Result
 from globus_compute_sdk.errors import TaskExecutionFailed
 from globus_compute_sdk.sdk.asynchronous.compute_future import ComputeFuture
+from globus_compute_sdk.sdk.batch import Batch
 from globus_compute_sdk.sdk.client import Client
 from globus_compute_sdk.sdk.utils import chunk_by
 
@@ -77,6 +81,14 @@ class TaskSubmissionInfo:
         )
 
 
+class SubmittedBatch(t.NamedTuple):
+    """Statistics of one batch submitted upstream by an Executor"""
+
+    num_tasks: int
+    num_bytes: int  # serialized task arguments
+    latency_s: float  # of the (successful) submit request
+
+
 class AtomicController:
     """This is used to synchronize between the Executor which starts
     WebSocketPollingTasks and the WebSocketPollingTask which closes itself when there
@@ -131,6 +143,15 @@ class Executor(concurrent.futures.Executor):
         task_group_id: str | None = None,
         label: str = "",
         batch_size: int = 128,
+        batch_max_bytes: int = 4 * 1024 * 1024,
+        batch_linger_s: float = 0.05,
+        max_inflight_batches: int = 4,
+        max_pending_tasks: int = 65536,
+        submit_retry_limit: int = 3,
+        result_deserializer_workers: int = 0,
+        amqp_prefetch_count: int = 2048,
+        amqp_ack_batch_size: int = 256,
+        amqp_ack_interval_s: float = 0.05,
         **kwargs,
     ):
         """
@@ -145,6 +166,34 @@ class Executor(concurrent.futures.Executor):
             logging and advanced needs with multiple executors.
         :param batch_size: the maximum number of tasks to coalesce before
             sending upstream [min: 1, default: 128]
+        :param batch_max_bytes: the target size of a batch's serialized task
+            arguments; tasks are coalesced until the next would exceed it.  (A
+            single larger task is sent by itself.)  Lowered automatically if the
+            web service rejects a batch as too large.  [default: 4 MiB]
+        :param batch_linger_s: the maximum time to wait for more tasks before
+            sending a batch that is not yet full.  The Executor lingers up to half
+            of the recently observed submit latency, within this bound, so that
+            a trickle of tasks is coalesced without delaying a lone task by more
+            than a request would take anyway.  [default: 0.05]
+        :param max_inflight_batches: the maximum number of batches to serialize
+            and submit concurrently [min: 1, default: 4]
+        :param max_pending_tasks: the maximum number of tasks waiting to be
+            batched; once reached, ``.submit()`` blocks until the submission
+            pipeline catches up [min: 1, default: 65536]
+        :param submit_retry_limit: how many times to retry submitting a batch
+            the web service did not accept (e.g., rate limited or unreachable),
+            with exponential backoff [default: 3]
+        :param result_deserializer_workers: by default, a task's result is
+            deserialized on the first call to its future's ``.result()`` (or
+            ``.exception()``).  If positive, results are instead deserialized as
+            they arrive, by a pool of this many threads; futures then complete
+            (and invoke their done callbacks) once deserialized.  [default: 0]
+        :param amqp_prefetch_count: how many results the AMQP service may send
+            before the Executor acknowledges any; 0 for no limit  [default: 2048]
+        :param amqp_ack_batch_size: acknowledge received results in bulk once
+            this many are outstanding ...  [default: 256]
+        :param amqp_ack_interval_s: ... or this many seconds after the first
+            outstanding result arrived, whichever comes first  [default: 0.05]
         :param batch_interval: [DEPRECATED; unused] number of seconds to coalesce tasks
             before submitting upstream
         :param batch_enabled: [DEPRECATED; unused] whether to batch results
@@ -168,19 +217,41 @@ class Executor(concurrent.futures.Executor):
         self.container_id = container_id
         self.label = label
         self.batch_size = max(1, batch_size)
+        self.batch_max_bytes = max(1, batch_max_bytes)
+        self.batch_linger_s = max(0.0, batch_linger_s)
+        self.max_inflight_batches = max(1, max_inflight_batches)
+        self.submit_retry_limit = max(0, submit_retry_limit)
+        self.amqp_prefetch_count = amqp_prefetch_count
+        self.amqp_ack_batch_size = amqp_ack_batch_size
+        self.amqp_ack_interval_s = amqp_ack_interval_s
 
         self.task_count_submitted = 0
         self._task_counter: int = 0
         self._task_group_id: str = task_group_id or str(uuid.uuid4())
         self._tasks_to_send: queue.Queue[
             tuple[ComputeFuture, TaskSubmissionInfo] | tuple[None, None]
-        ] = queue.Queue()
+        ] = queue.Queue(maxsize=max(1, max_pending_tasks))
+        self._submit_lock = threading.Lock()
+        self._submit_error: Exception | None = None
+
+        # recently submitted batches, and what has been learned from them
+        self.batch_history: collections.deque[SubmittedBatch] = collections.deque(
+            maxlen=1024
+        )
+        self._submit_latency_s: float | None = None  # moving average
+        self._batch_bytes_cap = self.batch_max_bytes
         self._function_registry: dict[tuple[t.Callable, str | None], str] = {}
 
         self._stopped = False
         self._stopped_in_error = False
         self._shutdown_lock = threading.RLock()
         self._result_watcher: _ResultWatcher | None = None
+        self._deserializer_pool: concurrent.futures.ThreadPoolExecutor | None = None
+        if result_deserializer_workers > 0:
+            self._deserializer_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=result_deserializer_workers,
+                thread_name_prefix="ResultDeserializer",
+            )
 
         log.debug("%s: initiated on thread: %s", self, threading.get_ident())
         self._task_submitter = threading.Thread(
@@ -220,6 +291,40 @@ class Executor(concurrent.futures.Executor):
     def task_group_id(self, task_group_id: str):
         self._task_group_id = task_group_id
 
+    @property
+    def batch_stats(self) -> dict[str, t.Any]:
+        """
+        Summary statistics of the recently submitted batches (the individual
+        records of which are in ``.batch_history``), and the current coalescing
+        policy::
+
+            >>> gce.batch_stats
+            {'batches': 12, 'tasks': 1500, 'bytes': 318000,
+             'tasks_per_batch': 125.0, 'bytes_per_batch': 26500.0,
+             'latency_s': {'mean': 0.12, 'p50': 0.11, 'p95': 0.2, 'max': 0.25},
+             'linger_s': 0.05, 'max_bytes': 4194304}
+        """
+        with self._submit_lock:
+            history = list(self.batch_history)
+        stats: dict[str, t.Any] = {
+            "batches": len(history),
+            "tasks": sum(b.num_tasks for b in history),
+            "bytes": sum(b.num_bytes for b in history),
+            "linger_s": self._linger_s(),
+            "max_bytes": min(self.batch_max_bytes, self._batch_bytes_cap),
+        }
+        if history:
+            latencies = sorted(b.latency_s for b in history)
+            stats["tasks_per_batch"] = stats["tasks"] / len(history)
+            stats["bytes_per_batch"] = stats["bytes"] / len(history)
+            stats["latency_s"] = {
+                "mean": sum(latencies) / len(latencies),
+                "p50": latencies[len(latencies) // 2],
+                "p95": latencies[int(len(latencies) * 0.95)],
+                "max": latencies[-1],
+            }
+        return stats
+
     def _fn_cache_key(self, fn: t.Callable):
         return (fn, self.container_id)
 
@@ -410,32 +515,71 @@ class Executor(concurrent.futures.Executor):
         )
 
         fut = ComputeFuture()
-        self._tasks_to_send.put((fut, task))
+        while True:
+            # Block while the submission pipeline is behind (backpressure), but
+            # not forever, should the pipeline have stopped
+            try:
+                self._tasks_to_send.put((fut, task), timeout=1)
+                break
+            except queue.Full:
+                if not self._task_submitter.is_alive():
+                    err_fmt = "%s is shutdown; no new functions may be executed"
+                    raise RuntimeError(err_fmt % repr(self))
         return fut
 
     def map(self, fn: t.Callable, *iterables, timeout=None, chunksize=1) -> t.Iterator:
         """
-        Globus Compute does not currently implement the `.map()`_ method of the `Executor
-        interface`_.  In a naive implementation, this method would merely be
-        syntactic sugar for bulk use of the ``.submit()`` method.  For example::
+        Execute ``fn(*args)`` on the Executor's endpoint for each tuple of
+        arguments drawn from ``iterables``, as per the `.map()`_ method of the
+        `Executor interface`_.
+
+        Example use::
+
+            >>> def add(a: int, b: int) -> int: return a + b
+            >>> gce = Executor(endpoint_id="some-ep-id")
+            >>> list(gce.map(add, range(4), range(4), chunksize=2))
+            [0, 2, 4, 6]
+
+        All tasks are submitted before this method returns; results are then
+        yielded lazily, in the order of the inputs, as they arrive.
 
-            def map(fxexec, fn, *fn_args_kwargs):
-                return [fxexec.submit(fn, *a, **kw) for a, kw in fn_args_kwargs]
+        With a ``chunksize`` greater than 1, each task carries up to
+        ``chunksize`` argument tuples, which a small wrapper function applies
+        ``fn`` to in turn on the endpoint.  A sweep over 1M small inputs thereby
+        costs ``1M / chunksize`` tasks rather than 1M.  Note that ``fn`` is then
+        sent with each task as an argument (serialized as data), rather than
+        registered, and that if ``fn`` raises for any input of a chunk, the
+        exception is raised in place of all of that chunk's results.
 
-        This naive implementation ignores a number of potential optimizations, so
-        we have decided to look at this at a future date if there is interest.
+        :param fn: Python function to execute on endpoint
+        :param iterables: iterables of positional arguments, as for the builtin
+            ``map()``
+        :param timeout: if set, raise ``TimeoutError`` if a result is not
+            available within ``timeout`` seconds of the call to ``.map()``
+        :param chunksize: the number of calls to ``fn`` to execute per task
+            [min: 1, default: 1]
+        :returns: an iterator of the results, in order
 
         .. _.map(): https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.Executor.map
         .. _Executor interface: https://docs.python.org/3/library/concurrent.futures.html#executor-objects
-
-        Raises
-        ------
-        NotImplementedError
-          always raised
         """  # noqa
-        raise NotImplementedError()
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+
+        if chunksize == 1:
+            return super().map(fn, *iterables, timeout=timeout)
+
+        chunk_results = super().map(
+            _map_chunk,
+            itertools.repeat(fn),
+            chunk_by(zip(*iterables), chunksize),
+            timeout=timeout,
+        )
+        return itertools.chain.from_iterable(chunk_results)
 
-    def reload_tasks(self) -> t.Iterable[ComputeFuture]:
+    def reload_tasks(
+        self, *, max_concurrency: int = 4, chunk_size: int = 1024
+    ) -> t.Iterable[ComputeFuture]:
         """
         .. _reload_tasks():
 
@@ -444,6 +588,14 @@ class Executor(concurrent.futures.Executor):
         nominally intended to "reattach" to a previously initiated session, based on
         the Task Group ID.
 
+        Task statuses are requested in chunks of ``chunk_size`` tasks, up to
+        ``max_concurrency`` requests at a time.  Results of completed tasks are
+        not deserialized until requested (e.g., via ``.result()``).  To work with
+        the futures as they arrive rather than after every chunk has been
+        fetched, see ``reload_tasks_iter()``.
+
+        :param max_concurrency: maximum number of simultaneous status requests
+        :param chunk_size: number of tasks per status request
         :returns: An iterable of futures.
         :raises ValueError: if the server response is incorrect or invalid
         :raises KeyError: the server did not return an expected response
@@ -454,13 +606,46 @@ class Executor(concurrent.futures.Executor):
         -----
         Any previous futures received from this executor will be cancelled.
         """  # noqa
+        return list(
+            self.reload_tasks_iter(
+                max_concurrency=max_concurrency, chunk_size=chunk_size
+            )
+        )
+
+    def reload_tasks_iter(
+        self, *, max_concurrency: int = 4, chunk_size: int = 1024
+    ) -> t.Iterator[ComputeFuture]:
+        """
+        Like ``reload_tasks()``, but return an iterator that yields each chunk
+        of futures as soon as its status request completes, rather than waiting
+        for the whole Task Group.  Chunks arrive in completion order, not Task
+        Group order.  Unfinished futures are watched for results as soon as
+        they are yielded.
+
+        The Task Group itself is requested (and any previous futures cancelled)
+        immediately, so errors in that request are raised by this call; errors
+        in the status requests are raised while iterating.
+
+        :param max_concurrency: maximum number of simultaneous status requests
+        :param chunk_size: number of tasks per status request
+        :returns: An iterator of futures.
+        :raises ValueError: if the server response is incorrect or invalid
+        :raises KeyError: the server did not return an expected response
+        :raises various: the usual (unhandled) request errors (e.g., no connection;
+            invalid authorization)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive ({max_concurrency})")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive ({chunk_size})")
+
         # step 1: cleanup!
         if self._result_watcher:
             self._result_watcher.shutdown(wait=False, cancel_futures=True)
             self._result_watcher = None
 
         task_group_id = self.task_group_id  # snapshot
-        # step 2: from server, acquire list of related task ids and make futures
+        # step 2: from server, acquire list of related task ids
         r = self.funcx_client.web_client.get_taskgroup_tasks(task_group_id)
         if r["taskgroup_id"] != task_group_id:
             msg = (
@@ -470,61 +655,116 @@ class Executor(concurrent.futures.Executor):
             )
             raise ValueError(msg)
 
-        # step 3: create the associated set of futures
         task_ids: list[str] = [task["id"] for task in r.get("tasks", [])]
-        futures: list[ComputeFuture] = []
+        if not task_ids:
+            log.warning(f"Received no tasks for Task Group ID: {task_group_id}")
+            return iter(())
 
-        if task_ids:
-            # Complete the futures that already have results.
-            pending: list[ComputeFuture] = []
-            deserialize = self.funcx_client.fx_serializer.deserialize
-            chunk_size = 1024
-            num_chunks = len(task_ids) // chunk_size + 1
-            for chunk_no, id_chunk in enumerate(
-                chunk_by(task_ids, chunk_size), start=1
-            ):
-                if num_chunks > 1:
-                    log.debug(
-                        "Large task group (%s tasks; %s chunks); retrieving chunk %s"
-                        " (%s tasks)",
-                        len(task_ids),
-                        num_chunks,
-                        chunk_no,
-                        len(id_chunk),
-                    )
+        # step 3: the goods for the consumer, as they arrive
+        return self._reload_task_chunks(task_ids, max_concurrency, chunk_size)
 
-                res = self.funcx_client.web_client.get_batch_status(id_chunk)
-                for task_id, task in res.data.get("results", {}).items():
-                    fut = ComputeFuture(task_id)
-                    futures.append(fut)
-                    completed_t = task.get("completion_t")
-                    if not completed_t:
-                        pending.append(fut)
-                    else:
-                        try:
-                            if task.get("status") == "success":
-                                fut.set_result(deserialize(task["result"]))
-                            else:
-                                exc = TaskExecutionFailed(
-                                    task["exception"], completed_t
-                                )
-                                fut.set_exception(exc)
-                        except Exception as exc:
-                            funcx_err = TaskExecutionFailed(
-                                "Failed to set result or exception"
-                            )
-                            funcx_err.__cause__ = exc
-                            fut.set_exception(funcx_err)
+    def _reload_task_chunks(
+        self, task_ids: list[str], max_concurrency: int, chunk_size: int
+    ) -> t.Iterator[ComputeFuture]:
+        num_chunks = (len(task_ids) + chunk_size - 1) // chunk_size
+        if num_chunks > 1:
+            log.debug(
+                "Large task group (%s tasks); retrieving %s chunks of up to %s"
+                " tasks, %s at a time",
+                len(task_ids),
+                num_chunks,
+                chunk_size,
+                max_concurrency,
+            )
+
+        for results in self._fetch_task_statuses(task_ids, max_concurrency, chunk_size):
+            futures: list[ComputeFuture] = []
+            pending: list[ComputeFuture] = []
+            for task_id, task in results.items():
+                fut = ComputeFuture(task_id)
+                futures.append(fut)
+                if not self._complete_reloaded_future(fut, task):
+                    pending.append(fut)
 
             if pending:
-                self._result_watcher = _ResultWatcher(self)
+                if not self._result_watcher:
+                    self._result_watcher = self._new_result_watcher()
+                    self._result_watcher.start()
                 self._result_watcher.watch_for_task_results(pending)
-                self._result_watcher.start()
-        else:
-            log.warning(f"Received no tasks for Task Group ID: {task_group_id}")
 
-        # step 5: the goods for the consumer
-        return futures
+            yield from futures
+
+    def _fetch_task_statuses(
+        self, task_ids: list[str], max_concurrency: int, chunk_size: int
+    ) -> t.Iterator[dict[str, dict]]:
+        get_batch_status = self.funcx_client.web_client.get_batch_status
+
+        def _fetch(id_chunk: tuple[str, ...]) -> dict[str, dict]:
+            return get_batch_status(list(id_chunk)).data.get("results", {})
+
+        if max_concurrency == 1:
+            for id_chunk in chunk_by(task_ids, chunk_size):
+                yield _fetch(id_chunk)
+            return
+
+        # Bound the in-flight requests (rather than submitting every chunk up
+        # front) so unconsumed responses do not pile up in memory
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="ReloadTasks"
+        ) as pool:
+            inflight: set[concurrent.futures.Future] = set()
+            try:
+                for id_chunk in chunk_by(task_ids, chunk_size):
+                    inflight.add(pool.submit(_fetch, id_chunk))
+                    if len(inflight) >= max_concurrency:
+                        done, inflight = concurrent.futures.wait(
+                            inflight, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                        for f in done:
+                            yield f.result()
+                for f in concurrent.futures.as_completed(inflight):
+                    inflight.discard(f)
+                    yield f.result()
+            finally:
+                for f in inflight:
+                    f.cancel()
+
+    def _complete_reloaded_future(self, fut: ComputeFuture, task: dict) -> bool:
+        """Complete the future from its task status; False if still pending"""
+        completed_t = task.get("completion_t")
+        if not completed_t:
+            return False
+
+        def _failed(exc: Exception) -> TaskExecutionFailed:
+            funcx_err = TaskExecutionFailed("Failed to set result or exception")
+            funcx_err.__cause__ = exc
+            return funcx_err
+
+        deserialize = self.funcx_client.fx_serializer.deserialize
+
+        def _deserialize(serialized):
+            try:
+                return deserialize(serialized)
+            except Exception as exc:
+                raise _failed(exc) from exc
+
+        try:
+            if task.get("status") == "success":
+                fut.set_serialized_result(task["result"], _deserialize)
+            else:
+                fut.set_exception(TaskExecutionFailed(task["exception"], completed_t))
+        except Exception as exc:
+            fut.set_exception(_failed(exc))
+        return True
+
+    def _new_result_watcher(self) -> _ResultWatcher:
+        return _ResultWatcher(
+            self,
+            prefetch_count=self.amqp_prefetch_count,
+            ack_batch_size=self.amqp_ack_batch_size,
+            ack_interval_s=self.amqp_ack_interval_s,
+            deserializer_pool=self._deserializer_pool,
+        )
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         thread_id = threading.get_ident()
@@ -535,7 +775,7 @@ class Executor(concurrent.futures.Executor):
                 self,
                 self._task_submitter.name,
             )
-            self._tasks_to_send.put((None, None))
+            self._send_poison_pill()
             if wait and self._task_submitter.ident != thread_id:
                 while self._task_submitter.is_alive():
                     self._task_submitter.join(0.1)
@@ -545,6 +785,8 @@ class Executor(concurrent.futures.Executor):
             if self._result_watcher:
                 self._result_watcher.shutdown(wait=wait, cancel_futures=cancel_futures)
                 self._result_watcher = None
+            if self._deserializer_pool:
+                self._deserializer_pool.shutdown(wait=wait)
 
         if thread_id != self._task_submitter.ident and self._stopped_in_error:
             # In an unhappy path scenario, there's the potential for multiple
@@ -555,78 +797,120 @@ class Executor(concurrent.futures.Executor):
         _REGISTERED_FXEXECUTORS.pop(id(self), None)
         log.debug("%s: shutdown complete (thread: %s)", self, thread_id)
 
+    def _send_poison_pill(self):
+        """Ask the task submitter thread to stop, once it has sent queued tasks"""
+        while self._task_submitter.is_alive():
+            try:
+                self._tasks_to_send.put((None, None), timeout=0.1)
+                return
+            except queue.Full:
+                if self._task_submitter.ident == threading.get_ident():
+                    return  # stopping itself; it drains the queue on the way out
+
     def _task_submitter_impl(self) -> None:
         """
-        Coalesce tasks from the interthread queue (``_tasks_to_send``), up to
-        ``self.batch_size``, submit them, and then send the futures to the
-        ResultWatcher.
+        Coalesce (and serialize) tasks from the interthread queue
+        (``_tasks_to_send``) into a batch, and hand each batch to a pool of
+        submission workers, which submit it (see ``_submit_tasks()``) and then
+        send the futures to the ResultWatcher.  Serializing one batch thereby
+        overlaps the upstream requests of others.
+
+        A batch is sent once it holds ``self.batch_size`` tasks, once the next
+        task would take its serialized size past ``self.batch_max_bytes``, or
+        once no more tasks arrive within the linger time (see ``_linger_s()``).
+
+        At most ``self.max_inflight_batches`` batches are in flight at once;
+        while that many are, this thread waits, ``_tasks_to_send`` fills up, and
+        ``.submit()`` blocks -- backpressure for overeager producers.
 
         The main job of this method is to loop forever, forwarding task
         requests upstream and the associated futures to the ResultWatcher.
 
         This thread stops when it receives a poison-pill of ``(None, None)``
-        in the queue.  (See ``shutdown()``.)
+        in the queue.  (See ``shutdown()``.)  It also stops if a worker fails to
+        submit a batch, raising the worker's exception.
         """
         log.debug(
             "%s: task submission thread started (%s)", self, threading.get_ident()
         )
         to_send = self._tasks_to_send  # cache lookup
         futs: list[ComputeFuture] = []  # for mypy/the exception branch
+        inflight = threading.BoundedSemaphore(self.max_inflight_batches)
+        submit_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_inflight_batches,
+            thread_name_prefix="TaskSubmitterWorker",
+        )
+        # a task that would have overfilled the previous batch (already serialized)
+        carry: tuple[ComputeFuture, tuple[str, str, str]] | None = None
         try:
             fut: ComputeFuture | None = ComputeFuture()  # just start the loop; please
             while fut is not None:
                 futs = []
-                tasks: list[TaskSubmissionInfo] = []
+                batch: Batch | None = None
+                num_bytes = 0
                 task_count = 0
                 try:
-                    fut, task = to_send.get()  # Block; wait for first result ...
+                    if carry:
+                        futs.append(carry[0])
+                        batch = self._create_batch()
+                        batch.tasks.append(carry[1])
+                        num_bytes = len(carry[1][2])
+                        carry = None
+                        fut, task = to_send.get(block=False)
+                    else:
+                        fut, task = to_send.get()  # Block; wait for first result ...
                     task_count += 1
                     bs = max(1, self.batch_size)  # May have changed while waiting
+                    max_bytes = min(self.batch_max_bytes, self._batch_bytes_cap)
+                    deadline = time.monotonic() + self._linger_s()
                     while task is not None:
                         assert fut is not None  # Come on mypy; contextually clear!
-                        tasks.append(task)
+                        if batch is None:
+                            batch = self._create_batch()
+                        size = batch.add(
+                            task.function_id, task.endpoint_id, task.args, task.kwargs
+                        )
+                        log.debug("Added task to Globus Compute batch: %s", task)
+                        if futs and num_bytes + size > max_bytes:
+                            carry = (fut, batch.tasks.pop())
+                            break
                         futs.append(fut)
-                        if not (len(tasks) < bs):
+                        num_bytes += size
+                        if len(futs) >= bs or num_bytes >= max_bytes:
                             break
-                        fut, task = to_send.get(block=False)  # ... don't block again
+
+                        # ... linger (briefly) for the batch to fill up
+                        remaining = deadline - time.monotonic()
+                        if remaining > 0:
+                            fut, task = to_send.get(timeout=remaining)
+                        else:
+                            fut, task = to_send.get(block=False)
                         task_count += 1
                 except queue.Empty:
                     pass
 
-                if not tasks:
-                    continue
+                if batch is not None and futs:
+                    inflight.acquire()  # wait for a free submission slot
+                    if self._submit_error:
+                        inflight.release()
+                        raise self._submit_error
 
-                log.info(f"Submitting tasks to Globus Compute: {len(tasks)}")
-                self._submit_tasks(futs, tasks)
-
-                with self._shutdown_lock:
-                    if self._stopped:
-                        continue
-
-                    if not (self._result_watcher and self._result_watcher.is_alive()):
-                        # Don't initialize the result watcher unless at least
-                        # one batch has been sent
-                        self._result_watcher = _ResultWatcher(self)
-                        self._result_watcher.start()
-                    try:
-                        self._result_watcher.watch_for_task_results(futs)
-                    except self._result_watcher.__class__.ShuttingDownError:
-                        log.debug("Waiting for previous ResultWatcher to shutdown")
-                        self._result_watcher.join()
-                        self._result_watcher = _ResultWatcher(self)
-                        self._result_watcher.start()
-                        self._result_watcher.watch_for_task_results(futs)
-
-                # important to clear futures; else a legitimately early-shutdown
-                # request (e.g., __exit__()) can cancel these (finally block,
-                # below) before the result comes back, even though _result_watcher
-                # is already watching them.
-                futs.clear()
+                    log.info(f"Submitting tasks to Globus Compute: {len(futs)}")
+                    submit_pool.submit(self._submit_batch, futs, batch, inflight)
+
+                    # the worker owns these futures now; else a legitimately
+                    # early-shutdown request (e.g., __exit__()) can cancel these
+                    # (finally block, below) before the result comes back
+                    futs = []
 
                 while task_count:
                     task_count -= 1
                     to_send.task_done()
 
+            submit_pool.shutdown(wait=True)  # let in-flight batches complete
+            if self._submit_error:
+                raise self._submit_error
+
         except Exception as exc:
             self._stopped = True
             self._stopped_in_error = True
@@ -644,6 +928,9 @@ class Executor(concurrent.futures.Executor):
             log.debug("%s: task submission thread dies", self)
             raise
         finally:
+            submit_pool.shutdown(wait=False)
+            if carry:
+                futs.append(carry[0])
             if sys.exc_info() != (None, None, None):
                 time.sleep(0.1)  # give any in-flight Futures a chance to be .put() ...
             while not self._tasks_to_send.empty():
@@ -661,39 +948,175 @@ class Executor(concurrent.futures.Executor):
                 pass
             log.debug("%s: task submission thread complete", self)
 
-    def _submit_tasks(self, futs: list[ComputeFuture], tasks: list[TaskSubmissionInfo]):
+    def _submit_batch(
+        self,
+        futs: list[ComputeFuture],
+        batch: Batch,
+        inflight: threading.BoundedSemaphore,
+    ):
+        """
+        Submission worker: submit a batch of tasks, and then send the futures to
+        the ResultWatcher.  On failure, cancel the futures and record the error
+        for the task submitter thread to raise.
+        """
+        try:
+            self._submit_tasks(futs, batch)
+            self._watch_futures(futs)
+        except Exception as exc:
+            with self._submit_lock:
+                self._submit_error = self._submit_error or exc
+            for fut in futs:
+                fut.cancel()
+                fut.set_running_or_notify_cancel()
+            try:
+                # wake the task submitter, if waiting for tasks
+                self._tasks_to_send.put_nowait((None, None))
+            except queue.Full:
+                pass  # not waiting; it checks for errors before each batch
+        finally:
+            inflight.release()
+
+    def _create_batch(self) -> Batch:
+        return self.funcx_client.create_batch(
+            task_group_id=self.task_group_id,
+            create_websocket_queue=True,
+        )
+
+    def _linger_s(self) -> float:
+        """
+        How long to wait for a batch to fill: half the recently observed submit
+        latency, up to ``self.batch_linger_s``.  Until a batch has been submitted
+        (no latency observed), don't wait.
+        """
+        if self._submit_latency_s is None:
+            return 0.0
+        return min(self.batch_linger_s, self._submit_latency_s / 2)
+
+    def _record_batch(self, num_tasks: int, num_bytes: int, latency_s: float):
+        with self._submit_lock:
+            self.batch_history.append(SubmittedBatch(num_tasks, num_bytes, latency_s))
+            if self._submit_latency_s is None:
+                self._submit_latency_s = latency_s
+            else:
+                self._submit_latency_s += 0.2 * (latency_s - self._submit_latency_s)
+
+    def _watch_futures(self, futs: list[ComputeFuture]):
+        with self._shutdown_lock:
+            if self._stopped:
+                return
+
+            if not (self._result_watcher and self._result_watcher.is_alive()):
+                # Don't initialize the result watcher unless at least
+                # one batch has been sent
+                self._result_watcher = self._new_result_watcher()
+                self._result_watcher.start()
+            try:
+                self._result_watcher.watch_for_task_results(futs)
+            except self._result_watcher.__class__.ShuttingDownError:
+                log.debug("Waiting for previous ResultWatcher to shutdown")
+                self._result_watcher.join()
+                self._result_watcher = self._new_result_watcher()
+                self._result_watcher.start()
+                self._result_watcher.watch_for_task_results(futs)
+
+    def _submit_tasks(self, futs: list[ComputeFuture], batch: Batch):
         """
         Submit a batch of tasks to the webservice, destined for self.endpoint_id.
         Upon success, update the futures with their associated task_id.
 
+        Submissions the web service did not accept -- it was unreachable, rate
+        limited the request, or was unavailable -- are retried, up to
+        ``self.submit_retry_limit`` times, with jittered exponential backoff.  A
+        batch rejected as too large is split in two, each half submitted in
+        turn, and subsequent batches are capped to half its size.
+
         :param futs: a list of ComputeFutures; will have their task_id attribute
             set when function completes successfully.
-        :param tasks: a list of tasks to submit upstream in a batch.
+        :param batch: the batch of tasks (one per future) to submit upstream
         """
-        batch = self.funcx_client.create_batch(
-            task_group_id=self.task_group_id,
-            create_websocket_queue=True,
-        )
-        for task in tasks:
-            batch.add(task.function_id, task.endpoint_id, task.args, task.kwargs)
-            log.debug("Added task to Globus Compute batch: %s", task)
-
-        try:
-            batch_tasks = self.funcx_client.batch_run(batch)
-        except Exception:
-            log.error(f"Error submitting {len(tasks)} tasks to Globus Compute")
-            raise
+        num_tasks = len(batch.tasks)
+        num_bytes = sum(len(payload) for _fn_id, _ep_id, payload in batch.tasks)
+        attempt = 0
+        while True:
+            try:
+                start = time.monotonic()
+                batch_tasks = self.funcx_client.batch_run(batch)
+                self._record_batch(num_tasks, num_bytes, time.monotonic() - start)
+                break
+            except globus_sdk.GlobusAPIError as exc:
+                if exc.http_status != 413 or num_tasks < 2:
+                    if not self._should_retry(exc, attempt, num_tasks):
+                        raise
+                    attempt += 1
+                    continue
 
-        self.task_count_submitted += len(batch_tasks)
+                with self._submit_lock:
+                    self._batch_bytes_cap = max(
+                        1, min(self._batch_bytes_cap, num_bytes // 2)
+                    )
+                log.warning(
+                    "Batch of %s tasks (%s bytes) too large; splitting, and capping"
+                    " batches at %s bytes",
+                    num_tasks,
+                    num_bytes,
+                    self._batch_bytes_cap,
+                )
+                mid = num_tasks // 2
+                for part_futs, part_tasks in (
+                    (futs[:mid], batch.tasks[:mid]),
+                    (futs[mid:], batch.tasks[mid:]),
+                ):
+                    part = self._create_batch()
+                    part.tasks.extend(part_tasks)
+                    self._submit_tasks(part_futs, part)
+                return
+            except Exception as exc:
+                if not self._should_retry(exc, attempt, num_tasks):
+                    raise
+                attempt += 1
+
+        with self._submit_lock:
+            self.task_count_submitted += len(batch_tasks)
+            count_submitted = self.task_count_submitted
         log.debug(
             "Batch submitted to task_group: %s - %s",
             self.task_group_id,
-            self.task_count_submitted,
+            count_submitted,
         )
 
         for fut, task_uuid in zip(futs, batch_tasks):
             fut.task_id = task_uuid
 
+    def _should_retry(self, exc: Exception, attempt: int, num_tasks: int) -> bool:
+        """If the failed submission may be retried, wait (back off) and say so"""
+        if attempt >= self.submit_retry_limit or not _is_retryable(exc):
+            log.error(f"Error submitting {num_tasks} tasks to Globus Compute")
+            return False
+        delay_s = min(30.0, 0.5 * 2 ** (attempt + 1)) * random.uniform(0.5, 1.0)
+        log.warning(
+            "Unable to submit %s tasks (%s); retrying in %.1fs (%s of %s)",
+            num_tasks,
+            exc,
+            delay_s,
+            attempt + 1,
+            self.submit_retry_limit,
+        )
+        time.sleep(delay_s)
+        return True
+
+
+def _map_chunk(fn, arg_tuples):
+    return [fn(*args) for args in arg_tuples]
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Whether a failed submission was not accepted, so may be safely retried"""
+    if isinstance(exc, globus_sdk.GlobusConnectionError):
+        return True  # never reached the web service
+    if isinstance(exc, globus_sdk.GlobusAPIError):
+        return exc.http_status in (429, 503)  # rate limited, or unavailable
+    return False
+
 
 class _ResultWatcher(threading.Thread):
     """
@@ -728,6 +1151,16 @@ class _ResultWatcher(threading.Thread):
     :param channel_close_window_limit: [default: 3] how many reopen
         attempts to allow within the tally window before concluding
         there is an external error and shutting down the watcher.
+    :param prefetch_count: [default: 2048] how many results the AMQP service
+        may send before any are acknowledged (``basic_qos``); 0 for no limit
+    :param ack_batch_size: [default: 256] acknowledge received results (all
+        at once) as soon as this many are outstanding ...
+    :param ack_interval_s: [default: 0.05] ... or at most this long after the
+        first outstanding result was received, whichever comes first
+    :param deserializer_pool: [default: None] if set, deserialize results on
+        this pool before completing their futures.  Otherwise, futures are
+        completed with the serialized result, to be deserialized on first
+        access; either way, the AMQP thread only matches and acknowledges.
     """
 
     class ShuttingDownError(Exception):
@@ -740,10 +1173,22 @@ class _ResultWatcher(threading.Thread):
         connect_attempt_limit=5,
         channel_close_window_s=10,
         channel_close_window_limit=3,
+        prefetch_count: int = 2048,
+        ack_batch_size: int = 256,
+        ack_interval_s: float = 0.05,
+        deserializer_pool: concurrent.futures.Executor | None = None,
     ):
         super().__init__()
         self.funcx_executor = funcx_executor
+        self.deserializer_pool = deserializer_pool
+        self.prefetch_count = max(0, prefetch_count)
+        self.ack_batch_size = max(1, ack_batch_size)
+        if self.prefetch_count:
+            # the service sends no more until some are acked; don't wait on them
+            self.ack_batch_size = min(self.ack_batch_size, self.prefetch_count)
+        self.ack_interval_s = ack_interval_s
         self._to_ack: list[int] = []  # outstanding amqp messages not-yet-acked
+        self._ack_timer: object | None = None
         self._time_to_check_results = threading.Event()
         self._new_futures_lock = threading.Lock()
 
@@ -908,15 +1353,20 @@ class _ResultWatcher(threading.Thread):
                 for f in futures
                 if f.task_id and f.task_id not in self._open_futures
             }
+            # Results may arrive before their futures (e.g., reloaded tasks);
+            # complete those now rather than rescan on the AMQP thread
+            arrived = [tid for tid in to_watch if tid in self._received_results]
+            to_complete = [
+                (to_watch.pop(tid), self._received_results.pop(tid)) for tid in arrived
+            ]
             self._open_futures.update(to_watch)
 
             if self._open_futures:  # futures as an empty list is acceptable
                 self._open_futures_empty.clear()
-                if self._received_results:
-                    # no sense is setting the event if there are not yet
-                    # any results
-                    self._time_to_check_results.set()
-        return len(to_watch)
+
+        for fut, (props, res) in to_complete:
+            self._resolve_future(fut, props, res)
+        return len(to_watch) + len(to_complete)
 
     def _match_results_to_futures(self):
         """
@@ -926,36 +1376,68 @@ class _ResultWatcher(threading.Thread):
 
         This method will set the _open_futures_empty event if there are no open
         futures *at the time of processing*.
+
+        Results are not deserialized here, on the AMQP thread: see
+        ``_complete_future()``.
         """
-        deserialize = self.funcx_executor.funcx_client.fx_serializer.deserialize
         with self._new_futures_lock:
-            futures_to_complete = [
-                self._open_futures.pop(tid)
+            to_complete = [
+                (self._open_futures.pop(tid), self._received_results.pop(tid))
                 for tid in self._open_futures.keys() & self._received_results.keys()
             ]
             if not self._open_futures:
                 self._open_futures_empty.set()
 
-        for fut in futures_to_complete:
-            props, res = self._received_results.pop(fut.task_id)
+        for fut, (props, res) in to_complete:
+            self._resolve_future(fut, props, res)
+
+    def _resolve_future(
+        self, fut: ComputeFuture, props: BasicProperties | None, res: Result
+    ):
+        if res.is_error:
+            timestamp = props and props.timestamp or 0
+            fut.set_exception(TaskExecutionFailed(res.data, str(timestamp)))
+            return
 
-            if res.is_error:
-                fut.set_exception(
-                    TaskExecutionFailed(res.data, str(props.timestamp or 0))
+        if self.deserializer_pool:
+            try:
+                self.deserializer_pool.submit(
+                    self._complete_future, fut, res.data, lazy=False
                 )
+                return
+            except RuntimeError:
+                pass  # pool shut down; fall back to deserializing on access
+        self._complete_future(fut, res.data, lazy=True)
+
+    def _complete_future(self, fut: ComputeFuture, data: str, lazy: bool):
+        """
+        Set the result of ``fut`` from the serialized ``data``.  If ``lazy``,
+        complete the future immediately and defer the deserialization to the
+        future's first ``.result()`` or ``.exception()`` call; otherwise,
+        deserialize first (e.g., on a worker thread).
+        """
+        try:
+            if lazy:
+                fut.set_serialized_result(data, self._deserialize)
             else:
                 try:
-                    fut.set_result(deserialize(res.data))
-                except InvalidStateError as err:
-                    log.error(
-                        f"Unable to set future state ({err}) for task: {fut.task_id}"
-                    )
+                    result = self._deserialize(data)
                 except Exception as exc:
-                    task_exc = Exception(
-                        f"Malformed or unexpected data structure. Data: {res.data}",
-                    )
-                    task_exc.__cause__ = exc
-                    fut.set_exception(task_exc)
+                    fut.set_exception(exc)
+                else:
+                    fut.set_result(result)
+        except InvalidStateError as err:
+            log.error(f"Unable to set future state ({err}) for task: {fut.task_id}")
+
+    def _deserialize(self, data: str) -> t.Any:
+        deserialize = self.funcx_executor.funcx_client.fx_serializer.deserialize
+        try:
+            return deserialize(data)
+        except Exception as exc:
+            task_exc = Exception(
+                f"Malformed or unexpected data structure. Data: {data}",
+            )
+            raise task_exc from exc
 
     def _event_watcher(self):
         """
@@ -977,12 +1459,7 @@ class _ResultWatcher(threading.Thread):
             return
 
         try:
-            if self._to_ack:
-                self._to_ack.sort()  # no change in the happy path
-                latest_msg_id = self._to_ack[-1]
-                self._channel.basic_ack(latest_msg_id, multiple=True)
-                self._to_ack.clear()
-                log.debug("%r Acknowledged through message: %s", self, latest_msg_id)
+            self._ack_received()
 
             if self._time_to_check_results.is_set():
                 self._time_to_check_results.clear()
@@ -992,6 +1469,19 @@ class _ResultWatcher(threading.Thread):
         finally:
             self._connection.ioloop.call_later(self.poll_period_s, self._event_watcher)
 
+    def _ack_received(self):
+        """Acknowledge, in one frame, every outstanding received message"""
+        if self._to_ack:
+            latest_msg_id = max(self._to_ack)
+            self._channel.basic_ack(latest_msg_id, multiple=True)
+            self._to_ack.clear()
+            log.debug("%r Acknowledged through message: %s", self, latest_msg_id)
+
+    def _ack_on_timer(self):
+        self._ack_timer = None
+        if self._channel and self._channel.is_open:
+            self._ack_received()
+
     def _on_message(
         self,
         channel: Channel,
@@ -1003,9 +1493,13 @@ class _ResultWatcher(threading.Thread):
         Nominally, the kernel of this whole class -- called by the Pika library
         (ioloop) when a new Result message has arrived from upstream.  This
         method will attempt to unpack the bytes so as to minimally verify that
-        the message is a valid Result object, and then store the unpacked
-        object in self._received_results for later processing and set the
-        ``_time_to_check_results`` event.
+        the message is a valid Result object, and then complete the associated
+        future.  If the future is not (yet) being watched, the result is stored
+        in self._received_results for ``watch_for_task_results()`` to find.
+
+        The message is acknowledged in bulk with others: once
+        ``ack_batch_size`` are outstanding, or ``ack_interval_s`` after the
+        first, whichever comes first.
 
         If the received message is *not* a result, then immediately NACK the
         message to AMQP service -- the responsibility to handle invalid messages
@@ -1019,14 +1513,31 @@ class _ResultWatcher(threading.Thread):
             if not isinstance(res, Result):
                 raise TypeError(f"Non-Result object received ({type(res)})")
 
-            self._received_results[str(res.task_id)] = (props, res)
+            task_id = str(res.task_id)
+            with self._new_futures_lock:
+                fut = self._open_futures.pop(task_id, None)
+                if fut is None:
+                    self._received_results[task_id] = (props, res)
+                    self._time_to_check_results.set()
+                elif not self._open_futures:
+                    self._open_futures_empty.set()
             self._to_ack.append(msg_id)
-            self._time_to_check_results.set()
         except Exception:
             # No sense in waiting for the RMQ default 30m timeout; let it know
             # *now* that this message failed.
             log.exception("Invalid message type queue put failed")
             channel.basic_nack(msg_id, requeue=True)
+            return
+
+        if fut is not None:
+            self._resolve_future(fut, props, res)
+
+        if len(self._to_ack) >= self.ack_batch_size:
+            self._ack_received()
+        elif self._ack_timer is None and self._connection:
+            self._ack_timer = self._connection.ioloop.call_later(
+                self.ack_interval_s, self._ack_on_timer
+            )
 
     def _stop_ioloop(self):
         """
@@ -1114,6 +1625,7 @@ class _ResultWatcher(threading.Thread):
             return
 
         self._consumer_tag = None
+        self._to_ack.clear()  # unacknowledged messages will be redelivered
         assert self._connection is not None, "Strictly called _by_ ioloop"
         # Doh!  Channel closed unexpectedly.
         now = time.monotonic()
@@ -1137,6 +1649,9 @@ class _ResultWatcher(threading.Thread):
             self.shutdown()
 
     def _start_consuming(self):
+        if self.prefetch_count:
+            # Pipelined: the qos request is processed before the consume request
+            self._channel.basic_qos(prefetch_count=self.prefetch_count)
         self._consumer_tag = self._channel.basic_consume(
             queue=f"{self._queue_prefix}{self.funcx_executor.task_group_id}",
             on_message_callback=self._on_message,
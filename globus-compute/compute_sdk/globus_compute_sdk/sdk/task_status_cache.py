@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from globus_compute_sdk.errors import SerializationError
+
+# Rough per-entry bookkeeping cost (key, entry tuple, ordering links), counted
+# toward max_bytes in addition to the result payload
+_ENTRY_OVERHEAD = 256
+
+_NO_RESULT = object()
+
+
+class _Entry(t.NamedTuple):
+    pending: bool
+    status: str | None
+    completion_t: t.Any
+    result: t.Any  # the result object, its serialized form, or _NO_RESULT
+    serialized: bool
+    nbytes: int
+    stored_at: float
+
+
+class TaskStatusCache(t.MutableMapping[str, t.Dict]):
+    """A bounded LRU (and optionally TTL) cache of task statuses
+
+    Behaves as a mapping of task id to the status dictionary the ``Client``
+    returns (``{"pending": ..., "status": ..., "result": ...}``), but stores
+    each status as a compact tuple and evicts the least recently used entries
+    once more than ``max_entries`` are held or their estimated size exceeds
+    ``max_bytes``.  Results are recorded with :meth:`set_result`; a result whose
+    serialized form is larger than ``inline_max_bytes`` is kept only in that
+    serialized form and deserialized each time it is read, so large results do
+    not stay alive as objects.
+
+    An evicted or expired task is simply a cache miss; the ``Client`` fetches
+    it from the web service again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 65536,
+        max_bytes: int = 256 * 2**20,
+        ttl_s: float | None = None,
+        inline_max_bytes: int = 1024,
+        deserialize: t.Callable[[str], t.Any] | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        max_entries: int
+            Maximum number of task statuses to hold.
+            Default: 65536
+
+        max_bytes: int
+            Maximum estimated size of the held statuses, in bytes; results are
+            measured by their serialized length.
+            Default: 256 MiB
+
+        ttl_s: float | None
+            Discard statuses this many seconds after they were stored.
+            Default: None (never expire)
+
+        inline_max_bytes: int
+            Results that serialize to at most this many bytes are kept as
+            objects; larger results are kept serialized.
+            Default: 1024
+
+        deserialize: Callable[[str], Any]
+            Turns a serialized result back into an object.  Required to use
+            :meth:`set_result`.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive (got {max_entries})")
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive (got {max_bytes})")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.inline_max_bytes = inline_max_bytes
+        self._deserialize = deserialize
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(entries={len(self)}, bytes={self._nbytes},"
+            f" max_entries={self.max_entries}, max_bytes={self.max_bytes})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> t.Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __contains__(self, task_id: object) -> bool:
+        if not isinstance(task_id, str):
+            return False
+        with self._lock:
+            entry = self._entries.get(task_id)
+            return entry is not None and not self._expire_if_stale(task_id, entry)
+
+    def __getitem__(self, task_id: str) -> t.Dict:
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is None or self._expire_if_stale(task_id, entry):
+                self.misses += 1
+                raise KeyError(task_id)
+            self._entries.move_to_end(task_id)
+            self.hits += 1
+
+        status: t.Dict[str, t.Any] = {"pending": entry.pending}
+        if entry.status is not None:
+            status["status"] = entry.status
+        if entry.result is not _NO_RESULT:
+            result = entry.result
+            if entry.serialized:
+                result = self._load(result)
+            status["result"] = result
+        if entry.completion_t is not None:
+            status["completion_t"] = entry.completion_t
+        return status
+
+    def __setitem__(self, task_id: str, status: t.Dict):
+        entry = _Entry(
+            pending=status.get("pending", True),
+            status=status.get("status"),
+            completion_t=status.get("completion_t"),
+            result=status.get("result", _NO_RESULT),
+            serialized=False,
+            nbytes=_ENTRY_OVERHEAD,
+            stored_at=time.monotonic(),
+        )
+        self._store(task_id, entry)
+
+    def __delitem__(self, task_id: str):
+        with self._lock:
+            entry = self._entries.pop(task_id)
+            self._nbytes -= entry.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def set_result(
+        self,
+        task_id: str,
+        serialized_result: str,
+        completion_t: t.Any,
+        status: str = "success",
+    ) -> t.Dict:
+        """Record a task's completed result
+
+        :param task_id: the task's id
+        :param serialized_result: the result, as serialized by the endpoint
+        :param completion_t: the task completion time, as reported by the service
+        :param status: the task's (final) status, as reported by the service
+        :returns: the task's status, with the deserialized result
+        :raises SerializationError: if the result cannot be deserialized
+        """
+        result = self._load(serialized_result)
+        nbytes = len(serialized_result)
+        serialized = nbytes > self.inline_max_bytes
+        entry = _Entry(
+            pending=False,
+            status=status,
+            completion_t=completion_t,
+            result=serialized_result if serialized else result,
+            serialized=serialized,
+            nbytes=_ENTRY_OVERHEAD + nbytes,
+            stored_at=time.monotonic(),
+        )
+        self._store(task_id, entry)
+        return {
+            "pending": False,
+            "status": status,
+            "result": result,
+            "completion_t": completion_t,
+        }
+
+    @property
+    def stats(self) -> t.Dict[str, t.Any]:
+        """Current occupancy and access counters, for sizing the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._nbytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "serialized_entries": sum(
+                    1 for e in self._entries.values() if e.serialized
+                ),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _load(self, serialized_result: str) -> t.Any:
+        if self._deserialize is None:
+            raise RuntimeError("No deserializer configured for task results")
+        try:
+            return self._deserialize(serialized_result)
+        except Exception:
+            raise SerializationError("Result Object Deserialization")
+
+    def _store(self, task_id: str, entry: _Entry):
+        with self._lock:
+            prev = self._entries.pop(task_id, None)
+            if prev is not None:
+                self._nbytes -= prev.nbytes
+            self._entries[task_id] = entry
+            self._nbytes += entry.nbytes
+
+            while len(self._entries) > self.max_entries or (
+                self._nbytes > self.max_bytes and len(self._entries) > 1
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self.evictions += 1
+
+    def _expire_if_stale(self, task_id: str, entry: _Entry) -> bool:
+        # Caller holds the lock
+        if self.ttl_s is None or time.monotonic() - entry.stored_at < self.ttl_s:
+            return False
+        del self._entries[task_id]
+        self._nbytes -= entry.nbytes
+        self.expirations += 1
+        return True
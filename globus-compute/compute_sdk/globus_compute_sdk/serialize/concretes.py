@@ -4,6 +4,7 @@ import codecs
 import inspect
 import logging
 import pickle
+import struct
 from collections import OrderedDict
 
 import dill
@@ -29,6 +30,75 @@ class DillDataBase64(SerializeBase):
         return data
 
 
+class PickleDataRaw(SerializeBase):
+    """Pickle protocol 5 with out-of-band buffers, as raw bytes
+
+    Unlike the other methods, this serializes to ``bytes`` rather than ``str``, so
+    it is only for transports that carry bytes, and is only used when requested
+    by identifier.  In exchange, nothing is base64 encoded: ``bytes`` are
+    embedded in the pickle stream as they are, and NumPy arrays (and other
+    ``PickleBuffer`` providers) are carried out-of-band, after the stream.
+
+    Layout, after the identifier: the number of out-of-band buffers (4 bytes),
+    the lengths of the pickle stream and of each buffer (8 bytes each), the
+    pickle stream, then the buffers.
+    """
+
+    identifier = "05\n"
+    _for_code = False
+    _bytes_payload = True
+
+    def __init__(self):
+        super().__init__()
+        self._b_identifier = self.identifier.encode()
+
+    def serialize(self, data) -> bytes:
+        if pickle.HIGHEST_PROTOCOL < 5:
+            raise NotImplementedError("Pickle protocol 5 requires Python 3.8+")
+
+        buffers: list[pickle.PickleBuffer] = []
+        stream = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        raws = [buf.raw() for buf in buffers]
+        header = struct.pack(
+            f"!I{1 + len(raws)}Q", len(raws), len(stream), *(r.nbytes for r in raws)
+        )
+        return b"".join([self._b_identifier, header, stream, *raws])
+
+    def deserialize(self, payload: bytes):
+        if pickle.HIGHEST_PROTOCOL < 5:
+            raise DeserializationError("Pickle protocol 5 requires Python 3.8+")
+
+        view = memoryview(payload)
+        offset = len(self._b_identifier)
+        if view[:offset] != self._b_identifier:
+            raise DeserializationError(
+                f"Buffer does not start with identifier:{self.identifier}"
+            )
+        if view.readonly:
+            # Deserialized arrays share the buffers' memory; copy once, so that
+            # they are writable (as they are from the other methods)
+            view = memoryview(bytearray(view))
+
+        try:
+            (count,) = struct.unpack_from("!I", view, offset)
+            offset += 4
+            lengths = struct.unpack_from(f"!{1 + count}Q", view, offset)
+            offset += 8 * (1 + count)
+        except struct.error as e:
+            raise DeserializationError(f"Truncated header: {e}") from e
+        if offset + sum(lengths) != len(view):
+            raise DeserializationError(
+                f"Expected {offset + sum(lengths)} bytes; got {len(view)}"
+            )
+
+        chunks = []
+        for length in lengths:
+            chunks.append(view[offset : offset + length])
+            offset += length
+        stream, *buffers = chunks
+        return pickle.loads(stream, buffers=buffers)
+
+
 class DillCodeSource(SerializeBase):
     """This method uses dill's getsource method to extract the function body and
     then serializes it.
@@ -234,5 +304,6 @@ METHODS_MAP_CODE = OrderedDict(
 METHODS_MAP_DATA = OrderedDict(
     [
         (DillDataBase64.identifier, DillDataBase64),
+        (PickleDataRaw.identifier, PickleDataRaw),
     ]
 )
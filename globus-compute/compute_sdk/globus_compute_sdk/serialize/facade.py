@@ -8,8 +8,18 @@ logger = logging.getLogger(__name__)
 class ComputeSerializer:
     """Wraps several serializers for one uniform interface"""
 
-    def __init__(self):
-        """Instantiate the appropriate classes"""
+    def __init__(self, data_method=None):
+        """Instantiate the appropriate classes
+
+        Parameters
+        ----------
+        data_method : str
+           Identifier of the data serialization method to try first, such as a
+           bytes-payload method (e.g., ``PickleDataRaw.identifier``) for a
+           transport that carries bytes; see ``negotiate_data_method()``.  Data
+           this method fails to serialize falls back to the default methods.
+           Default: None (the str-payload methods, in order)
+        """
 
         # Do we want to do a check on header size here ? Probably overkill
         headers = list(METHODS_MAP_CODE.keys()) + list(METHODS_MAP_DATA.keys())
@@ -23,6 +33,38 @@ class ComputeSerializer:
         for key in METHODS_MAP_DATA:
             self.methods_for_data[key] = METHODS_MAP_DATA[key]()
 
+        if data_method is not None and data_method not in self.methods_for_data:
+            raise ValueError(f"Unknown data serialization method: {data_method!r}")
+        self.data_method = data_method
+
+        # Methods that serialize to bytes are only used when requested, as most
+        # transports (and older deserializers) expect str payloads
+        self._default_data_methods = [
+            method
+            for method in self.methods_for_data.values()
+            if not getattr(method, "_bytes_payload", False)
+        ]
+        if data_method is not None:
+            self._default_data_methods.insert(0, self.methods_for_data[data_method])
+
+    @staticmethod
+    def negotiate_data_method(accepted):
+        """Pick the data serialization method to use with a peer
+
+        Parameters
+        ----------
+        accepted : iterable of str
+           Identifiers of the data methods the peer can deserialize, in the
+           peer's order of preference
+
+        Returns the first identifier also supported here, or None, for the
+        default methods (which every peer supports)
+        """
+        for identifier in accepted:
+            if identifier in METHODS_MAP_DATA:
+                return identifier
+        return None
+
     def _list_methods(self):
         return self.methods_for_code, self.methods_for_data
 
@@ -33,7 +75,7 @@ class ComputeSerializer:
         if callable(data):
             stype, methods = "Callable", self.methods_for_code.values()
         else:
-            stype, methods = "Data", self.methods_for_data.values()
+            stype, methods = "Data", self._default_data_methods
         err_msg = f"{stype} Serialization Method {{}} failed with: {{}}"
 
         for method in methods:
@@ -58,11 +100,13 @@ class ComputeSerializer:
         """
         Parameters
         ----------
-        payload : str
+        payload : str (or bytes, for bytes-payload methods)
            Payload object to be deserialized
 
         """
         header = payload[0 : self.header_size]
+        if not isinstance(header, str):
+            header = str(header, "ascii", errors="replace")
         if header in self.methods_for_code:
             result = self.methods_for_code[header].deserialize(payload)
         elif header in self.methods_for_data:
@@ -77,28 +121,45 @@ class ComputeSerializer:
         """
         Parameters
         ----------
-        buffers : list of \n terminated strings
+        buffers : list of \n terminated strings (or UTF-8 bytes)
         """
-        packed = ""
+        parts = []
         for buf in buffers:
-            s_length = str(len(buf)) + "\n"
-            packed += s_length + buf
+            if not isinstance(buf, str):
+                buf = str(buf, "utf-8")
+            parts.append(f"{len(buf)}\n")
+            parts.append(buf)
 
-        return packed
+        return "".join(parts)
 
     @staticmethod
     def unpack_buffers(packed_buffer):
         """
         Parameters
         ----------
-        packed_buffer : packed buffer as string
+        packed_buffer : packed buffer as string (or UTF-8 bytes)
         """
+        # Buffer lengths count characters, so bytes are decoded (once) first; the
+        # serialized buffers are ASCII, so this is the same as counting bytes.
+        # Walk the buffer by offset, rather than re-slicing the remainder
+        if not isinstance(packed_buffer, str):
+            packed_buffer = str(packed_buffer, "utf-8")
+
         unpacked = []
-        while packed_buffer:
-            s_length, buf = packed_buffer.split("\n", 1)
-            i_length = int(s_length)
-            current, packed_buffer = buf[:i_length], buf[i_length:]
-            unpacked.extend([current])
+        offset, end = 0, len(packed_buffer)
+        while offset < end:
+            newline = packed_buffer.find("\n", offset)
+            if newline == -1:
+                raise ValueError(f"Missing buffer length at offset {offset}")
+            start = newline + 1
+            stop = start + int(packed_buffer[offset:newline])
+            if stop > end:
+                raise ValueError(
+                    f"Truncated buffer at offset {start}: expected {stop - start}"
+                    f" characters, found {end - start}"
+                )
+            unpacked.append(packed_buffer[start:stop])
+            offset = stop
 
         return unpacked
 
@@ -106,15 +167,9 @@ class ComputeSerializer:
         """Unpacks a packed buffer and returns the deserialized contents
         Parameters
         ----------
-        packed_buffer : packed buffer as string
+        packed_buffer : packed buffer as string (or UTF-8 bytes)
         """
-        unpacked = []
-        while packed_buffer:
-            s_length, buf = packed_buffer.split("\n", 1)
-            i_length = int(s_length)
-            current, packed_buffer = buf[:i_length], buf[i_length:]
-            deserialized = self.deserialize(current)
-            unpacked.extend([deserialized])
+        unpacked = [self.deserialize(buf) for buf in self.unpack_buffers(packed_buffer)]
 
         assert len(unpacked) == 3, "Unpack expects 3 buffers, got {}".format(
             len(unpacked)
@@ -1,8 +1,12 @@
 import inspect
+import pickle
 import sys
 
 import globus_compute_sdk.serialize.concretes as concretes
 import pytest
+from globus_compute_sdk.serialize.base import DeserializationError
+
+PB = hasattr(pickle, "PickleBuffer")
 
 
 def foo(x, y=3):
@@ -269,3 +273,117 @@ def test_serialize_deserialize_combined():
 
     alternate_deserialized = combined.deserialize(combined_serialized_func, variation=2)
     assert alternate_deserialized != deserialized
+
+
+@pytest.mark.parametrize(
+    "buffers",
+    (
+        [],
+        [""],
+        ["00\nabc\n", "", "01\n\n\n"],
+        ["12\nñ unicode\n", "x" * 10_000],
+    ),
+)
+def test_pack_unpack_buffers(buffers):
+    from globus_compute_sdk.serialize.facade import ComputeSerializer
+
+    packed = ComputeSerializer.pack_buffers(buffers)
+    # the wire format: each buffer is prefixed by its length, and a newline
+    assert packed == "".join(f"{len(buf)}\n{buf}" for buf in buffers)
+
+    assert ComputeSerializer.unpack_buffers(packed) == buffers
+    assert ComputeSerializer.unpack_buffers(packed.encode()) == buffers
+    assert ComputeSerializer.unpack_buffers(memoryview(packed.encode())) == buffers
+
+
+def test_pack_buffers_accepts_bytes():
+    from globus_compute_sdk.serialize.facade import ComputeSerializer
+
+    assert ComputeSerializer.pack_buffers([b"00\nab", "cd"]) == "5\n00\nab2\ncd"
+
+
+@pytest.mark.parametrize("packed", ("no length", "x\nabc", "10\nabc"))
+def test_unpack_buffers_malformed(packed):
+    from globus_compute_sdk.serialize.facade import ComputeSerializer
+
+    with pytest.raises(ValueError):
+        ComputeSerializer.unpack_buffers(packed)
+
+
+def test_unpack_and_deserialize_bytes():
+    from globus_compute_sdk.serialize.facade import ComputeSerializer
+
+    s = ComputeSerializer()
+    packed = s.pack_buffers([s.serialize(foo), s.serialize((2,)), s.serialize({})])
+    fn, args, kwargs = s.unpack_and_deserialize(packed.encode())
+    assert fn(*args, **kwargs) == 6
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires pickle protocol 5")
+@pytest.mark.parametrize(
+    "data",
+    (
+        None,
+        {"a": [1, 2.5, "three"]},
+        b"\x00\xff" * 1000,
+        [bytearray(b"ab"), pickle.PickleBuffer(b"out of band") if PB else None],
+    ),
+)
+def test_pickle_data_raw(data):
+    raw = concretes.PickleDataRaw()
+    serialized = raw.serialize(data)
+    assert isinstance(serialized, bytes)
+    assert serialized.startswith(b"05\n")
+
+    deserialized = raw.deserialize(serialized)
+    if isinstance(data, list) and PB:
+        assert deserialized[0] == data[0]
+        assert bytes(deserialized[1]) == b"out of band"
+    else:
+        assert deserialized == data
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires pickle protocol 5")
+def test_pickle_data_raw_out_of_band():
+    raw = concretes.PickleDataRaw()
+    big = bytearray(b"x" * 100_000)
+    serialized = raw.serialize(pickle.PickleBuffer(big))
+    # The buffer follows the pickle stream, rather than being copied into it
+    assert serialized.endswith(big)
+    assert len(serialized) < len(big) + 100
+
+    deserialized = raw.deserialize(memoryview(serialized))
+    assert bytes(deserialized) == big
+    assert not memoryview(deserialized).readonly
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires pickle protocol 5")
+@pytest.mark.parametrize("mangle", (lambda b: b"00\n" + b[3:], lambda b: b[:-1]))
+def test_pickle_data_raw_malformed(mangle):
+    raw = concretes.PickleDataRaw()
+    with pytest.raises(DeserializationError):
+        raw.deserialize(mangle(raw.serialize([1, 2])))
+
+
+def test_raw_data_method_negotiated():
+    from globus_compute_sdk.serialize.facade import ComputeSerializer
+
+    # only used when requested, as older peers cannot deserialize it
+    assert ComputeSerializer().serialize([1]).startswith("00\n")
+    assert ComputeSerializer.negotiate_data_method(["99\n", "05\n", "00\n"]) == "05\n"
+    assert ComputeSerializer.negotiate_data_method(["99\n"]) is None
+
+    with pytest.raises(ValueError):
+        ComputeSerializer(data_method="99\n")
+
+    s = ComputeSerializer(data_method=concretes.PickleDataRaw.identifier)
+    if sys.version_info >= (3, 8):
+        serialized = s.serialize({"k": b"v"})
+        assert isinstance(serialized, bytes)
+        assert s.deserialize(serialized) == {"k": b"v"}
+        assert ComputeSerializer().deserialize(serialized) == {"k": b"v"}
+
+    # pickle can not serialize modules (dill can), so fall back to the defaults
+    serialized = s.serialize([sys])
+    assert serialized.startswith("00\n")
+    assert s.deserialize(serialized) == [sys]
@@ -139,6 +139,35 @@ def test_pending_tasks_always_fetched():
             assert sf == args[0]
 
 
+def test_batch_result_survives_eviction():
+    serde = ComputeSerializer()
+    gcc = gc.Client(
+        do_version_check=False, login_manager=mock.Mock(), task_cache_max_entries=2
+    )
+    gcc.web_client = mock.MagicMock()
+    done_id, *pending_ids = (str(uuid.uuid4()) for _ in range(3))
+    gcc._task_status_table[done_id] = {"pending": False, "result": "done"}
+    gcc.web_client.get_batch_status.return_value = {
+        "results": {
+            task_id: {
+                "status": "success",
+                "completion_t": "1.1",
+                "result": serde.serialize(task_id),
+            }
+            for task_id in pending_ids
+        }
+    }
+
+    results = gcc.get_batch_result([done_id, *pending_ids])
+
+    assert done_id not in gcc._task_status_table, "Verify test setup: evicted"
+    assert results[done_id]["result"] == "done"
+    for task_id in pending_ids:
+        assert results[task_id]["result"] == task_id
+    assert gcc.task_cache_stats["entries"] == 2
+    assert gcc.task_cache_stats["evictions"] == 1
+
+
 @pytest.mark.parametrize("create_ws_queue", [True, False, None])
 def test_batch_created_websocket_queue(create_ws_queue):
     eid = str(uuid.uuid4())
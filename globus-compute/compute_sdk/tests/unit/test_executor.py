@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import concurrent.futures
+import operator
 import random
 import threading
+import time
 import typing as t
 import uuid
 from unittest import mock
 
+import globus_sdk
 import pika
 import pytest
 from globus_compute_common import messagepack
@@ -13,7 +17,12 @@ from globus_compute_common.messagepack.message_types import Result, ResultErrorD
 from globus_compute_sdk import Client, Executor
 from globus_compute_sdk.errors import TaskExecutionFailed
 from globus_compute_sdk.sdk.asynchronous.compute_future import ComputeFuture
-from globus_compute_sdk.sdk.executor import TaskSubmissionInfo, _ResultWatcher
+from globus_compute_sdk.sdk.batch import Batch
+from globus_compute_sdk.sdk.executor import (
+    TaskSubmissionInfo,
+    _map_chunk,
+    _ResultWatcher,
+)
 from globus_compute_sdk.serialize.facade import ComputeSerializer
 from tests.utils import try_assert, try_for_timeout
 
@@ -31,7 +40,7 @@ def noop():
 
 class MockedExecutor(Executor):
     def __init__(self, *args, **kwargs):
-        kwargs.update({"funcx_client": mock.Mock(spec=Client)})
+        kwargs.setdefault("funcx_client", mock.Mock(spec=Client))
         super().__init__(*args, **kwargs)
         self._time_to_stop_mock = threading.Event()
         self._task_submitter_exception: t.Type[Exception] | None = None
@@ -71,6 +80,7 @@ class MockedResultWatcher(_ResultWatcher):
 def gc_executor(mocker):
     gcc = mock.MagicMock()
     gcc.session_task_group_id = str(uuid.uuid4())
+    gcc.create_batch.side_effect = Batch
     gce = Executor(funcx_client=gcc)
     watcher = mocker.patch(
         "globus_compute_sdk.sdk.executor._ResultWatcher", autospec=True
@@ -256,11 +266,53 @@ def test_same_function_different_containers_allowed(gc_executor):
         gce.register_function(noop)
 
 
-def test_map_raises(gc_executor):
+def _run_locally(fn, *args):
+    fut = ComputeFuture()
+    fut.set_result(fn(*args))
+    return fut
+
+
+@pytest.mark.parametrize("chunksize", (1, 2, 3, 10, 100))
+def test_map_chunks_and_preserves_order(gc_executor, mocker, chunksize):
+    gcc, gce = gc_executor
+    mock_submit = mocker.patch.object(gce, "submit", side_effect=_run_locally)
+    xs, ys = list(range(25)), list(range(100, 125))
+
+    results = gce.map(operator.add, xs, ys, chunksize=chunksize)
+
+    assert list(results) == list(map(operator.add, xs, ys))
+    assert mock_submit.call_count == -(-len(xs) // chunksize)
+    if chunksize > 1:
+        submitted_fn, fn, chunk = mock_submit.call_args_list[0][0]
+        assert submitted_fn is _map_chunk
+        assert fn is operator.add
+        assert chunk == tuple(zip(xs, ys))[:chunksize]
+
+
+@pytest.mark.parametrize("chunksize", (0, -1))
+def test_map_invalid_chunksize(gc_executor, chunksize):
     gcc, gce = gc_executor
+    with pytest.raises(ValueError):
+        gce.map(noop, [1], chunksize=chunksize)
+
+
+def test_map_results_are_lazy(gc_executor, mocker):
+    gcc, gce = gc_executor
+    futs = [ComputeFuture() for _ in range(3)]
+    mocker.patch.object(gce, "submit", side_effect=futs)
+
+    results = gce.map(noop, range(6), chunksize=2, timeout=0.01)
+    futs[0].set_result(["a", "b"])
+    assert next(results) == "a"
+    assert next(results) == "b"
+    with pytest.raises(concurrent.futures.TimeoutError):
+        next(results)
+
 
-    with pytest.raises(NotImplementedError):
-        gce.map(noop)
+def test_map_chunk_runs_from_registered_source():
+    serde = ComputeSerializer()
+    map_chunk = serde.deserialize(serde.serialize(_map_chunk))
+    assert map_chunk(operator.mul, ((2, 3), (4, 5))) == [6, 20]
 
 
 @pytest.mark.parametrize("num_tasks", [0, 1, 2, 10])
@@ -475,11 +527,128 @@ def test_reload_handles_deseralization_error_gracefully(gc_executor):
     assert all("Failed to set " in str(fut.exception()) for fut in futs)
 
 
+def _status_by_id(task_ids, **status):
+    return mock.MagicMock(data={"results": {t_id: dict(status) for t_id in task_ids}})
+
+
+@pytest.mark.parametrize("max_concurrency", (1, 3))
+def test_reload_tasks_concurrent_chunks(gc_executor, max_concurrency):
+    gcc, gce = gc_executor
+    task_ids = [str(uuid.uuid4()) for _ in range(11)]
+    gcc.web_client.get_taskgroup_tasks.return_value = {
+        "taskgroup_id": gce.task_group_id,
+        "tasks": [{"id": t_id} for t_id in task_ids],
+    }
+
+    lock = threading.Lock()
+    inflight, peak = [0], [0]
+
+    def get_batch_status(id_chunk):
+        with lock:
+            inflight[0] += 1
+            peak[0] = max(peak[0], inflight[0])
+        time.sleep(0.02)
+        with lock:
+            inflight[0] -= 1
+        return _status_by_id(id_chunk)
+
+    gcc.web_client.get_batch_status.side_effect = get_batch_status
+
+    futs = gce.reload_tasks(max_concurrency=max_concurrency, chunk_size=2)
+
+    assert gcc.web_client.get_batch_status.call_count == 6
+    assert peak[0] == max_concurrency
+    assert sorted(f.task_id for f in futs) == sorted(task_ids)
+
+
+def test_reload_tasks_iter_yields_as_chunks_arrive(gc_executor):
+    gcc, gce = gc_executor
+    task_ids = [str(uuid.uuid4()) for _ in range(4)]
+    gcc.web_client.get_taskgroup_tasks.return_value = {
+        "taskgroup_id": gce.task_group_id,
+        "tasks": [{"id": t_id} for t_id in task_ids],
+    }
+    release = threading.Event()
+
+    def get_batch_status(id_chunk):
+        if task_ids[0] not in id_chunk:
+            release.wait(timeout=5)
+        return _status_by_id(id_chunk)
+
+    gcc.web_client.get_batch_status.side_effect = get_batch_status
+
+    futs_iter = gce.reload_tasks_iter(max_concurrency=2, chunk_size=2)
+    first = [next(futs_iter), next(futs_iter)]
+    assert [f.task_id for f in first] == task_ids[:2], "Other chunk still in flight"
+    try_assert(lambda: gce._result_watcher.is_alive())
+    assert gce._result_watcher._open_futures.keys() == set(task_ids[:2])
+
+    release.set()
+    rest = list(futs_iter)
+    assert [f.task_id for f in rest] == task_ids[2:]
+
+
+def test_reload_tasks_iter_validates_task_group_eagerly(gc_executor):
+    gcc, gce = gc_executor
+    gcc.web_client.get_taskgroup_tasks.return_value = {"taskgroup_id": "abcd"}
+
+    with pytest.raises(ValueError):
+        gce.reload_tasks_iter()
+    with pytest.raises(ValueError):
+        gce.reload_tasks_iter(max_concurrency=0)
+
+
+def test_reload_tasks_defers_deserialization(gc_executor):
+    gcc, gce = gc_executor
+    serde = ComputeSerializer()
+    gcc.fx_serializer = mock.Mock(wraps=serde)
+    task_ids = [str(uuid.uuid4()) for _ in range(3)]
+    gcc.web_client.get_taskgroup_tasks.return_value = {
+        "taskgroup_id": gce.task_group_id,
+        "tasks": [{"id": t_id} for t_id in task_ids],
+    }
+    gcc.web_client.get_batch_status.return_value = _status_by_id(
+        task_ids, completion_t=1, status="success", result=serde.serialize("abc")
+    )
+
+    futs = gce.reload_tasks()
+
+    assert all(f.done() for f in futs)
+    assert not gcc.fx_serializer.deserialize.called
+    assert futs[0].result() == "abc"
+    assert futs[0].exception() is None
+    assert gcc.fx_serializer.deserialize.call_count == 1, "Deserialized once"
+
+
+def test_compute_future_deserializes_once_across_threads():
+    def slow_deserialize(payload):
+        time.sleep(0.05)
+        return payload.upper()
+
+    deserialize = mock.Mock(side_effect=slow_deserialize)
+    fut = ComputeFuture()
+    fut.set_serialized_result("abc", deserialize)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: fut.result(), range(4)))
+
+    assert results == ["ABC"] * 4
+    assert deserialize.call_count == 1
+
+
+def test_compute_future_deserialization_error():
+    fut = ComputeFuture()
+    fut.set_serialized_result("abc", mock.Mock(side_effect=ValueError("bad data")))
+
+    assert isinstance(fut.exception(), ValueError)
+    with pytest.raises(ValueError):
+        fut.result()
+
+
 @pytest.mark.parametrize("batch_size", tuple(range(1, 11)))
 def test_task_submitter_respects_batch_size(gc_executor, batch_size: int):
     gcc, gce = gc_executor
 
-    gcc.create_batch.side_effect = mock.MagicMock
     gcc.register_function.return_value = "abc"
     num_batches = 50
 
@@ -491,7 +660,7 @@ def test_task_submitter_respects_batch_size(gc_executor, batch_size: int):
 
     for args, _kwargs in gcc.batch_run.call_args_list:
         batch, *_ = args
-        assert batch.add.call_count <= batch_size
+        assert len(batch.tasks) <= batch_size
 
 
 def test_task_submitter_stops_executor_on_exception():
@@ -506,6 +675,7 @@ def test_task_submitter_stops_executor_on_upstream_error_response(randomstring):
     gce = MockedExecutor()
 
     upstream_error = Exception(f"Upstream error {randomstring}!!")
+    gce.funcx_client.create_batch.side_effect = Batch
     gce.funcx_client.batch_run.side_effect = upstream_error
     gce.task_group_id = "abc"
     tsi = TaskSubmissionInfo(
@@ -542,11 +712,214 @@ def test_task_submitter_sets_future_task_ids(gc_executor):
     batch_ids = [uuid.uuid4() for _ in range(num_tasks)]
 
     gcc.batch_run.return_value = batch_ids
-    gce._submit_tasks(futs, [])
+    batch = Batch(task_group_id=gce.task_group_id)
+    for _ in futs:
+        batch.add("some_fn_id", "some_ep_id")
+    gce._submit_tasks(futs, batch)
 
     assert all(f.task_id == task_id for f, task_id in zip(futs, batch_ids))
 
 
+@pytest.fixture
+def pipelined_executor(mocker):
+    gcc = mock.MagicMock()
+    gcc.session_task_group_id = str(uuid.uuid4())
+    gcc.register_function.return_value = "abc"
+    gcc.create_batch.side_effect = Batch
+    mocker.patch("globus_compute_sdk.sdk.executor.time.sleep")  # retry backoff
+    watcher = mocker.patch(
+        "globus_compute_sdk.sdk.executor._ResultWatcher", autospec=True
+    )
+    executors = []
+
+    def create(**kwargs):
+        gce = MockedExecutor(funcx_client=gcc, batch_size=1, **kwargs)
+        gce.endpoint_id = "some_ep_id"
+        watcher.side_effect = lambda *a, **k: MockedResultWatcher(gce)
+        executors.append(gce)
+        return gcc, gce
+
+    yield create
+
+    for gce in executors:
+        gce.shutdown(wait=False, cancel_futures=True)
+        try_for_timeout(_is_stopped(gce._task_submitter))
+
+
+def _batch_args(batch: Batch) -> list[tuple]:
+    serde = ComputeSerializer()
+    return [serde.deserialize(serde.unpack_buffers(p)[0]) for _f, _e, p in batch.tasks]
+
+
+def test_task_submitter_sends_batches_concurrently(pipelined_executor):
+    gcc, gce = pipelined_executor(max_inflight_batches=3)
+    in_flight, release = [], threading.Event()
+
+    def batch_run(batch):
+        in_flight.append(batch)
+        release.wait()
+        return [f"id-{a}" for a in _batch_args(batch)]
+
+    gcc.batch_run.side_effect = batch_run
+    futs = [gce.submit(noop, i) for i in range(5)]
+
+    try_assert(lambda: len(in_flight) == 3)
+    time.sleep(0.05)
+    assert len(in_flight) == 3, "Expect no more than max_inflight_batches"
+
+    release.set()
+    try_assert(lambda: all(f.task_id for f in futs))
+    for i, fut in enumerate(futs):
+        assert fut.task_id == f"id-{(i,)}", "Expect each future mapped to its task"
+
+
+def test_task_submitter_backpressure(pipelined_executor):
+    gcc, gce = pipelined_executor(max_inflight_batches=1, max_pending_tasks=2)
+    release = threading.Event()
+    gcc.batch_run.side_effect = lambda b: release.wait() and ["id"]
+
+    submitted = []
+
+    def producer():
+        for i in range(10):
+            submitted.append(gce.submit(noop, i))
+
+    producer_thread = threading.Thread(target=producer, daemon=True)
+    producer_thread.start()
+
+    # 1 batch in flight, 1 batch awaiting a slot, 2 tasks queued: the next blocks
+    try_assert(lambda: len(submitted) == 4)
+    time.sleep(0.05)
+    assert len(submitted) == 4, "Expect submit() to block while the queue is full"
+
+    release.set()
+    producer_thread.join(timeout=5)
+    assert len(submitted) == 10
+
+
+def test_task_submitter_retries_transient_errors(pipelined_executor):
+    gcc, gce = pipelined_executor(submit_retry_limit=2)
+    conn_err = globus_sdk.GlobusConnectionError("unreachable", Exception())
+    gcc.batch_run.side_effect = [conn_err, conn_err, ["some_task_id"]]
+
+    fut = gce.submit(noop)
+    try_assert(lambda: fut.task_id == "some_task_id")
+    assert gcc.batch_run.call_count == 3
+
+
+def test_task_submitter_gives_up_after_retry_limit(pipelined_executor):
+    gcc, gce = pipelined_executor(submit_retry_limit=1)
+    conn_err = globus_sdk.GlobusConnectionError("unreachable", Exception())
+    gcc.batch_run.side_effect = conn_err
+
+    fut = gce.submit(noop)
+    try_assert(lambda: gce._stopped)
+    try_assert(lambda: fut.cancelled())
+    assert gcc.batch_run.call_count == 2
+
+
+def test_task_submitter_does_not_retry_rejected_batch(pipelined_executor):
+    gcc, gce = pipelined_executor(submit_retry_limit=3)
+    gcc.batch_run.side_effect = ValueError("Invalid request")
+
+    gce.submit(noop)
+    try_assert(lambda: gce._stopped)
+    try_assert(lambda: isinstance(gce._task_submitter_exception, ValueError))
+    assert gcc.batch_run.call_count == 1
+
+
+def _api_error(http_status: int) -> globus_sdk.GlobusAPIError:
+    err = globus_sdk.GlobusAPIError.__new__(globus_sdk.GlobusAPIError)
+    err.http_status = http_status
+    return err
+
+
+def test_task_submitter_coalesces_by_bytes(pipelined_executor):
+    gcc, gce = pipelined_executor(batch_max_bytes=200)
+    gce.batch_size = 100
+    gcc.batch_run.side_effect = lambda b: [f"id-{a}" for a in _batch_args(b)]
+
+    payload = "x" * 60  # each task is ~100 bytes serialized
+    futs = [gce.submit(noop, i, payload) for i in range(9)]
+    try_assert(lambda: all(f.task_id for f in futs))
+
+    for args, _kwargs in gcc.batch_run.call_args_list:
+        batch, *_ = args
+        batch_bytes = sum(len(p) for _f, _e, p in batch.tasks)
+        assert batch_bytes <= 200 or len(batch.tasks) == 1
+    assert gcc.batch_run.call_count >= 9 // 2
+    for i, fut in enumerate(futs):
+        assert fut.task_id == f"id-{(i, payload)}", "Carried tasks keep their order"
+
+
+def test_task_submitter_sends_lone_oversized_task(pipelined_executor):
+    gcc, gce = pipelined_executor(batch_max_bytes=10)
+    gcc.batch_run.return_value = ["some_id"]
+
+    fut = gce.submit(noop, "x" * 100)
+    try_assert(lambda: fut.task_id == "some_id")
+
+
+def test_task_submitter_lingers_for_trickle(pipelined_executor):
+    gcc, gce = pipelined_executor(batch_linger_s=5)
+    gce.batch_size = 100
+    gce._record_batch(1, 10, 0.2)  # as if observed; linger for 0.1s
+    gcc.batch_run.side_effect = lambda b: ["id"] * len(b.tasks)
+
+    futs = [gce.submit(noop, i) for i in range(3)]
+    try_assert(lambda: all(f.task_id for f in futs))
+    assert gcc.batch_run.call_count == 1, "Expect trickled tasks coalesced"
+
+
+def test_linger_learned_from_latency(pipelined_executor):
+    _gcc, gce = pipelined_executor(batch_linger_s=0.05)
+    assert gce._linger_s() == 0, "Don't wait before any latency is observed"
+
+    gce._record_batch(1, 10, 0.04)
+    assert gce._linger_s() == pytest.approx(0.02)
+
+    for _ in range(50):
+        gce._record_batch(1, 10, 1.0)
+    assert gce._linger_s() == pytest.approx(0.05), "Bounded by batch_linger_s"
+
+
+def test_batch_stats(pipelined_executor):
+    gcc, gce = pipelined_executor()
+    assert gce.batch_stats["batches"] == 0
+
+    for latency in (0.1, 0.3, 0.2):
+        gce._record_batch(10, 1000, latency)
+    stats = gce.batch_stats
+    assert stats["batches"] == 3
+    assert stats["tasks"] == 30
+    assert stats["bytes"] == 3000
+    assert stats["tasks_per_batch"] == 10
+    assert stats["latency_s"]["p50"] == 0.2
+    assert stats["latency_s"]["max"] == 0.3
+    assert stats["max_bytes"] == gce.batch_max_bytes
+    assert list(gce.batch_history)[0] == (10, 1000, 0.1)
+
+
+def test_task_submitter_splits_batch_too_large(pipelined_executor):
+    gcc, gce = pipelined_executor()
+
+    def batch_run(batch):
+        if len(batch.tasks) > 2:
+            raise _api_error(413)
+        return [f"id-{a}" for a in _batch_args(batch)]
+
+    gcc.batch_run.side_effect = batch_run
+    futs = [ComputeFuture() for _ in range(5)]
+    batch = Batch(task_group_id=gce.task_group_id)
+    for i in range(5):
+        batch.add("some_fn_id", "some_ep_id", (i,))
+
+    gce._submit_tasks(futs, batch)
+
+    assert [f.task_id for f in futs] == [f"id-{(i,)}" for i in range(5)]
+    assert gce.batch_stats["max_bytes"] < gce.batch_max_bytes, "Expect cap learned"
+
+
 def test_resultwatcher_stops_if_unable_to_connect(mocker):
     mock_time = mocker.patch("globus_compute_sdk.sdk.executor.time")
     gce = mock.Mock(spec=Executor)
@@ -720,6 +1093,92 @@ def test_resultwatcher_match_handles_deserialization_error():
     mrw.shutdown()
 
 
+def test_resultwatcher_match_defers_deserialization(randomstring):
+    payload = randomstring()
+    fxs = ComputeSerializer()
+    fut = ComputeFuture(task_id=uuid.uuid4())
+    res = Result(task_id=fut.task_id, data=fxs.serialize(payload))
+
+    mrw = MockedResultWatcher(mock.Mock())
+    deserialize = mrw.funcx_executor.funcx_client.fx_serializer.deserialize
+    deserialize.side_effect = fxs.deserialize
+    mrw._received_results[fut.task_id] = (None, res)
+    mrw.watch_for_task_results([fut])
+    mrw.start()
+    mrw._event_watcher()
+
+    assert fut.done()
+    assert not deserialize.called, "AMQP thread only matches futures"
+    assert fut.result() == payload
+    assert fut.result() == payload
+    assert deserialize.call_count == 1
+    mrw.shutdown()
+
+
+def test_resultwatcher_match_offloads_deserialization(randomstring):
+    payload = randomstring()
+    fxs = ComputeSerializer()
+    fut = ComputeFuture(task_id=uuid.uuid4())
+    res = Result(task_id=fut.task_id, data=fxs.serialize(payload))
+    deserialized_on = []
+
+    def deserialize(data):
+        deserialized_on.append(threading.current_thread().name)
+        return fxs.deserialize(data)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        1, thread_name_prefix="some_pool"
+    ) as pool:
+        mrw = MockedResultWatcher(mock.Mock(), deserializer_pool=pool)
+        mrw.funcx_executor.funcx_client.fx_serializer.deserialize = deserialize
+        mrw._received_results[fut.task_id] = (None, res)
+        mrw.watch_for_task_results([fut])
+        mrw.start()
+        mrw._event_watcher()
+
+        assert fut.result(timeout=5) == payload
+    assert len(deserialized_on) == 1
+    assert deserialized_on[0].startswith("some_pool")
+    mrw.shutdown()
+
+
+def test_resultwatcher_match_falls_back_if_pool_shut_down(randomstring):
+    payload = randomstring()
+    fxs = ComputeSerializer()
+    fut = ComputeFuture(task_id=uuid.uuid4())
+    res = Result(task_id=fut.task_id, data=fxs.serialize(payload))
+    pool = concurrent.futures.ThreadPoolExecutor(1)
+    pool.shutdown()
+
+    mrw = MockedResultWatcher(mock.Mock(), deserializer_pool=pool)
+    mrw.funcx_executor.funcx_client.fx_serializer.deserialize = fxs.deserialize
+    mrw._received_results[fut.task_id] = (None, res)
+    mrw.watch_for_task_results([fut])
+    mrw.start()
+    mrw._event_watcher()
+
+    assert fut.result() == payload
+    mrw.shutdown()
+
+
+@pytest.mark.parametrize("workers", (0, 2))
+def test_executor_result_deserializer_pool(workers):
+    gce = MockedExecutor(result_deserializer_workers=workers)
+    try:
+        with mock.patch(
+            "globus_compute_sdk.sdk.executor._ResultWatcher"
+        ) as mock_watcher:
+            gce._new_result_watcher()
+        _a, kwargs = mock_watcher.call_args
+        assert kwargs["deserializer_pool"] is gce._deserializer_pool
+        assert bool(gce._deserializer_pool) is bool(workers)
+    finally:
+        gce.shutdown()
+    if workers:
+        with pytest.raises(RuntimeError):
+            gce._deserializer_pool.submit(noop)
+
+
 @pytest.mark.parametrize("unpacked", ("not_a_Result", Exception))
 def test_resultwatcher_onmessage_verifies_result_type(mocker, unpacked):
     mock_unpack = mocker.patch("globus_compute_sdk.sdk.executor.messagepack.unpack")
@@ -747,6 +1206,94 @@ def test_resultwatcher_onmessage_sets_check_results_flag():
     assert mrw._time_to_check_results.is_set()
 
 
+def _result_message(task_id, msg_id):
+    body = messagepack.pack(Result(task_id=task_id, data="abc"))
+    return mock.Mock(delivery_tag=msg_id), mock.Mock(), body
+
+
+def test_resultwatcher_onmessage_resolves_watched_future():
+    fut = ComputeFuture(task_id=str(uuid.uuid4()))
+    mrw = MockedResultWatcher(mock.Mock())
+    mrw.watch_for_task_results([fut])
+    mrw.start()
+
+    mrw._on_message(mrw._channel, *_result_message(fut.task_id, 1))
+
+    assert fut.done(), "Resolved on arrival; no wait for the next poll"
+    assert not mrw._received_results
+    assert not mrw._time_to_check_results.is_set()
+    assert mrw._open_futures_empty.is_set()
+    mrw.shutdown()
+
+
+def test_resultwatcher_watch_resolves_arrived_results():
+    fut = ComputeFuture(task_id=str(uuid.uuid4()))
+    mrw = MockedResultWatcher(mock.Mock())
+    mrw.start()
+    mrw._on_message(mrw._channel, *_result_message(fut.task_id, 1))
+    assert fut.task_id in mrw._received_results, "Verify test setup"
+
+    assert mrw.watch_for_task_results([fut]) == 1
+    assert fut.done()
+    assert not mrw._received_results
+    assert not mrw._open_futures
+    mrw.shutdown()
+
+
+def test_resultwatcher_acks_every_n():
+    mrw = MockedResultWatcher(mock.Mock(), ack_batch_size=3)
+    mrw.start()
+    for msg_id in range(1, 8):
+        mrw._on_message(mrw._channel, *_result_message(uuid.uuid4(), msg_id))
+
+    acks = [a for a, _k in mrw._channel.basic_ack.call_args_list]
+    assert acks == [(3,), (6,)]
+    assert all(
+        k == {"multiple": True} for _a, k in mrw._channel.basic_ack.call_args_list
+    )
+    assert mrw._to_ack == [7]
+    mrw.shutdown()
+
+
+def test_resultwatcher_acks_after_interval():
+    mrw = MockedResultWatcher(mock.Mock(), ack_batch_size=100, ack_interval_s=0.3)
+    mrw.start()
+    call_later = mrw._connection.ioloop.call_later
+    for msg_id in range(1, 4):
+        mrw._on_message(mrw._channel, *_result_message(uuid.uuid4(), msg_id))
+
+    assert call_later.call_count == 1, "One timer for the outstanding acks"
+    (delay, on_timer), _k = call_later.call_args
+    assert delay == 0.3
+    assert not mrw._channel.basic_ack.called
+
+    on_timer()
+    mrw._channel.basic_ack.assert_called_once_with(3, multiple=True)
+    assert not mrw._to_ack
+
+    mrw._on_message(mrw._channel, *_result_message(uuid.uuid4(), 4))
+    assert call_later.call_count == 2, "Rearmed for the next outstanding ack"
+    mrw.shutdown()
+
+
+@pytest.mark.parametrize("prefetch_count", (0, 10))
+def test_resultwatcher_sets_prefetch(prefetch_count):
+    mrw = MockedResultWatcher(
+        mock.Mock(), prefetch_count=prefetch_count, ack_batch_size=256
+    )
+    mrw.start()
+    mrw._on_channel_open(mrw._channel)
+
+    if prefetch_count:
+        mrw._channel.basic_qos.assert_called_once_with(prefetch_count=prefetch_count)
+        assert mrw.ack_batch_size == prefetch_count, "Never wait on withheld results"
+    else:
+        assert not mrw._channel.basic_qos.called
+        assert mrw.ack_batch_size == 256
+    assert mrw._channel.basic_consume.called
+    mrw.shutdown()
+
+
 @pytest.mark.parametrize("exc", (MemoryError("some description"), "some description"))
 def test_resultwatcher_stops_loop_on_open_failure(mocker, exc):
     mock_log = mocker.patch("globus_compute_sdk.sdk.executor.log", autospec=True)
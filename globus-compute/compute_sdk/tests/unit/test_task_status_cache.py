@@ -0,0 +1,115 @@
+from unittest import mock
+
+import pytest
+from globus_compute_sdk.errors import SerializationError
+from globus_compute_sdk.sdk.task_status_cache import TaskStatusCache
+from globus_compute_sdk.serialize import ComputeSerializer
+
+
+@pytest.fixture
+def serde():
+    return ComputeSerializer()
+
+
+@pytest.fixture
+def cache(serde):
+    return TaskStatusCache(deserialize=serde.deserialize)
+
+
+def test_behaves_as_status_mapping(cache, serde):
+    cache["t1"] = {"pending": True, "status": "waiting-for-ep"}
+    st = cache.set_result("t2", serde.serialize("abc"), "1.1")
+
+    assert st == {
+        "pending": False,
+        "status": "success",
+        "result": "abc",
+        "completion_t": "1.1",
+    }
+    assert cache["t1"] == {"pending": True, "status": "waiting-for-ep"}
+    assert cache["t2"] == st
+    assert "t2" in cache
+    assert cache.get("missing", {}) == {}
+    assert len(cache) == 2
+    del cache["t1"]
+    assert list(cache) == ["t2"]
+
+
+@pytest.mark.parametrize("invalid", ({"max_entries": 0}, {"max_bytes": 0}))
+def test_invalid_bounds(invalid):
+    with pytest.raises(ValueError):
+        TaskStatusCache(**invalid)
+
+
+def test_evicts_least_recently_used(serde):
+    cache = TaskStatusCache(max_entries=3, deserialize=serde.deserialize)
+    for i in range(3):
+        cache.set_result(f"t{i}", serde.serialize(i), "1.1")
+
+    assert cache["t0"]["result"] == 0  # now most recently used
+    cache.set_result("t3", serde.serialize(3), "1.1")
+
+    assert "t1" not in cache, "Least recently used is evicted"
+    assert sorted(cache) == ["t0", "t2", "t3"]
+    assert cache.stats["evictions"] == 1
+
+
+def test_evicts_by_bytes(serde):
+    big = serde.serialize("x" * 10_000)
+    cache = TaskStatusCache(max_bytes=3 * len(big), deserialize=serde.deserialize)
+    for i in range(5):
+        cache.set_result(f"t{i}", big, "1.1")
+
+    assert sorted(cache) == ["t3", "t4"]
+    assert cache.stats["bytes"] <= cache.max_bytes
+
+
+def test_large_results_kept_serialized(serde):
+    deserialize = mock.Mock(side_effect=serde.deserialize)
+    cache = TaskStatusCache(inline_max_bytes=100, deserialize=deserialize)
+    small, large = "x", "x" * 1000
+
+    cache.set_result("small", serde.serialize(small), "1.1")
+    cache.set_result("large", serde.serialize(large), "1.1")
+    assert deserialize.call_count == 2
+    assert cache.stats["serialized_entries"] == 1
+
+    assert cache["small"]["result"] == small
+    assert deserialize.call_count == 2, "Small results are kept as objects"
+    assert cache["large"]["result"] == large
+    assert cache["large"]["result"] == large
+    assert deserialize.call_count == 4, "Large results deserialized on access"
+
+
+def test_deserialization_failure(cache):
+    with pytest.raises(SerializationError):
+        cache.set_result("t1", "not a serialized result", "1.1")
+    assert "t1" not in cache
+
+
+def test_ttl_expires_entries(cache):
+    cache.ttl_s = 10
+    with mock.patch("globus_compute_sdk.sdk.task_status_cache.time") as mock_time:
+        mock_time.monotonic.return_value = 100
+        cache["t1"] = {"pending": False, "status": "success", "result": 1}
+        mock_time.monotonic.return_value = 109
+        assert cache["t1"]["result"] == 1
+        mock_time.monotonic.return_value = 110
+        assert cache.get("t1") is None
+
+    assert len(cache) == 0
+    assert cache.stats["expirations"] == 1
+
+
+def test_stats_hit_rate(cache):
+    assert cache.stats["hit_rate"] == 0.0
+    cache["t1"] = {"pending": True}
+    cache.get("t1")
+    cache.get("t1")
+    cache.get("t2")
+
+    stats = cache.stats
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0